@@ -1,37 +1,12 @@
-from . import audit_commands
-from . import bootstrap_commands
-from . import check_commands
-from . import context_runtime_preflight
-from . import governance_commands
-from . import governance_index
-from . import multi_repo_worktree_identity
-from . import permission_and_authorization_runtime_gate
-from . import offering_package_selection_runtime_baseline
-from . import offering_package_definition_resolution
-from . import offering_package_materialization_and_bootstrap_mapping
-from . import offering_package_prerequisite_gate
-from . import offering_package_status_and_evidence_runtime
-from . import outside_in_validation_and_evidence_promotion_baseline
-from . import offering_package_composition_and_closeout
-from . import package_machine_interface_read_boundary
-from . import query_orchestration_runtime
-from . import repo_check_runtime_adoption
-from . import result_artifact_eligibility_and_evidence_promotion_gate
-from . import runtime_composition_root_and_system_assembly
-from . import runtime_adoption_readiness_inspect
-from . import runtime_budget_retry_and_recovery_control
-from . import runbook_runtime
-from . import session_context_snapshot_runtime
-from . import session_persistence_and_transcript_compaction
-from . import session_readiness_state
-from . import shared_command_dispatch_runtime
-from . import structured_output_and_result_normalization_plane
-from . import tool_command_adoption
-from . import tool_progress_and_runtime_event_stream
-from . import workflow_and_runbook_orchestration_runtime
-from . import agent_delegation_and_task_lifecycle_runtime
-from . import skill_and_plugin_extension_runtime
-from . import github_governance_topology_contract_baseline
+"""AAA governance toolkit.
+
+Submodules are imported on first attribute access so that light entry points
+(the ``aaa`` launcher forwarding to a running governance daemon) do not pay for
+importing every runtime validator.
+"""
+
+import importlib
+from typing import Any
 
 __all__ = [
     "audit_commands",
@@ -70,3 +45,15 @@ __all__ = [
     "tool_progress_and_runtime_event_stream",
     "workflow_and_runbook_orchestration_runtime",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
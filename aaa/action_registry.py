@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from typing import Any, Callable
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from .trust.capability import ScopeInterner
 
 
 class RuntimeSecurityError(Exception):
@@ -15,24 +18,95 @@ class ActionSpec:
     name: str
     handler: Callable[[Any], dict[str, Any]]
     scopes: list[str]
+    scope_mask: int = 0
+
+
+@dataclass
+class ActionTiming:
+    calls: int = 0
+    denied: int = 0
+    dispatch_ns: int = 0
+    handler_ns: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "denied": self.denied,
+            "dispatch_ms": self.dispatch_ns / 1e6,
+            "handler_ms": self.handler_ns / 1e6,
+        }
+
+
+@dataclass(frozen=True)
+class AuthorizationTable:
+    """
+    Per-runbook authorization, compiled once from its allowed scopes: every
+    registered action maps to whether it may run, so dispatch is a dict lookup.
+    """
+
+    allowed_scopes: tuple[str, ...] | None
+    allowed_mask: int
+    authorized: dict[str, bool] = field(repr=False)
 
 
 class ActionRegistry:
     def __init__(self) -> None:
         self._actions: dict[str, ActionSpec] = {}
+        self._scopes = ScopeInterner()
+        self._tables: dict[frozenset[str] | None, AuthorizationTable] = {}
+        self._timings: dict[str, ActionTiming] = {}
 
     def register(self, name: str, handler: Callable[[Any], dict[str, Any]], scopes: list[str]) -> None:
-        self._actions[name] = ActionSpec(name=name, handler=handler, scopes=scopes)
+        self._actions[name] = ActionSpec(name=name, handler=handler, scopes=scopes, scope_mask=self._scopes.mask(scopes))
+        self._tables.clear()
+
+    def compile(self, allowed_scopes: Iterable[str] | None) -> AuthorizationTable:
+        """Authorization table for a runbook's allowed scopes (``None`` allows everything), cached per scope set."""
+        key = None if allowed_scopes is None else frozenset(allowed_scopes)
+        table = self._tables.get(key)
+        if table is None:
+            allowed_mask = -1 if key is None else self._scopes.mask(key, intern=False)
+            authorized = {
+                name: not spec.scope_mask or bool(spec.scope_mask & allowed_mask)
+                for name, spec in self._actions.items()
+            }
+            table = AuthorizationTable(
+                allowed_scopes=None if allowed_scopes is None else tuple(allowed_scopes),
+                allowed_mask=allowed_mask,
+                authorized=authorized,
+            )
+            self._tables[key] = table
+        return table
 
-    def execute(self, name: str, args: Any, allowed_scopes: list[str] | None) -> dict[str, Any]:
+    def execute(self, name: str, args: Any, allowed_scopes: list[str] | AuthorizationTable | None) -> dict[str, Any]:
+        started = time.perf_counter_ns()
+        table = allowed_scopes if isinstance(allowed_scopes, AuthorizationTable) else self.compile(allowed_scopes)
         spec = self._actions.get(name)
         if spec is None:
             raise ValueError(f"unsupported action: {name}")
-        if allowed_scopes is not None and spec.scopes:
-            if not any(scope in allowed_scopes for scope in spec.scopes):
-                raise RuntimeSecurityError(
-                    "SCOPE_VIOLATION",
-                    "missing required scope",
-                    {"allowed": allowed_scopes, "required_any_of": spec.scopes},
-                )
-        return spec.handler(args)
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = self._timings[name] = ActionTiming()
+        timing.calls += 1
+        if not table.authorized.get(name, False):
+            timing.denied += 1
+            timing.dispatch_ns += time.perf_counter_ns() - started
+            allowed = None if table.allowed_scopes is None else list(table.allowed_scopes)
+            raise RuntimeSecurityError(
+                "SCOPE_VIOLATION",
+                "missing required scope",
+                {"allowed": allowed, "required_any_of": spec.scopes},
+            )
+        dispatched = time.perf_counter_ns()
+        timing.dispatch_ns += dispatched - started
+        try:
+            return spec.handler(args)
+        finally:
+            timing.handler_ns += time.perf_counter_ns() - dispatched
+
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """Per-action call counts and cumulative dispatch (lookup + authorization) and handler time."""
+        return {name: timing.to_dict() for name, timing in sorted(self._timings.items())}
+
+    def reset_timings(self) -> None:
+        self._timings.clear()
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, Required, When, compile_rules
+
 
 ALLOWED_TASK_STATE = {
     "queued",
@@ -30,74 +32,51 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    task_state = str(bundle.get("task_state", "")).strip()
-    ownership_scope = str(bundle.get("ownership_scope", "")).strip()
-    handoff_evidence_class = str(bundle.get("handoff_evidence_class", "")).strip()
-    verification_required = bundle.get("verification_required")
-    verification_closure_state = str(bundle.get("verification_closure_state", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("runtime_plane_mode", "delegation_lifecycle", "runtime_plane_mode must be delegation_lifecycle"),
+        Equals("line_class", "mandatory_core_absorption_line", "line_class must be mandatory_core_absorption_line"),
+        Required("task_id", "task_id is required"),
+        OneOf("task_state", ALLOWED_TASK_STATE, "task_state is not allowed"),
+        OneOf("ownership_scope", ALLOWED_OWNERSHIP_SCOPE, "ownership_scope is not allowed"),
+        OneOf("handoff_evidence_class", ALLOWED_HANDOFF_EVIDENCE_CLASS, "handoff_evidence_class is not allowed"),
+        OneOf(
+            "verification_closure_state",
+            ALLOWED_VERIFICATION_CLOSURE_STATE,
+            "verification_closure_state is not allowed",
+        ),
+        Flag(
+            "handoff_completion_before_verification_allowed",
+            False,
+            "handoff completion may not precede verification closure",
+        ),
+        Flag("extension_loading_allowed", False, "extension loading is outside delegation lifecycle scope"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+        When(
+            "verification_closure_state",
+            lambda values, bundle: bundle.get("verification_required") is True
+            and values["verification_closure_state"] != "verified",
+            "verification-required task may not complete handoff before verification closure",
+        ),
+        When(
+            "verification_closure_state",
+            lambda values, bundle: bundle.get("verification_required") is False
+            and values["verification_closure_state"] not in {"not_required", "verified"},
+            "verification_closure_state conflicts with verification_required=false",
+        ),
+        When(
+            "handoff_evidence_class",
+            lambda values, bundle: bundle.get("verification_required") is True
+            and values["handoff_evidence_class"] != "verification_record",
+            "verification-required task must hand off a verification_record",
+        ),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "delegation_lifecycle":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be delegation_lifecycle"})
-    if bundle.get("line_class") != "mandatory_core_absorption_line":
-        errors.append({"code": "line_class", "message": "line_class must be mandatory_core_absorption_line"})
-    if not str(bundle.get("task_id", "")).strip():
-        errors.append({"code": "task_id", "message": "task_id is required"})
-    if task_state not in ALLOWED_TASK_STATE:
-        errors.append({"code": "task_state", "message": "task_state is not allowed"})
-    if ownership_scope not in ALLOWED_OWNERSHIP_SCOPE:
-        errors.append({"code": "ownership_scope", "message": "ownership_scope is not allowed"})
-    if handoff_evidence_class not in ALLOWED_HANDOFF_EVIDENCE_CLASS:
-        errors.append({"code": "handoff_evidence_class", "message": "handoff_evidence_class is not allowed"})
-    if verification_closure_state not in ALLOWED_VERIFICATION_CLOSURE_STATE:
-        errors.append({"code": "verification_closure_state", "message": "verification_closure_state is not allowed"})
-    if bundle.get("handoff_completion_before_verification_allowed") is not False:
-        errors.append(
-            {
-                "code": "handoff_completion_before_verification_allowed",
-                "message": "handoff completion may not precede verification closure",
-            }
-        )
-    if bundle.get("extension_loading_allowed") is not False:
-        errors.append(
-            {
-                "code": "extension_loading_allowed",
-                "message": "extension loading is outside delegation lifecycle scope",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
 
-    if verification_required is True and verification_closure_state != "verified":
-        errors.append(
-            {
-                "code": "verification_closure_state",
-                "message": "verification-required task may not complete handoff before verification closure",
-            }
-        )
-    if verification_required is False and verification_closure_state not in {"not_required", "verified"}:
-        errors.append(
-            {
-                "code": "verification_closure_state",
-                "message": "verification_closure_state conflicts with verification_required=false",
-            }
-        )
-    if verification_required is True and handoff_evidence_class != "verification_record":
-        errors.append(
-            {
-                "code": "handoff_evidence_class",
-                "message": "verification-required task must hand off a verification_record",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -107,12 +86,12 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "task_id": str(bundle.get("task_id", "")).strip(),
-            "task_state": task_state,
-            "ownership_scope": ownership_scope,
-            "handoff_evidence_class": handoff_evidence_class,
-            "verification_required": bool(verification_required),
-            "verification_closure_state": verification_closure_state,
+            "task_id": values["task_id"],
+            "task_state": values["task_state"],
+            "ownership_scope": values["ownership_scope"],
+            "handoff_evidence_class": values["handoff_evidence_class"],
+            "verification_required": bool(bundle.get("verification_required")),
+            "verification_closure_state": values["verification_closure_state"],
         },
     }
 
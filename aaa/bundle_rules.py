@@ -0,0 +1,379 @@
+"""Declarative rule tables for the governance bundle validators.
+
+Each runtime module declares its checks as a list of rules and compiles them
+once at import time with ``compile_rules``. Compilation emits a single
+straight-line checker function: every referenced field is resolved once per
+bundle (stripped text, stripped text list, or the raw value), enum sets are
+frozen, and the rules run in declaration order so the emitted ``errors`` keep
+the exact order the hand-written validators produced.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+
+ErrorList = list[dict[str, str]]
+Values = dict[str, Any]
+
+TEXT = "text"
+TEXTS = "texts"
+RAW = "raw"
+
+
+class _Emitter:
+    """Source buffer plus the constants and field locals the generated checker binds."""
+
+    def __init__(self, fields: dict[str, str]):
+        self.fields = fields
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {}
+
+    def const(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def line(self, text: str, indent: int = 1) -> None:
+        self.lines.append("    " * indent + text)
+
+    def error(self, code: str, message: str, indent: int = 2) -> None:
+        self.line(f"append({{'code': {code!r}, 'message': {message!r}}})", indent)
+
+
+class Rule:
+    def needs(self) -> tuple[str, str, Any] | None:
+        """Return ``(field, kind, default)`` for the accessor this rule reads, if any."""
+        return None
+
+    def emit(self, out: _Emitter) -> None:
+        raise NotImplementedError
+
+    def _code(self) -> str:
+        return getattr(self, "code", None) or getattr(self, "field", "")
+
+
+@dataclass(frozen=True)
+class Equals(Rule):
+    """``bundle[field]`` (unstripped) must equal ``expected``."""
+
+    field: str
+    expected: Any
+    message: str
+    code: str | None = None
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if get({self.field!r}) != {out.const(self.expected)}:")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class Flag(Rule):
+    """``bundle[field]`` must be exactly ``True``/``False`` (identity, not truthiness)."""
+
+    field: str
+    expected: bool
+    message: str
+    code: str | None = None
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if get({self.field!r}) is not {bool(self.expected)!r}:")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class Required(Rule):
+    """Stripped text of ``field`` must be non-empty."""
+
+    field: str
+    message: str
+    code: str | None = None
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXT, None)
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if not {out.fields[self.field]}:")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class OneOf(Rule):
+    """Stripped text of ``field`` must be in ``allowed``; ``strip=False`` tests the raw value."""
+
+    field: str
+    allowed: Iterable[Any]
+    message: str
+    code: str | None = None
+    strip: bool = True
+
+    def needs(self) -> tuple[str, str, Any] | None:
+        return (self.field, TEXT, None) if self.strip else None
+
+    def emit(self, out: _Emitter) -> None:
+        value = out.fields[self.field] if self.strip else f"get({self.field!r})"
+        out.line(f"if {value} not in {out.const(frozenset(self.allowed))}:")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class Prefix(Rule):
+    """Stripped text of ``field`` must start with ``prefix``."""
+
+    field: str
+    prefix: str
+    message: str
+    code: str | None = None
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXT, None)
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if not {out.fields[self.field]}.startswith({self.prefix!r}):")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class TypeIs(Rule):
+    """Raw value of ``field`` (``default`` when absent) must be an instance of ``types``."""
+
+    field: str
+    types: type | tuple[type, ...]
+    message: str
+    code: str | None = None
+    default: Any = None
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, RAW, self.default)
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if not isinstance({out.fields[self.field]}, {out.const(self.types)}):")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class ItemsIn(Rule):
+    """Every stripped item of ``field`` must be in ``allowed``, with at least ``min_items`` items."""
+
+    field: str
+    allowed: Iterable[str]
+    message: str
+    code: str | None = None
+    min_items: int = 0
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXTS, None)
+
+    def emit(self, out: _Emitter) -> None:
+        items = out.fields[self.field]
+        allowed = out.const(frozenset(self.allowed))
+        out.line(f"if len({items}) < {int(self.min_items)} or not {allowed}.issuperset({items}):")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class SameSet(Rule):
+    """Stripped items of ``field`` must form exactly the set ``expected``."""
+
+    field: str
+    expected: Iterable[str]
+    message: str
+    code: str | None = None
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXTS, None)
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if {out.const(frozenset(self.expected))} != set({out.fields[self.field]}):")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class SameList(Rule):
+    """Stripped items of ``field`` must equal ``expected`` in order."""
+
+    field: str
+    expected: Iterable[str]
+    message: str
+    code: str | None = None
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXTS, None)
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if {out.fields[self.field]} != {out.const(list(self.expected))}:")
+        out.error(self._code(), self.message)
+
+
+@dataclass(frozen=True)
+class Unknown(Rule):
+    """Report stripped items of ``field`` outside ``allowed`` as ``"<prefix>: a, b"``."""
+
+    field: str
+    allowed: Iterable[str]
+    prefix: str
+    code: str | None = None
+    sort: bool = False
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXTS, None)
+
+    def emit(self, out: _Emitter) -> None:
+        allowed = out.const(frozenset(self.allowed))
+        listed = "sorted(listed)" if self.sort else "listed"
+        out.line(f"listed = [item for item in {out.fields[self.field]} if item not in {allowed}]")
+        out.line("if listed:")
+        out.line(f"append({{'code': {self._code()!r}, 'message': {self.prefix + ': '!r} + ', '.join({listed})}})", 2)
+
+
+@dataclass(frozen=True)
+class Missing(Rule):
+    """Report items of ``required`` absent from ``field`` as ``"<prefix>: a, b"``.
+
+    ``required`` keeps its declaration order unless ``sort`` is set.
+    """
+
+    field: str
+    required: Iterable[str]
+    prefix: str
+    code: str | None = None
+    sort: bool = False
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, TEXTS, None)
+
+    def emit(self, out: _Emitter) -> None:
+        required = out.const(tuple(sorted(self.required)) if self.sort else tuple(self.required))
+        out.line(f"listed = [item for item in {required} if item not in {out.fields[self.field]}]")
+        out.line("if listed:")
+        out.line(f"append({{'code': {self._code()!r}, 'message': {self.prefix + ': '!r} + ', '.join(listed)}})", 2)
+
+
+@dataclass(frozen=True)
+class ArrayOf(Rule):
+    """Raw ``field`` must be a list of at least ``min_items`` items.
+
+    When ``allowed`` is given, every stripped item must also belong to it;
+    that failure reports ``invalid_message`` under the same code.
+    """
+
+    field: str
+    message: str
+    allowed: Iterable[str] | None = None
+    invalid_message: str = ""
+    code: str | None = None
+    min_items: int = 1
+
+    def needs(self) -> tuple[str, str, Any]:
+        return (self.field, RAW, [])
+
+    def emit(self, out: _Emitter) -> None:
+        items = out.fields[self.field]
+        out.line(f"if not isinstance({items}, list) or len({items}) < {int(self.min_items)}:")
+        out.error(self._code(), self.message)
+        if self.allowed is not None:
+            allowed = out.const(frozenset(self.allowed))
+            out.line(f"elif any(str(item).strip() not in {allowed} for item in {items}):")
+            out.error(self._code(), self.invalid_message)
+
+
+@dataclass(frozen=True)
+class When(Rule):
+    """Cross-field rule: report ``code``/``message`` when ``violated(values, bundle)`` is true.
+
+    ``fields`` lists ``(field, kind)`` or ``(field, kind, default)`` accessors
+    the predicate reads from ``values``.
+    """
+
+    code: str
+    violated: Callable[[Values, dict[str, Any]], bool]
+    message: str
+    fields: tuple[tuple[Any, ...], ...] = ()
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"if {out.const(self.violated)}(values, bundle):")
+        out.error(self.code, self.message)
+
+
+@dataclass(frozen=True)
+class Custom(Rule):
+    """Escape hatch for structural checks (nested models, derived sub-bundles).
+
+    ``run(bundle, values, errors)`` appends any number of errors itself.
+    """
+
+    run: Callable[[dict[str, Any], Values, ErrorList], None]
+    fields: tuple[tuple[Any, ...], ...] = ()
+
+    def emit(self, out: _Emitter) -> None:
+        out.line(f"{out.const(self.run)}(bundle, values, errors)")
+
+
+class CompiledRules:
+    """A compiled rule table; ``check(bundle)`` returns ``(errors, values)``."""
+
+    def __init__(self, check: Callable[[dict[str, Any]], tuple[ErrorList, Values]], source: str, size: int):
+        self.check = check
+        self.source = source
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _accessor_source(field: str, kind: str, default: Any, out: _Emitter) -> str:
+    if kind == TEXT:
+        return f"str(get({field!r}, '')).strip()"
+    if kind == TEXTS:
+        return f"[str(item).strip() for item in get({field!r}, [])]"
+    if kind == RAW:
+        # Empty list/dict defaults are emitted as literals so each call gets a
+        # fresh object, exactly like ``bundle.get(field, [])``.
+        if default is None or (type(default) in (list, dict) and not default):
+            return f"get({field!r}, {default!r})"
+        return f"get({field!r}, {out.const(default)})"
+    raise ValueError(f"unknown accessor kind: {kind}")
+
+
+def compile_rules(rules: Iterable[Rule], fields: Iterable[tuple[Any, ...]] = ()) -> CompiledRules:
+    """Compile ``rules`` into a checker.
+
+    ``fields`` declares extra ``(field, kind[, default])`` accessors whose
+    values callers read back (e.g. for ``derived_results``). Accessors are
+    evaluated in declaration order, extra fields first.
+    """
+    rules = list(rules)
+    declared: dict[str, tuple[str, Any]] = {}
+
+    def declare(spec: tuple[Any, ...]) -> None:
+        field, kind = spec[0], spec[1]
+        default = spec[2] if len(spec) > 2 else None
+        existing = declared.get(field)
+        if existing is not None and existing != (kind, default):
+            raise ValueError(f"field {field!r} declared as both {existing[0]} and {kind}")
+        declared[field] = (kind, default)
+
+    for spec in fields:
+        declare(spec)
+    for rule in rules:
+        for spec in getattr(rule, "fields", ()):
+            declare(spec)
+        need = rule.needs()
+        if need is not None:
+            declare(need)
+
+    out = _Emitter({field: f"v{index}" for index, field in enumerate(declared)})
+    out.line("get = bundle.get")
+    for field, (kind, default) in declared.items():
+        out.line(f"{out.fields[field]} = {_accessor_source(field, kind, default, out)}")
+    entries = ", ".join(f"{field!r}: {name}" for field, name in out.fields.items())
+    out.line(f"values = {{{entries}}}")
+    out.line("errors = []")
+    out.line("append = errors.append")
+    for rule in rules:
+        rule.emit(out)
+    out.line("return errors, values")
+
+    source = "def check(bundle):\n" + "\n".join(out.lines) + "\n"
+    namespace = dict(out.namespace)
+    exec(compile(source, "<bundle_rules>", "exec"), namespace)
+    return CompiledRules(namespace["check"], source, len(rules))
@@ -8,6 +8,7 @@ from aaa.registry.policy_client import RegistryClient, RegistryClientError
 from aaa.engine.repair import AutoFixEngine
 
 from .cmd import verify_ci
+from .jsonl import JsonlEventSink, active_sink
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -20,6 +21,7 @@ CHECKS = [
     "orphaned_assets",
     "test_policy_compliance",
 ]
+CHECK_EVENT_COMMAND = "aaa check"
 
 
 def _load_repo_type(repo_root: Path) -> str:
@@ -33,7 +35,7 @@ def _load_repo_type(repo_root: Path) -> str:
     return str(payload.get("repo_type") or "").strip()
 
 
-def _run_repo_checks(repo_root: Path) -> list[str]:
+def _run_repo_checks(repo_root: Path, sink: Optional[JsonlEventSink] = None) -> list[str]:
     evals_root = Path(os.environ.get("AAA_EVALS_ROOT", REPO_ROOT.parent / "aaa-evals"))
     runner = evals_root / "runner" / "run_repo_checks.py"
     errors: list[str] = []
@@ -59,51 +61,71 @@ def _run_repo_checks(repo_root: Path) -> list[str]:
         except json.JSONDecodeError:
             payload = {"pass": False, "details": ["invalid_json_output"]}
             
-        if run_result.returncode != 0 or payload.get("pass") is not True:
+        passed = run_result.returncode == 0 and payload.get("pass") is True
+        if sink is not None:
+            sink.emit(
+                event="result",
+                status="ok" if passed else "error",
+                command=CHECK_EVENT_COMMAND,
+                step_id=check,
+                data={"repo": str(repo_root), "pass": passed},
+            )
+        if not passed:
             err_id = f"check_failed:{check}"
             errors.append(err_id)
             details_map[err_id] = payload.get("details", [])
     return errors, details_map
 
 
+def _add_license_section(text: str) -> str:
+    return text + "\n\n## License\nMIT"
+
+
+# (check id, relative path, needs fix?, fixer). All fixes for a run are
+# applied as one AutoFixEngine transaction.
+FIXABLE_CHECKS = [
+    ("missing_license_section", "README.md", lambda text: "License" not in text, _add_license_section),
+]
+
+
 def _run_fixable_checks(repo_root: Path, auto_fix: bool) -> tuple[list[str], dict[str, Any]]:
     """
-    Demonstration of Self-Healing Loop:
-    1. Check for 'License' in README.md.
-    2. If missing and auto_fix=True, use AutoFixEngine to append it.
+    Self-Healing Loop:
+    1. Run every FIXABLE_CHECKS entry against its file.
+    2. If auto_fix=True, apply all needed fixes with AutoFixEngine as one
+       transaction (all files fixed, or none).
     """
     errors = []
     details = {}
-    readme = repo_root / "README.md"
-    
-    if readme.exists():
-        content = readme.read_text(encoding="utf-8")
-        if "License" not in content:
-            if auto_fix:
-                print("🛠️  Auto-Fixing: Adding License section to README.md...")
-                engine = AutoFixEngine()
-                
-                def add_license(text: str) -> str:
-                    return text + "\n\n## License\nMIT"
-                    
-                result = engine.apply_fix(readme, add_license)
-                if result.success:
-                     print(f"✅ Fix Applied: {result.message}")
-                else:
-                     errors.append("autofix_failed")
-                     details["autofix_failed"] = [result.message]
-            else:
-                 # Only report error if not fixing
-                 # However, to avoid noise in this MVP, we might only warn.
-                 # For demonstration, we'll flag it.
-                 pass
-                 # errors.append("missing_license_section")
-                 # details["missing_license_section"] = ["README.md missing 'License' section. Run with --auto-fix to repair."]
-    
+    plan = []
+    fixed_checks = []
+
+    for check_id, rel_path, needs_fix, fixer in FIXABLE_CHECKS:
+        path = repo_root / rel_path
+        if not path.exists() or not needs_fix(path.read_text(encoding="utf-8")):
+            continue
+        # To avoid noise in this MVP, unfixed findings are not reported as errors.
+        if auto_fix:
+            print(f"🛠️  Auto-Fixing: {check_id} ({rel_path})...")
+            plan.append((path, fixer))
+            fixed_checks.append(check_id)
+
+    if plan:
+        result = AutoFixEngine().apply_fixes(plan)
+        if result.success:
+            print(f"✅ Fix Applied: {result.message} ({', '.join(fixed_checks)})")
+        else:
+            errors.append("autofix_failed")
+            details["autofix_failed"] = [f"{path}: {r.message}" for path, r in result.results.items()]
+
     return errors, details
 
 
-def run_blocking_check(repo_root: Path, auto_fix: bool = False) -> dict[str, Any]:
+def run_blocking_check(
+    repo_root: Path,
+    auto_fix: bool = False,
+    sink: Optional[JsonlEventSink] = None,
+) -> dict[str, Any]:
     workflow_ref = os.environ.get("AAA_GATE_WORKFLOW", DEFAULT_GATE)
     errors: list[str] = []
     details_map: dict[str, Any] = {}
@@ -113,7 +135,7 @@ def run_blocking_check(repo_root: Path, auto_fix: bool = False) -> dict[str, Any
         details_map["missing_gate_workflow"] = [f"Expected gate workflow {workflow_ref} not found in .github/workflows/"]
 
     # 1. Run Standard Checks
-    check_errors, check_details = _run_repo_checks(repo_root)
+    check_errors, check_details = _run_repo_checks(repo_root, sink=sink or active_sink())
     errors.extend(check_errors)
     details_map.update(check_details)
     
@@ -1,5 +1,6 @@
 import argparse
 import json
+import os
 import shutil
 import sys
 from importlib import metadata
@@ -19,14 +20,18 @@ from . import pack_commands
 from . import package_commands
 from . import bootstrap_commands
 from . import outside_in_validation_and_evidence_promotion_baseline
+from . import governance_client
 from . import governance_commands
+from . import governance_daemon
 from . import runbook_registry
 from . import runbook_runtime
 from .utils import version_check
 from . import outdated as outdated_commands
 from . import outdated as outdated_commands
 from .action_registry import RuntimeSecurityError
+from .jsonl import jsonl_session
 from .cmd import registry_commands
+from .registry.policy_client import DEFAULT_POLICY_REGISTRY_URL, POLICY_REGISTRY_ENV, default_policy_registry_url
 
 if typer:
     app = typer.Typer(no_args_is_help=True)
@@ -84,6 +89,7 @@ def run_runbook_impl(
     json_output: bool = False,
     runbook_file: str | None = None,
     output_format: str = "human",
+    jsonl_file: str | None = None,
 ) -> int:
     def _format_error_details(details: object) -> list[str]:
         if details is None:
@@ -102,7 +108,8 @@ def run_runbook_impl(
             if not spec:
                 raise runbook_registry.RunbookError("runbook spec is required")
             path, payload = runbook_registry.resolve_runbook(spec, REPO_ROOT)
-        result = runbook_runtime.execute_runbook(payload, _parse_inputs(inputs))
+        with jsonl_session(jsonl_file is not None, Path(jsonl_file) if jsonl_file else None):
+            result = runbook_runtime.execute_runbook(payload, _parse_inputs(inputs))
         response = {"status": "ok", "result": result}
         exit_code = 0
     except runbook_registry.RunbookError as exc:
@@ -176,6 +183,8 @@ if typer:
     lock_typer = lock_commands.app
     from .cmd import observability_commands
     observability_typer = observability_commands.app
+    from .cmd import policy_commands
+    policy_typer = policy_commands.app
 
     @run_typer.command("runbook")
     def run_runbook(
@@ -184,6 +193,7 @@ if typer:
         json_output: bool = typer.Option(False, "--json", help="Output JSON result (Legacy)"),
         output_format: str = typer.Option("human", "--format", help="human|json|llm"),
         runbook_file: Path | None = typer.Option(None, "--runbook-file", help="Runbook JSON file"),
+        jsonl_file: Path | None = typer.Option(None, "--jsonl-file", help="Append per-step JSONL events to this file"),
     ):
         """Run a runbook by id@version."""
         exit_code = run_runbook_impl(
@@ -192,6 +202,7 @@ if typer:
             json_output=json_output,
             runbook_file=str(runbook_file) if runbook_file else None,
             output_format=output_format,
+            jsonl_file=str(jsonl_file) if jsonl_file else None,
         )
         if exit_code:
             raise typer.Exit(code=exit_code)
@@ -806,6 +817,61 @@ if typer:
         if not payload["valid"]:
             raise typer.Exit(code=2)
 
+    @governance_typer.command("validate-batch")
+    def governance_validate_batch(
+        inputs: list[str] = typer.Argument(..., help="Bundle directories, files, globs, .jsonl streams, or - for stdin"),
+        workers: int | None = typer.Option(None, "--workers", help="Worker processes (default: CPU count, 1 = in-process)"),
+        chunksize: int = typer.Option(32, "--chunksize", help="Bundles per worker task"),
+        output_format: str = typer.Option("json", "--format", help="json|human"),
+    ):
+        """Validate many governance bundles, routing each to its validator by runtime_plane_mode/command_id."""
+        summary: dict = {}
+        for payload in governance_commands.validate_batch_cli(inputs=inputs, workers=workers, chunksize=chunksize):
+            if payload["event"] == "summary":
+                summary = payload
+            if output_format == "json":
+                typer.echo(json.dumps(payload, ensure_ascii=True))
+            elif payload["event"] == "result":
+                codes = ",".join(payload["error_codes"])
+                typer.echo(f"{'ok' if payload['valid'] else 'error'} {payload['source']} {payload['validator'] or '-'} {codes}".rstrip())
+            else:
+                typer.echo(
+                    f"total={payload['total']} valid={payload['valid_count']} invalid={payload['invalid_count']} "
+                    f"unroutable={payload['unroutable_count']} elapsed={payload['elapsed_seconds']}s"
+                )
+        if not summary.get("valid"):
+            raise typer.Exit(code=2)
+
+    @governance_typer.command("serve")
+    def governance_serve(
+        socket_path: str | None = typer.Option(
+            None,
+            "--socket",
+            help=f"Unix socket path (default: ${governance_client.SOCKET_ENV} or a per-user runtime path)",
+        ),
+        status: bool = typer.Option(False, "--status", help="Print a running daemon's stats and exit"),
+        stop: bool = typer.Option(False, "--stop", help="Stop a running daemon"),
+    ):
+        """Serve governance validation over a Unix socket from warm, preloaded validators."""
+        path = socket_path or governance_client.default_socket_path()
+        if status or stop:
+            response = governance_daemon.control("shutdown" if stop else "stats", path)
+            if response is None:
+                typer.echo(json.dumps({"running": False, "socket": path}, ensure_ascii=True))
+                raise typer.Exit(code=1)
+            typer.echo(json.dumps({"running": not stop, "socket": path, **response}, ensure_ascii=True))
+            return
+        try:
+            governance_daemon.serve(
+                path,
+                on_ready=lambda server: typer.echo(
+                    json.dumps({"event": "listening", "socket": path, "pid": os.getpid()}, ensure_ascii=True)
+                ),
+            )
+        except RuntimeError as exc:
+            typer.echo(str(exc), err=True)
+            raise typer.Exit(code=1)
+
     @ops_typer.command("render-dashboard")
     def ops_render_dashboard(
         input_path: Path = typer.Option(..., "--input", help="Input JSON file"),
@@ -814,8 +880,12 @@ if typer:
         threshold: float = typer.Option(0.8, "--threshold", help="Compliance threshold"),
         drift_threshold: float = typer.Option(0.05, "--drift-threshold", help="Drift rate threshold"),
         health_threshold: float = typer.Option(0.9, "--health-threshold", help="Repo health threshold"),
+        page_size: int = typer.Option(0, "--page-size", help="Paginate the HTML repo table (0 = single page)"),
+        history_window: int = typer.Option(90, "--history-window", help="Trend points exported to the dashboard"),
+        history_max_points: int = typer.Option(0, "--history-max-points", help="Cap on retained history points (0 = unlimited)"),
     ):
         """Render governance dashboard outputs."""
+        from aaa.ops.dashboard_history import HistoryRetention
         from aaa.ops.render_dashboard import render_dashboard
 
         compliance_rate, metrics = render_dashboard(
@@ -827,6 +897,9 @@ if typer:
                 "drift": drift_threshold,
                 "health": health_threshold,
             },
+            page_size=page_size,
+            history_window=history_window,
+            retention=HistoryRetention(max_points=history_max_points),
         )
         drift_rate = metrics.get("drift_rate", 0.0)
         repo_health = metrics.get("repo_health", 1.0)
@@ -1078,8 +1151,9 @@ if typer:
         mode: str = typer.Option("blocking", "--mode", help="blocking"),
         output_format: str = typer.Option("human", "--format", help="human|json|llm"),
         remote: Optional[str] = typer.Option(None, "--remote", help="Remote Policy ID to run"),
-        registry: str = typer.Option("file:///Users/imac/Documents/Code/AI-Lotto/AAA_WORKSPACE/aaa-policies", "--registry", help="Registry URL"),
+        registry: str = typer.Option(DEFAULT_POLICY_REGISTRY_URL, "--registry", envvar=POLICY_REGISTRY_ENV, help="Registry URL"),
         auto_fix: bool = typer.Option(False, "--auto-fix", help="Attempt to automatically fix violations"),
+        jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Append per-check JSONL events to this file"),
     ):
         """Run governance checks (local or remote)."""
         print(f"DEBUG: CLI check called. Mode={mode}, AutoFix={auto_fix}")
@@ -1088,7 +1162,8 @@ if typer:
             raw_result = check_commands.run_remote_policy(remote, registry)
         elif mode == "blocking":
             # Normal Blocking Mode
-            raw_result = check_commands.run_blocking_check(Path.cwd(), auto_fix=auto_fix)
+            with jsonl_session(jsonl_file is not None, jsonl_file):
+                raw_result = check_commands.run_blocking_check(Path.cwd(), auto_fix=auto_fix)
         else:
             raise typer.Exit(code=2)
         semantic_result = output_formatter.enrich_result("check", raw_result)
@@ -1109,9 +1184,15 @@ if typer:
 
 if typer:
     @app.command("outdated")
-    def outdated(json_output: bool = typer.Option(False, "--json", help="Output JSON report")):
+    def outdated(
+        json_output: bool = typer.Option(False, "--json", help="Output JSON report"),
+        max_age: Optional[float] = typer.Option(
+            None, "--max-age", help="Seconds a cached registry index is used without revalidation (default: AAA_REGISTRY_MAX_AGE or 3600)"
+        ),
+        refresh: bool = typer.Option(False, "--refresh", help="Revalidate the cached registry index now"),
+    ):
         """Report outdated AAA components."""
-        report = outdated_commands.build_outdated_report(Path.cwd())
+        report = outdated_commands.build_outdated_report(Path.cwd(), max_age=0 if refresh else max_age)
         if json_output:
             typer.echo(json.dumps(report, ensure_ascii=True, indent=2))
             return
@@ -1140,6 +1221,7 @@ if typer:
     app.add_typer(registry_typer, name="registry")
     app.add_typer(lock_typer, name="lock")
     app.add_typer(observability_typer, name="observe")
+    app.add_typer(policy_typer, name="policy")
     app.add_typer(court_commands.app, name="court", help="Supreme Court Interface (v1.9)")
     
     # v2.0 Agent OS
@@ -1147,6 +1229,7 @@ if typer:
     app.add_typer(os_commands.app, name="os", help="Agent OS Kernel (v2.0)")
     app.add_typer(os_commands.trust_app, name="trust", help="Global Trust Network")
     app.add_typer(os_commands.cert_app, name="cert", help="Enterprise Certification")
+    app.add_typer(os_commands.revocation_app, name="revocation", help="Agent Kill-Switch Revocation Lists")
 
 
 def _run_fallback() -> int:
@@ -1187,6 +1270,9 @@ def _run_fallback() -> int:
     render_parser.add_argument("--threshold", type=float, default=0.8)
     render_parser.add_argument("--drift-threshold", type=float, default=0.05)
     render_parser.add_argument("--health-threshold", type=float, default=0.9)
+    render_parser.add_argument("--page-size", type=int, default=0)
+    render_parser.add_argument("--history-window", type=int, default=90)
+    render_parser.add_argument("--history-max-points", type=int, default=0)
 
     ensure_parser = init_sub.add_parser("ensure-repos")
     ensure_parser.add_argument("--org", required=True)
@@ -1255,7 +1341,7 @@ def _run_fallback() -> int:
     check_parser.add_argument("--mode", default="blocking")
     check_parser.add_argument("--format", dest="output_format", default="human", help="human|json|llm")
     check_parser.add_argument("--remote", help="Remote Policy ID")
-    check_parser.add_argument("--registry", default="file:///Users/imac/Documents/Code/AI-Lotto/AAA_WORKSPACE/aaa-policies")
+    check_parser.add_argument("--registry", default=default_policy_registry_url())
     check_parser.add_argument("--auto-fix", action="store_true")
 
     governance_parser = subparsers.add_parser("governance")
@@ -1434,6 +1520,7 @@ def _run_fallback() -> int:
 
     if args.command == "ops":
         if args.ops_command == "render-dashboard":
+            from aaa.ops.dashboard_history import HistoryRetention
             from aaa.ops.render_dashboard import render_dashboard
 
             compliance_rate, metrics = render_dashboard(
@@ -1445,6 +1532,9 @@ def _run_fallback() -> int:
                     "drift": args.drift_threshold,
                     "health": args.health_threshold,
                 },
+                page_size=args.page_size,
+                history_window=args.history_window,
+                retention=HistoryRetention(max_points=args.history_max_points),
             )
             drift_rate = metrics.get("drift_rate", 0.0)
             repo_health = metrics.get("repo_health", 1.0)
@@ -1,6 +1,8 @@
 import typer
 from rich.console import Console
 from pathlib import Path
+from typing import List, Optional
+from aaa.engine.revocation import RevocationChecker, sync_revocations
 from aaa.os.kernel import AgentKernel
 from aaa.trust.verifier import TrustVerifier
 
@@ -8,18 +10,23 @@ app = typer.Typer(no_args_is_help=True)
 console = Console()
 
 @app.command("boot")
-def boot_kernel():
+def boot_kernel(
+    warm: bool = typer.Option(False, "--warm", help="Initialize every subsystem now (for long-running agents)"),
+):
     """Initialize the Agent OS Kernel."""
-    kernel = AgentKernel(Path.cwd())
+    kernel = AgentKernel(Path.cwd(), warm=warm)
     status = kernel.boot()
     
-    console.print("[bold green]Agent OS Kernel Booted.[/bold green]")
+    if status["status"] == "ONLINE":
+        console.print("[bold green]Agent OS Kernel Booted.[/bold green]")
+    else:
+        console.print(f"[bold yellow]Agent OS Kernel Booted ({status['status']}).[/bold yellow]")
     console.print_json(data=status)
 
 @app.command("status")
 def system_status():
     """Show OS Status."""
-    boot_kernel()
+    boot_kernel(warm=False)
 
 # Trust Sub-commands
 trust_app = typer.Typer(no_args_is_help=True)
@@ -44,3 +51,33 @@ def cert_status():
     verifier = TrustVerifier(Path.cwd())
     status = verifier.get_certification_status(Path.cwd())
     console.print_json(data=status)
+
+# Revocation Sub-commands
+revocation_app = typer.Typer(no_args_is_help=True)
+app.add_typer(revocation_app, name="revocation")
+
+@revocation_app.command("sync")
+def sync_revocation_lists(
+    sources: List[str] = typer.Argument(..., help="Remote revocation lists (path, file:// or https:// URL)"),
+    revocation_file: str = typer.Option(".aaa/revocation.json", "--file", help="Local revocation list"),
+    index_file: Optional[str] = typer.Option(None, "--index", help="Also write a compact sorted index here"),
+):
+    """Merge remote revocation lists into the local kill-switch list (atomic)."""
+    try:
+        result = sync_revocations(revocation_file, sources, index_file=index_file)
+    except Exception as e:
+        console.print(f"[red]SYNC FAILED[/red]: {e} (local list unchanged)")
+        raise typer.Exit(code=1)
+    console.print_json(data=result)
+
+@revocation_app.command("check")
+def check_revocation(
+    agent_id: str,
+    revocation_file: str = typer.Option(".aaa/revocation.json", "--file", help="Local revocation list"),
+    index_file: Optional[str] = typer.Option(None, "--index", help="Use a compact sorted index instead"),
+):
+    """Check whether an agent is revoked."""
+    if RevocationChecker(revocation_file, index_file=index_file).is_revoked(agent_id):
+        console.print(f"[red]REVOKED[/red]: {agent_id}")
+        raise typer.Exit(code=1)
+    console.print(f"[green]ACTIVE[/green]: {agent_id}")
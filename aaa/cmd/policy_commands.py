@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from aaa.compiler.parser import CompilerError, Parser
+from aaa.compiler.workspace import evaluate_workspace
+from aaa.registry.policy_client import (
+    DEFAULT_POLICY_REGISTRY_URL,
+    POLICY_REGISTRY_ENV,
+    RegistryClient,
+    RegistryClientError,
+)
+
+app = typer.Typer(no_args_is_help=True)
+
+
+def _read_repo_list(path: Path) -> List[str]:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+@app.command("matrix")
+def policy_matrix(
+    policies: List[Path] = typer.Argument(..., help="Policy YAML/JSON files"),
+    repos: Optional[List[str]] = typer.Option(None, "--repo", help="Repo root (repeatable)"),
+    repos_file: Optional[Path] = typer.Option(None, "--repos-file", help="File with one repo root per line"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Worker processes (default: CPU count)"),
+    json_out: Optional[Path] = typer.Option(None, "--json-out", help="Write the full JSON matrix here"),
+    csv_out: Optional[Path] = typer.Option(None, "--csv-out", help="Write the repo x rule CSV here"),
+):
+    """Evaluate policies across many repos into a repo x rule violations matrix."""
+    roots = list(repos or [])
+    if repos_file:
+        roots.extend(_read_repo_list(repos_file))
+    if not roots:
+        typer.echo("❌ No repos given (use --repo or --repos-file)", err=True)
+        raise typer.Exit(code=2)
+    try:
+        loaded = [Parser.load(path) for path in policies]
+        matrix = evaluate_workspace(loaded, roots, workers=workers)
+    except CompilerError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(code=2)
+
+    payload = matrix.to_dict()
+    if json_out:
+        json_out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if csv_out:
+        csv_out.write_text(matrix.to_csv(), encoding="utf-8")
+    if json_out or csv_out:
+        typer.echo(json.dumps(payload["summary"], indent=2))
+    else:
+        typer.echo(json.dumps(payload, indent=2))
+    if not matrix.valid:
+        raise typer.Exit(code=1)
+
+
+@app.command("prefetch")
+def policy_prefetch(
+    specs: Optional[List[str]] = typer.Argument(None, help="Policies as id or id@version"),
+    registry: str = typer.Option(DEFAULT_POLICY_REGISTRY_URL, "--registry", envvar=POLICY_REGISTRY_ENV, help="Registry URL"),
+    all_policies: bool = typer.Option(False, "--all", help="Prefetch the latest version of every policy"),
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Policy store (default: ~/.aaa/cache)"),
+    workers: int = typer.Option(8, "--workers", help="Parallel fetches"),
+):
+    """Warm the local policy store so `aaa check --remote` runs offline."""
+    try:
+        client = RegistryClient(registry, cache_dir=cache_dir)
+        targets = list(specs or [])
+        if all_policies:
+            targets.extend(sorted(client.fetch_manifest().policies))
+        if not targets:
+            typer.echo("❌ No policies given (pass specs or --all)", err=True)
+            raise typer.Exit(code=2)
+        results = client.prefetch(targets, workers=workers)
+    except RegistryClientError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(code=1)
+
+    for result in results:
+        if result["status"] == "error":
+            typer.echo(f"❌ {result['spec']}: {result['error']}")
+        else:
+            typer.echo(f"{'🟢' if result['status'] == 'cached' else '⬇️ '} {result['policy']}@{result['version']} -> {result['path']}")
+    if any(result["status"] == "error" for result in results):
+        raise typer.Exit(code=1)
@@ -0,0 +1,134 @@
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
+
+from .parser import CompilerError
+from .schema import CheckType, Policy, Rule
+
+
+@dataclass
+class RulePlan:
+    """A rule with everything it needs precomputed (compiled pattern, split key path)."""
+
+    index: int
+    rule: Rule
+    pattern: Optional[Pattern[str]] = None
+    keys: Tuple[str, ...] = ()
+
+    @property
+    def check(self):
+        return self.rule.check
+
+    def violation(self) -> Dict[str, str]:
+        check = self.check
+        if check.type == CheckType.FILE_EXISTS:
+            message = f"File not found: {check.path}"
+        elif check.type == CheckType.CONTENT_CONTAINS:
+            message = f"File {check.path} missing pattern: {check.pattern}"
+        else:
+            message = f"JSON {check.path} key {check.key_path} != {check.expected_value!r}"
+        return {"id": self.rule.id, "severity": self.rule.severity.value, "message": message}
+
+
+@dataclass
+class FileGroup:
+    """All rules targeting one file; the file is stat'ed, read and JSON-parsed at most once."""
+
+    path: str
+    rules: List[RulePlan] = field(default_factory=list)
+
+    @property
+    def needs_text(self) -> bool:
+        return any(plan.check.type == CheckType.CONTENT_CONTAINS for plan in self.rules)
+
+    @property
+    def needs_json(self) -> bool:
+        return any(plan.check.type == CheckType.JSON_MATCH for plan in self.rules)
+
+
+def plan_policy(policy: Policy) -> List[FileGroup]:
+    """
+    Group a policy's rules by target file, in first-seen order, precompiling
+    every content pattern. Shared by the in-process evaluator and the generator.
+    """
+    groups: Dict[str, FileGroup] = {}
+    for index, rule in enumerate(policy.rules):
+        check = rule.check
+        plan = RulePlan(index=index, rule=rule)
+        if check.type == CheckType.CONTENT_CONTAINS:
+            try:
+                plan.pattern = re.compile(check.pattern)
+            except re.error as e:
+                raise CompilerError(f"Rule {rule.id}: invalid pattern {check.pattern!r}: {e}")
+        elif check.type == CheckType.JSON_MATCH:
+            plan.keys = tuple(check.key_path.split("."))
+        groups.setdefault(check.path, FileGroup(path=check.path)).rules.append(plan)
+    return list(groups.values())
+
+
+_INVALID = object()
+
+
+def json_value(data: Any, keys: Tuple[str, ...]) -> Any:
+    """Walk ``keys`` through nested dicts; ``_INVALID`` when a non-dict is hit."""
+    value = data
+    for key in keys:
+        if not isinstance(value, dict):
+            return _INVALID
+        value = value.get(key)
+    return value
+
+
+def load_target(path: Path, needs_text: bool, needs_json: bool) -> Tuple[bool, Optional[str], Any]:
+    """Stat, read and JSON-parse ``path`` once; returns ``(exists, text, data)``."""
+    exists = path.exists()
+    text = path.read_text(encoding="utf-8") if exists and needs_text else None
+    data: Any = _INVALID
+    if exists and needs_json:
+        try:
+            data = json.loads(text if text is not None else path.read_text(encoding="utf-8"))
+        except Exception:
+            data = _INVALID
+    return exists, text, data
+
+
+def check_rule(plan: RulePlan, exists: bool, text: Optional[str], data: Any) -> bool:
+    """True when ``plan``'s rule passes against the loaded file state."""
+    check_type = plan.check.type
+    if check_type == CheckType.FILE_EXISTS:
+        return exists
+    if check_type == CheckType.CONTENT_CONTAINS:
+        return text is not None and plan.pattern.search(text) is not None
+    if data is _INVALID:
+        return False
+    value = json_value(data, plan.keys)
+    return value is not _INVALID and value == plan.check.expected_value
+
+
+class PolicyEvaluator:
+    """
+    Runs a compiled Policy in-process against a workspace root, without
+    generating and spawning a check script. Violations are reported in rule
+    order with the same ids, severities and messages as the generated script.
+    """
+
+    def __init__(self, policy: Policy):
+        self.policy = policy
+        self.groups = plan_policy(policy)
+
+    def evaluate(self, root: Union[str, Path] = ".") -> List[Dict[str, str]]:
+        root = Path(root)
+        violations: List[Tuple[int, Dict[str, str]]] = []
+        for group in self.groups:
+            exists, text, data = load_target(root / group.path, group.needs_text, group.needs_json)
+            for plan in group.rules:
+                if not check_rule(plan, exists, text, data):
+                    violations.append((plan.index, plan.violation()))
+        violations.sort(key=lambda item: item[0])
+        return [violation for _, violation in violations]
+
+
+def evaluate_policy(policy: Policy, root: Union[str, Path] = ".") -> List[Dict[str, str]]:
+    return PolicyEvaluator(policy).evaluate(root)
@@ -1,15 +1,21 @@
-from .schema import Policy, Rule, CheckType
+from .schema import Policy, CheckType
+from .evaluator import FileGroup, RulePlan, plan_policy
 from typing import List
 
 class Generator:
     """
     Compiles a Policy object into a standard Python check script.
+
+    Rules are grouped by target file so the script stats, reads and
+    JSON-parses each file once; content patterns are compiled at import.
+    Violations are still reported in rule order.
     """
-    
+
     @staticmethod
     def generate(policy: Policy) -> str:
+        groups = plan_policy(policy)
         lines = []
-        lines.append(f"# Generated by AAA Governance Compiler v1.3")
+        lines.append(f"# Generated by AAA Governance Compiler v1.4")
         lines.append(f"# Policy: {policy.metadata.name} (v{policy.metadata.version})")
         lines.append("import sys")
         lines.append("from pathlib import Path")
@@ -18,16 +24,22 @@ class Generator:
         lines.append("")
         lines.append("# --- Helper Functions ---")
         lines.append(Generator._get_helpers())
-        lines.append("")
+        patterns = [plan for group in groups for plan in group.rules if plan.pattern is not None]
+        if patterns:
+            lines.append("# --- Precompiled Patterns ---")
+            for plan in sorted(patterns, key=lambda plan: plan.index):
+                lines.append(f"PATTERN_{plan.index} = re.compile({plan.pattern.pattern!r})")
+            lines.append("")
         lines.append("def main():")
         lines.append("    violations = []")
-        lines.append(f"    print('Running Policy: {policy.metadata.name}')")
-        
-        for rule in policy.rules:
-            lines.append(f"    # Rule: {rule.id}")
-            lines.append(Generator._generate_check_logic(rule))
-            
+        lines.append(f"    print({'Running Policy: ' + policy.metadata.name!r})")
+
+        for group in groups:
+            lines.append("")
+            lines.append(Generator._generate_group_logic(group))
+
         lines.append("")
+        lines.append("    violations = [v for _, v in sorted(violations, key=lambda item: item[0])]")
         lines.append("    if violations:")
         lines.append("        print('\\n❌ Policy Violations Found:')")
         lines.append("        for v in violations:")
@@ -39,54 +51,60 @@ class Generator:
         lines.append("")
         lines.append("if __name__ == '__main__':")
         lines.append("    main()")
-        
+
         return "\n".join(lines)
 
     @staticmethod
     def _get_helpers() -> str:
         return """
-def check_file_exists(path: str) -> bool:
-    return Path(path).exists()
-
-def check_content_contains(path: str, pattern: str) -> bool:
-    p = Path(path)
-    if not p.exists(): return False
-    content = p.read_text(encoding='utf-8')
-    return re.search(pattern, content) is not None
+INVALID = object()
 
-def check_json_match(path: str, key_path: str, expected) -> bool:
-    p = Path(path)
-    if not p.exists(): return False
+def read_json(path: Path, text):
     try:
-        data = json.loads(p.read_text(encoding='utf-8'))
-        keys = key_path.split('.')
-        val = data
-        for k in keys:
-            if isinstance(val, dict): val = val.get(k)
-            else: return False
-        return val == expected
-    except:
-        return False
+        return json.loads(text if text is not None else path.read_text(encoding='utf-8'))
+    except Exception:
+        return INVALID
+
+def json_value(data, keys):
+    value = data
+    for key in keys:
+        if not isinstance(value, dict):
+            return INVALID
+        value = value.get(key)
+    return value
 """
 
     @staticmethod
-    def _generate_check_logic(rule: Rule) -> str:
-        check = rule.check
+    def _generate_group_logic(group: FileGroup) -> str:
         # Logic block indentation: 4 spaces (inside main)
         block = []
-        
+        block.append(f"    # --- File: {group.path} ---")
+        block.append(f"    path = Path({group.path!r})")
+        block.append("    exists = path.exists()")
+        if group.needs_text:
+            block.append("    text = path.read_text(encoding='utf-8') if exists else None")
+        if group.needs_json:
+            text = "text" if group.needs_text else "None"
+            block.append(f"    data = read_json(path, {text}) if exists else INVALID")
+        for plan in group.rules:
+            block.append(f"    # Rule: {plan.rule.id}")
+            block.extend(Generator._generate_check_logic(plan))
+        return "\n".join(block)
+
+    @staticmethod
+    def _generate_check_logic(plan: RulePlan) -> List[str]:
+        check = plan.check
+        block = []
+
         if check.type == CheckType.FILE_EXISTS:
-            block.append(f"    if not check_file_exists('{check.path}'):")
-            block.append(f"        violations.append({{'id': '{rule.id}', 'severity': '{rule.severity.value}', 'message': 'File not found: {check.path}'}})")
-            
+            block.append("    if not exists:")
+
         elif check.type == CheckType.CONTENT_CONTAINS:
-            block.append(f"    if not check_content_contains('{check.path}', r'{check.pattern}'):")
-            block.append(f"        violations.append({{'id': '{rule.id}', 'severity': '{rule.severity.value}', 'message': 'File {check.path} missing pattern: {check.pattern}'}})")
-            
+            block.append(f"    if text is None or PATTERN_{plan.index}.search(text) is None:")
+
         elif check.type == CheckType.JSON_MATCH:
-            # Handle string vs int vs bool for expected value in generated code
-            expected_repr = repr(check.expected_value)
-            block.append(f"    if not check_json_match('{check.path}', '{check.key_path}', {expected_repr}):")
-            block.append(f"        violations.append({{'id': '{rule.id}', 'severity': '{rule.severity.value}', 'message': 'JSON {check.path} key {check.key_path} != {expected_repr}'}})")
-            
-        return "\n".join(block)
+            block.append(f"    value = json_value(data, {plan.keys!r}) if data is not INVALID else INVALID")
+            block.append(f"    if value is INVALID or value != {check.expected_value!r}:")
+
+        block.append(f"        violations.append(({plan.index}, {plan.violation()!r}))")
+        return block
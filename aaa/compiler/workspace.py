@@ -0,0 +1,215 @@
+import csv
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .evaluator import RulePlan, check_rule, load_target, plan_policy
+from .parser import CompilerError, Parser
+from .schema import Policy
+
+PASS = "pass"
+FAIL = "fail"
+ERROR = "error"
+
+
+@dataclass
+class _Target:
+    path: str
+    rules: List[Tuple[int, RulePlan]] = field(default_factory=list)
+    needs_text: bool = False
+    needs_json: bool = False
+
+
+class WorkspacePlan:
+    """
+    Merges several policies into one evaluation plan: every file any policy
+    targets is stat'ed, read and JSON-parsed once per repo, and each rule
+    becomes a matrix column keyed ``<policy name>:<rule id>``.
+    """
+
+    def __init__(self, policies: Sequence[Policy]):
+        self.policies = list(policies)
+        self.columns: List[Dict[str, str]] = []
+        targets: Dict[str, _Target] = {}
+        for policy in self.policies:
+            offset = len(self.columns)
+            for rule in policy.rules:
+                self.columns.append(
+                    {
+                        "key": f"{policy.metadata.name}:{rule.id}",
+                        "policy": policy.metadata.name,
+                        "version": policy.metadata.version,
+                        "rule": rule.id,
+                        "severity": rule.severity.value,
+                    }
+                )
+            for group in plan_policy(policy):
+                target = targets.setdefault(group.path, _Target(path=group.path))
+                target.needs_text = target.needs_text or group.needs_text
+                target.needs_json = target.needs_json or group.needs_json
+                target.rules.extend((offset + plan.index, plan) for plan in group.rules)
+        keys = [column["key"] for column in self.columns]
+        duplicates = sorted({key for key in keys if keys.count(key) > 1})
+        if duplicates:
+            raise CompilerError(f"Duplicate policy rule keys: {', '.join(duplicates)}")
+        self.targets = list(targets.values())
+
+    def evaluate_repo(self, root: Union[str, Path]) -> Dict[str, Any]:
+        root = Path(root)
+        width = len(self.columns)
+        status = [PASS] * width
+        messages: Dict[int, str] = {}
+        rule_seconds = [0.0] * width
+        error: Optional[str] = None
+        start = time.perf_counter()
+        try:
+            if not root.is_dir():
+                raise FileNotFoundError(f"repo root not found: {root}")
+            for target in self.targets:
+                exists, text, data = load_target(root / target.path, target.needs_text, target.needs_json)
+                for column, plan in target.rules:
+                    rule_start = time.perf_counter()
+                    passed = check_rule(plan, exists, text, data)
+                    rule_seconds[column] += time.perf_counter() - rule_start
+                    if not passed:
+                        status[column] = FAIL
+                        messages[column] = plan.violation()["message"]
+        except Exception as exc:
+            status = [ERROR] * width
+            messages = {}
+            error = f"{type(exc).__name__}: {exc}"
+        return {
+            "repo": str(root),
+            "status": status,
+            "messages": messages,
+            "rule_seconds": rule_seconds,
+            "elapsed_seconds": time.perf_counter() - start,
+            "error": error,
+        }
+
+
+class PolicyMatrix:
+    """Repo x rule evaluation result with per-repo and per-rule timing."""
+
+    def __init__(self, columns: List[Dict[str, str]], rows: List[Dict[str, Any]], elapsed_seconds: float):
+        self.columns = columns
+        self.rows = rows
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def failing_cells(self) -> int:
+        return sum(row["status"].count(FAIL) for row in self.rows)
+
+    @property
+    def error_repos(self) -> int:
+        return sum(1 for row in self.rows if row["error"])
+
+    @property
+    def valid(self) -> bool:
+        return self.failing_cells == 0 and self.error_repos == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        keys = [column["key"] for column in self.columns]
+        violations = []
+        for row in self.rows:
+            for column, message in sorted(row["messages"].items()):
+                violations.append(
+                    {
+                        "repo": row["repo"],
+                        "rule": keys[column],
+                        "severity": self.columns[column]["severity"],
+                        "message": message,
+                    }
+                )
+        repo_count = len(self.rows) or 1
+        rule_timing = {}
+        for column, key in enumerate(keys):
+            total = sum(row["rule_seconds"][column] for row in self.rows)
+            rule_timing[key] = {
+                "total_ms": round(total * 1e3, 3),
+                "mean_us": round(total / repo_count * 1e6, 2),
+                "failing_repos": sum(1 for row in self.rows if row["status"][column] == FAIL),
+            }
+        return {
+            "status": "ok" if self.valid else "error",
+            "valid": self.valid,
+            "summary": {
+                "repos": len(self.rows),
+                "rules": len(keys),
+                "failing_cells": self.failing_cells,
+                "error_repos": self.error_repos,
+                "elapsed_seconds": round(self.elapsed_seconds, 3),
+            },
+            "rules": self.columns,
+            "repos": [
+                {
+                    "repo": row["repo"],
+                    "failed": row["status"].count(FAIL),
+                    "elapsed_ms": round(row["elapsed_seconds"] * 1e3, 3),
+                    "error": row["error"],
+                }
+                for row in self.rows
+            ],
+            "matrix": {row["repo"]: dict(zip(keys, row["status"])) for row in self.rows},
+            "violations": violations,
+            "rule_timing": rule_timing,
+        }
+
+    def to_csv(self) -> str:
+        keys = [column["key"] for column in self.columns]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["repo", *keys, "failed", "elapsed_ms", "error"])
+        for row in self.rows:
+            writer.writerow(
+                [
+                    row["repo"],
+                    *row["status"],
+                    row["status"].count(FAIL),
+                    f"{row['elapsed_seconds'] * 1e3:.3f}",
+                    row["error"] or "",
+                ]
+            )
+        return buffer.getvalue()
+
+
+_WORKER_PLAN: Optional[WorkspacePlan] = None
+
+
+def _init_worker(policy_payloads: List[Dict[str, Any]]) -> None:
+    global _WORKER_PLAN
+    _WORKER_PLAN = WorkspacePlan([Parser.parse_obj(payload) for payload in policy_payloads])
+
+
+def _evaluate_in_worker(root: str) -> Dict[str, Any]:
+    return _WORKER_PLAN.evaluate_repo(root)
+
+
+def evaluate_workspace(
+    policies: Sequence[Policy],
+    repo_roots: Iterable[Union[str, Path]],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 4,
+) -> PolicyMatrix:
+    """
+    Evaluate every policy against every repo root. ``workers=1`` runs
+    in-process; otherwise repos are fanned out to a process pool whose workers
+    build the merged plan once (patterns compiled per worker, not per repo).
+    Rows keep the order of ``repo_roots``.
+    """
+    plan = WorkspacePlan(policies)
+    roots = [str(root) for root in repo_roots]
+    start = time.perf_counter()
+    max_workers = min(workers or os.cpu_count() or 1, max(len(roots), 1))
+    if max_workers == 1:
+        rows = [plan.evaluate_repo(root) for root in roots]
+    else:
+        payloads = [policy.model_dump(mode="json") for policy in plan.policies]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(payloads,)) as executor:
+            rows = list(executor.map(_evaluate_in_worker, roots, chunksize=max(chunksize, 1)))
+    return PolicyMatrix(plan.columns, rows, time.perf_counter() - start)
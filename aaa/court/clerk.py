@@ -1,3 +1,4 @@
+import os
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -42,6 +43,16 @@ class CourtClerk:
                 continue # Skip corrupted files
         return sorted(pending, key=lambda c: c.submitted_at)
 
+    def list_cases(self) -> List[CaseFile]:
+        """List all readable cases."""
+        cases = []
+        for file_path in self.case_dir.glob("*.json"):
+            try:
+                cases.append(self._load(file_path))
+            except Exception:
+                continue
+        return cases
+
     def get_case(self, case_id: str) -> Optional[CaseFile]:
         """Retrieve a specific case."""
         file_path = self.case_dir / f"{case_id}.json"
@@ -71,6 +82,8 @@ class CourtClerk:
     def _save(self, case: CaseFile):
         file_path = self.case_dir / f"{case.case_id}.json"
         file_path.write_text(case.model_dump_json(indent=2), encoding="utf-8")
+        # Touch the case directory so watchers (e.g. the kernel guard) see rulings on existing cases.
+        os.utime(self.case_dir)
 
     def _load(self, file_path: Path) -> CaseFile:
         return CaseFile.model_validate_json(file_path.read_text(encoding="utf-8"))
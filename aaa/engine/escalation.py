@@ -0,0 +1,203 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .semantic import SemanticCheckResult
+
+Verdict = Tuple[bool, str]  # (passed, reason)
+
+
+class EscalationProvider(ABC):
+    """Model backend for semantic escalation; receives (content, rule) pairs in batches."""
+
+    model_id: str
+
+    @abstractmethod
+    def complete_batch(self, requests: Sequence[Tuple[str, str]]) -> List[Verdict]:
+        pass
+
+
+class LocalEscalationProvider(EscalationProvider):
+    """
+    Deterministic in-process stand-in for a model endpoint. ``judge`` decides
+    each (content, rule) pair; by default everything is flagged, matching the
+    simulated escalation. Batch sizes are recorded for inspection.
+    """
+
+    def __init__(self, model_id: str = "local-stub", judge: Optional[Callable[[str, str], Verdict]] = None):
+        self.model_id = model_id
+        self.judge = judge or (lambda content, rule: (False, f"LLM Escalation Triggered (Simulated): Verifying '{rule}'"))
+        self.batches: List[int] = []
+        self._lock = threading.Lock()
+
+    def complete_batch(self, requests: Sequence[Tuple[str, str]]) -> List[Verdict]:
+        with self._lock:
+            self.batches.append(len(requests))
+        return [self.judge(content, rule) for content, rule in requests]
+
+
+def request_key(model_id: str, rule: str, content: str) -> str:
+    """Cache key: hash of (rule, content digest, model id)."""
+    content_digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return hashlib.sha256(json.dumps([rule, content_digest, model_id]).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Persistent verdict cache (sqlite). Pass ``":memory:"`` for a throwaway cache."""
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        if db_path is None:
+            db_path = Path.cwd() / ".aaa" / "escalation_cache.db"
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, passed INTEGER, reason TEXT)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Verdict]:
+        keys = list(keys)
+        found: Dict[str, Verdict] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, passed, reason FROM verdicts WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                found.update((key, (bool(passed), reason)) for key, passed, reason in rows)
+        return found
+
+    def put_many(self, verdicts: Dict[str, Verdict]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verdicts (key, passed, reason) VALUES (?, ?, ?)",
+                [(key, int(passed), reason) for key, (passed, reason) in verdicts.items()],
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class EscalationStats:
+    requests: int = 0
+    cache_hits: int = 0
+    deduplicated: int = 0
+    coalesced: int = 0
+    provider_requests: int = 0
+    provider_batches: int = 0
+
+    @property
+    def cost(self) -> int:
+        return self.provider_requests
+
+    def to_dict(self) -> Dict[str, int]:
+        return {**asdict(self), "cost": self.cost}
+
+
+class EscalationDispatcher:
+    """
+    Routes escalations to a provider: answers from the response cache first,
+    collapses identical requests (within a call and across threads already
+    in flight), sends the rest in batches of ``batch_size`` with at most
+    ``max_concurrency`` provider calls running at once. A result costs 1 only
+    when its request actually reached the provider in this call.
+    """
+
+    def __init__(
+        self,
+        provider: EscalationProvider,
+        cache: Optional[ResponseCache] = None,
+        batch_size: int = 16,
+        max_concurrency: int = 4,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.stats = EscalationStats()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+
+    def escalate(self, requests: Sequence[Tuple[str, str]]) -> List[SemanticCheckResult]:
+        keys = [request_key(self.provider.model_id, rule, content) for content, rule in requests]
+        unique: Dict[str, Tuple[str, str]] = {}
+        for key, request in zip(keys, requests):
+            unique.setdefault(key, request)
+        run = EscalationStats(requests=len(keys), deduplicated=len(keys) - len(unique))
+
+        verdicts: Dict[str, Verdict] = self.cache.get_many(unique) if self.cache is not None else {}
+        run.cache_hits = len(verdicts)
+        owned: List[str] = []
+        waiting: Dict[str, Future] = {}
+        with self._lock:
+            for key in unique:
+                if key in verdicts:
+                    continue
+                if key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                else:
+                    self._inflight[key] = Future()
+                    owned.append(key)
+        run.coalesced = len(waiting)
+
+        batches = [owned[i:i + self.batch_size] for i in range(0, len(owned), self.batch_size)]
+        run.provider_batches = len(batches)
+        run.provider_requests = len(owned)
+        try:
+            if len(batches) == 1:
+                verdicts.update(self._run_batch(batches[0], unique))
+            elif batches:
+                with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                    for result in executor.map(lambda batch: self._run_batch(batch, unique), batches):
+                        verdicts.update(result)
+        finally:
+            with self._lock:
+                for key in owned:
+                    future = self._inflight.pop(key)
+                    if not future.done():
+                        future.set_exception(RuntimeError("escalation batch failed"))
+        for key, future in waiting.items():
+            verdicts[key] = future.result()
+
+        self._record(run)
+        charged = set(owned)
+        results = []
+        for key in keys:
+            passed, reason = verdicts[key]
+            results.append(SemanticCheckResult(passed, reason, cost=1 if key in charged else 0))
+            charged.discard(key)
+        return results
+
+    def _run_batch(self, batch: List[str], unique: Dict[str, Tuple[str, str]]) -> Dict[str, Verdict]:
+        with self._slots:
+            answers = self.provider.complete_batch([unique[key] for key in batch])
+        if len(answers) != len(batch):
+            raise RuntimeError(f"provider returned {len(answers)} verdicts for {len(batch)} requests")
+        verdicts = {key: (bool(passed), reason) for key, (passed, reason) in zip(batch, answers)}
+        if self.cache is not None:
+            self.cache.put_many(verdicts)
+        with self._lock:
+            for key, verdict in verdicts.items():
+                self._inflight[key].set_result(verdict)
+        return verdicts
+
+    def _record(self, run: EscalationStats) -> None:
+        with self._lock:
+            for name, value in asdict(run).items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
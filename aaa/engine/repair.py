@@ -1,7 +1,12 @@
 import ast
+import os
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+Fixer = Callable[[str], str]
 
 class FixResult:
     def __init__(self, success: bool, changed: bool, message: str):
@@ -9,68 +14,150 @@ class FixResult:
         self.changed = changed
         self.message = message
 
+class FixBatchResult:
+    def __init__(self, success: bool, message: str, results: Dict[Path, FixResult]):
+        self.success = success
+        self.message = message
+        self.results = results
+
+    @property
+    def changed(self) -> List[Path]:
+        return [path for path, result in self.results.items() if result.changed]
+
+class _Candidate:
+    def __init__(self, path: Path, result: FixResult, original: Optional[bytes] = None, content: Optional[str] = None):
+        self.path = path
+        self.result = result
+        self.original = original
+        self.content = content
+        self.staged: Optional[str] = None
+
 class AutoFixEngine:
     """
     Zone Zero Component: Safely applies fixes to files with Circuit Breaker logic.
     Target Coverage: 100%
+
+    Fixes are computed and verified in memory, staged to temp files beside
+    their targets and committed with ``os.replace``, so a file on disk is
+    always either fully original or fully fixed.
     """
-    
-    def __init__(self, max_retries: int = 3):
+
+    def __init__(self, max_retries: int = 3, max_workers: int = 8):
         self.max_retries = max_retries
+        self.max_workers = max_workers
 
-    def apply_fix(self, file_path: Path, fixer: Callable[[str], str]) -> FixResult:
+    def apply_fix(self, file_path: Path, fixer: Fixer) -> FixResult:
         """
         Apply a fix function to a file with rollback protection.
-        
+
         Args:
             file_path: Path to the file to fix.
             fixer: A function that takes file content (str) and returns fixed content (str).
-            
+
         Returns:
             FixResult indicating success/failure and change status.
         """
+        path = Path(file_path)
+        return self.apply_fixes([(path, fixer)]).results[path]
+
+    def apply_fixes(self, plan: Iterable[Tuple[Path, Fixer]]) -> FixBatchResult:
+        """
+        Apply many fixers across many files as one transaction.
+
+        Fixers for the same file run in plan order, however its path is
+        spelled; results are keyed by the first spelling in the plan. Files
+        are fixed and verified in parallel; if any file fails, nothing is
+        written. If a commit step fails, files already replaced are restored.
+        """
+        grouped: Dict[Path, List[Fixer]] = {}
+        spelling: Dict[Path, Path] = {}
+        for path, fixer in plan:
+            path = Path(path)
+            key = spelling.setdefault(path.resolve(), path)
+            grouped.setdefault(key, []).append(fixer)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(grouped)))) as executor:
+            candidates = list(executor.map(lambda item: self._prepare(*item), grouped.items()))
+        results = {candidate.path: candidate.result for candidate in candidates}
+
+        failed = [candidate for candidate in candidates if not candidate.result.success]
+        if failed:
+            for candidate in candidates:
+                if candidate.result.changed:
+                    candidate.result = results[candidate.path] = FixResult(True, False, "Not applied (transaction aborted)")
+            return FixBatchResult(False, f"{len(failed)} of {len(candidates)} files failed; no changes written", results)
+
+        pending = [candidate for candidate in candidates if candidate.result.changed]
+        try:
+            for candidate in pending:
+                candidate.staged = self._stage(candidate.path, candidate.content.encode("utf-8"))
+            committed: List[_Candidate] = []
+            try:
+                for candidate in pending:
+                    os.replace(candidate.staged, candidate.path)
+                    candidate.staged = None
+                    committed.append(candidate)
+            except Exception as e:
+                for candidate in reversed(committed):
+                    os.replace(self._stage(candidate.path, candidate.original), candidate.path)
+                raise e
+        except Exception as e:
+            for candidate in pending:
+                results[candidate.path] = FixResult(False, False, f"Commit failed (Rollback applied): {e}")
+            return FixBatchResult(False, f"Commit failed: {e}", results)
+        finally:
+            for candidate in pending:
+                if candidate.staged and os.path.exists(candidate.staged):
+                    os.unlink(candidate.staged)
+        return FixBatchResult(True, f"{len(pending)} files fixed", results)
+
+    def _prepare(self, file_path: Path, fixers: List[Fixer]) -> _Candidate:
         if not file_path.exists():
-            return FixResult(False, False, f"File not found: {file_path}")
+            return _Candidate(file_path, FixResult(False, False, f"File not found: {file_path}"))
+
+        original = file_path.read_bytes()
+        original_content = original.decode("utf-8")
 
-        original_content = file_path.read_text(encoding='utf-8')
-        
-        # 1. Circuit Breaker Loop
+        # Circuit Breaker Loop
         for attempt in range(1, self.max_retries + 1):
             try:
-                # 2. Apply Fix
-                new_content = fixer(original_content)
-                
-                if new_content == original_content:
-                    return FixResult(True, False, "No changes needed")
-                
-                # 3. Write Candidate
-                file_path.write_text(new_content, encoding='utf-8')
-                
-                # 4. Stability Check
-                if self._check_stability(file_path):
-                    return FixResult(True, True, "Fix applied and verified")
-                else:
-                    # Unstable, rollback
-                    file_path.write_text(original_content, encoding='utf-8')
-                    if attempt == self.max_retries:
-                         return FixResult(False, False, "Fix introduced syntax errors (Rollback applied)")
-                         
+                new_content = original_content
+                for fixer in fixers:
+                    new_content = fixer(new_content)
             except Exception as e:
-                # Runtime error during fix, rollback
-                file_path.write_text(original_content, encoding='utf-8')
-                return FixResult(False, False, f"Exception during fix: {str(e)}")
-                
-        return FixResult(False, False, "Max retries exceeded")
+                return _Candidate(file_path, FixResult(False, False, f"Exception during fix: {str(e)}"))
+
+            if new_content == original_content:
+                return _Candidate(file_path, FixResult(True, False, "No changes needed"))
+
+            if self._check_stability(file_path, new_content):
+                return _Candidate(file_path, FixResult(True, True, "Fix applied and verified"), original, new_content)
+
+        return _Candidate(file_path, FixResult(False, False, "Fix introduced syntax errors (Rollback applied)"))
+
+    def _stage(self, file_path: Path, data: bytes) -> str:
+        """Write ``data`` to a temp file beside ``file_path`` (same filesystem, same mode)."""
+        fd, tmp = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".fix")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            shutil.copymode(file_path, tmp)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return tmp
 
-    def _check_stability(self, file_path: Path) -> bool:
+    def _check_stability(self, file_path: Path, content: str) -> bool:
         """
-        Verify file stability (e.g., syntax check for Python).
+        Verify candidate stability (e.g., syntax check for Python).
         """
         if file_path.suffix == '.py':
             try:
-                ast.parse(file_path.read_text(encoding='utf-8'))
+                ast.parse(content)
                 return True
             except SyntaxError:
                 return False
-        # For non-code files, assume stable if written successfully
+        # For non-code files, assume stable if the fixer produced text
         return True
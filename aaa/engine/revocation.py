@@ -1,22 +1,172 @@
 import os
 import json
+import mmap
+import tempfile
+import time
+import urllib.request
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _atomic_write(path: str, data: bytes) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".revocation-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+class SortedIndex:
+    """
+    Compact on-disk membership index for very large (federated) revocation
+    lists: sorted, de-duplicated UTF-8 ids, one per line. Lookups bisect an
+    mmap of the file, so nothing is parsed or loaded into memory.
+    """
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._size = os.fstat(f.fileno()).st_size
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b""
+
+    def __contains__(self, agent_id: str) -> bool:
+        key = agent_id.encode("utf-8")
+        data = self._map
+        lo, hi = 0, self._size
+        # lo and hi always sit on line starts
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", 0, mid) + 1
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = self._size
+            line = data[start:end]
+            if line == key:
+                return True
+            if line < key:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def close(self) -> None:
+        if self._size:
+            self._map.close()
+
+    @staticmethod
+    def write(path: str, agent_ids: Iterable[str]) -> int:
+        keys = sorted({agent_id.encode("utf-8") for agent_id in agent_ids})
+        if any(b"\n" in key for key in keys):
+            raise ValueError("agent ids must not contain newlines")
+        _atomic_write(path, b"\n".join(keys))
+        return len(keys)
 
 class RevocationChecker:
     """
     Global Kill-Switch (Lockout) mechanism for v2.0.1.
     Checks against a central 'locks.json' or revocation list.
+
+    The revoked set is held in memory (a frozenset, or a ``SortedIndex``
+    when ``index_file`` is given) and reloaded only when the file's inode,
+    mtime or size changes. The file is stat'ed at most once per
+    ``refresh_interval`` seconds; in between, ``is_revoked`` is a pure
+    in-memory lookup. ``refresh_interval=0`` stats on every check.
     """
-    def __init__(self, revocation_file: str = ".aaa/revocation.json"):
+    def __init__(self, revocation_file: str = ".aaa/revocation.json", refresh_interval: float = 1.0, index_file: Optional[str] = None):
         self.revocation_file = revocation_file
+        self.refresh_interval = refresh_interval
+        self.index_file = index_file
+        self._revoked: Union[FrozenSet[str], SortedIndex] = frozenset()
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._checked_at = float("-inf")
 
     def is_revoked(self, agent_id: str) -> bool:
-        if not os.path.exists(self.revocation_file):
-            return False
-            
+        if time.monotonic() - self._checked_at >= self.refresh_interval:
+            self.refresh()
+        return agent_id in self._revoked
+
+    def refresh(self) -> None:
+        """Reload the revocation list now if it changed on disk."""
+        self._checked_at = time.monotonic()
+        source = self.index_file or self.revocation_file
+        stamp = _file_stamp(source)
+        if stamp == self._stamp:
+            return
+        if stamp is None:
+            self._replace(frozenset(), stamp)
+            return
         try:
-            with open(self.revocation_file, "r") as f:
-                data = json.load(f)
-                return agent_id in data.get("revoked_agents", [])
+            if self.index_file:
+                loaded: Union[FrozenSet[str], SortedIndex] = SortedIndex(source)
+            else:
+                loaded = frozenset(load_revocation_list(source))
         except Exception:
-            # Fail-safe: if file corrupted, assume not revoked but log error
-            return False
+            # Fail-safe: if file corrupted, keep the last good list (initially: none revoked)
+            return
+        self._replace(loaded, stamp)
+
+    def _replace(self, revoked: Union[FrozenSet[str], SortedIndex], stamp: Optional[Tuple[int, int, int]]) -> None:
+        previous = self._revoked
+        self._revoked = revoked
+        self._stamp = stamp
+        if isinstance(previous, SortedIndex):
+            previous.close()
+
+def _parse_revocation_list(data: Any) -> List[str]:
+    if isinstance(data, dict):
+        data = data.get("revoked_agents", [])
+    if not isinstance(data, list) or not all(isinstance(item, str) for item in data):
+        raise ValueError("revocation list must be a list of agent ids or {'revoked_agents': [...]}")
+    return data
+
+def load_revocation_list(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return _parse_revocation_list(json.load(f))
+
+def _fetch_revocation_list(source: str) -> List[str]:
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=10) as response:
+            return _parse_revocation_list(json.loads(response.read().decode("utf-8")))
+    if source.startswith("file://"):
+        source = source[len("file://"):]
+    return load_revocation_list(source)
+
+def sync_revocations(revocation_file: str, sources: Iterable[str], index_file: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Merge remote revocation lists into ``revocation_file``. Every source is
+    fetched before anything is written, and the result replaces the file
+    atomically, so a failed sync leaves the local list untouched.
+    """
+    sources = list(sources)
+    payload: Dict[str, Any] = {}
+    if os.path.exists(revocation_file):
+        with open(revocation_file, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if isinstance(payload, list):
+            payload = {"revoked_agents": payload}
+    local = set(_parse_revocation_list(payload))
+    merged = set(local)
+    for source in sources:
+        merged.update(_fetch_revocation_list(source))
+
+    payload["revoked_agents"] = sorted(merged)
+    _atomic_write(revocation_file, (json.dumps(payload, indent=2) + "\n").encode("utf-8"))
+    if index_file:
+        SortedIndex.write(index_file, merged)
+    return {
+        "revocation_file": revocation_file,
+        "index_file": index_file,
+        "sources": len(sources),
+        "total": len(merged),
+        "added": len(merged - local),
+    }
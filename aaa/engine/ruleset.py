@@ -1,9 +1,18 @@
-from typing import Any, Dict, Optional, List
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..validation_memo import canonical_json
+
+_MISSING = object()
 
 class InheritanceMerger:
     """
     Handles merging of governance rulesets with Inheritance strategy.
     Strategy: Deep Merge for Dictionaries, Atomic Replacement for Lists/Scalars.
+
+    Results share structure with their inputs: subtrees the child does not
+    touch are the parent's objects, and values the child sets are the
+    child's objects. Treat merged rulesets as read-only.
     """
     
     def merge(self, parent: Optional[Dict[str, Any]], child: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -20,16 +29,129 @@ class InheritanceMerger:
 
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursive deep merge implementation.
+        Recursive deep merge implementation. Only dicts on a path the override
+        changes are copied; if nothing changes, ``base`` itself is returned.
         """
-        result = base.copy()
-        
+        result = None
+
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            current = base.get(key, _MISSING)
+            if isinstance(current, dict) and isinstance(value, dict):
                 # Both are dicts -> Recurse
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                # Otherwise -> Overwrite (atomic replacement for lists, scalars, or type mismatches)
-                result[key] = value
-                
-        return result
+                value = self._deep_merge(current, value)
+            # Otherwise -> Overwrite (atomic replacement for lists, scalars, or type mismatches)
+            if value is current:
+                continue
+            if result is None:
+                result = base.copy()
+            result[key] = value
+
+        return base if result is None else result
+
+
+class RulesetResolutionError(ValueError):
+    pass
+
+
+class RulesetResolver:
+    """
+    Resolves effective rulesets over a DAG of named rulesets (e.g. org ->
+    business unit -> team -> archetype -> repo). A node's effective ruleset
+    is its parents' effective rulesets merged left to right, then its own
+    body merged on top.
+
+    Every merge is memoized by the content hashes of its two inputs, and a
+    node's effective hash is derived from those input hashes (no
+    re-serialization of merged output), so identical inheritance paths are
+    merged once. Redefining a node invalidates only its descendants.
+    """
+
+    def __init__(self, merger: Optional[InheritanceMerger] = None):
+        self.merger = merger or InheritanceMerger()
+        self._bodies: Dict[str, Dict[str, Any]] = {}
+        self._body_hashes: Dict[str, str] = {}
+        self._parents: Dict[str, Tuple[str, ...]] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._effective: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._merges: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+        self.stats = {"merges": 0, "merge_hits": 0, "resolved": 0}
+
+    def define(self, name: str, body: Optional[Dict[str, Any]] = None, parents: Sequence[str] = ()) -> Set[str]:
+        """Add or replace a ruleset; returns the names whose effective ruleset was invalidated."""
+        body = body or {}
+        for parent in self._parents.get(name, ()):
+            self._children[parent].discard(name)
+        self._bodies[name] = body
+        self._body_hashes[name] = hashlib.sha256(canonical_json(body).encode("utf-8")).hexdigest()
+        self._parents[name] = tuple(parents)
+        for parent in parents:
+            self._children.setdefault(parent, set()).add(name)
+        self._children.setdefault(name, set())
+
+        invalidated = set()
+        stack = [name]
+        while stack:
+            node = stack.pop()
+            if node in invalidated:
+                continue
+            invalidated.add(node)
+            self._effective.pop(node, None)
+            stack.extend(self._children.get(node, ()))
+        return invalidated
+
+    def resolve(self, name: str) -> Dict[str, Any]:
+        return self._resolve(name)[1]
+
+    def resolve_many(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        return {name: self._resolve(name)[1] for name in names}
+
+    def effective_hash(self, name: str) -> str:
+        return self._resolve(name)[0]
+
+    def _resolve(self, name: str) -> Tuple[str, Dict[str, Any]]:
+        cached = self._effective.get(name)
+        if cached is not None:
+            return cached
+        # Iterative post-order walk so deep hierarchies cannot hit the recursion limit.
+        visiting: Set[str] = set()
+        stack: List[Tuple[str, bool]] = [(name, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in self._effective:
+                continue
+            if node not in self._bodies:
+                raise RulesetResolutionError(f"Unknown ruleset: {node}")
+            if expanded:
+                visiting.discard(node)
+                self._effective[node] = self._compute(node)
+                continue
+            if node in visiting:
+                raise RulesetResolutionError(f"Inheritance cycle through ruleset: {node}")
+            visiting.add(node)
+            stack.append((node, True))
+            for parent in reversed(self._parents[node]):
+                if parent not in self._effective:
+                    if parent in visiting:
+                        raise RulesetResolutionError(f"Inheritance cycle through ruleset: {parent}")
+                    stack.append((parent, False))
+        return self._effective[name]
+
+    def _compute(self, name: str) -> Tuple[str, Dict[str, Any]]:
+        self.stats["resolved"] += 1
+        current: Tuple[str, Dict[str, Any]] = ("", {})
+        for parent in self._parents[name]:
+            current = self._merge(current, self._effective[parent])
+        return self._merge(current, (self._body_hashes[name], self._bodies[name]))
+
+    def _merge(self, base: Tuple[str, Dict[str, Any]], override: Tuple[str, Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        if not base[0]:
+            return override
+        key = (base[0], override[0])
+        cached = self._merges.get(key)
+        if cached is not None:
+            self.stats["merge_hits"] += 1
+            return cached
+        self.stats["merges"] += 1
+        merged = (hashlib.sha256(f"{base[0]}+{override[0]}".encode("ascii")).hexdigest(), self.merger.merge(base[1], override[1]))
+        self._merges[key] = merged
+        return merged
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, Prefix, SameList, compile_rules
+
 
 REQUIRED_STAGES = [
     "topology_contract_baseline",
@@ -18,69 +20,43 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "github_governance_topology_composition_and_closeout",
+            "runtime_plane_mode must be github_governance_topology_composition_and_closeout",
+        ),
+        Equals(
+            "line_class",
+            "github_governance_topology_support_program",
+            "line_class must be github_governance_topology_support_program",
+        ),
+        Equals("closeout_role", "topology_support_closeout", "closeout_role must be topology_support_closeout"),
+        SameList(
+            "consumed_topology_stages",
+            REQUIRED_STAGES,
+            "consumed_topology_stages must explicitly enumerate the full topology support stage set",
+        ),
+        Prefix(
+            "consumed_stage_set_hash",
+            "sha256:",
+            "consumed_stage_set_hash must be a sha256-prefixed fingerprint",
+        ),
+        Flag("semantics_rejudgment_allowed", False, "closeout may not rejudge consumed topology semantics"),
+        Flag("primary_semantics_backfill_allowed", False, "closeout may not backfill undefined primary semantics"),
+        Flag("conditional_expansion_triggered", False, "closeout may not trigger conditional expansion"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    consumed_topology_stages = [str(item).strip() for item in bundle.get("consumed_topology_stages", [])]
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "github_governance_topology_composition_and_closeout":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be github_governance_topology_composition_and_closeout",
-            }
-        )
-    if bundle.get("line_class") != "github_governance_topology_support_program":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be github_governance_topology_support_program",
-            }
-        )
-    if bundle.get("closeout_role") != "topology_support_closeout":
-        errors.append({"code": "closeout_role", "message": "closeout_role must be topology_support_closeout"})
-    if consumed_topology_stages != REQUIRED_STAGES:
-        errors.append(
-            {
-                "code": "consumed_topology_stages",
-                "message": "consumed_topology_stages must explicitly enumerate the full topology support stage set",
-            }
-        )
-    consumed_stage_set_hash = str(bundle.get("consumed_stage_set_hash", "")).strip()
-    if not consumed_stage_set_hash.startswith("sha256:"):
-        errors.append(
-            {
-                "code": "consumed_stage_set_hash",
-                "message": "consumed_stage_set_hash must be a sha256-prefixed fingerprint",
-            }
-        )
-    if bundle.get("semantics_rejudgment_allowed") is not False:
-        errors.append(
-            {
-                "code": "semantics_rejudgment_allowed",
-                "message": "closeout may not rejudge consumed topology semantics",
-            }
-        )
-    if bundle.get("primary_semantics_backfill_allowed") is not False:
-        errors.append(
-            {
-                "code": "primary_semantics_backfill_allowed",
-                "message": "closeout may not backfill undefined primary semantics",
-            }
-        )
-    if bundle.get("conditional_expansion_triggered") is not False:
-        errors.append(
-            {
-                "code": "conditional_expansion_triggered",
-                "message": "closeout may not trigger conditional expansion",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
+    consumed_topology_stages = values["consumed_topology_stages"]
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import RAW, TEXT, ArrayOf, Custom, Equals, Flag, OneOf, compile_rules
+
 
 ALLOWED_TOPOLOGY_MODE = {"dedicated_repo", "repo_local", "hybrid"}
 ALLOWED_AUTHORITY_SPLIT = {"org_centralized", "repo_distributed", "mixed_authority"}
@@ -26,54 +28,27 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    topology_mode = str(bundle.get("topology_mode", "")).strip()
-    authority_split = str(bundle.get("authority_split", "")).strip()
-    asset_model = bundle.get("asset_class_authority_model", [])
+ASSET_ENTRY_RULES = compile_rules(
+    [
+        ArrayOf(
+            "allowed_topology_modes",
+            "allowed_topology_modes must be a non-empty array",
+            allowed=ALLOWED_TOPOLOGY_MODE,
+            invalid_message="allowed_topology_modes includes an unsupported topology",
+        ),
+        OneOf("authority_owner", ALLOWED_AUTHORITY_SPLIT, "authority_owner is not allowed"),
+        OneOf("placement_mode", ALLOWED_PLACEMENT_MODE, "placement_mode is not allowed"),
+        OneOf("precedence_rule", ALLOWED_PRECEDENCE_RULE, "precedence_rule is not allowed"),
+        OneOf("conflict_rule", ALLOWED_CONFLICT_RULE, "conflict_rule is not allowed"),
+        ArrayOf("evidence_requirements", "evidence_requirements must be a non-empty array"),
+    ],
+    fields=[("asset_class", TEXT)],
+)
+HYBRID_REQUIRED_ASSET_CLASSES = ("org_profile_metadata", "repo_local_workflows", "codeowners")
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "github_governance_topology_contract_baseline":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be github_governance_topology_contract_baseline",
-            }
-        )
-    if bundle.get("line_class") != "github_governance_topology_support_program":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be github_governance_topology_support_program",
-            }
-        )
-    if topology_mode not in ALLOWED_TOPOLOGY_MODE:
-        errors.append({"code": "topology_mode", "message": "topology_mode is not allowed"})
-    if authority_split not in ALLOWED_AUTHORITY_SPLIT:
-        errors.append({"code": "authority_split", "message": "authority_split is not allowed"})
-    if bundle.get("precedence_law") != "machine_checkable_precedence_required":
-        errors.append({"code": "precedence_law", "message": "precedence_law must be machine_checkable_precedence_required"})
-    if bundle.get("conflict_law") != "machine_checkable_conflict_verdict_required":
-        errors.append({"code": "conflict_law", "message": "conflict_law must be machine_checkable_conflict_verdict_required"})
-    if bundle.get("evidence_sufficiency_law") != "machine_checkable_evidence_sufficiency_required":
-        errors.append(
-            {
-                "code": "evidence_sufficiency_law",
-                "message": "evidence_sufficiency_law must be machine_checkable_evidence_sufficiency_required",
-            }
-        )
-    if bundle.get("dedicated_repo_existence_is_only_truth") is not False:
-        errors.append(
-            {
-                "code": "dedicated_repo_existence_is_only_truth",
-                "message": "dedicated_repo_existence_is_only_truth must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
 
+def _check_asset_model(bundle: dict[str, Any], values: dict[str, Any], errors: list[dict[str, str]]) -> None:
+    asset_model = values["asset_class_authority_model"]
     if not isinstance(asset_model, list) or len(asset_model) < 3:
         errors.append(
             {
@@ -81,62 +56,77 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
                 "message": "asset_class_authority_model must contain at least three asset classes",
             }
         )
-    else:
-        seen_asset_classes: set[str] = set()
-        for item in asset_model:
-            if not isinstance(item, dict):
-                errors.append({"code": "asset_class_authority_model", "message": "asset model entries must be objects"})
-                break
-            asset_class = str(item.get("asset_class", "")).strip()
-            allowed_topology_modes = item.get("allowed_topology_modes", [])
-            authority_owner = str(item.get("authority_owner", "")).strip()
-            placement_mode = str(item.get("placement_mode", "")).strip()
-            precedence_rule = str(item.get("precedence_rule", "")).strip()
-            conflict_rule = str(item.get("conflict_rule", "")).strip()
-            evidence_requirements = item.get("evidence_requirements", [])
-
-            if asset_class not in ALLOWED_ASSET_CLASS:
-                errors.append({"code": "asset_class", "message": "asset_class is not allowed"})
-                continue
-            seen_asset_classes.add(asset_class)
-            if not isinstance(allowed_topology_modes, list) or not allowed_topology_modes:
-                errors.append({"code": "allowed_topology_modes", "message": "allowed_topology_modes must be a non-empty array"})
-            elif any(str(mode).strip() not in ALLOWED_TOPOLOGY_MODE for mode in allowed_topology_modes):
-                errors.append({"code": "allowed_topology_modes", "message": "allowed_topology_modes includes an unsupported topology"})
-            if authority_owner not in ALLOWED_AUTHORITY_SPLIT:
-                errors.append({"code": "authority_owner", "message": "authority_owner is not allowed"})
-            if placement_mode not in ALLOWED_PLACEMENT_MODE:
-                errors.append({"code": "placement_mode", "message": "placement_mode is not allowed"})
-            if precedence_rule not in ALLOWED_PRECEDENCE_RULE:
-                errors.append({"code": "precedence_rule", "message": "precedence_rule is not allowed"})
-            if conflict_rule not in ALLOWED_CONFLICT_RULE:
-                errors.append({"code": "conflict_rule", "message": "conflict_rule is not allowed"})
-            if not isinstance(evidence_requirements, list) or not evidence_requirements:
-                errors.append({"code": "evidence_requirements", "message": "evidence_requirements must be a non-empty array"})
-
-        if topology_mode == "hybrid":
-            if "org_profile_metadata" not in seen_asset_classes:
-                errors.append(
-                    {
-                        "code": "asset_class_authority_model",
-                        "message": "hybrid must include org_profile_metadata authority modeling",
-                    }
-                )
-            if "repo_local_workflows" not in seen_asset_classes:
-                errors.append(
-                    {
-                        "code": "asset_class_authority_model",
-                        "message": "hybrid must include repo_local_workflows authority modeling",
-                    }
-                )
-            if "codeowners" not in seen_asset_classes:
+        return
+
+    seen_asset_classes: set[str] = set()
+    for item in asset_model:
+        if not isinstance(item, dict):
+            errors.append({"code": "asset_class_authority_model", "message": "asset model entries must be objects"})
+            break
+        entry_errors, entry_values = ASSET_ENTRY_RULES.check(item)
+        asset_class = entry_values["asset_class"]
+        if asset_class not in ALLOWED_ASSET_CLASS:
+            errors.append({"code": "asset_class", "message": "asset_class is not allowed"})
+            continue
+        seen_asset_classes.add(asset_class)
+        errors.extend(entry_errors)
+
+    if values["topology_mode"] == "hybrid":
+        for asset_class in HYBRID_REQUIRED_ASSET_CLASSES:
+            if asset_class not in seen_asset_classes:
                 errors.append(
                     {
                         "code": "asset_class_authority_model",
-                        "message": "hybrid must include codeowners authority modeling",
+                        "message": f"hybrid must include {asset_class} authority modeling",
                     }
                 )
 
+
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "github_governance_topology_contract_baseline",
+            "runtime_plane_mode must be github_governance_topology_contract_baseline",
+        ),
+        Equals(
+            "line_class",
+            "github_governance_topology_support_program",
+            "line_class must be github_governance_topology_support_program",
+        ),
+        OneOf("topology_mode", ALLOWED_TOPOLOGY_MODE, "topology_mode is not allowed"),
+        OneOf("authority_split", ALLOWED_AUTHORITY_SPLIT, "authority_split is not allowed"),
+        Equals(
+            "precedence_law",
+            "machine_checkable_precedence_required",
+            "precedence_law must be machine_checkable_precedence_required",
+        ),
+        Equals(
+            "conflict_law",
+            "machine_checkable_conflict_verdict_required",
+            "conflict_law must be machine_checkable_conflict_verdict_required",
+        ),
+        Equals(
+            "evidence_sufficiency_law",
+            "machine_checkable_evidence_sufficiency_required",
+            "evidence_sufficiency_law must be machine_checkable_evidence_sufficiency_required",
+        ),
+        Flag(
+            "dedicated_repo_existence_is_only_truth",
+            False,
+            "dedicated_repo_existence_is_only_truth must be false",
+        ),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+        Custom(_check_asset_model, fields=(("asset_class_authority_model", RAW, []),)),
+    ]
+)
+
+
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
+
+    asset_model = values["asset_class_authority_model"]
     valid = not errors
     return {
         "status": "ok" if valid else "error",
@@ -145,8 +135,8 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "topology_mode": topology_mode,
-            "authority_split": authority_split,
+            "topology_mode": values["topology_mode"],
+            "authority_split": values["authority_split"],
             "asset_class_count": len(asset_model) if isinstance(asset_model, list) else 0,
             "precedence_law": bundle.get("precedence_law"),
             "conflict_law": bundle.get("conflict_law"),
@@ -0,0 +1,286 @@
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+
+# validator name (the `aaa governance <name>` command) -> (module, function)
+VALIDATORS: dict[str, tuple[str, str]] = {
+    "validate-tool-command-adoption": ("tool_command_adoption", "validate_bundle"),
+    "validate-multi-repo-worktree-identity": ("multi_repo_worktree_identity", "validate_bundle"),
+    "validate-context-runtime-preflight": ("context_runtime_preflight", "validate_bundle"),
+    "validate-session-readiness-state": ("session_readiness_state", "validate_bundle"),
+    "readiness-inspect": ("runtime_adoption_readiness_inspect", "validate_bundle"),
+    "repo-check": ("repo_check_runtime_adoption", "validate_bundle"),
+    "shared-command-dispatch": ("shared_command_dispatch_runtime", "validate_dispatch_bundle"),
+    "result-evidence-promotion-gate": ("result_artifact_eligibility_and_evidence_promotion_gate", "validate_bundle"),
+    "session-context-snapshot": ("session_context_snapshot_runtime", "validate_bundle"),
+    "query-orchestration": ("query_orchestration_runtime", "validate_bundle"),
+    "permission-gate": ("permission_and_authorization_runtime_gate", "validate_bundle"),
+    "event-stream": ("tool_progress_and_runtime_event_stream", "validate_bundle"),
+    "session-persistence": ("session_persistence_and_transcript_compaction", "validate_bundle"),
+    "runtime-control": ("runtime_budget_retry_and_recovery_control", "validate_bundle"),
+    "result-normalization": ("structured_output_and_result_normalization_plane", "validate_bundle"),
+    "workflow-runtime": ("workflow_and_runbook_orchestration_runtime", "validate_bundle"),
+    "delegation-lifecycle": ("agent_delegation_and_task_lifecycle_runtime", "validate_bundle"),
+    "extension-runtime": ("skill_and_plugin_extension_runtime", "validate_bundle"),
+    "composition-root": ("runtime_composition_root_and_system_assembly", "validate_bundle"),
+    "offering-package-selection-runtime-baseline": ("offering_package_selection_runtime_baseline", "validate_bundle"),
+    "offering-package-definition-resolution": ("offering_package_definition_resolution", "validate_bundle"),
+    "offering-package-prerequisite-gate": ("offering_package_prerequisite_gate", "validate_bundle"),
+    "offering-package-materialization-and-bootstrap-mapping": (
+        "offering_package_materialization_and_bootstrap_mapping",
+        "validate_bundle",
+    ),
+    "offering-package-status-and-evidence-runtime": ("offering_package_status_and_evidence_runtime", "validate_bundle"),
+    "package-machine-interface-read-boundary": ("package_machine_interface_read_boundary", "validate_bundle"),
+    "offering-package-composition-and-closeout": ("offering_package_composition_and_closeout", "validate_bundle"),
+    "topology-aware-init-plan-validation": ("topology_aware_init_plan_validation", "validate_bundle"),
+    "topology-aware-offering-package-definition-resolution": (
+        "topology_aware_offering_package_definition_resolution",
+        "validate_bundle",
+    ),
+    "topology-aware-prerequisite-gate": ("topology_aware_prerequisite_gate", "validate_bundle"),
+    "topology-aware-materialization-and-bootstrap-mapping": (
+        "topology_aware_materialization_and_bootstrap_mapping",
+        "validate_bundle",
+    ),
+    "topology-aware-package-status-and-repo-checks": ("topology_aware_package_status_and_repo_checks", "validate_bundle"),
+    "github-governance-topology-contract-baseline": ("github_governance_topology_contract_baseline", "validate_bundle"),
+    "github-governance-topology-composition-and-closeout": (
+        "github_governance_topology_composition_and_closeout",
+        "validate_bundle",
+    ),
+}
+
+PLANE_MODE_ROUTES: dict[str, str] = {
+    "command_dispatch": "shared-command-dispatch",
+    "result_evidence_gate": "result-evidence-promotion-gate",
+    "context_snapshot": "session-context-snapshot",
+    "orchestration_loop": "query-orchestration",
+    "permission_gate": "permission-gate",
+    "event_stream": "event-stream",
+    "session_persistence": "session-persistence",
+    "runtime_control": "runtime-control",
+    "result_normalization": "result-normalization",
+    "workflow_runtime": "workflow-runtime",
+    "delegation_lifecycle": "delegation-lifecycle",
+    "extension_plane": "extension-runtime",
+    "composition_root": "composition-root",
+    "offering_package_selection": "offering-package-selection-runtime-baseline",
+    "offering_package_definition_resolution": "offering-package-definition-resolution",
+    "offering_package_prerequisite_gate": "offering-package-prerequisite-gate",
+    "offering_package_materialization_mapping": "offering-package-materialization-and-bootstrap-mapping",
+    "offering_package_status_evidence": "offering-package-status-and-evidence-runtime",
+    "package_machine_interface_read_boundary": "package-machine-interface-read-boundary",
+    "offering_package_composition_closeout": "offering-package-composition-and-closeout",
+    "topology_aware_init_plan_validation": "topology-aware-init-plan-validation",
+    "topology_aware_offering_package_definition_resolution": "topology-aware-offering-package-definition-resolution",
+    "topology_aware_prerequisite_gate": "topology-aware-prerequisite-gate",
+    "topology_aware_materialization_and_bootstrap_mapping": "topology-aware-materialization-and-bootstrap-mapping",
+    "topology_aware_package_status_and_repo_checks": "topology-aware-package-status-and-repo-checks",
+    "github_governance_topology_contract_baseline": "github-governance-topology-contract-baseline",
+    "github_governance_topology_composition_and_closeout": "github-governance-topology-composition-and-closeout",
+}
+
+COMMAND_ID_ROUTES: dict[str, str] = {
+    "readiness-inspect": "readiness-inspect",
+    "repo-check": "repo-check",
+}
+
+# The v0.1 adoption bundles predate runtime_plane_mode; route them by their marker fields.
+FIELD_ROUTES: tuple[tuple[str, str], ...] = (
+    ("tool_refs", "validate-tool-command-adoption"),
+    ("command_refs", "validate-tool-command-adoption"),
+    ("worktree_instances", "validate-multi-repo-worktree-identity"),
+    ("canonical_repo_root", "validate-multi-repo-worktree-identity"),
+    ("preflight_checks", "validate-context-runtime-preflight"),
+    ("current_truth_sources", "validate-context-runtime-preflight"),
+    ("readiness_checks", "validate-session-readiness-state"),
+    ("orchestration_mode", "validate-session-readiness-state"),
+)
+
+BUNDLE_SUFFIXES = (".json",)
+STREAM_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def route_bundle(bundle: dict[str, Any]) -> str | None:
+    """Return the validator name for ``bundle`` or ``None`` when it cannot be routed."""
+    mode = bundle.get("runtime_plane_mode")
+    if isinstance(mode, str) and mode in PLANE_MODE_ROUTES:
+        return PLANE_MODE_ROUTES[mode]
+    command_id = str(bundle.get("command_id", "")).strip()
+    if command_id in COMMAND_ID_ROUTES:
+        return COMMAND_ID_ROUTES[command_id]
+    for field, name in FIELD_ROUTES:
+        if field in bundle:
+            return name
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_validator(name: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    # Imported on first use so a worker only loads the runtimes its bundles need.
+    module_name, function_name = VALIDATORS[name]
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, function_name)
+
+
+def iter_bundle_sources(inputs: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """Yield ``(source, kind, payload)`` work items.
+
+    ``kind`` is ``"path"`` for bundle files (read by the worker) or ``"text"``
+    for a JSONL line. Inputs may be directories (searched recursively for
+    ``*.json``), ``.jsonl`` streams, ``-`` for a JSONL stream on stdin, bundle
+    files, or glob patterns.
+    """
+    for item in inputs:
+        if item == "-":
+            yield from _iter_stream_lines("<stdin>", sys.stdin)
+            continue
+        path = Path(item)
+        if path.is_dir():
+            for candidate in sorted(path.rglob("*")):
+                if candidate.is_file() and candidate.suffix in BUNDLE_SUFFIXES:
+                    yield (str(candidate), "path", str(candidate))
+        elif path.is_file() and path.suffix in STREAM_SUFFIXES:
+            with path.open("r", encoding="utf-8") as handle:
+                yield from _iter_stream_lines(str(path), handle)
+        elif path.is_file():
+            yield (str(path), "path", str(path))
+        else:
+            for match in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(match):
+                    yield (match, "path", match)
+
+
+def _iter_stream_lines(label: str, handle: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    for line_number, line in enumerate(handle, start=1):
+        if line.strip():
+            yield (f"{label}:{line_number}", "text", line)
+
+
+def _failure(source: str, validator: str | None, code: str, message: str) -> dict[str, Any]:
+    return {
+        "source": source,
+        "validator": validator,
+        "status": "error",
+        "valid": False,
+        "error_codes": [code],
+        "errors": [{"code": code, "message": message}],
+    }
+
+
+def validate_item(item: tuple[str, str, str]) -> dict[str, Any]:
+    source, kind, payload = item
+    try:
+        text = Path(payload).read_text(encoding="utf-8") if kind == "path" else payload
+        bundle = json.loads(text)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        return _failure(source, None, "bundle_load", str(exc))
+    if not isinstance(bundle, dict):
+        return _failure(source, None, "bundle_load", "bundle must be a JSON object")
+    name = route_bundle(bundle)
+    if name is None:
+        return _failure(source, None, "unroutable", "no validator matches runtime_plane_mode or command_id")
+    try:
+        result = get_validator(name)(bundle)
+    except Exception as exc:  # A malformed bundle must not take down the whole batch.
+        return _failure(source, name, "validator_exception", f"{type(exc).__name__}: {exc}")
+    return {
+        "source": source,
+        "validator": name,
+        "status": result.get("status"),
+        "valid": bool(result.get("valid")),
+        "error_codes": result.get("error_codes", []),
+        "errors": result.get("errors", []),
+    }
+
+
+def _validate_chunk(chunk: list[tuple[str, str, str]]) -> list[dict[str, Any]]:
+    return [validate_item(item) for item in chunk]
+
+
+def _chunks(items: Iterable[tuple[str, str, str]], size: int) -> Iterator[list[tuple[str, str, str]]]:
+    chunk: list[tuple[str, str, str]] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_batch(
+    inputs: Iterable[str],
+    *,
+    workers: int | None = None,
+    chunksize: int = 32,
+) -> Iterator[dict[str, Any]]:
+    """Validate every bundle in ``inputs``, yielding results in input order.
+
+    ``workers=1`` validates in-process. Otherwise chunks are fanned out to a
+    process pool with a bounded number of chunks in flight, so results stream
+    out while later inputs are still being discovered.
+    """
+    items = iter_bundle_sources(inputs)
+    chunks = _chunks(items, max(chunksize, 1))
+    if workers == 1:
+        for chunk in chunks:
+            yield from _validate_chunk(chunk)
+        return
+    max_workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_validate_chunk, chunk))
+            if len(pending) >= max_workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class BatchSummary:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.total = 0
+        self.valid = 0
+        self.unroutable = 0
+        self.load_errors = 0
+        self.by_validator: dict[str, dict[str, int]] = {}
+
+    def add(self, result: dict[str, Any]) -> None:
+        self.total += 1
+        if result["valid"]:
+            self.valid += 1
+        codes = result["error_codes"]
+        if "unroutable" in codes:
+            self.unroutable += 1
+        if "bundle_load" in codes:
+            self.load_errors += 1
+        if result["validator"]:
+            counts = self.by_validator.setdefault(result["validator"], {"total": 0, "valid": 0, "invalid": 0})
+            counts["total"] += 1
+            counts["valid" if result["valid"] else "invalid"] += 1
+
+    def payload(self) -> dict[str, Any]:
+        invalid = self.total - self.valid
+        return {
+            "status": "ok" if invalid == 0 else "error",
+            "valid": invalid == 0,
+            "total": self.total,
+            "valid_count": self.valid,
+            "invalid_count": invalid,
+            "unroutable_count": self.unroutable,
+            "load_error_count": self.load_errors,
+            "by_validator": dict(sorted(self.by_validator.items())),
+            "elapsed_seconds": round(time.monotonic() - self.started, 3),
+        }
@@ -0,0 +1,202 @@
+"""Thin client for the ``aaa governance serve`` daemon and the ``aaa`` launcher.
+
+``main`` is the console entry point. When argv is a governance bundle command
+and a daemon answers on the socket, the request is forwarded and the daemon's
+rendered output is written verbatim; otherwise the full Typer CLI runs. This
+module must stay importable without the validators (stdlib only).
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+from typing import Any
+
+
+SOCKET_ENV = "AAA_GOVERNANCE_SOCKET"
+FORWARD_ENV = "AAA_GOVERNANCE_FORWARD"
+CONNECT_TIMEOUT = 0.05
+REQUEST_TIMEOUT = 30.0
+
+# ``aaa governance <command> --bundle PATH [--format human|json]`` commands the daemon serves.
+BUNDLE_COMMANDS = (
+    "validate-tool-command-adoption",
+    "validate-multi-repo-worktree-identity",
+    "validate-context-runtime-preflight",
+    "validate-session-readiness-state",
+    "readiness-inspect",
+    "repo-check",
+    "result-evidence-promotion-gate",
+    "session-context-snapshot",
+    "query-orchestration",
+    "permission-gate",
+    "event-stream",
+    "session-persistence",
+    "runtime-control",
+    "result-normalization",
+    "workflow-runtime",
+    "delegation-lifecycle",
+    "extension-runtime",
+    "composition-root",
+    "offering-package-selection-runtime-baseline",
+    "offering-package-definition-resolution",
+    "offering-package-prerequisite-gate",
+    "offering-package-materialization-and-bootstrap-mapping",
+    "offering-package-status-and-evidence-runtime",
+    "package-machine-interface-read-boundary",
+    "offering-package-composition-and-closeout",
+    "topology-aware-init-plan-validation",
+    "topology-aware-offering-package-definition-resolution",
+    "topology-aware-prerequisite-gate",
+    "topology-aware-materialization-and-bootstrap-mapping",
+    "topology-aware-package-status-and-repo-checks",
+    "github-governance-topology-contract-baseline",
+    "github-governance-topology-composition-and-closeout",
+)
+DISPATCH_COMMAND = "shared-command-dispatch"
+
+_COMMAND_OPTIONS = {
+    "validate": ("--bundle", "--format"),
+    "dispatch": ("--dispatch-bundle", "--command-bundle", "--format"),
+}
+
+
+class DaemonUnavailable(Exception):
+    pass
+
+
+def default_socket_path() -> str:
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return configured
+    # Both are private (0700) per-user directories; never a shared one like /tmp.
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return str(Path(runtime_dir) / "aaa-governance.sock")
+    return str(Path.home() / ".aaa" / "run" / "governance.sock")
+
+
+def socket_is_trusted(path: str) -> bool:
+    """
+    Whether ``path`` is a socket only this user could have created: owned by
+    us, no group/other permission bits, in a directory we own that nobody
+    else can write to. Anything else may be another user's impostor daemon.
+    """
+    try:
+        st = os.lstat(path)
+        parent = os.stat(os.path.dirname(os.path.abspath(path)))
+    except OSError:
+        return False
+    uid = os.getuid()
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and st.st_uid == uid
+        and not st.st_mode & 0o077
+        and parent.st_uid == uid
+        and not parent.st_mode & 0o022
+    )
+
+
+def _parse_options(args: list[str], allowed: tuple[str, ...]) -> dict[str, str] | None:
+    options: dict[str, str] = {}
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if "=" in arg and arg.startswith("--"):
+            name, value = arg.split("=", 1)
+        elif index + 1 < len(args):
+            name, value = arg, args[index + 1]
+            index += 1
+        else:
+            return None
+        if name not in allowed or name in options:
+            return None
+        options[name] = value
+        index += 1
+    return options
+
+
+def build_request(argv: list[str]) -> dict[str, Any] | None:
+    """Translate ``governance <command> ...`` argv into a daemon request, or None if not forwardable."""
+    if len(argv) < 2 or argv[0] != "governance":
+        return None
+    command = argv[1]
+    if command in BUNDLE_COMMANDS:
+        op = "validate"
+    elif command == DISPATCH_COMMAND:
+        op = "dispatch"
+    else:
+        return None
+    options = _parse_options(argv[2:], _COMMAND_OPTIONS[op])
+    if options is None:
+        return None
+    output_format = options.pop("--format", "human")
+    if output_format not in ("human", "json"):
+        return None
+    args = {name[2:].replace("-", "_"): value for name, value in options.items()}
+    required = {"bundle"} if op == "validate" else {"dispatch_bundle", "command_bundle"}
+    if set(args) != required:
+        return None
+    return {
+        "op": op,
+        "command": command,
+        "args": args,
+        "format": output_format,
+        "cwd": os.getcwd(),
+    }
+
+
+def send_request(request: dict[str, Any], socket_path: str | None = None) -> dict[str, Any]:
+    """Send one newline-delimited JSON request and return the daemon's response."""
+    path = socket_path or default_socket_path()
+    if not socket_is_trusted(path):
+        raise DaemonUnavailable(f"refusing untrusted socket {path}")
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(CONNECT_TIMEOUT)
+        try:
+            client.connect(path)
+        except OSError as exc:
+            raise DaemonUnavailable(str(exc)) from exc
+        client.settimeout(REQUEST_TIMEOUT)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+    finally:
+        client.close()
+    if not line:
+        raise DaemonUnavailable("daemon closed the connection")
+    return json.loads(line)
+
+
+def forward(argv: list[str], socket_path: str | None = None) -> int | None:
+    """Run ``argv`` on the daemon; return its exit code, or None to fall back to the local CLI."""
+    if os.environ.get(FORWARD_ENV, "1") == "0":
+        return None
+    request = build_request(argv)
+    if request is None:
+        return None
+    path = socket_path or default_socket_path()
+    if not socket_is_trusted(path):
+        return None
+    try:
+        response = send_request(request, path)
+    except (DaemonUnavailable, OSError, ValueError):
+        return None
+    if not response.get("ok"):
+        # Errors (missing files, malformed JSON) re-run locally so they surface exactly as the CLI reports them.
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stdout.flush()
+    return int(response["exit_code"])
+
+
+def main() -> Any:
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        return exit_code
+    from .cli import app
+
+    return app()
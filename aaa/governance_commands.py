@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from . import context_runtime_preflight
+from . import governance_batch
 from . import governance_index
 from . import multi_repo_worktree_identity
 from . import agent_delegation_and_task_lifecycle_runtime
@@ -63,6 +64,20 @@ def update_index_cli(
     )
 
 
+def validate_batch_cli(
+    *,
+    inputs: list[str],
+    workers: int | None = None,
+    chunksize: int = 32,
+) -> Iterator[dict[str, Any]]:
+    """Stream one ``result`` event per bundle, then a ``summary`` event."""
+    summary = governance_batch.BatchSummary()
+    for result in governance_batch.validate_batch(inputs, workers=workers, chunksize=chunksize):
+        summary.add(result)
+        yield {"event": "result", **result}
+    yield {"event": "summary", **summary.payload()}
+
+
 def validate_tool_command_adoption_cli(*, bundle: str) -> dict[str, Any]:
     return tool_command_adoption.validate_bundle_file(bundle)
 
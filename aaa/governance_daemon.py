@@ -0,0 +1,225 @@
+"""Long-running governance validation daemon (``aaa governance serve``).
+
+Listens on a Unix domain socket for newline-delimited JSON requests and answers
+from validators imported once at startup:
+
+    {"op": "validate", "command": "repo-check", "args": {"bundle": "b.json"}, "format": "json", "cwd": "/repo"}
+    {"op": "dispatch", "command": "shared-command-dispatch",
+     "args": {"dispatch_bundle": "d.json", "command_bundle": "c.json"}, "format": "human", "cwd": "/repo"}
+    {"op": "ping"} | {"op": "stats"} | {"op": "shutdown"}
+
+``validate``/``dispatch`` responses carry the exact stdout and exit code the
+CLI command would produce. Requests run one at a time in the caller's working
+directory so relative bundle paths resolve (and are reported) as on the CLI.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+from . import governance_commands
+from .governance_client import BUNDLE_COMMANDS, DISPATCH_COMMAND, DaemonUnavailable, default_socket_path, send_request
+from .validation_memo import MEMO
+
+
+LATENCY_WINDOW = 1024
+
+_REQUIRED_ARGS = {
+    "validate": {"bundle"},
+    "dispatch": {"dispatch_bundle", "command_bundle"},
+}
+
+
+def _cli_function(command: str) -> Callable[..., dict[str, Any]]:
+    return getattr(governance_commands, command.replace("-", "_") + "_cli")
+
+
+COMMAND_FUNCTIONS = {command: _cli_function(command) for command in BUNDLE_COMMANDS + (DISPATCH_COMMAND,)}
+
+
+def render(payload: dict[str, Any], output_format: str) -> tuple[str, int]:
+    """Render ``payload`` exactly as the ``aaa governance`` bundle commands print it."""
+    if output_format == "json":
+        text = json.dumps(payload, indent=2, ensure_ascii=True) + "\n"
+    else:
+        lines = [f"status={payload['status']} valid={payload['valid']}"]
+        lines.extend(f"{error['code']}: {error['message']}" for error in payload["errors"])
+        text = "\n".join(lines) + "\n"
+    return text, 0 if payload["valid"] else 2
+
+
+class GovernanceDaemon:
+    """Request handling and latency accounting, independent of the socket transport."""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.requests = 0
+        self.failures = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._run_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def handle(self, request: Any) -> dict[str, Any]:
+        op = request.get("op") if isinstance(request, dict) else None
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "stats":
+            return {"ok": True, "stats": self.stats()}
+        if op == "shutdown":
+            return {"ok": True, "shutdown": True}
+        if op in _REQUIRED_ARGS:
+            return self._run(op, request)
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    def _run(self, op: str, request: dict[str, Any]) -> dict[str, Any]:
+        command = request.get("command")
+        args = request.get("args")
+        output_format = request.get("format", "human")
+        expected = DISPATCH_COMMAND if op == "dispatch" else command
+        if command != expected or command not in COMMAND_FUNCTIONS:
+            return self._failed(f"unsupported {op} command: {command}")
+        if not isinstance(args, dict) or set(args) != _REQUIRED_ARGS[op]:
+            return self._failed(f"{op} requires args: {', '.join(sorted(_REQUIRED_ARGS[op]))}")
+        if output_format not in ("human", "json"):
+            return self._failed(f"unsupported format: {output_format}")
+
+        start = time.perf_counter()
+        try:
+            # cwd is process-wide, so commands run one at a time.
+            with self._run_lock:
+                previous = os.getcwd()
+                os.chdir(request.get("cwd") or previous)
+                try:
+                    payload = COMMAND_FUNCTIONS[command](**{name: str(value) for name, value in args.items()})
+                finally:
+                    os.chdir(previous)
+            stdout, exit_code = render(payload, output_format)
+        except Exception as exc:
+            return self._failed(f"{type(exc).__name__}: {exc}")
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self.requests += 1
+            self._latencies.append(elapsed)
+        return {"ok": True, "exit_code": exit_code, "stdout": stdout}
+
+    def _failed(self, message: str) -> dict[str, Any]:
+        with self._stats_lock:
+            self.failures += 1
+        return {"ok": False, "error": message}
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            requests = self.requests
+            failures = self.failures
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1e6, 1)
+
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started_at, 3),
+            "requests": requests,
+            "failures": failures,
+            "latency_us": {
+                "window": len(latencies),
+                "mean": round(sum(latencies) / len(latencies) * 1e6, 1) if latencies else 0.0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(latencies[-1] * 1e6, 1) if latencies else 0.0,
+            },
+            "memo": MEMO.stats(),
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {"ok": False, "error": "malformed request"}
+            else:
+                response = self.server.governance.handle(request)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if response.get("shutdown"):
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class GovernanceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: GovernanceDaemon | None = None):
+        self.governance = daemon or GovernanceDaemon()
+        self.socket_path = socket_path
+        _claim_socket_path(socket_path)
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _claim_socket_path(socket_path: str) -> None:
+    path = Path(socket_path)
+    try:
+        st = os.lstat(socket_path)
+    except FileNotFoundError:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        return
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        # Never delete a regular file, a symlink or another user's socket.
+        raise RuntimeError(f"refusing to replace {socket_path}: not a socket owned by this user")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        path.unlink()  # stale socket from a daemon that did not exit cleanly
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"governance daemon already running on {socket_path}")
+
+
+def serve(socket_path: str | None = None, *, on_ready: Callable[[GovernanceServer], None] | None = None) -> None:
+    """Serve until ``shutdown`` is requested or SIGTERM/SIGINT arrives."""
+    server = GovernanceServer(socket_path or default_socket_path())
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    try:
+        if on_ready:
+            on_ready(server)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def control(op: str, socket_path: str | None = None) -> dict[str, Any] | None:
+    """Send ``ping``/``stats``/``shutdown`` to a running daemon; None when none is listening."""
+    try:
+        return send_request({"op": op}, socket_path)
+    except DaemonUnavailable:
+        return None
@@ -38,7 +38,8 @@ try:
 except Exception:  # pragma: no cover - fallback when jsonschema isn't available
     Draft202012Validator = None
 
-from .jsonl import emit_jsonl
+from .jsonl import emit_jsonl, jsonl_command
+from .init_run_journal import WORKSPACE_UNIT, InitRunJournal, plan_run_key
 from . import messages
 from . import verify_ci as verify_ci_module
 
@@ -89,6 +90,7 @@ DEFAULT_GATE_WORKFLOW = (
     "ai-asset-architecture/aaa-actions/.github/workflows/reusable-gate.yaml@main"
 )
 LOCAL_SANDBOX_PROFILE = "local_sandbox"
+_ACTIVE_JOURNAL: Optional[InitRunJournal] = None
 
 
 @dataclass
@@ -259,8 +261,12 @@ def _local_sandbox_ensure_repos(
         if not repo_name:
             _emit_error_and_exit(jsonl, command, step_id, ERROR_INVALID_ARGUMENT, "repo name missing in plan")
         repo_dir = workspace_dir / _local_repo_dir_name(repo_name)
+        unit_inputs = {"repo": repo, "plan_ref": plan_ref, "path": str(repo_dir)}
+        if repo_dir.exists() and _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs):
+            continue
         repo_dir.mkdir(parents=True, exist_ok=True)
         write_repo_metadata(repo_dir, _repo_type_from_plan(repo), plan_ref)
+        _journal_record(step_id, repo_name, unit_inputs)
         emit_jsonl(
             jsonl,
             event="result",
@@ -760,6 +766,53 @@ class _Cwd:
         os.chdir(self.original)
 
 
+class _JournalScope:
+    def __init__(self, journal: Optional[InitRunJournal]):
+        self.journal = journal
+        self.previous: Optional[InitRunJournal] = None
+
+    def __enter__(self):
+        global _ACTIVE_JOURNAL
+        self.previous = _ACTIVE_JOURNAL
+        _ACTIVE_JOURNAL = self.journal
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _ACTIVE_JOURNAL
+        _ACTIVE_JOURNAL = self.previous
+
+
+def _journal_resumed(
+    jsonl: bool,
+    command: str,
+    step_id: str,
+    repo_name: str,
+    inputs: dict[str, Any],
+    full_name: Optional[str] = None,
+) -> bool:
+    if _ACTIVE_JOURNAL is None or not _ACTIVE_JOURNAL.is_complete(step_id, repo_name, inputs):
+        return False
+    emit_jsonl(
+        jsonl,
+        event="result",
+        status="noop",
+        command=command,
+        step_id=step_id,
+        data={"repo": full_name or repo_name, "status": "resumed"},
+    )
+    return True
+
+
+def _journal_record(
+    step_id: str,
+    repo_name: str,
+    inputs: dict[str, Any],
+    report: Optional[dict[str, Any]] = None,
+) -> None:
+    if _ACTIVE_JOURNAL is not None:
+        _ACTIVE_JOURNAL.record_unit(step_id, repo_name, inputs, report)
+
+
 class _ReportBuilder:
     def __init__(
         self,
@@ -817,6 +870,14 @@ class _ReportBuilder:
             payload["commands"] = commands
         self.steps.append(payload)
 
+    def restore_from_journal(self, journal: InitRunJournal) -> None:
+        workspace_updates = journal.workspace_updates()
+        if workspace_updates:
+            for repo in self.repos:
+                repo.update(workspace_updates)
+        for repo_name, updates in journal.repo_updates().items():
+            self.mark_repo(repo_name, **updates)
+
     def build(self, status: str, prs_created: int, next_actions: list[str]) -> dict[str, Any]:
         aaa = self.plan.get("aaa", {})
         target = self.plan.get("target", {})
@@ -906,10 +967,12 @@ class _ReportBuilder:
         "This does not certify downstream bundle readiness, full automation, or full execution readiness."
     ),
 )
+@jsonl_command
 def validate_plan(
     plan: Path = typer.Option(..., "--plan", exists=False, readable=False),
     schema: Path = typer.Option(REPO_ROOT / "specs" / "plan.schema.json", "--schema"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
 ):
     command = "aaa init validate-plan"
@@ -976,14 +1039,17 @@ def validate_plan(
 
 
 @init_app.callback(invoke_without_command=True)
+@jsonl_command
 def run_plan(
     plan: Optional[Path] = typer.Option(None, "--plan"),
     mode: str = typer.Option("pr", "--mode"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     profile: Optional[str] = typer.Option(None, "--profile"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
+    resume: bool = typer.Option(False, "--resume"),
 ):
     if plan is None:
         return
@@ -1055,234 +1121,279 @@ def run_plan(
     )
     prs_created = 0
     next_actions: list[str] = []
+    journal: Optional[InitRunJournal] = None
+    if not dry_run:
+        journal = InitRunJournal.for_plan(
+            workspace_dir,
+            plan_run_key(plan, plan_data, mode, preset, profile),
+            resume=resume,
+        )
 
-    try:
-        for step in steps:
-            step_id_value = step.get("id")
-            started_at = _rfc3339_now()
-
-            if step_id_value == "preflight":
-                if not _is_local_sandbox_profile(profile):
-                    _require_tool("gh", jsonl, command, step_id, dry_run=dry_run)
-                _require_tool("git", jsonl, command, step_id, dry_run=dry_run)
-                emit_jsonl(
-                    jsonl,
-                    event="result",
-                    status="ok" if not dry_run else "noop",
-                    command=command,
-                    step_id="preflight",
-                    data={"status": "checked"},
-                )
-                report_builder.add_step(
-                    "preflight",
-                    "pass",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-                continue
+    with _JournalScope(journal):
+        try:
+            for step in steps:
+                step_id_value = step.get("id")
+                started_at = _rfc3339_now()
+                step_inputs = {
+                    "step": step,
+                    "aaa": plan_data.get("aaa", {}),
+                    "target": plan_data.get("target", {}),
+                    "mode": mode,
+                    "profile": profile,
+                    "repos": resolved_repos,
+                }
+                resumed_step = journal.completed_step(step_id_value, step_inputs) if journal else None
 
-            if step_id_value == "ensure_repos":
-                if _is_local_sandbox_profile(profile):
-                    _local_sandbox_ensure_repos(
-                        resolved_repos,
-                        workspace_dir,
-                        str(plan),
-                        jsonl,
-                        command,
-                        "ensure_repos",
-                    )
-                else:
-                    ensure_repos(
-                        org=org,
-                        from_plan=plan,
-                        preset=preset,
-                        jsonl=jsonl,
-                        log_dir=log_dir,
-                        dry_run=dry_run,
-                    )
-                report_builder.add_step(
-                    "ensure_repos",
-                    "pass",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            elif step_id_value == "apply_templates":
-                if _is_local_sandbox_profile(profile):
+                if resumed_step is not None and step_id_value != "preflight":
                     emit_jsonl(
                         jsonl,
                         event="result",
                         status="noop",
                         command=command,
-                        step_id="apply_templates",
-                        data={"status": "profile_deferred", "profile": LOCAL_SANDBOX_PROFILE},
-                    )
-                else:
-                    aaa_tag = _aaa_version_from_plan(plan_data)
-                    apply_templates(
-                        org=org,
-                        from_plan=plan,
-                        preset=preset,
-                        aaa_tag=aaa_tag,
-                        jsonl=jsonl,
-                        log_dir=log_dir,
-                        dry_run=dry_run,
+                        step_id=step_id_value,
+                        data={"status": "resumed"},
                     )
-                report_builder.add_step(
-                    "apply_templates",
-                    "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            elif step_id_value == "sync_assets":
-                if dry_run:
+                    report_builder.steps.append(dict(resumed_step["payload"]))
+                    if step_id_value == "open_prs" and resumed_step["payload"].get("status") == "pass":
+                        prs_created += len(report_builder.repos)
+                    continue
+
+                if step_id_value == "preflight":
+                    if not _is_local_sandbox_profile(profile):
+                        _require_tool("gh", jsonl, command, step_id, dry_run=dry_run)
+                    _require_tool("git", jsonl, command, step_id, dry_run=dry_run)
                     emit_jsonl(
                         jsonl,
                         event="result",
-                        status="noop",
+                        status="ok" if not dry_run else "noop",
                         command=command,
-                        step_id="sync_assets",
-                        data={"status": "dry_run"},
+                        step_id="preflight",
+                        data={"status": "checked"},
                     )
-                else:
-                    with _Cwd(workspace_dir):
-                        from .cli import sync_skills, sync_workflows
-
-                        sync_skills(target="codex")
-                        sync_skills(target="agent")
-                        sync_workflows(target="agent")
-                    for repo in report_builder.repos:
-                        repo["workflows_synced"] = True
-                        repo["skills_synced"] = True
-                report_builder.add_step(
-                    "sync_assets",
-                    "pass",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            elif step_id_value == "branch_protection":
-                if _is_local_sandbox_profile(profile):
-                    emit_jsonl(
-                        jsonl,
-                        event="result",
-                        status="noop",
-                        command=command,
-                        step_id="branch_protection",
-                        data={"status": "profile_excluded", "profile": LOCAL_SANDBOX_PROFILE},
+                    report_builder.add_step(
+                        "preflight",
+                        "pass",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
-                else:
-                    protect(
-                        org=org,
-                        from_plan=plan,
-                        preset=preset,
-                        jsonl=jsonl,
-                        log_dir=log_dir,
-                        dry_run=dry_run,
+                    continue
+
+                if step_id_value == "ensure_repos":
+                    if _is_local_sandbox_profile(profile):
+                        _local_sandbox_ensure_repos(
+                            resolved_repos,
+                            workspace_dir,
+                            str(plan),
+                            jsonl,
+                            command,
+                            "ensure_repos",
+                        )
+                    else:
+                        ensure_repos(
+                            org=org,
+                            from_plan=plan,
+                            preset=preset,
+                            jsonl=jsonl,
+                            log_dir=log_dir,
+                            dry_run=dry_run,
+                        )
+                    report_builder.add_step(
+                        "ensure_repos",
+                        "pass",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
-                report_builder.add_step(
-                    "branch_protection",
-                    "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            elif step_id_value == "open_prs":
-                if mode == "pr" and not _is_local_sandbox_profile(profile):
-                    open_prs(
-                        org=org,
-                        from_plan=plan,
-                        preset=preset,
-                        jsonl=jsonl,
-                        log_dir=log_dir,
-                        dry_run=dry_run,
+                elif step_id_value == "apply_templates":
+                    if _is_local_sandbox_profile(profile):
+                        emit_jsonl(
+                            jsonl,
+                            event="result",
+                            status="noop",
+                            command=command,
+                            step_id="apply_templates",
+                            data={"status": "profile_deferred", "profile": LOCAL_SANDBOX_PROFILE},
+                        )
+                    else:
+                        aaa_tag = _aaa_version_from_plan(plan_data)
+                        apply_templates(
+                            org=org,
+                            from_plan=plan,
+                            preset=preset,
+                            aaa_tag=aaa_tag,
+                            jsonl=jsonl,
+                            log_dir=log_dir,
+                            dry_run=dry_run,
+                        )
+                    report_builder.add_step(
+                        "apply_templates",
+                        "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
-                    if not dry_run:
-                        prs_created += len(report_builder.repos)
-                report_builder.add_step(
-                    "open_prs",
-                    "pass" if mode == "pr" and not _is_local_sandbox_profile(profile) else "skipped_profile",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            elif step_id_value == "ci_verify":
-                if _is_local_sandbox_profile(profile):
-                    emit_jsonl(
-                        jsonl,
-                        event="result",
-                        status="noop",
-                        command=command,
-                        step_id="ci_verify",
-                        data={"status": "profile_excluded", "profile": LOCAL_SANDBOX_PROFILE},
+                elif step_id_value == "sync_assets":
+                    if dry_run:
+                        emit_jsonl(
+                            jsonl,
+                            event="result",
+                            status="noop",
+                            command=command,
+                            step_id="sync_assets",
+                            data={"status": "dry_run"},
+                        )
+                    else:
+                        sync_inputs = {"workspace_dir": str(workspace_dir)}
+                        if not _journal_resumed(jsonl, command, "sync_assets", WORKSPACE_UNIT, sync_inputs):
+                            with _Cwd(workspace_dir):
+                                from .cli import sync_skills, sync_workflows
+
+                                sync_skills(target="codex")
+                                sync_skills(target="agent")
+                                sync_workflows(target="agent")
+                            _journal_record(
+                                "sync_assets",
+                                WORKSPACE_UNIT,
+                                sync_inputs,
+                                {"workflows_synced": True, "skills_synced": True},
+                            )
+                        for repo in report_builder.repos:
+                            repo["workflows_synced"] = True
+                            repo["skills_synced"] = True
+                    report_builder.add_step(
+                        "sync_assets",
+                        "pass",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
-                else:
-                    verify_ci(
-                        org=org,
-                        from_plan=plan,
-                        preset=preset,
-                        jsonl=jsonl,
-                        log_dir=log_dir,
-                        dry_run=dry_run,
+                elif step_id_value == "branch_protection":
+                    if _is_local_sandbox_profile(profile):
+                        emit_jsonl(
+                            jsonl,
+                            event="result",
+                            status="noop",
+                            command=command,
+                            step_id="branch_protection",
+                            data={"status": "profile_excluded", "profile": LOCAL_SANDBOX_PROFILE},
+                        )
+                    else:
+                        protect(
+                            org=org,
+                            from_plan=plan,
+                            preset=preset,
+                            jsonl=jsonl,
+                            log_dir=log_dir,
+                            dry_run=dry_run,
+                        )
+                    report_builder.add_step(
+                        "branch_protection",
+                        "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
-                report_builder.add_step(
-                    "ci_verify",
-                    "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            elif step_id_value == "repo_evals":
-                if _is_local_sandbox_profile(profile):
-                    emit_jsonl(
-                        jsonl,
-                        event="result",
-                        status="noop",
-                        command=command,
-                        step_id="repo_evals",
-                        data={"status": "profile_excluded", "profile": LOCAL_SANDBOX_PROFILE},
+                elif step_id_value == "open_prs":
+                    if mode == "pr" and not _is_local_sandbox_profile(profile):
+                        open_prs(
+                            org=org,
+                            from_plan=plan,
+                            preset=preset,
+                            jsonl=jsonl,
+                            log_dir=log_dir,
+                            dry_run=dry_run,
+                        )
+                        if not dry_run:
+                            prs_created += len(report_builder.repos)
+                    report_builder.add_step(
+                        "open_prs",
+                        "pass" if mode == "pr" and not _is_local_sandbox_profile(profile) else "skipped_profile",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
+                    )
+                elif step_id_value == "ci_verify":
+                    if _is_local_sandbox_profile(profile):
+                        emit_jsonl(
+                            jsonl,
+                            event="result",
+                            status="noop",
+                            command=command,
+                            step_id="ci_verify",
+                            data={"status": "profile_excluded", "profile": LOCAL_SANDBOX_PROFILE},
+                        )
+                    else:
+                        verify_ci(
+                            org=org,
+                            from_plan=plan,
+                            preset=preset,
+                            jsonl=jsonl,
+                            log_dir=log_dir,
+                            dry_run=dry_run,
+                        )
+                    report_builder.add_step(
+                        "ci_verify",
+                        "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
+                    )
+                elif step_id_value == "repo_evals":
+                    if _is_local_sandbox_profile(profile):
+                        emit_jsonl(
+                            jsonl,
+                            event="result",
+                            status="noop",
+                            command=command,
+                            step_id="repo_evals",
+                            data={"status": "profile_excluded", "profile": LOCAL_SANDBOX_PROFILE},
+                        )
+                    else:
+                        repo_checks(
+                            org=org,
+                            from_plan=plan,
+                            preset=preset,
+                            suite="governance",
+                            jsonl=jsonl,
+                            log_dir=log_dir,
+                            dry_run=dry_run,
+                        )
+                    report_builder.add_step(
+                        "repo_evals",
+                        "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
                 else:
-                    repo_checks(
-                        org=org,
-                        from_plan=plan,
-                        preset=preset,
-                        suite="governance",
-                        jsonl=jsonl,
-                        log_dir=log_dir,
-                        dry_run=dry_run,
+                    report_builder.add_step(
+                        step_id_value or "unknown",
+                        "skipped",
+                        started_at,
+                        _rfc3339_now(),
+                        step.get("commands"),
                     )
-                report_builder.add_step(
-                    "repo_evals",
-                    "pass" if not _is_local_sandbox_profile(profile) else "skipped_profile",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-            else:
-                report_builder.add_step(
-                    step_id_value or "unknown",
-                    "skipped",
-                    started_at,
-                    _rfc3339_now(),
-                    step.get("commands"),
-                )
-    except SystemExit:
-        report = report_builder.build("fail", prs_created, next_actions)
-        report_path = _resolve_report_path(log_dir, workspace_dir)
-        report_path.write_text(json.dumps(report, ensure_ascii=True, indent=2), encoding="utf-8")
-        emit_jsonl(
-            jsonl,
-            event="result",
-            status="error",
-            command=command,
-            step_id=step_id,
-            data={"report_path": str(report_path)},
-        )
-        raise
+                if journal is not None:
+                    journal.record_step(report_builder.steps[-1], step_inputs)
+        except SystemExit:
+            if journal is not None:
+                report_builder.restore_from_journal(journal)
+            report = report_builder.build("fail", prs_created, next_actions)
+            report_path = _resolve_report_path(log_dir, workspace_dir)
+            report_path.write_text(json.dumps(report, ensure_ascii=True, indent=2), encoding="utf-8")
+            emit_jsonl(
+                jsonl,
+                event="result",
+                status="error",
+                command=command,
+                step_id=step_id,
+                data={"report_path": str(report_path)},
+            )
+            raise
 
+    if journal is not None:
+        report_builder.restore_from_journal(journal)
     report = report_builder.build("pass", prs_created, next_actions)
     report_path = _resolve_report_path(log_dir, workspace_dir)
     report_path.write_text(json.dumps(report, ensure_ascii=True, indent=2), encoding="utf-8")
@@ -1302,11 +1413,13 @@ def run_plan(
 
 
 @init_app.command("ensure-repos")
+@jsonl_command
 def ensure_repos(
     org: str = typer.Option(..., "--org"),
     from_plan: Path = typer.Option(..., "--from-plan"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
 ):
@@ -1358,10 +1471,15 @@ def ensure_repos(
             )
             continue
 
+        unit_inputs = {"full_name": full_name, "repo": repo, "visibility": visibility}
+        if _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs, full_name):
+            continue
+
         _require_tool("gh", jsonl, command, step_id, dry_run=False)
         view_result = _run_command(["gh", "repo", "view", full_name, "--json", "url,defaultBranchRef,visibility"])
         if view_result.code == 0:
             data = json.loads(view_result.stdout or "{}")
+            _journal_record(step_id, repo_name, unit_inputs, {"status": "exists", "url": data.get("url") or ""})
             emit_jsonl(
                 jsonl,
                 event="result",
@@ -1411,6 +1529,7 @@ def ensure_repos(
             )
 
         data = _gh_repo_view(full_name) or {}
+        _journal_record(step_id, repo_name, unit_inputs, {"status": "created", "url": data.get("url") or ""})
         emit_jsonl(
             jsonl,
             event="result",
@@ -1428,12 +1547,14 @@ def ensure_repos(
 
 
 @init_app.command("apply-templates")
+@jsonl_command
 def apply_templates(
     org: str = typer.Option(..., "--org"),
     from_plan: Path = typer.Option(..., "--from-plan"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     aaa_tag: str = typer.Option(..., "--aaa-tag"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
 ):
@@ -1496,6 +1617,16 @@ def apply_templates(
             )
             continue
 
+        unit_inputs = {
+            "full_name": full_name,
+            "repo": repo,
+            "template_source": f"{template_full}@{aaa_tag}",
+            "project_slug": project_slug,
+        }
+        if _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs, full_name):
+            continue
+        unit_report = {"template_applied": True, "template_source": f"{template_full}@{aaa_tag}"}
+
         _require_tool("git", jsonl, command, step_id, dry_run=False)
         _require_tool("gh", jsonl, command, step_id, dry_run=False)
         template_clone = _run_command(
@@ -1570,6 +1701,7 @@ def apply_templates(
                     {"repo": full_name, "details": push_result.stderr},
                 )
 
+            _journal_record(step_id, repo_name, unit_inputs, unit_report)
             emit_jsonl(
                 jsonl,
                 event="result",
@@ -1613,6 +1745,7 @@ def apply_templates(
                 {"repo": full_name, "details": push_result.stderr},
             )
 
+        _journal_record(step_id, repo_name, unit_inputs, unit_report)
         emit_jsonl(
             jsonl,
             event="result",
@@ -1628,11 +1761,13 @@ def apply_templates(
 
 
 @init_app.command("protect")
+@jsonl_command
 def protect(
     org: str = typer.Option(..., "--org"),
     from_plan: Path = typer.Option(..., "--from-plan"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
 ):
@@ -1712,6 +1847,10 @@ def protect(
             )
             continue
 
+        unit_inputs = {"full_name": full_name, "default_branch": default_branch, "settings": settings}
+        if _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs, full_name):
+            continue
+
         _require_tool("gh", jsonl, command, step_id, dry_run=False)
         api_result = _run_command(
             [
@@ -1736,6 +1875,7 @@ def protect(
                 {"repo": full_name, "details": api_result.stderr},
             )
 
+        _journal_record(step_id, repo_name, unit_inputs)
         emit_jsonl(
             jsonl,
             event="result",
@@ -1747,11 +1887,13 @@ def protect(
 
 
 @init_app.command("verify-ci")
+@jsonl_command
 def verify_ci(
     org: str = typer.Option(..., "--org"),
     from_plan: Path = typer.Option(..., "--from-plan"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
 ):
@@ -1822,6 +1964,10 @@ def verify_ci(
                     {"repo": full_name, "missing": missing},
                 )
 
+        unit_inputs = {"full_name": full_name, "default_branch": default_branch, "checks": checks}
+        if _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs, full_name):
+            continue
+
         _require_tool("gh", jsonl, command, step_id, dry_run=False)
         api_result = _run_command(["gh", "api", f"repos/{full_name}/commits/{default_branch}/check-runs"])
         if api_result.code != 0:
@@ -1861,6 +2007,7 @@ def verify_ci(
                 {"repo": full_name, "failed": failed},
             )
 
+        _journal_record(step_id, repo_name, unit_inputs)
         emit_jsonl(
             jsonl,
             event="result",
@@ -1872,11 +2019,13 @@ def verify_ci(
 
 
 @init_app.command("open-prs")
+@jsonl_command
 def open_prs(
     org: str = typer.Option(..., "--org"),
     from_plan: Path = typer.Option(..., "--from-plan"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
 ):
@@ -1931,6 +2080,10 @@ def open_prs(
             )
             continue
 
+        unit_inputs = {"full_name": full_name, "default_branch": default_branch, "head": head, "aaa_tag": aaa_tag}
+        if _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs, full_name):
+            continue
+
         _require_tool("gh", jsonl, command, step_id, dry_run=False)
         list_result = _run_command(
             ["gh", "api", f"repos/{full_name}/pulls", "--field", "state=open", "--field", f"head={head}"]
@@ -1939,6 +2092,7 @@ def open_prs(
             existing = json.loads(list_result.stdout)
             if existing:
                 pr_url = existing[0].get("html_url") or existing[0].get("url")
+                _journal_record(step_id, repo_name, unit_inputs, {"pr_url": pr_url or ""})
                 emit_jsonl(
                     jsonl,
                     event="result",
@@ -1978,6 +2132,7 @@ def open_prs(
             )
 
         pr_url = pr_create.stdout.strip()
+        _journal_record(step_id, repo_name, unit_inputs, {"pr_url": pr_url})
         emit_jsonl(
             jsonl,
             event="result",
@@ -1989,12 +2144,14 @@ def open_prs(
 
 
 @init_app.command("repo-checks")
+@jsonl_command
 def repo_checks(
     org: str = typer.Option(..., "--org"),
     from_plan: Path = typer.Option(..., "--from-plan"),
     suite: str = typer.Option(..., "--suite"),
     preset: Optional[str] = typer.Option(None, "--preset"),
     jsonl: bool = typer.Option(False, "--jsonl"),
+    jsonl_file: Optional[Path] = typer.Option(None, "--jsonl-file", help="Write --jsonl events to this file instead of stdout"),
     log_dir: Optional[Path] = typer.Option(None, "--log-dir"),
     dry_run: bool = typer.Option(False, "--dry-run"),
 ):
@@ -2080,6 +2237,10 @@ def repo_checks(
             failed.append({"repo": repo_name, "check": "repo_path", "message": "repo path missing"})
             continue
 
+        unit_inputs = {"repo": repo, "suite": suite, "checks": checks, "repo_path": str(repo_path)}
+        if _journal_resumed(jsonl, command, step_id, repo_name, unit_inputs):
+            continue
+
         repo_type = _repo_type_from_plan(repo)
         manifest_path = os.environ.get(
             "AAA_CHECKS_MANIFEST",
@@ -2104,6 +2265,8 @@ def repo_checks(
             if not payload.get("pass"):
                 failed.append({"repo": repo_name, "check": check, "message": payload.get("details")})
 
+        if all(result["status"] == "pass" for result in repo_results):
+            _journal_record(step_id, repo_name, unit_inputs)
         emit_jsonl(
             jsonl,
             event="result",
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+
+JOURNAL_ROOT = Path(".aaa") / "init-runs"
+JOURNAL_FILE = "journal.jsonl"
+WORKSPACE_UNIT = "*"
+
+
+def _rfc3339_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def canonical_digest(payload: Any) -> str:
+    encoded = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def plan_run_key(
+    plan_path: Path,
+    plan: dict[str, Any],
+    mode: str,
+    preset: Optional[str],
+    profile: Optional[str],
+) -> str:
+    """Identify a bootstrap run independently of the plan's per-repo contents.
+
+    Content changes are caught per unit by the input digests, so editing one
+    repo entry in the plan only invalidates that repo's completed units.
+    """
+    target = plan.get("target", {})
+    return canonical_digest(
+        {
+            "plan_path": str(plan_path.resolve()),
+            "target_org": target.get("org", ""),
+            "project_slug": target.get("project_slug", ""),
+            "mode": mode,
+            "preset": preset or "",
+            "profile": profile or "",
+        }
+    )[:16]
+
+
+class InitRunJournal:
+    """Append-only record of completed (step, repo) units for one plan run."""
+
+    def __init__(self, run_dir: Path, resume: bool = False):
+        self.run_dir = run_dir
+        self.path = run_dir / JOURNAL_FILE
+        self.resume = resume
+        self.units: dict[tuple[str, str], dict[str, Any]] = {}
+        self.steps: dict[str, dict[str, Any]] = {}
+        run_dir.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._load()
+        else:
+            self.path.write_text("", encoding="utf-8")
+
+    @classmethod
+    def for_plan(cls, workspace_dir: Path, run_key: str, resume: bool = False) -> "InitRunJournal":
+        return cls(workspace_dir / JOURNAL_ROOT / run_key, resume=resume)
+
+    def _load(self) -> None:
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-append leaves a torn last line; that unit simply reruns.
+                continue
+            kind = entry.get("kind")
+            if kind == "unit":
+                self.units[(entry.get("step", ""), entry.get("repo", ""))] = entry
+            elif kind == "step":
+                self.steps[entry.get("step", "")] = entry
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=True, sort_keys=True) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def is_complete(self, step_id: str, repo: str, inputs: dict[str, Any]) -> bool:
+        entry = self.units.get((step_id, repo))
+        return bool(entry) and entry.get("inputs_digest") == canonical_digest(inputs)
+
+    def record_unit(
+        self,
+        step_id: str,
+        repo: str,
+        inputs: dict[str, Any],
+        report: Optional[dict[str, Any]] = None,
+    ) -> None:
+        entry = {
+            "kind": "unit",
+            "step": step_id,
+            "repo": repo,
+            "inputs_digest": canonical_digest(inputs),
+            "report": report or {},
+            "completed_at": _rfc3339_now(),
+        }
+        self.units[(step_id, repo)] = entry
+        self._append(entry)
+
+    def completed_step(self, step_id: str, inputs: dict[str, Any]) -> Optional[dict[str, Any]]:
+        entry = self.steps.get(step_id)
+        if entry and entry.get("inputs_digest") == canonical_digest(inputs):
+            return entry
+        return None
+
+    def record_step(self, step_payload: dict[str, Any], inputs: dict[str, Any]) -> None:
+        entry = {
+            "kind": "step",
+            "step": step_payload.get("id", ""),
+            "inputs_digest": canonical_digest(inputs),
+            "payload": step_payload,
+        }
+        self.steps[entry["step"]] = entry
+        self._append(entry)
+
+    def repo_updates(self) -> dict[str, dict[str, Any]]:
+        updates: dict[str, dict[str, Any]] = {}
+        for (_step_id, repo), entry in self.units.items():
+            if repo == WORKSPACE_UNIT or not entry.get("report"):
+                continue
+            updates.setdefault(repo, {}).update(entry["report"])
+        return updates
+
+    def workspace_updates(self) -> dict[str, Any]:
+        updates: dict[str, Any] = {}
+        for (_step_id, repo), entry in self.units.items():
+            if repo == WORKSPACE_UNIT:
+                updates.update(entry.get("report") or {})
+        return updates
@@ -1,14 +1,25 @@
+import atexit
+import contextvars
+import functools
+import inspect
 import json
-from datetime import datetime, timezone
-from typing import Any, Optional
+import os
+import sys
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Protocol, TextIO
 
 
 def _rfc3339_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def emit_jsonl(
-    enabled: bool,
+def _event_payload(
+    ts: str,
     *,
     event: str,
     status: str,
@@ -17,12 +28,10 @@ def emit_jsonl(
     code: Optional[int] = None,
     message: Optional[str] = None,
     data: Optional[dict[str, Any]] = None,
-) -> None:
-    if not enabled:
-        return
+) -> dict[str, Any]:
     payload: dict[str, Any] = {
         "event": event,
-        "ts": _rfc3339_now(),
+        "ts": ts,
         "command": command,
         "step_id": step_id,
         "status": status,
@@ -33,4 +42,327 @@ def emit_jsonl(
         payload["message"] = message
     if data is not None:
         payload["data"] = data
+    return payload
+
+
+class EventOutput(Protocol):
+    def write(self, data: str) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class StreamOutput:
+    """Write batches to a text stream; ``None`` resolves ``sys.stdout`` at write time."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def write(self, data: str) -> None:
+        stream = self.stream or sys.stdout
+        stream.write(data)
+        stream.flush()
+
+    def close(self) -> None:
+        return None
+
+
+class FileOutput:
+    """Append batches to a file with one ``O_APPEND`` write per batch.
+
+    Whole batches land contiguously, so several processes can share one file
+    without interleaving partial lines.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def write(self, data: str) -> None:
+        fd = self._open()
+        view = memoryview(data.encode("utf-8"))
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class RotatingFileOutput(FileOutput):
+    """``FileOutput`` that rolls ``path`` over to ``path.1`` .. ``path.N`` by size."""
+
+    def __init__(self, path: Path, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+    def _rotated(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def _rotate(self) -> None:
+        self.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._rotated(index)
+                if source.exists():
+                    os.replace(source, self._rotated(index + 1))
+            if self.path.exists():
+                os.replace(self.path, self._rotated(1))
+        elif self.path.exists():
+            self.path.unlink()
+
+    def write(self, data: str) -> None:
+        fd = self._open()
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            current = None
+        if current is None or current.st_ino != os.fstat(fd).st_ino:
+            # Another process rotated the file underneath us; follow the new one.
+            self.close()
+            fd = self._open()
+            current = os.fstat(fd)
+        if current.st_size and current.st_size + len(data) > self.max_bytes:
+            self._rotate()
+        super().write(data)
+
+
+_LIVE_SINKS: "weakref.WeakSet[JsonlEventSink]" = weakref.WeakSet()
+
+
+class JsonlEventSink:
+    """Buffered JSONL event writer shared by CLI commands and runtimes.
+
+    Events are serialized immediately and buffered; the buffer is written to
+    every output when it reaches ``max_buffered`` events, when ``flush_interval``
+    seconds have passed, or on ``flush``/``close``. Timestamps are derived from a
+    single wall-clock anchor plus a monotonic offset, so they never go backwards
+    within a sink. A per-``step_id`` ``seq`` counter lets consumers restore the
+    emission order of each step within one sink; counters are per process, so
+    events from several processes appending to one file are not ordered by it.
+    """
+
+    def __init__(
+        self,
+        outputs: Optional[list[EventOutput]] = None,
+        *,
+        max_buffered: int = 256,
+        flush_interval: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.outputs: list[EventOutput] = list(outputs) if outputs is not None else [StreamOutput()]
+        self.max_buffered = max(1, max_buffered)
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._wall_anchor = datetime.now(timezone.utc)
+        self._mono_anchor = clock()
+        self._lock = threading.Lock()
+        self._buffer: list[str] = []
+        self._seq: dict[str, int] = {}
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        _LIVE_SINKS.add(self)
+
+    def __enter__(self) -> "JsonlEventSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def timestamp(self) -> str:
+        return (self._wall_anchor + timedelta(seconds=self._clock() - self._mono_anchor)).isoformat()
+
+    def emit(
+        self,
+        *,
+        event: str,
+        status: str,
+        command: str,
+        step_id: str,
+        code: Optional[int] = None,
+        message: Optional[str] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> None:
+        with self._lock:
+            if self._closed:
+                raise ValueError("event sink is closed")
+            seq = self._seq.get(step_id, 0) + 1
+            self._seq[step_id] = seq
+            payload = _event_payload(
+                self.timestamp(),
+                event=event,
+                status=status,
+                command=command,
+                step_id=step_id,
+                code=code,
+                message=message,
+                data=data,
+            )
+            payload["seq"] = seq
+            self._buffer.append(json.dumps(payload, ensure_ascii=True) + "\n")
+            if len(self._buffer) >= self.max_buffered or self.flush_interval <= 0:
+                self._flush_locked()
+            else:
+                self._ensure_flusher()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._stop.set()
+            for output in self.outputs:
+                output.close()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        batch = "".join(self._buffer)
+        self._buffer.clear()
+        for output in self.outputs:
+            output.write(batch)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher = threading.Thread(target=self._flush_periodically, name="aaa-jsonl-flush", daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def _after_fork_in_child(self) -> None:
+        # The parent still owns whatever it had buffered; the child starts clean.
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._flusher = None
+
+
+def _close_live_sinks() -> None:
+    for sink in list(_LIVE_SINKS):
+        sink.close()
+
+
+def _reset_sinks_after_fork() -> None:
+    for sink in list(_LIVE_SINKS):
+        sink._after_fork_in_child()
+
+
+atexit.register(_close_live_sinks)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sinks_after_fork)
+
+
+_ACTIVE_SINK: contextvars.ContextVar[Optional[JsonlEventSink]] = contextvars.ContextVar("aaa_jsonl_sink", default=None)
+
+
+@contextmanager
+def use_sink(sink: JsonlEventSink) -> Iterator[JsonlEventSink]:
+    """Route ``emit_jsonl`` calls made inside the block to ``sink``."""
+    token = _ACTIVE_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _ACTIVE_SINK.reset(token)
+        sink.flush()
+
+
+def active_sink() -> Optional[JsonlEventSink]:
+    return _ACTIVE_SINK.get()
+
+
+def open_sink(path: Optional[Path] = None, max_bytes: int = 0, backup_count: int = 5) -> JsonlEventSink:
+    """Sink writing to stdout, or to ``path`` (rotated by size when ``max_bytes`` > 0)."""
+    if path is None:
+        output: EventOutput = StreamOutput()
+    elif max_bytes > 0:
+        output = RotatingFileOutput(Path(path), max_bytes=max_bytes, backup_count=backup_count)
+    else:
+        output = FileOutput(Path(path))
+    return JsonlEventSink([output])
+
+
+@contextmanager
+def jsonl_session(enabled: bool, path: Optional[Path] = None, max_bytes: int = 0) -> Iterator[Optional[JsonlEventSink]]:
+    """
+    Buffer every event emitted inside the block through one sink, closed on
+    exit. Inside an active session (one command invoking another) the
+    existing sink is reused so events stay in emission order.
+    """
+    current = _ACTIVE_SINK.get()
+    if not enabled or current is not None:
+        yield current if enabled else None
+        return
+    sink = open_sink(path, max_bytes=max_bytes)
+    try:
+        with use_sink(sink):
+            yield sink
+    finally:
+        sink.close()
+
+
+def jsonl_command(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Run a CLI command inside ``jsonl_session``, driven by its ``jsonl`` and
+    ``jsonl_file`` parameters. The signature is kept, so Typer still sees the
+    command's options and direct calls that omit ``jsonl_file`` still work.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        # Direct calls see Typer's OptionInfo defaults rather than values.
+        jsonl_file = bound.arguments.get("jsonl_file")
+        path = Path(jsonl_file) if isinstance(jsonl_file, (str, os.PathLike)) else None
+        with jsonl_session(bound.arguments.get("jsonl") is True, path):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def emit_jsonl(
+    enabled: bool,
+    *,
+    event: str,
+    status: str,
+    command: str,
+    step_id: str,
+    code: Optional[int] = None,
+    message: Optional[str] = None,
+    data: Optional[dict[str, Any]] = None,
+    sink: Optional[JsonlEventSink] = None,
+) -> None:
+    if not enabled:
+        return
+    sink = sink or _ACTIVE_SINK.get()
+    if sink is not None:
+        sink.emit(event=event, status=status, command=command, step_id=step_id, code=code, message=message, data=data)
+        return
+    payload = _event_payload(
+        _rfc3339_now(),
+        event=event,
+        status=status,
+        command=command,
+        step_id=step_id,
+        code=code,
+        message=message,
+        data=data,
+    )
     print(json.dumps(payload, ensure_ascii=True), flush=True)
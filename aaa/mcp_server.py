@@ -5,20 +5,144 @@ except ImportError:
     class FastMCP:
         def __init__(self, name: str):
             self.name = name
-        def tool(self):
+        def tool(self, *_args, **_kwargs):
             def decorator(func):
                 return func
             return decorator
         def run(self):
             print(f"MCP Server {self.name} is not available: mcp-sdk-python not installed.")
 
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Optional
+
 from . import check_commands
 from . import output_formatter
 from . import messages
 
 mcp = FastMCP("AAA Governance Server")
 
+FINGERPRINT_SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", ".pytest_cache", ".mypy_cache", ".ruff_cache"}
+FINGERPRINT_ENV = ("AAA_EVALS_ROOT", "AAA_CHECKS_MANIFEST", "AAA_GATE_WORKFLOW")
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aaa-mcp")
+
+
+def repo_fingerprint(repo_path: Path) -> str:
+    """Hash the working tree's (path, size, mtime) triples plus check-relevant env.
+
+    This is a stat-only walk: far cheaper than re-running the check
+    subprocesses, and it changes whenever any checked file is touched.
+    """
+    digest = hashlib.sha256()
+    for name in FINGERPRINT_ENV:
+        digest.update(f"{name}={os.environ.get(name, '')}\0".encode("utf-8"))
+    stack = [repo_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in FINGERPRINT_SKIP_DIRS:
+                        stack.append(Path(entry.path))
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            relative = os.path.relpath(entry.path, repo_path)
+            digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class RepoResultCache:
+    """Per-repo results for check/audit, revalidated by tree fingerprint."""
+
+    def __init__(self, fingerprint: Callable[[Path], str] = repo_fingerprint):
+        self._fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], dict[str, Any]] = {}
+        self._inflight: dict[tuple[str, str], Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def peek(self, kind: str, repo_path: Path) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get((kind, str(repo_path)))
+            return dict(entry) if entry else None
+
+    def refreshing(self, kind: str, repo_path: Path) -> bool:
+        with self._lock:
+            return (kind, str(repo_path)) in self._inflight
+
+    def get(self, kind: str, repo_path: Path, compute: Callable[[Path], dict[str, Any]]) -> dict[str, Any]:
+        key = (kind, str(repo_path))
+        fingerprint = self._fingerprint(repo_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry["fingerprint"] == fingerprint:
+                entry["verified_at"] = time.time()
+                entry["stale"] = False
+                self.hits += 1
+                return entry["result"]
+            if entry:
+                entry["stale"] = True
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = Future()
+                self._inflight[key] = pending
+                self.misses += 1
+        if not owner:
+            # Identical request already running (e.g. a status-triggered refresh); share it.
+            return pending.result()
+        try:
+            result = compute(repo_path)
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        now = time.time()
+        with self._lock:
+            self._entries[key] = {
+                "result": result,
+                "fingerprint": fingerprint,
+                "computed_at": now,
+                "verified_at": now,
+                "stale": False,
+            }
+            self._inflight.pop(key, None)
+        pending.set_result(result)
+        return result
+
+    def refresh_in_background(
+        self,
+        kind: str,
+        repo_path: Path,
+        compute: Callable[[Path], dict[str, Any]],
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Future:
+        return (executor or _EXECUTOR).submit(self.get, kind, repo_path, compute)
+
+
+RESULT_CACHE = RepoResultCache()
+
 
 def _wrap_mcp_response(report: str) -> dict:
     payload = {"report": report}
@@ -26,29 +150,93 @@ def _wrap_mcp_response(report: str) -> dict:
     return payload
 
 
-@mcp.tool()
+def _run_check(repo_path: Path) -> dict:
+    return check_commands.run_blocking_check(repo_path)
+
+
+def _run_audit(repo_path: Path) -> dict:
+    from . import audit_commands
+
+    return audit_commands.run_local_audit(repo_path)
+
+
+def _format_llm(command: str, raw_result: dict) -> str:
+    semantic_result = output_formatter.enrich_result(command, raw_result)
+    formatter = output_formatter.get_formatter("llm")
+    return formatter.format(semantic_result)
+
+
 def aaa_check(path: str = ".") -> dict:
     """
     Run AAA governance checks for the specified repository path.
     Returns LLM-optimized semantic diagnostic information.
     """
     repo_path = Path(path).resolve()
-    raw_result = check_commands.run_blocking_check(repo_path)
-    semantic_result = output_formatter.enrich_result("check", raw_result)
-    formatter = output_formatter.get_formatter("llm")
-    return _wrap_mcp_response(formatter.format(semantic_result))
+    raw_result = RESULT_CACHE.get("check", repo_path, _run_check)
+    return _wrap_mcp_response(_format_llm("check", raw_result))
+
 
-@mcp.tool()
 def aaa_audit(path: str = ".") -> dict:
     """
     Generate a governance audit report for the specified repository path.
     """
-    from . import audit_commands
     repo_path = Path(path).resolve()
-    raw_result = audit_commands.run_local_audit(repo_path)
-    semantic_result = output_formatter.enrich_result("audit", raw_result)
-    formatter = output_formatter.get_formatter("llm")
-    return _wrap_mcp_response(formatter.format(semantic_result))
+    raw_result = RESULT_CACHE.get("audit", repo_path, _run_audit)
+    return _wrap_mcp_response(_format_llm("audit", raw_result))
+
+
+def aaa_check_status(path: str = ".") -> dict:
+    """
+    Return the last known check result for a repository path without waiting.
+    A background refresh is started so the next call sees current results.
+    """
+    repo_path = Path(path).resolve()
+    entry = RESULT_CACHE.peek("check", repo_path)
+    if not RESULT_CACHE.refreshing("check", repo_path):
+        RESULT_CACHE.refresh_in_background("check", repo_path, _run_check)
+    if entry is None:
+        return {
+            "status": "pending",
+            "report": None,
+            "freshness": {"computed_at": None, "age_seconds": None, "stale": None, "refreshing": True},
+        }
+    now = time.time()
+    payload = _wrap_mcp_response(_format_llm("check", entry["result"]))
+    payload["status"] = "cached"
+    payload["freshness"] = {
+        "computed_at": datetime.fromtimestamp(entry["computed_at"], timezone.utc).isoformat(),
+        "age_seconds": round(now - entry["computed_at"], 3),
+        "verified_seconds_ago": round(now - entry["verified_at"], 3),
+        "stale": entry["stale"],
+        "refreshing": True,
+    }
+    return payload
+
+
+@mcp.tool(name="aaa_check")
+async def aaa_check_tool(path: str = ".") -> dict:
+    """
+    Run AAA governance checks for the specified repository path.
+    Returns LLM-optimized semantic diagnostic information.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, aaa_check, path)
+
+
+@mcp.tool(name="aaa_audit")
+async def aaa_audit_tool(path: str = ".") -> dict:
+    """
+    Generate a governance audit report for the specified repository path.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, aaa_audit, path)
+
+
+@mcp.tool(name="aaa_check_status")
+async def aaa_check_status_tool(path: str = ".") -> dict:
+    """
+    Return the last known check result and its freshness immediately.
+    """
+    return aaa_check_status(path)
+
 
 if __name__ == "__main__":
     mcp.run()
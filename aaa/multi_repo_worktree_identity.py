@@ -2,6 +2,8 @@ import json
 from pathlib import Path, PurePosixPath
 from typing import Any
 
+from .bundle_rules import TEXTS, Custom, Equals, Required, Unknown, When, compile_rules
+
 
 ALLOWED_VALIDATOR_RULES = {
     "require_canonical_repo_root",
@@ -26,40 +28,10 @@ def _looks_like_workspace_root(path: str) -> bool:
     return "workspace" in lowered
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    canonical_repo_root = str(bundle.get("canonical_repo_root", "")).strip()
-    worktree_instances = [str(item).strip() for item in bundle.get("worktree_instances", [])]
-    validator_rules = [str(item).strip() for item in bundle.get("validator_rules", [])]
-    runtime_guards = [str(item).strip() for item in bundle.get("runtime_guards", [])]
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-
-    if not canonical_repo_root:
-        errors.append({"code": "canonical_repo_root", "message": "canonical_repo_root is required"})
-
-    unknown_validator_rules = [rule for rule in validator_rules if rule not in ALLOWED_VALIDATOR_RULES]
-    if unknown_validator_rules:
-        errors.append(
-            {
-                "code": "validator_rules",
-                "message": f"unknown validator rules: {', '.join(unknown_validator_rules)}",
-            }
-        )
-
-    unknown_runtime_guards = [guard for guard in runtime_guards if guard not in ALLOWED_RUNTIME_GUARDS]
-    if unknown_runtime_guards:
-        errors.append(
-            {
-                "code": "runtime_guards",
-                "message": f"unknown runtime guards: {', '.join(unknown_runtime_guards)}",
-            }
-        )
-
-    if not worktree_instances:
-        errors.append({"code": "worktree_instances", "message": "at least one worktree instance is required"})
+def _check_worktree_targets(bundle: dict[str, Any], values: dict[str, Any], errors: list[dict[str, str]]) -> None:
+    canonical_repo_root = values["canonical_repo_root"]
+    worktree_instances = values["worktree_instances"]
+    validator_rules = values["validator_rules"]
 
     if canonical_repo_root and "reject_workspace_root_as_repo_target" in validator_rules:
         if _looks_like_workspace_root(canonical_repo_root):
@@ -69,7 +41,6 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
                     "message": "workspace root cannot be used as canonical repo target",
                 }
             )
-
     if "reject_unknown_worktree_target" in validator_rules:
         if not canonical_repo_root:
             errors.append(
@@ -88,25 +59,43 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
                         "message": f"worktree targets must live under {expected_prefix}: {', '.join(invalid_instances)}",
                     }
                 )
+    if canonical_repo_root and canonical_repo_root in worktree_instances:
+        errors.append(
+            {
+                "code": "worktree_instances",
+                "message": "worktree instance cannot equal canonical repo root",
+            }
+        )
 
-    if canonical_repo_root:
-        duplicate_targets = [item for item in worktree_instances if item == canonical_repo_root]
-        if duplicate_targets:
-            errors.append(
-                {
-                    "code": "worktree_instances",
-                    "message": "worktree instance cannot equal canonical repo root",
-                }
-            )
+
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Required("canonical_repo_root", "canonical_repo_root is required"),
+        Unknown("validator_rules", ALLOWED_VALIDATOR_RULES, "unknown validator rules"),
+        Unknown("runtime_guards", ALLOWED_RUNTIME_GUARDS, "unknown runtime guards"),
+        When(
+            "worktree_instances",
+            lambda values, bundle: not values["worktree_instances"],
+            "at least one worktree instance is required",
+            fields=(("worktree_instances", TEXTS),),
+        ),
+        Custom(_check_worktree_targets),
+    ]
+)
+
+
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
-        "canonical_repo_root": canonical_repo_root,
-        "resolved_validator_rules": validator_rules,
-        "resolved_runtime_guards": runtime_guards,
-        "worktree_instances": worktree_instances,
+        "canonical_repo_root": values["canonical_repo_root"],
+        "resolved_validator_rules": values["validator_rules"],
+        "resolved_runtime_guards": values["runtime_guards"],
+        "worktree_instances": values["worktree_instances"],
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
     }
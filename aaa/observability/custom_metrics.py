@@ -1,8 +1,57 @@
 import sqlite3
 import json
 import time
+from bisect import bisect_left
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# Upper bounds (ms) of LatencyHistogram buckets; a final bucket catches the rest.
+LATENCY_BUCKETS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+MetricPoint = Tuple[str, float, Dict[str, str]]
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram kept in memory, so hot paths can observe
+    every call and write to ``MetricStore`` in batches.
+    """
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (inf if it is the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def points(self, name: str, tags: Optional[Dict[str, str]] = None) -> List[MetricPoint]:
+        """Cumulative ``<name>.bucket`` points tagged with ``le``, plus ``<name>.count`` and ``<name>.sum``."""
+        tags = tags or {}
+        points = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += n
+            points.append((f"{name}.bucket", float(cumulative), {**tags, "le": "+Inf" if bound == float("inf") else str(bound)}))
+        points.append((f"{name}.count", float(self.count), dict(tags)))
+        points.append((f"{name}.sum", self.total_ms, dict(tags)))
+        return points
 
 class MetricStore:
     def __init__(self, db_path: Optional[Path] = None):
@@ -68,3 +117,18 @@ class MetricStore:
         )
         conn.commit()
         conn.close()
+
+    def record_many(self, points: Iterable[MetricPoint]):
+        """Record several metric points in one transaction."""
+        now = time.time()
+        rows = [(now, name, value, json.dumps(tags or {})) for name, value, tags in points]
+        if not rows:
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("INSERT INTO metrics (timestamp, metric_name, value, tags) VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+    def record_histogram(self, metric_name: str, histogram: LatencyHistogram, tags: Dict[str, str] = None):
+        """Record a histogram snapshot (see ``LatencyHistogram.points``)."""
+        self.record_many(histogram.points(metric_name, tags))
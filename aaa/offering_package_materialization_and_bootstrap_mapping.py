@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import ArrayOf, Equals, Flag, OneOf, TypeIs, compile_rules
+
 
 ALLOWED_PACKAGE_LEVELS = {"lite", "core", "full"}
 ALLOWED_REPO_IDS = {
@@ -31,139 +33,70 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "offering_package_materialization_mapping",
+            "runtime_plane_mode must be offering_package_materialization_mapping",
+        ),
+        Equals(
+            "line_class",
+            "offering_package_runtime_enablement_line",
+            "line_class must be offering_package_runtime_enablement_line",
+        ),
+        Equals("baseline_scope", "pre_topology_baseline", "baseline_scope must be pre_topology_baseline"),
+        Flag(
+            "post_topology_consumption_required",
+            True,
+            "post_topology_consumption_required must be true",
+        ),
+        Equals(
+            "topology_mapping_precedence_ref",
+            "v2.1.34",
+            "topology_mapping_precedence_ref must be v2.1.34",
+        ),
+        OneOf("package_level", ALLOWED_PACKAGE_LEVELS, "package_level is not allowed"),
+        ArrayOf(
+            "minimum_repo_set",
+            "minimum_repo_set must be a non-empty array with at least 3 repos",
+            allowed=ALLOWED_REPO_IDS,
+            invalid_message="minimum_repo_set includes unsupported repo identifiers",
+            min_items=3,
+        ),
+        OneOf("workflow_inclusion_level", ALLOWED_WORKFLOW_LEVELS, "workflow_inclusion_level is not allowed"),
+        TypeIs("template_sync_required", bool, "template_sync_required must be a boolean"),
+        TypeIs("workflow_enablement_required", bool, "workflow_enablement_required must be a boolean"),
+        ArrayOf(
+            "governance_asset_load_list",
+            "governance_asset_load_list must be a non-empty array",
+            allowed=ALLOWED_GOVERNANCE_ASSETS,
+            invalid_message="governance_asset_load_list includes unsupported asset identifiers",
+        ),
+        Equals(
+            "materialization_target_mode",
+            "repo_template_workflow_asset_mapping",
+            "materialization_target_mode must be repo_template_workflow_asset_mapping",
+        ),
+        OneOf("mapping_completeness", {"complete"}, "mapping_completeness must be complete"),
+        Flag(
+            "dedicated_github_universal_invariant",
+            False,
+            "dedicated_github_universal_invariant must be false",
+        ),
+        Flag(
+            "package_status_assertion_included",
+            False,
+            "package_status_assertion_included must be false",
+        ),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    minimum_repo_set = bundle.get("minimum_repo_set", [])
-    governance_asset_load_list = bundle.get("governance_asset_load_list", [])
-    package_level = str(bundle.get("package_level", "")).strip()
-    workflow_inclusion_level = str(bundle.get("workflow_inclusion_level", "")).strip()
-    mapping_completeness = str(bundle.get("mapping_completeness", "")).strip()
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "offering_package_materialization_mapping":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be offering_package_materialization_mapping",
-            }
-        )
-    if bundle.get("line_class") != "offering_package_runtime_enablement_line":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be offering_package_runtime_enablement_line",
-            }
-        )
-    if bundle.get("baseline_scope") != "pre_topology_baseline":
-        errors.append(
-            {
-                "code": "baseline_scope",
-                "message": "baseline_scope must be pre_topology_baseline",
-            }
-        )
-    if bundle.get("post_topology_consumption_required") is not True:
-        errors.append(
-            {
-                "code": "post_topology_consumption_required",
-                "message": "post_topology_consumption_required must be true",
-            }
-        )
-    if bundle.get("topology_mapping_precedence_ref") != "v2.1.34":
-        errors.append(
-            {
-                "code": "topology_mapping_precedence_ref",
-                "message": "topology_mapping_precedence_ref must be v2.1.34",
-            }
-        )
-    if package_level not in ALLOWED_PACKAGE_LEVELS:
-        errors.append({"code": "package_level", "message": "package_level is not allowed"})
-    if not isinstance(minimum_repo_set, list) or len(minimum_repo_set) < 3:
-        errors.append(
-            {
-                "code": "minimum_repo_set",
-                "message": "minimum_repo_set must be a non-empty array with at least 3 repos",
-            }
-        )
-    else:
-        unsupported_repos = [repo for repo in minimum_repo_set if str(repo).strip() not in ALLOWED_REPO_IDS]
-        if unsupported_repos:
-            errors.append(
-                {
-                    "code": "minimum_repo_set",
-                    "message": "minimum_repo_set includes unsupported repo identifiers",
-                }
-            )
-    if workflow_inclusion_level not in ALLOWED_WORKFLOW_LEVELS:
-        errors.append(
-            {
-                "code": "workflow_inclusion_level",
-                "message": "workflow_inclusion_level is not allowed",
-            }
-        )
-    if not isinstance(bundle.get("template_sync_required"), bool):
-        errors.append(
-            {
-                "code": "template_sync_required",
-                "message": "template_sync_required must be a boolean",
-            }
-        )
-    if not isinstance(bundle.get("workflow_enablement_required"), bool):
-        errors.append(
-            {
-                "code": "workflow_enablement_required",
-                "message": "workflow_enablement_required must be a boolean",
-            }
-        )
-    if not isinstance(governance_asset_load_list, list) or not governance_asset_load_list:
-        errors.append(
-            {
-                "code": "governance_asset_load_list",
-                "message": "governance_asset_load_list must be a non-empty array",
-            }
-        )
-    else:
-        unsupported_assets = [
-            asset for asset in governance_asset_load_list if str(asset).strip() not in ALLOWED_GOVERNANCE_ASSETS
-        ]
-        if unsupported_assets:
-            errors.append(
-                {
-                    "code": "governance_asset_load_list",
-                    "message": "governance_asset_load_list includes unsupported asset identifiers",
-                }
-            )
-    if bundle.get("materialization_target_mode") != "repo_template_workflow_asset_mapping":
-        errors.append(
-            {
-                "code": "materialization_target_mode",
-                "message": "materialization_target_mode must be repo_template_workflow_asset_mapping",
-            }
-        )
-    if mapping_completeness != "complete":
-        errors.append(
-            {
-                "code": "mapping_completeness",
-                "message": "mapping_completeness must be complete",
-            }
-        )
-    if bundle.get("dedicated_github_universal_invariant") is not False:
-        errors.append(
-            {
-                "code": "dedicated_github_universal_invariant",
-                "message": "dedicated_github_universal_invariant must be false",
-            }
-        )
-    if bundle.get("package_status_assertion_included") is not False:
-        errors.append(
-            {
-                "code": "package_status_assertion_included",
-                "message": "package_status_assertion_included must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -173,12 +106,12 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "package_level": package_level,
-            "minimum_repo_set": minimum_repo_set,
-            "workflow_inclusion_level": workflow_inclusion_level,
+            "package_level": values["package_level"],
+            "minimum_repo_set": values["minimum_repo_set"],
+            "workflow_inclusion_level": values["workflow_inclusion_level"],
             "template_sync_required": bundle.get("template_sync_required"),
             "workflow_enablement_required": bundle.get("workflow_enablement_required"),
-            "governance_asset_load_list": governance_asset_load_list,
+            "governance_asset_load_list": values["governance_asset_load_list"],
             "topology_mapping_precedence_ref": bundle.get("topology_mapping_precedence_ref"),
             "post_topology_consumption_required": bundle.get("post_topology_consumption_required"),
             "materialization_target_mode": bundle.get("materialization_target_mode"),
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import ArrayOf, Equals, Flag, OneOf, compile_rules
+
 
 ALLOWED_PACKAGE_LEVEL = {"lite", "core", "full"}
 ALLOWED_PREREQUISITES = {
@@ -22,85 +24,49 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-    package_level = str(bundle.get("package_level", "")).strip()
-    gate_scope = str(bundle.get("gate_scope", "")).strip()
-    checked_prerequisites = bundle.get("checked_prerequisites", [])
-    prerequisite_verdict = str(bundle.get("prerequisite_verdict", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "offering_package_prerequisite_gate",
+            "runtime_plane_mode must be offering_package_prerequisite_gate",
+        ),
+        Equals(
+            "line_class",
+            "offering_package_runtime_enablement_line",
+            "line_class must be offering_package_runtime_enablement_line",
+        ),
+        Equals("baseline_scope", "pre_topology_baseline", "baseline_scope must be pre_topology_baseline"),
+        Flag(
+            "post_topology_consumption_required",
+            True,
+            "post_topology_consumption_required must be true",
+        ),
+        Equals(
+            "topology_prerequisite_precedence_ref",
+            "v2.1.33",
+            "topology_prerequisite_precedence_ref must be v2.1.33",
+        ),
+        OneOf("package_level", ALLOWED_PACKAGE_LEVEL, "package_level is not allowed"),
+        OneOf("gate_scope", {"pre_adoption_only"}, "gate_scope must be pre_adoption_only"),
+        ArrayOf(
+            "checked_prerequisites",
+            "checked_prerequisites must be a non-empty array",
+            allowed=ALLOWED_PREREQUISITES,
+            invalid_message="checked_prerequisites includes unsupported prerequisite identifiers",
+        ),
+        OneOf("prerequisite_verdict", ALLOWED_VERDICTS, "prerequisite_verdict must be pass/fail/pass_with_gap"),
+        Flag("activation_implied", False, "activation_implied must be false"),
+        Flag("readiness_implied", False, "readiness_implied must be false"),
+        Flag("completion_implied", False, "completion_implied must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "offering_package_prerequisite_gate":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be offering_package_prerequisite_gate",
-            }
-        )
-    if bundle.get("line_class") != "offering_package_runtime_enablement_line":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be offering_package_runtime_enablement_line",
-            }
-        )
-    if bundle.get("baseline_scope") != "pre_topology_baseline":
-        errors.append(
-            {
-                "code": "baseline_scope",
-                "message": "baseline_scope must be pre_topology_baseline",
-            }
-        )
-    if bundle.get("post_topology_consumption_required") is not True:
-        errors.append(
-            {
-                "code": "post_topology_consumption_required",
-                "message": "post_topology_consumption_required must be true",
-            }
-        )
-    if bundle.get("topology_prerequisite_precedence_ref") != "v2.1.33":
-        errors.append(
-            {
-                "code": "topology_prerequisite_precedence_ref",
-                "message": "topology_prerequisite_precedence_ref must be v2.1.33",
-            }
-        )
-    if package_level not in ALLOWED_PACKAGE_LEVEL:
-        errors.append({"code": "package_level", "message": "package_level is not allowed"})
-    if gate_scope != "pre_adoption_only":
-        errors.append({"code": "gate_scope", "message": "gate_scope must be pre_adoption_only"})
-    if not isinstance(checked_prerequisites, list) or not checked_prerequisites:
-        errors.append(
-            {
-                "code": "checked_prerequisites",
-                "message": "checked_prerequisites must be a non-empty array",
-            }
-        )
-    else:
-        unsupported = [item for item in checked_prerequisites if str(item).strip() not in ALLOWED_PREREQUISITES]
-        if unsupported:
-            errors.append(
-                {
-                    "code": "checked_prerequisites",
-                    "message": "checked_prerequisites includes unsupported prerequisite identifiers",
-                }
-            )
-    if prerequisite_verdict not in ALLOWED_VERDICTS:
-        errors.append(
-            {
-                "code": "prerequisite_verdict",
-                "message": "prerequisite_verdict must be pass/fail/pass_with_gap",
-            }
-        )
-    if bundle.get("activation_implied") is not False:
-        errors.append({"code": "activation_implied", "message": "activation_implied must be false"})
-    if bundle.get("readiness_implied") is not False:
-        errors.append({"code": "readiness_implied", "message": "readiness_implied must be false"})
-    if bundle.get("completion_implied") is not False:
-        errors.append({"code": "completion_implied", "message": "completion_implied must be false"})
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
+
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -110,10 +76,10 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "package_level": package_level,
-            "gate_scope": gate_scope,
-            "checked_prerequisites": checked_prerequisites,
-            "prerequisite_verdict": prerequisite_verdict,
+            "package_level": values["package_level"],
+            "gate_scope": values["gate_scope"],
+            "checked_prerequisites": values["checked_prerequisites"],
+            "prerequisite_verdict": values["prerequisite_verdict"],
             "topology_prerequisite_precedence_ref": bundle.get("topology_prerequisite_precedence_ref"),
             "post_topology_consumption_required": bundle.get("post_topology_consumption_required"),
         },
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, compile_rules
+
 
 ALLOWED_PACKAGE_LEVEL = {"lite", "core", "full"}
 
@@ -11,96 +13,43 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-    package_level = str(bundle.get("package_level", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "offering_package_selection",
+            "runtime_plane_mode must be offering_package_selection",
+        ),
+        Equals(
+            "line_class",
+            "offering_package_runtime_enablement_line",
+            "line_class must be offering_package_runtime_enablement_line",
+        ),
+        Equals("baseline_scope", "pre_topology_baseline", "baseline_scope must be pre_topology_baseline"),
+        Flag(
+            "post_topology_consumption_required",
+            True,
+            "post_topology_consumption_required must be true",
+        ),
+        Equals("topology_contract_ref", "v2.1.30", "topology_contract_ref must be v2.1.30"),
+        OneOf("package_level", ALLOWED_PACKAGE_LEVEL, "package_level must be one of lite/core/full"),
+        Equals(
+            "selection_artifact_mode",
+            "explicit_selection_artifact",
+            "selection_artifact_mode must be explicit_selection_artifact",
+        ),
+        Flag("free_text_alias_allowed", False, "free_text_alias_allowed must be false"),
+        Flag("package_level_alias_forbidden", True, "package_level_alias_forbidden must be true"),
+        Flag("definition_resolution_included", False, "definition_resolution_included must be false"),
+        Flag("prerequisite_judgment_included", False, "prerequisite_judgment_included must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "offering_package_selection":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be offering_package_selection",
-            }
-        )
-    if bundle.get("line_class") != "offering_package_runtime_enablement_line":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be offering_package_runtime_enablement_line",
-            }
-        )
-    if bundle.get("baseline_scope") != "pre_topology_baseline":
-        errors.append(
-            {
-                "code": "baseline_scope",
-                "message": "baseline_scope must be pre_topology_baseline",
-            }
-        )
-    if bundle.get("post_topology_consumption_required") is not True:
-        errors.append(
-            {
-                "code": "post_topology_consumption_required",
-                "message": "post_topology_consumption_required must be true",
-            }
-        )
-    if bundle.get("topology_contract_ref") != "v2.1.30":
-        errors.append(
-            {
-                "code": "topology_contract_ref",
-                "message": "topology_contract_ref must be v2.1.30",
-            }
-        )
-    if package_level not in ALLOWED_PACKAGE_LEVEL:
-        errors.append(
-            {
-                "code": "package_level",
-                "message": "package_level must be one of lite/core/full",
-            }
-        )
-    if bundle.get("selection_artifact_mode") != "explicit_selection_artifact":
-        errors.append(
-            {
-                "code": "selection_artifact_mode",
-                "message": "selection_artifact_mode must be explicit_selection_artifact",
-            }
-        )
-    if bundle.get("free_text_alias_allowed") is not False:
-        errors.append(
-            {
-                "code": "free_text_alias_allowed",
-                "message": "free_text_alias_allowed must be false",
-            }
-        )
-    if bundle.get("package_level_alias_forbidden") is not True:
-        errors.append(
-            {
-                "code": "package_level_alias_forbidden",
-                "message": "package_level_alias_forbidden must be true",
-            }
-        )
-    if bundle.get("definition_resolution_included") is not False:
-        errors.append(
-            {
-                "code": "definition_resolution_included",
-                "message": "definition_resolution_included must be false",
-            }
-        )
-    if bundle.get("prerequisite_judgment_included") is not False:
-        errors.append(
-            {
-                "code": "prerequisite_judgment_included",
-                "message": "prerequisite_judgment_included must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
+
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -110,7 +59,7 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "package_level": package_level,
+            "package_level": values["package_level"],
             "selection_artifact_mode": bundle.get("selection_artifact_mode"),
             "post_topology_consumption_required": bundle.get("post_topology_consumption_required"),
         },
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+
+HISTORY_FILE = "history.jsonl"
+STATE_FILE = "history.state.json"
+METRICS_EXPORT = "metrics.json"
+TRENDS_EXPORT = "trends.json"
+RATE_FIELDS = ("compliance_rate", "drift_rate", "repo_health")
+_TAIL_BLOCK = 8192
+
+
+@dataclass(frozen=True)
+class HistoryRetention:
+    """Retention policy applied when the history log is compacted.
+
+    The newest ``raw_points`` entries are always kept at full resolution.
+    Older raw entries are averaged in groups of ``downsample_every``, and
+    ``max_points`` (0 = unlimited) caps the total after downsampling.
+    Compaction runs once every ``compact_every`` appends, so a render only
+    pays for one appended line plus a tail read of the exported window.
+    """
+
+    raw_points: int = 365
+    downsample_every: int = 7
+    max_points: int = 0
+    compact_every: int = 50
+
+
+def _merge_bucket(bucket: list[dict]) -> dict:
+    merged = {
+        "date": bucket[-1].get("date", "-"),
+        "total_repos": bucket[-1].get("total_repos", 0),
+        "samples": sum(int(entry.get("samples", 1)) for entry in bucket),
+    }
+    for field in RATE_FIELDS:
+        values = [entry[field] for entry in bucket if field in entry]
+        if values:
+            merged[field] = round(sum(values) / len(values), 4)
+    return merged
+
+
+def downsample(entries: list[dict], retention: HistoryRetention) -> list[dict]:
+    split = max(len(entries) - max(retention.raw_points, 0), 0)
+    older, recent = entries[:split], entries[split:]
+    every = max(retention.downsample_every, 1)
+    result: list[dict] = []
+    bucket: list[dict] = []
+    for entry in older:
+        if int(entry.get("samples", 1)) > 1:
+            result.extend(bucket)
+            bucket = []
+            result.append(entry)
+            continue
+        bucket.append(entry)
+        if len(bucket) == every:
+            result.append(_merge_bucket(bucket) if every > 1 else bucket[0])
+            bucket = []
+    # A partial bucket stays raw so the next compaction can fill it.
+    result.extend(bucket)
+    result.extend(recent)
+    if retention.max_points > 0 and len(result) > retention.max_points:
+        result = result[-retention.max_points:]
+    return result
+
+
+def _read_json_list(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return []
+    return [item for item in payload if isinstance(item, dict)] if isinstance(payload, list) else []
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+class DashboardHistory:
+    """Append-only dashboard time series stored next to the rendered HTML."""
+
+    def __init__(self, directory: Path, retention: HistoryRetention | None = None):
+        self.directory = Path(directory)
+        self.retention = retention or HistoryRetention()
+        self.path = self.directory / HISTORY_FILE
+        self.state_path = self.directory / STATE_FILE
+
+    def append(self, entry: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            self._seed_from_legacy_exports()
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=True, separators=(",", ":")) + "\n")
+        pending = self._pending_appends() + 1
+        if pending >= max(self.retention.compact_every, 1):
+            self.compact()
+        else:
+            self._write_state(pending)
+
+    def entries(self) -> list[dict]:
+        if not self.path.exists():
+            return []
+        result = []
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    result.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return result
+
+    def tail(self, count: int) -> list[dict]:
+        """Return the last ``count`` entries, reading only the end of the log."""
+        if count <= 0 or not self.path.exists():
+            return []
+        with self.path.open("rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            position = handle.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= count:
+                step = min(_TAIL_BLOCK, position)
+                position -= step
+                handle.seek(position)
+                data = handle.read(step) + data
+        lines = data.splitlines()
+        if position > 0:
+            # The first line may be cut mid-record.
+            lines = lines[1:]
+        result = []
+        for line in lines[-count:]:
+            try:
+                result.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return result
+
+    def compact(self) -> None:
+        entries = downsample(self.entries(), self.retention)
+        content = "".join(json.dumps(entry, ensure_ascii=True, separators=(",", ":")) + "\n" for entry in entries)
+        _atomic_write(self.path, content)
+        self._write_state(0)
+
+    def export_window(self, window: int = 90) -> list[dict]:
+        """Write the compact ``metrics.json``/``trends.json`` read by dashboard.js."""
+        entries = self.tail(window)
+        metrics = [
+            {
+                "date": entry.get("date", "-"),
+                "compliance_rate": entry.get("compliance_rate", 0.0),
+                "drift_rate": entry.get("drift_rate", 0.0),
+                "repo_health": entry.get("repo_health", 0.0),
+            }
+            for entry in entries
+        ]
+        trends = [
+            {
+                "date": entry.get("date", "-"),
+                "compliance_rate": entry.get("compliance_rate", 0.0),
+                "total_repos": entry.get("total_repos", 0),
+            }
+            for entry in entries
+        ]
+        (self.directory / METRICS_EXPORT).write_text(json.dumps(metrics, separators=(",", ":")), encoding="utf-8")
+        (self.directory / TRENDS_EXPORT).write_text(json.dumps(trends, separators=(",", ":")), encoding="utf-8")
+        return entries
+
+    def _pending_appends(self) -> int:
+        if not self.state_path.exists():
+            return 0
+        try:
+            return int(json.loads(self.state_path.read_text(encoding="utf-8")).get("pending_appends", 0))
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+            return 0
+
+    def _write_state(self, pending: int) -> None:
+        self.state_path.write_text(json.dumps({"pending_appends": pending}), encoding="utf-8")
+
+    def _seed_from_legacy_exports(self) -> None:
+        # Dashboards rendered before the history log kept their series in the exports.
+        metrics = _read_json_list(self.directory / METRICS_EXPORT)
+        trends = _read_json_list(self.directory / TRENDS_EXPORT)
+        if metrics:
+            seeded = []
+            for index, entry in enumerate(metrics):
+                merged = dict(entry)
+                if len(trends) == len(metrics):
+                    merged["total_repos"] = trends[index].get("total_repos", 0)
+                seeded.append(merged)
+        else:
+            seeded = trends
+        if seeded:
+            self.path.write_text(
+                "".join(json.dumps(entry, ensure_ascii=True, separators=(",", ":")) + "\n" for entry in seeded),
+                encoding="utf-8",
+            )
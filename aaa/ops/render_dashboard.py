@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import json
+import re
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
+from typing import IO, Any, Iterator, Optional
+
+from .dashboard_history import DashboardHistory, HistoryRetention
 
 
 ALLOWED_STATUS = {"pass", "fail", "error", "skip"}
 DRIFT_CHECKS = {"orphaned_assets", "checks_manifest_alignment"}
 TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
+STREAM_CHUNK_SIZE = 1 << 16
+ROW_SPOOL_BYTES = 4 * 1024 * 1024
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\r\n"
 
 
 def compute_compliance(payload):
@@ -65,6 +77,164 @@ def compute_metrics(payload: dict) -> dict[str, float]:
     }
 
 
+class DashboardAggregator:
+    """Single-pass accumulator for compliance, drift and health.
+
+    Produces the same numbers as ``compute_compliance`` plus ``compute_metrics``
+    while keeping only counters and the failing-repo list in memory.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.eligible = 0
+        self.compliant = 0
+        self.archived = 0
+        self.drift_repos = 0
+        self.health_total = 0.0
+        self.failing: list[dict] = []
+
+    def add(self, repo: dict) -> tuple[bool | None, str]:
+        checks = repo.get("checks", [])
+        pass_count = 0
+        failed_ids = []
+        drift_seen = False
+        drift_failed = False
+        for check in checks:
+            status = check.get("status")
+            if status not in ALLOWED_STATUS:
+                raise ValueError(f"invalid check status: {status}")
+            if status == "pass":
+                pass_count += 1
+            else:
+                check_id = check.get("id")
+                if check_id:
+                    failed_ids.append(check_id)
+            if check.get("id") in DRIFT_CHECKS:
+                drift_seen = True
+                drift_failed = drift_failed or status != "pass"
+        failing = ", ".join(failed_ids) or "-"
+        self.total += 1
+        if repo.get("archived"):
+            self.archived += 1
+            return None, failing
+        self.eligible += 1
+        ok = pass_count == len(checks)
+        if ok:
+            self.compliant += 1
+        else:
+            self.failing.append(
+                {
+                    "name": repo.get("name", "-"),
+                    "repo_type": repo.get("repo_type", "-"),
+                    "failing": failing,
+                }
+            )
+        self.health_total += (pass_count / len(checks)) if checks else 1.0
+        if drift_seen and drift_failed:
+            self.drift_repos += 1
+        return ok, failing
+
+    @property
+    def compliance_rate(self) -> float:
+        return (self.compliant / self.eligible) if self.eligible else 1.0
+
+    def summary(self) -> dict:
+        return {
+            "total_repos": self.total,
+            "eligible_repos": self.eligible,
+            "compliant_repos": self.compliant,
+            "failing_repos": len(self.failing),
+            "archived_repos": self.archived,
+        }
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "drift_rate": (self.drift_repos / self.eligible) if self.eligible else 0.0,
+            "repo_health": (self.health_total / self.eligible) if self.eligible else 1.0,
+        }
+
+
+class _JsonStream:
+    def __init__(self, handle: IO[str], chunk_size: int = STREAM_CHUNK_SIZE):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.handle.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _JSON_WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        if self.peek() != expected:
+            raise ValueError(f"malformed audit payload: expected {expected!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A scalar ending exactly at the buffer edge may continue in the next chunk.
+            if end >= len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_audit_repos(path: Path, meta: dict[str, Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+    """Yield repos from an audit payload without loading the whole document.
+
+    Top-level keys other than ``repos`` are decoded into ``meta`` as they are
+    encountered; they are complete once the iterator is exhausted.
+    """
+    with Path(path).open("r", encoding="utf-8") as handle:
+        stream = _JsonStream(handle, chunk_size)
+        stream.take("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.take(":")
+            if key == "repos" and stream.peek() == "[":
+                stream.take("[")
+                if stream.peek() == "]":
+                    stream.take("]")
+                else:
+                    while True:
+                        yield stream.value()
+                        if stream.peek() == "]":
+                            stream.take("]")
+                            break
+                        stream.take(",")
+            else:
+                meta[key] = stream.value()
+            if stream.peek() == "}":
+                return
+            stream.take(",")
+
+
 def _format_compliance(value: bool | None) -> str:
     if value is None:
         return "N/A"
@@ -88,11 +258,110 @@ def _failing_checks(checks: list[dict]) -> str:
     return ", ".join([c for c in failed if c]) or "-"
 
 
-def _render_template(template_name: str, **values: str) -> str:
+@lru_cache(maxsize=None)
+def _compile_template(template_name: str) -> tuple[tuple[str, Optional[str]], ...]:
     template = (TEMPLATE_DIR / template_name).read_text(encoding="utf-8")
-    for key, value in values.items():
-        template = template.replace(f"{{{{{key}}}}}", value)
-    return template
+    parts: list[tuple[str, Optional[str]]] = []
+    last = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        parts.append((template[last:match.start()], match.group(1)))
+        last = match.end()
+    parts.append((template[last:], None))
+    return tuple(parts)
+
+
+def _render_template(template_name: str, **values: str) -> str:
+    chunks = []
+    for literal, key in _compile_template(template_name):
+        chunks.append(literal)
+        if key is not None:
+            chunks.append(values.get(key, f"{{{{{key}}}}}"))
+    return "".join(chunks)
+
+
+def _write_template(
+    handle: IO[str],
+    template_name: str,
+    values: dict[str, str],
+    spools: dict[str, IO[str]],
+) -> None:
+    for literal, key in _compile_template(template_name):
+        handle.write(literal)
+        if key is None:
+            continue
+        if key in spools:
+            spool = spools[key]
+            spool.seek(0)
+            shutil.copyfileobj(spool, handle)
+        else:
+            handle.write(values.get(key, f"{{{{{key}}}}}"))
+
+
+def _markdown_row(repo: dict, compliant: bool | None, failing: str) -> str:
+    return "| {name} | {repo_type} | {compliance} | {failing} |".format(
+        name=repo.get("name", "-"),
+        repo_type=repo.get("repo_type", "-"),
+        compliance=_format_compliance(compliant),
+        failing=failing,
+    )
+
+
+def _html_row(repo: dict, compliant: bool | None, failing: str, hidden: bool = False) -> str:
+    return (
+        "<tr{hidden}>"
+        "<td class=\"repo-name\">{name}</td>"
+        "<td class=\"repo-type\">{repo_type}</td>"
+        "<td><span class=\"status {status_class}\" data-status=\"{status_key}\">{status_label}</span></td>"
+        "<td class=\"failing\">{failing}</td>"
+        "</tr>"
+    ).format(
+        hidden=" hidden" if hidden else "",
+        name=repo.get("name", "-"),
+        repo_type=repo.get("repo_type", "-"),
+        status_class=_compliance_class(compliant),
+        status_key=_format_status_key(compliant),
+        status_label=_format_compliance(compliant),
+        failing=failing,
+    )
+
+
+def _markdown_failing_list(failing_rows: list[dict]) -> str:
+    if not failing_rows:
+        return "- None / 無"
+    return "\n".join("- {name} ({repo_type}) - {failing}".format(**row) for row in failing_rows)
+
+
+def _html_failing_list(failing_rows: list[dict]) -> str:
+    if not failing_rows:
+        return "<li class=\"empty\" data-i18n=\"panel.failing_empty\">All repos compliant</li>"
+    return "\n".join(
+        "<li><div class=\"fail-name\">{name}</div>"
+        "<div class=\"fail-meta\">{repo_type}</div>"
+        "<div class=\"fail-checks\">{failing}</div></li>".format(**row)
+        for row in failing_rows
+    )
+
+
+def _summary_values(date_str: str, compliance_rate: float, summary: dict, metrics: dict[str, float]) -> dict[str, str]:
+    return {
+        "date": date_str,
+        "rate_pct": f"{compliance_rate:.0%}",
+        "drift_rate_pct": f"{metrics.get('drift_rate', 0.0):.0%}",
+        "repo_health_pct": f"{metrics.get('repo_health', 0.0):.0%}",
+        "total_repos": str(summary.get("total_repos", 0)),
+        "eligible_repos": str(summary.get("eligible_repos", 0)),
+        "failing_repos": str(summary.get("failing_repos", 0)),
+        "archived_repos": str(summary.get("archived_repos", 0)),
+    }
+
+
+def _threshold_values(thresholds: dict[str, float], page_size: int) -> dict[str, str]:
+    return {
+        "threshold": f"{thresholds.get('compliance', 0.8):.2f}",
+        "drift_threshold": f"{thresholds.get('drift', 0.05):.2f}",
+        "health_threshold": f"{thresholds.get('health', 0.9):.2f}",
+        "page_size": str(max(page_size, 0)),
+    }
 
 
 def _build_failing_list(rows: list[dict]) -> list[dict]:
@@ -109,45 +378,6 @@ def _build_failing_list(rows: list[dict]) -> list[dict]:
     return failing
 
 
-def _update_trends(path: Path, date_str: str, compliance_rate: float, total_repos: int) -> None:
-    entries = []
-    if path.exists():
-        try:
-            entries = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            entries = []
-    entries.append(
-        {
-            "date": date_str,
-            "compliance_rate": round(compliance_rate, 4),
-            "total_repos": total_repos,
-        }
-    )
-    if len(entries) > 90:
-        entries = entries[-90:]
-    path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
-
-
-def _update_metrics(path: Path, date_str: str, compliance_rate: float, metrics: dict[str, float]) -> None:
-    entries = []
-    if path.exists():
-        try:
-            entries = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            entries = []
-    entries.append(
-        {
-            "date": date_str,
-            "compliance_rate": round(compliance_rate, 4),
-            "drift_rate": round(metrics.get("drift_rate", 0.0), 4),
-            "repo_health": round(metrics.get("repo_health", 0.0), 4),
-        }
-    )
-    if len(entries) > 90:
-        entries = entries[-90:]
-    path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
-
-
 def render_markdown(
     date_str: str,
     compliance_rate: float,
@@ -155,35 +385,14 @@ def render_markdown(
     summary: dict,
     metrics: dict[str, float],
 ) -> str:
-    row_lines = []
-    for repo in rows:
-        row_lines.append(
-            "| {name} | {repo_type} | {compliance} | {failing} |".format(
-                name=repo.get("name", "-"),
-                repo_type=repo.get("repo_type", "-"),
-                compliance=_format_compliance(repo.get("compliant")),
-                failing=_failing_checks(repo.get("checks", [])),
-            )
-        )
-    failing_rows = _build_failing_list(rows)
-    if failing_rows:
-        failing_md = "\n".join(
-            "- {name} ({repo_type}) - {failing}".format(**row)
-            for row in failing_rows
-        )
-    else:
-        failing_md = "- None / 無"
+    row_lines = [
+        _markdown_row(repo, repo.get("compliant"), _failing_checks(repo.get("checks", [])))
+        for repo in rows
+    ]
     return _render_template(
         "dashboard.md.tmpl",
-        date=date_str,
-        rate_pct=f"{compliance_rate:.0%}",
-        drift_rate_pct=f"{metrics.get('drift_rate', 0.0):.0%}",
-        repo_health_pct=f"{metrics.get('repo_health', 0.0):.0%}",
-        total_repos=str(summary.get("total_repos", 0)),
-        eligible_repos=str(summary.get("eligible_repos", 0)),
-        failing_repos=str(summary.get("failing_repos", 0)),
-        archived_repos=str(summary.get("archived_repos", 0)),
-        failing_list=failing_md,
+        **_summary_values(date_str, compliance_rate, summary, metrics),
+        failing_list=_markdown_failing_list(_build_failing_list(rows)),
         rows="\n".join(row_lines),
     )
 
@@ -195,52 +404,23 @@ def render_html(
     summary: dict,
     metrics: dict[str, float],
     thresholds: dict[str, float],
+    page_size: int = 0,
 ) -> str:
-    row_lines = []
-    for repo in rows:
-        status_key = _format_status_key(repo.get("compliant"))
-        status_label = _format_compliance(repo.get("compliant"))
-        status_class = _compliance_class(repo.get("compliant"))
-        row_lines.append(
-            "<tr>"
-            "<td class=\"repo-name\">{name}</td>"
-            "<td class=\"repo-type\">{repo_type}</td>"
-            "<td><span class=\"status {status_class}\" data-status=\"{status_key}\">{status_label}</span></td>"
-            "<td class=\"failing\">{failing}</td>"
-            "</tr>".format(
-                name=repo.get("name", "-"),
-                repo_type=repo.get("repo_type", "-"),
-                status_class=status_class,
-                status_key=status_key,
-                status_label=status_label,
-                failing=_failing_checks(repo.get("checks", [])),
-            )
-        )
-    failing_rows = _build_failing_list(rows)
-    if failing_rows:
-        failing_list = "\n".join(
-            "<li><div class=\"fail-name\">{name}</div>"
-            "<div class=\"fail-meta\">{repo_type}</div>"
-            "<div class=\"fail-checks\">{failing}</div></li>".format(**row)
-            for row in failing_rows
+    row_lines = [
+        _html_row(
+            repo,
+            repo.get("compliant"),
+            _failing_checks(repo.get("checks", [])),
+            hidden=page_size > 0 and index >= page_size,
         )
-    else:
-        failing_list = "<li class=\"empty\" data-i18n=\"panel.failing_empty\">All repos compliant</li>"
+        for index, repo in enumerate(rows)
+    ]
     return _render_template(
         "dashboard.html.tmpl",
-        date=date_str,
-        rate_pct=f"{compliance_rate:.0%}",
-        drift_rate_pct=f"{metrics.get('drift_rate', 0.0):.0%}",
-        repo_health_pct=f"{metrics.get('repo_health', 0.0):.0%}",
-        total_repos=str(summary.get("total_repos", 0)),
-        eligible_repos=str(summary.get("eligible_repos", 0)),
-        failing_repos=str(summary.get("failing_repos", 0)),
-        archived_repos=str(summary.get("archived_repos", 0)),
-        failing_list=failing_list,
+        **_summary_values(date_str, compliance_rate, summary, metrics),
+        **_threshold_values(thresholds, page_size),
+        failing_list=_html_failing_list(_build_failing_list(rows)),
         rows="\n".join(row_lines),
-        threshold=f"{thresholds.get('compliance', 0.8):.2f}",
-        drift_threshold=f"{thresholds.get('drift', 0.05):.2f}",
-        health_threshold=f"{thresholds.get('health', 0.9):.2f}",
     )
 
 
@@ -249,34 +429,63 @@ def render_dashboard(
     md_out: str,
     html_out: str,
     thresholds: dict[str, float] | None = None,
+    page_size: int = 0,
+    history_window: int = 90,
+    retention: HistoryRetention | None = None,
 ) -> tuple[float, dict[str, float]]:
-    payload = json.loads(Path(input_path).read_text(encoding="utf-8"))
-    compliance_rate, rows, summary = compute_compliance(payload)
-    metrics = compute_metrics(payload)
-    date_str = payload.get("generated_at") or "-"
     thresholds = thresholds or {"compliance": 0.8, "drift": 0.05, "health": 0.9}
-    md = render_markdown(date_str, compliance_rate, rows, summary, metrics)
-    html = render_html(date_str, compliance_rate, rows, summary, metrics, thresholds)
-    md_path = Path(md_out)
-    html_path = Path(html_out)
-    md_path.parent.mkdir(parents=True, exist_ok=True)
-    html_path.parent.mkdir(parents=True, exist_ok=True)
-    md_path.write_text(md, encoding="utf-8")
-    html_path.write_text(html, encoding="utf-8")
+    aggregator = DashboardAggregator()
+    meta: dict[str, Any] = {}
+    md_rows = tempfile.SpooledTemporaryFile(max_size=ROW_SPOOL_BYTES, mode="w+", encoding="utf-8")
+    html_rows = tempfile.SpooledTemporaryFile(max_size=ROW_SPOOL_BYTES, mode="w+", encoding="utf-8")
+    with md_rows, html_rows:
+        separator = ""
+        for index, repo in enumerate(iter_audit_repos(Path(input_path), meta)):
+            compliant, failing = aggregator.add(repo)
+            md_rows.write(separator + _markdown_row(repo, compliant, failing))
+            html_rows.write(separator + _html_row(repo, compliant, failing, hidden=page_size > 0 and index >= page_size))
+            separator = "\n"
+
+        compliance_rate = aggregator.compliance_rate
+        summary = aggregator.summary()
+        metrics = aggregator.metrics()
+        date_str = meta.get("generated_at") or "-"
+        values = _summary_values(date_str, compliance_rate, summary, metrics)
+        md_path = Path(md_out)
+        html_path = Path(html_out)
+        md_path.parent.mkdir(parents=True, exist_ok=True)
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        with md_path.open("w", encoding="utf-8") as handle:
+            _write_template(
+                handle,
+                "dashboard.md.tmpl",
+                {**values, "failing_list": _markdown_failing_list(aggregator.failing)},
+                {"rows": md_rows},
+            )
+        with html_path.open("w", encoding="utf-8") as handle:
+            _write_template(
+                handle,
+                "dashboard.html.tmpl",
+                {
+                    **values,
+                    **_threshold_values(thresholds, page_size),
+                    "failing_list": _html_failing_list(aggregator.failing),
+                },
+                {"rows": html_rows},
+            )
     css = _render_template("dashboard.css.tmpl")
     js = _render_template("dashboard.js.tmpl")
     (html_path.parent / "dashboard.css").write_text(css, encoding="utf-8")
     (html_path.parent / "dashboard.js").write_text(js, encoding="utf-8")
-    _update_trends(
-        html_path.parent / "trends.json",
-        date_str,
-        compliance_rate,
-        summary.get("total_repos", 0),
-    )
-    _update_metrics(
-        html_path.parent / "metrics.json",
-        date_str,
-        compliance_rate,
-        metrics,
+    history = DashboardHistory(html_path.parent, retention)
+    history.append(
+        {
+            "date": date_str,
+            "compliance_rate": round(compliance_rate, 4),
+            "drift_rate": round(metrics.get("drift_rate", 0.0), 4),
+            "repo_health": round(metrics.get("repo_health", 0.0), 4),
+            "total_repos": summary.get("total_repos", 0),
+        }
     )
+    history.export_window(history_window)
     return compliance_rate, metrics
@@ -0,0 +1,325 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from aaa.engine.revocation import RevocationChecker
+from aaa.observability.custom_metrics import LatencyHistogram, MetricStore
+from aaa.policy.scope import ScopeEnforcer
+
+STAGES = ("semantic", "revocation", "scope", "locks", "constitution")
+DEFAULT_TTL = 30.0
+PATH_KEYS = ("path", "paths", "target", "targets")
+
+Stamp = Optional[Tuple[int, int, int]]
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def payload_digest(payload: Dict[str, Any]) -> str:
+    """Digest of a payload normalized to sorted-key compact JSON, so equal payloads share cache entries."""
+    normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def payload_paths(payload: Dict[str, Any]) -> List[str]:
+    paths: List[str] = []
+    for key in PATH_KEYS:
+        value = payload.get(key)
+        if isinstance(value, str):
+            paths.append(value)
+        elif isinstance(value, (list, tuple)):
+            paths.extend(item for item in value if isinstance(item, str))
+    return paths
+
+
+@dataclass
+class GuardDecision:
+    allowed: bool
+    agent_id: str
+    action: str
+    reasons: List[str] = field(default_factory=list)
+    stages: Dict[str, bool] = field(default_factory=dict)
+    cached: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class GuardPipeline:
+    """
+    Pre-action checks for ``AgentKernel.run_safe_action``. The independent
+    stages (registry capability lookup, revocation, scope, lock status and
+    court injunctions) run concurrently; ``workers=1`` runs them in-process.
+
+    Decisions are cached per (agent, action, payload digest) for ``ttl``
+    seconds and dropped as soon as the registry index, revocation list,
+    court cases or locks file change on disk. The scope stage is re-run on
+    cache hits for payloads with paths, since symlinks are not stamped.
+
+    Per-stage latencies go into in-memory histograms that are written to
+    ``metrics`` every ``flush_interval`` seconds, on ``flush_metrics()`` /
+    ``close()``, and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        kernel: Any,
+        ttl: float = DEFAULT_TTL,
+        workers: int = len(STAGES),
+        max_entries: int = 4096,
+        metrics: Optional[MetricStore] = None,
+        flush_interval: float = 10.0,
+    ):
+        self.kernel = kernel
+        self.root = Path(kernel.root)
+        self.ttl = ttl
+        self.workers = workers
+        self.max_entries = max_entries
+        self.metrics = metrics
+        self.flush_interval = flush_interval
+        self.registry_file = self.root / ".aaa" / "registry_index.json"
+        self.revocation_file = self.root / ".aaa" / "revocation.json"
+        self.court_dir = self.root / ".aaa" / "court" / "cases"
+        self.revocation = RevocationChecker(str(self.revocation_file), refresh_interval=0)
+        self.scope = ScopeEnforcer([str(self.root)])
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES + ("total",)}
+        self.stats = {"checks": 0, "cache_hits": 0, "invalidations": 0}
+        self._decisions: "OrderedDict[Tuple[str, str, str], Tuple[GuardDecision, float]]" = OrderedDict()
+        self._decisions_stamp: Tuple[Stamp, ...] = ()
+        self._capabilities: Tuple[Stamp, Optional[FrozenSet[str]]] = (None, None)
+        self._injunctions: Tuple[Stamp, FrozenSet[Tuple[str, str]]] = (None, frozenset())
+        self._lock = threading.Lock()
+        self._stage_locks = {stage: threading.Lock() for stage in STAGES}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._flushed_at = time.monotonic()
+        _LIVE_GUARDS.add(self)
+
+    def _subsystems(self) -> Dict[str, Any]:
+        # Kernel subsystems are lazy. Resolve them before stamping state (their
+        # construction creates files) and before stages run, so stage threads
+        # never race to construct one.
+        subsystems: Dict[str, Any] = {}
+        for name in ("registry", "locker", "clerk"):
+            try:
+                subsystems[name] = getattr(self.kernel, name)
+            except Exception as exc:
+                subsystems[name] = exc
+        return subsystems
+
+    def state_stamp(self, locker: Any = None) -> Tuple[Stamp, ...]:
+        """Stamps of everything a cached decision depends on; any change invalidates the cache."""
+        locks_file = getattr(locker, "locks_file", None)
+        return (
+            _stamp(self.registry_file),
+            _stamp(self.revocation_file),
+            _stamp(self.court_dir),
+            _stamp(locks_file) if locks_file is not None else None,
+        )
+
+    def check(self, agent_id: str, action: str, payload: Dict[str, Any]) -> GuardDecision:
+        started = time.perf_counter()
+        key = (agent_id, action, payload_digest(payload))
+        subsystems = self._subsystems()
+        stamp = self.state_stamp(subsystems["locker"])
+        now = time.monotonic()
+        with self._lock:
+            self.stats["checks"] += 1
+            if stamp != self._decisions_stamp:
+                if self._decisions:
+                    self.stats["invalidations"] += 1
+                self._decisions.clear()
+                self._decisions_stamp = stamp
+            entry = self._decisions.get(key)
+            if entry is not None and entry[1] > now:
+                self._decisions.move_to_end(key)
+                self.stats["cache_hits"] += 1
+            else:
+                entry = None
+        if entry is not None:
+            decision = GuardDecision(**{**asdict(entry[0]), "cached": True})
+            paths = payload_paths(payload)
+            if paths and decision.stages.get("scope"):
+                # Symlinks are not part of the state stamp: re-resolve paths on every hit.
+                reason = self._timed("scope", lambda: self._check_scope(paths))
+                if reason:
+                    decision.allowed = False
+                    decision.stages["scope"] = False
+                    decision.reasons.append(f"scope: {reason}")
+            with self._lock:
+                self._observe("total", started)
+            self._maybe_flush()
+            return decision
+
+        decision = self._evaluate(agent_id, action, payload, subsystems)
+        settled = self.state_stamp(subsystems["locker"]) == stamp
+        with self._lock:
+            if settled and stamp == self._decisions_stamp:
+                self._decisions[key] = (decision, now + self.ttl)
+                if len(self._decisions) > self.max_entries:
+                    self._decisions.popitem(last=False)
+            self._observe("total", started)
+        self._maybe_flush()
+        return decision
+
+    def _evaluate(self, agent_id: str, action: str, payload: Dict[str, Any], subsystems: Dict[str, Any]) -> GuardDecision:
+        paths = payload_paths(payload)
+        stages: Dict[str, Callable[[], Optional[str]]] = {
+            "semantic": lambda: self._check_semantic(action, subsystems["registry"]),
+            "revocation": lambda: self._check_revocation(agent_id),
+            "scope": lambda: self._check_scope(paths),
+            "locks": lambda: self._check_locks(agent_id, paths, subsystems["locker"]),
+            "constitution": lambda: self._check_constitution(agent_id, action, subsystems["clerk"]),
+        }
+        if self.workers == 1:
+            results = {stage: self._timed(stage, fn) for stage, fn in stages.items()}
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="aaa-guard")
+            futures = {stage: self._executor.submit(self._timed, stage, fn) for stage, fn in stages.items()}
+            results = {stage: future.result() for stage, future in futures.items()}
+        reasons = [f"{stage}: {reason}" for stage, reason in results.items() if reason]
+        return GuardDecision(
+            allowed=not reasons,
+            agent_id=agent_id,
+            action=action,
+            reasons=reasons,
+            stages={stage: reason is None for stage, reason in results.items()},
+        )
+
+    def _timed(self, stage: str, fn: Callable[[], Optional[str]]) -> Optional[str]:
+        started = time.perf_counter()
+        try:
+            return fn()
+        except Exception as exc:
+            # Fail closed: a stage that cannot decide denies.
+            return f"{type(exc).__name__}: {exc}"
+        finally:
+            with self._lock:
+                self._observe(stage, started)
+
+    def _observe(self, stage: str, started: float) -> None:
+        self.histograms[stage].observe((time.perf_counter() - started) * 1e3)
+
+    # Stages return None to allow, or a reason to deny.
+
+    def _check_semantic(self, action: str, registry: Any) -> Optional[str]:
+        if isinstance(registry, Exception):
+            raise registry
+        with self._stage_locks["semantic"]:
+            stamp = _stamp(self.registry_file)
+            if self._capabilities[1] is None or self._capabilities[0] != stamp:
+                if self._capabilities[1] is not None:
+                    registry.load()
+                declared = set()
+                for pack in registry.get_packs().values():
+                    capabilities = pack.get("capabilities", []) if isinstance(pack, dict) else []
+                    if isinstance(capabilities, list):
+                        declared.update(cap for cap in capabilities if isinstance(cap, str))
+                self._capabilities = (stamp, frozenset(declared))
+            capabilities = self._capabilities[1]
+        # A registry that declares no capabilities does not constrain actions.
+        if capabilities and action not in capabilities:
+            return f"action '{action}' is not a registered capability"
+        return None
+
+    def _check_revocation(self, agent_id: str) -> Optional[str]:
+        with self._stage_locks["revocation"]:
+            revoked = self.revocation.is_revoked(agent_id)
+        return f"agent '{agent_id}' is revoked" if revoked else None
+
+    def _check_scope(self, paths: List[str]) -> Optional[str]:
+        with self._stage_locks["scope"]:
+            # The enforcer's directory cache only spans one check, so a directory
+            # swapped for a symlink since the last check is re-resolved.
+            self.scope.clear_cache()
+            allowed = self.scope.is_allowed_many(str(self.root / path) for path in paths)
+        outside = [path for path, ok in zip(paths, allowed) if not ok]
+        return f"outside workspace: {', '.join(outside)}" if outside else None
+
+    def _check_locks(self, agent_id: str, paths: List[str], locker: Any) -> Optional[str]:
+        if not paths:
+            return None
+        if isinstance(locker, Exception):
+            raise locker
+        held = []
+        for path in paths:
+            info = locker.check_lock(path)
+            if info is not None and info.owner != agent_id:
+                held.append(f"{path} (locked by {info.owner})")
+        return f"locked: {', '.join(held)}" if held else None
+
+    def _check_constitution(self, agent_id: str, action: str, clerk: Any) -> Optional[str]:
+        if isinstance(clerk, Exception):
+            raise clerk
+        with self._stage_locks["constitution"]:
+            stamp = _stamp(self.court_dir)
+            if self._injunctions[0] != stamp or stamp is None:
+                self._injunctions = (stamp, self._load_injunctions(clerk))
+            injunctions = self._injunctions[1]
+        if (action, agent_id) in injunctions or (action, "*") in injunctions:
+            return f"action '{action}' is enjoined by a court ruling"
+        return None
+
+    @staticmethod
+    def _load_injunctions(clerk: Any) -> FrozenSet[Tuple[str, str]]:
+        """(action, agent or '*') pairs from adjudicated cases whose verdict is DENY."""
+        from aaa.court.schema import Ruling
+
+        injunctions = set()
+        for case in clerk.list_cases():
+            action = case.facts.get("action")
+            if case.verdict is not None and case.verdict.ruling == Ruling.DENY and isinstance(action, str):
+                injunctions.add((action, str(case.facts.get("agent_id", "*"))))
+        return frozenset(injunctions)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._decisions.clear()
+
+    def _maybe_flush(self) -> None:
+        if self.metrics is not None and time.monotonic() - self._flushed_at >= self.flush_interval:
+            self.flush_metrics()
+
+    def flush_metrics(self) -> None:
+        """Write per-stage latency histograms to the metric store and start new ones."""
+        with self._lock:
+            self._flushed_at = time.monotonic()
+            points = []
+            for stage, histogram in self.histograms.items():
+                if histogram.count:
+                    points.extend(histogram.points("guard.latency_ms", {"stage": stage}))
+                    histogram.reset()
+        if self.metrics is not None and points:
+            self.metrics.record_many(points)
+
+    def close(self) -> None:
+        self.flush_metrics()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+_LIVE_GUARDS: "weakref.WeakSet[GuardPipeline]" = weakref.WeakSet()
+
+
+def _close_live_guards() -> None:
+    for guard in list(_LIVE_GUARDS):
+        guard.close()
+
+
+atexit.register(_close_live_guards)
@@ -2,17 +2,22 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import platform
 import sys
-
-# Protocol Integrations
-from aaa.registry.client import RegistryClient  # Semantic
-from aaa.court.clerk import CourtClerk  # Constitution
-from aaa.engine.locking import LockManager  # Multi-Agent Safety (v1.6)
+import time
 
 class RuleEngine:
     """Mock Rule Engine for v2.0 Bootstrap."""
     def __init__(self, root):
         self.root = root
 
+# Boot report module name -> kernel attribute
+SUBSYSTEMS = {
+    "guardian": "rules",
+    "semantic": "registry",
+    "constitution": "clerk",
+    "lock_manager": "locker",
+    "guard": "guard",
+}
+
 class AgentKernel:
     """
     The Agent Operating System Kernel.
@@ -20,45 +25,143 @@ class AgentKernel:
     1. Guardian (Safety & Compliance)
     2. Semantic (Registry & Knowledge)
     3. Constitution (Human Override & Adjudication)
+
+    Subsystems (and their imports) are initialized on first use, so a boot
+    touches nothing on disk. ``warm=True`` initializes them all up front
+    for long-running agents; ``boot()`` reports per-subsystem init times.
     """
     
-    def __init__(self, workspace_root: Path):
+    def __init__(self, workspace_root: Path, warm: bool = False):
+        started = time.perf_counter()
         self.root = workspace_root
-        self.registry = RegistryClient(workspace_root / ".aaa" / "registry_index.json")
-        self.clerk = CourtClerk(data_dir=workspace_root / ".aaa" / "court")
-        self.rules = RuleEngine(workspace_root)
-        self.locker = LockManager(workspace_root / ".aaa" / "locks")
-        
+        self._subsystems: Dict[str, Any] = {}
+        self.init_ms: Dict[str, float] = {}
+        self.init_errors: Dict[str, str] = {}
+        if warm:
+            self.warm()
+        self.construct_ms = (time.perf_counter() - started) * 1e3
+
+    @property
+    def registry(self):
+        return self._subsystem("registry")
+
+    @property
+    def clerk(self):
+        return self._subsystem("clerk")
+
+    @property
+    def rules(self) -> RuleEngine:
+        return self._subsystem("rules")
+
+    @property
+    def locker(self):
+        return self._subsystem("locker")
+
+    @property
+    def guard(self):
+        return self._subsystem("guard")
+
+    def _init_registry(self):
+        from aaa.registry.client import RegistryClient  # Semantic
+        return RegistryClient(self.root / ".aaa" / "registry_index.json")
+
+    def _init_clerk(self):
+        from aaa.court.clerk import CourtClerk  # Constitution
+        return CourtClerk(data_dir=self.root / ".aaa" / "court")
+
+    def _init_rules(self) -> RuleEngine:
+        return RuleEngine(self.root)
+
+    def _init_locker(self):
+        from aaa.engine.locking import LockManager  # Multi-Agent Safety (v1.6)
+        return LockManager(self.root / ".aaa" / "locks")
+
+    def _init_guard(self):
+        from aaa.observability.custom_metrics import MetricStore
+        from aaa.os.guard import GuardPipeline
+        db_path = self.root / ".aaa" / "observability.db"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        return GuardPipeline(self, metrics=MetricStore(db_path=db_path))
+
+    def _subsystem(self, name: str) -> Any:
+        if name in self._subsystems:
+            return self._subsystems[name]
+        started = time.perf_counter()
+        try:
+            instance = getattr(self, f"_init_{name}")()
+        except Exception as exc:
+            self.init_errors[name] = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            self.init_ms[name] = (time.perf_counter() - started) * 1e3
+        self.init_errors.pop(name, None)
+        self._subsystems[name] = instance
+        return instance
+
+    def close(self) -> None:
+        """Flush the guard's latency metrics and stop its worker threads."""
+        guard = self._subsystems.get("guard")
+        if guard is not None:
+            guard.close()
+
+    def __enter__(self) -> "AgentKernel":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def warm(self) -> Dict[str, str]:
+        """Initialize every subsystem now; failures are recorded (see ``boot()``) rather than raised."""
+        for attr in SUBSYSTEMS.values():
+            try:
+                self._subsystem(attr)
+            except Exception:
+                pass
+        return dict(self.init_errors)
+
+    def _module_state(self, attr: str) -> str:
+        if attr in self._subsystems:
+            return "ready"
+        return "error" if attr in self.init_errors else "lazy"
+
     def boot(self) -> Dict[str, Any]:
         """Initialize the OS runtime."""
+        subsystems = {}
+        for module, attr in SUBSYSTEMS.items():
+            entry: Dict[str, Any] = {"state": self._module_state(attr)}
+            if attr in self.init_ms:
+                entry["init_ms"] = round(self.init_ms[attr], 3)
+            if attr in self.init_errors:
+                entry["error"] = self.init_errors[attr]
+            subsystems[module] = entry
         return {
             "kernel": "AAA Agent OS v2.0",
             "system": platform.system(),
             "python": sys.version.split()[0],
             "workspace": str(self.root),
-            "status": "ONLINE",
-            "modules": {
-                "guardian": "active",
-                "semantic": "active", 
-                "constitution": "active",
-                "lock_manager": "active"
-            }
+            "status": "DEGRADED" if self.init_errors else "ONLINE",
+            # A lazy subsystem is still available; only a failed init is reported here.
+            "modules": {module: "error" if entry["state"] == "error" else "active" for module, entry in subsystems.items()},
+            "boot_report": {
+                "construct_ms": round(self.construct_ms, 3),
+                "subsystems": subsystems,
+            },
         }
 
-    def run_safe_action(self, action_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def run_safe_action(self, action_name: str, payload: Dict[str, Any], agent_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Execute an action with full Trinity Protection.
         1. Semantic: Validate Intent
         2. Guardian: Check Constraints
-        3. Constitution: Check for Injunctions (Future)
+        3. Constitution: Check for Injunctions
+        The checks run as one ``GuardPipeline`` pass (see ``aaa.os.guard``).
         """
-        # 1. Semantic Check (Registry)
-        # TODO: Lookup action capability
-        
-        # 2. Guardian Check (Rules)
-        # TODO: Pre-execution checks
+        agent_id = agent_id or str(payload.get("agent_id", "Agent-Kernel"))
+        decision = self.guard.check(agent_id, action_name, payload)
+        if not decision.allowed:
+            return {"status": "denied", "action": action_name, "reasons": decision.reasons}
         
-        # 3. Execution (Simulated for now)
+        # Execution (Simulated for now)
         return {"status": "executed", "action": action_name}
 
     def escalate_conflict(self, conflict_data: Dict[str, Any]) -> str:
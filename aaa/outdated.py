@@ -5,9 +5,11 @@ from dataclasses import dataclass
 from importlib import metadata
 from pathlib import Path
 from typing import Any, Optional
-from urllib import request
+from .utils import http_cache
+from .workspace_inventory import load_inventory
 
 DEFAULT_REGISTRY_URL = "https://raw.githubusercontent.com/ai-asset-architecture/ai-asset-architecture-registry/main/registry_index.json"
+DEFAULT_REGISTRY_MAX_AGE = 60 * 60
 
 
 @dataclass(frozen=True)
@@ -20,15 +22,32 @@ class ComponentStatus:
     details: dict[str, Any] | None = None
 
 
-def load_registry_index() -> dict[str, Any]:
+def registry_max_age() -> float:
+    value = os.environ.get("AAA_REGISTRY_MAX_AGE")
+    try:
+        return float(value) if value else DEFAULT_REGISTRY_MAX_AGE
+    except ValueError:
+        return DEFAULT_REGISTRY_MAX_AGE
+
+
+def load_registry_index(max_age: Optional[float] = None, cache_info: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """
+    Registry index from ``AAA_REGISTRY_INDEX_PATH`` or, through the shared
+    HTTP cache, from ``AAA_REGISTRY_INDEX_URL``. ``cache_info`` (if given) is
+    filled with where the index came from and how old it is.
+    """
     path_override = os.environ.get("AAA_REGISTRY_INDEX_PATH")
     if path_override:
         path = Path(path_override).expanduser()
         if path.is_file():
+            if cache_info is not None:
+                cache_info.update({"url": str(path), "source": "file", "age_seconds": 0.0, "stale": False})
             return json.loads(path.read_text(encoding="utf-8"))
     url = os.environ.get("AAA_REGISTRY_INDEX_URL", DEFAULT_REGISTRY_URL)
-    with request.urlopen(url, timeout=2) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    response = http_cache.fetch_json(url, max_age=registry_max_age() if max_age is None else max_age)
+    if cache_info is not None:
+        cache_info.update(response.describe())
+    return response.payload
 
 
 def get_remote_versions(index: dict[str, Any]) -> dict[str, str]:
@@ -53,10 +72,14 @@ def detect_local_versions(repo_root: Path) -> dict[str, Any]:
     }
 
 
-def build_outdated_report(repo_root: Path) -> dict[str, Any]:
+def build_outdated_report(repo_root: Path, max_age: Optional[float] = None) -> dict[str, Any]:
+    registry: dict[str, Any] = {}
     try:
-        index = load_registry_index()
-    except Exception:
+        index = load_registry_index(max_age=max_age, cache_info=registry)
+    except Exception as exc:
+        index = {}
+        registry = {"source": "unavailable", "stale": True, "error": f"{type(exc).__name__}: {exc}"}
+    if not isinstance(index, dict):
         index = {}
     remote = get_remote_versions(index)
     local = detect_local_versions(repo_root)
@@ -71,6 +94,7 @@ def build_outdated_report(repo_root: Path) -> dict[str, Any]:
     return {
         "source": index.get("registries", {}).get("official", {}).get("url", "registry"),
         "components": [status.__dict__ for status in statuses],
+        "registry": registry,
     }
 
 
@@ -92,9 +116,27 @@ def render_outdated_report(report: dict[str, Any]) -> str:
         versions = details.get("versions")
         if versions:
             lines.append(f"  - versions: {', '.join(versions)}")
+    registry = report.get("registry") or {}
+    if registry.get("source") == "unavailable":
+        lines.extend(["", f"Registry index unavailable ({registry.get('error', 'unknown error')}); remote versions unknown."])
+    elif registry.get("stale"):
+        lines.extend(["", f"Registry index is {_format_age(registry.get('age_seconds', 0))} old (offline: {registry.get('error', 'fetch failed')})."])
+    elif registry.get("source") in ("cache", "revalidated", "network"):
+        lines.extend(["", f"Registry index: {registry['source']}, {_format_age(registry.get('age_seconds', 0))} old."])
     return "\n".join(lines)
 
 
+def _format_age(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 120:
+        return f"{seconds}s"
+    if seconds < 2 * 3600:
+        return f"{seconds // 60}m"
+    if seconds < 2 * 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+
 def _local_tools_version() -> str:
     try:
         return metadata.version("aaa-tools")
@@ -131,15 +173,7 @@ def _local_templates_version(repo_root: Path) -> str:
 
 
 def _collect_uses_versions(repo_root: Path, repo_name: str) -> list[str]:
-    workflows = list((repo_root / ".github" / "workflows").glob("*.yml"))
-    workflows.extend((repo_root / ".github" / "workflows").glob("*.yaml"))
-    pattern = re.compile(r"uses:\s*[^\s]*/" + re.escape(repo_name) + r"@([A-Za-z0-9._-]+)")
-    versions: list[str] = []
-    for path in workflows:
-        content = path.read_text(encoding="utf-8")
-        for match in pattern.findall(content):
-            versions.append(match)
-    return versions
+    return load_inventory(repo_root, children=False).uses_versions(repo_name)
 
 
 def _summarize_versions(versions: list[str]) -> dict[str, Any]:
@@ -6,6 +6,7 @@ from . import offering_package_selection_runtime_baseline
 from . import topology_aware_offering_package_definition_resolution
 from . import offering_package_status_and_evidence_runtime
 from . import topology_aware_package_status_and_repo_checks
+from .workspace_inventory import load_inventory
 
 
 PACKAGE_LEVELS = ("lite", "core", "full")
@@ -56,8 +57,7 @@ PACKAGE_BASELINES: dict[str, dict[str, Any]] = {
 
 
 def _top_level_repo_names(workspace: str | Path) -> list[str]:
-    root = Path(workspace)
-    return sorted(item.name for item in root.iterdir() if item.is_dir())
+    return list(load_inventory(workspace).child_dirs)
 
 
 def _inventory_signals(level: str, topology_mode: str, workspace: str | Path, detected: dict[str, Any]) -> dict[str, Any]:
@@ -164,13 +164,9 @@ def detect_topology_mode(workspace: str | Path) -> dict[str, Any]:
     if not root.exists():
         raise FileNotFoundError(f"workspace does not exist: {root}")
 
-    child_dirs = [item for item in root.iterdir() if item.is_dir()]
-    dedicated_repo_present = any(item.name == ".github" for item in child_dirs)
-    repo_local_github_paths = sorted(
-        str(item.relative_to(root) / ".github")
-        for item in child_dirs
-        if item.name != ".github" and (item / ".github").exists()
-    )
+    inventory = load_inventory(root)
+    dedicated_repo_present = ".github" in inventory.child_dirs
+    repo_local_github_paths = sorted(str(Path(name) / ".github") for name in inventory.github_children())
 
     if dedicated_repo_present and repo_local_github_paths:
         detected = "hybrid"
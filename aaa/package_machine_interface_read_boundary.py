@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, TypeIs, When, compile_rules
+
 
 REQUIRED_PAYLOADS = {
     "package_selection",
@@ -17,90 +19,61 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-    exposed_payloads = bundle.get("exposed_payloads", [])
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "package_machine_interface_read_boundary",
+            "runtime_plane_mode must be package_machine_interface_read_boundary",
+        ),
+        Equals(
+            "line_class",
+            "offering_package_runtime_enablement_line",
+            "line_class must be offering_package_runtime_enablement_line",
+        ),
+        Equals("baseline_scope", "pre_topology_baseline", "baseline_scope must be pre_topology_baseline"),
+        Flag(
+            "post_topology_consumption_required",
+            True,
+            "post_topology_consumption_required must be true",
+        ),
+        Equals(
+            "topology_read_boundary_precedence_ref",
+            "v2.1.35",
+            "topology_read_boundary_precedence_ref must be v2.1.35",
+        ),
+        Equals(
+            "interface_scope",
+            "machine_read_boundary_only",
+            "interface_scope must be machine_read_boundary_only",
+        ),
+        TypeIs("exposed_payloads", list, "exposed_payloads must be an array", default=[]),
+        When(
+            "exposed_payloads",
+            lambda values, bundle: isinstance(values["exposed_payloads"], list)
+            and {str(item).strip() for item in values["exposed_payloads"]} != REQUIRED_PAYLOADS,
+            "exposed_payloads must exactly match the canonical package read payload set",
+        ),
+        Equals(
+            "cli_output_mapping_mode",
+            "isomorphic_human_json_mapping",
+            "cli_output_mapping_mode must be isomorphic_human_json_mapping",
+        ),
+        Flag("read_only_boundary", True, "read_only_boundary must be true"),
+        Flag("ai_orchestration_claimed", False, "ai_orchestration_claimed must be false"),
+        Flag(
+            "remote_session_semantics_included",
+            False,
+            "remote_session_semantics_included must be false",
+        ),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "package_machine_interface_read_boundary":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be package_machine_interface_read_boundary",
-            }
-        )
-    if bundle.get("line_class") != "offering_package_runtime_enablement_line":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be offering_package_runtime_enablement_line",
-            }
-        )
-    if bundle.get("baseline_scope") != "pre_topology_baseline":
-        errors.append(
-            {
-                "code": "baseline_scope",
-                "message": "baseline_scope must be pre_topology_baseline",
-            }
-        )
-    if bundle.get("post_topology_consumption_required") is not True:
-        errors.append(
-            {
-                "code": "post_topology_consumption_required",
-                "message": "post_topology_consumption_required must be true",
-            }
-        )
-    if bundle.get("topology_read_boundary_precedence_ref") != "v2.1.35":
-        errors.append(
-            {
-                "code": "topology_read_boundary_precedence_ref",
-                "message": "topology_read_boundary_precedence_ref must be v2.1.35",
-            }
-        )
-    if bundle.get("interface_scope") != "machine_read_boundary_only":
-        errors.append(
-            {
-                "code": "interface_scope",
-                "message": "interface_scope must be machine_read_boundary_only",
-            }
-        )
-    if not isinstance(exposed_payloads, list):
-        errors.append({"code": "exposed_payloads", "message": "exposed_payloads must be an array"})
-    else:
-        payload_set = {str(item).strip() for item in exposed_payloads}
-        if payload_set != REQUIRED_PAYLOADS:
-            errors.append(
-                {
-                    "code": "exposed_payloads",
-                    "message": "exposed_payloads must exactly match the canonical package read payload set",
-                }
-            )
-    if bundle.get("cli_output_mapping_mode") != "isomorphic_human_json_mapping":
-        errors.append(
-            {
-                "code": "cli_output_mapping_mode",
-                "message": "cli_output_mapping_mode must be isomorphic_human_json_mapping",
-            }
-        )
-    if bundle.get("read_only_boundary") is not True:
-        errors.append({"code": "read_only_boundary", "message": "read_only_boundary must be true"})
-    if bundle.get("ai_orchestration_claimed") is not False:
-        errors.append(
-            {
-                "code": "ai_orchestration_claimed",
-                "message": "ai_orchestration_claimed must be false",
-            }
-        )
-    if bundle.get("remote_session_semantics_included") is not False:
-        errors.append(
-            {
-                "code": "remote_session_semantics_included",
-                "message": "remote_session_semantics_included must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
+
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -111,7 +84,7 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "errors": errors,
         "derived_results": {
             "interface_scope": bundle.get("interface_scope"),
-            "exposed_payloads": exposed_payloads,
+            "exposed_payloads": values["exposed_payloads"],
             "cli_output_mapping_mode": bundle.get("cli_output_mapping_mode"),
             "read_only_boundary": bundle.get("read_only_boundary"),
             "topology_read_boundary_precedence_ref": bundle.get("topology_read_boundary_precedence_ref"),
@@ -1,18 +1,72 @@
 import os
-from typing import List
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+_ROOT = None  # trie key marking an allowed root
 
 class ScopeEnforcer:
     """
     Path-based recursion blocking for Agents (v2.0.1).
+
+    Allowed roots and targets are compared after symlink resolution.
+    Roots live in a path-component trie, so a lookup costs O(depth)
+    regardless of how many roots are allowed. Directory realpaths are kept
+    in a bounded LRU; each target then costs one ``lstat`` for its final
+    component. Use one enforcer per run (or call ``clear_cache``) so
+    symlinks changed mid-flight are not masked.
     """
-    def __init__(self, allowed_paths: List[str]):
-        # Normalize paths
-        self.allowed_paths = [os.path.abspath(p) for p in allowed_paths]
+    def __init__(self, allowed_paths: List[str], cache_size: int = 4096):
+        self.cache_size = cache_size
+        self._dir_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._trie: dict = {}
+        self.allowed_paths = []
+        for path in allowed_paths:
+            root = os.path.realpath(path)
+            self.allowed_paths.append(root)
+            node = self._trie
+            for part in self._components(root):
+                node = node.setdefault(part, {})
+            node[_ROOT] = root
 
     def is_allowed(self, target_path: str) -> bool:
-        abs_target = os.path.abspath(target_path)
-        for allowed in self.allowed_paths:
-            # Check if target is same as or subdirectory of allowed
-            if abs_target == allowed or abs_target.startswith(allowed + os.sep):
-                return True
-        return False
+        return self.allowed_root(self.resolve(target_path)) is not None
+
+    def is_allowed_many(self, target_paths: Iterable[str]) -> List[bool]:
+        return [self.allowed_root(self.resolve(path)) is not None for path in target_paths]
+
+    def allowed_root(self, resolved_path: str) -> Optional[str]:
+        """Allowed root containing an already-resolved absolute path, if any."""
+        node = self._trie
+        if _ROOT in node:
+            return node[_ROOT]
+        for part in self._components(resolved_path):
+            node = node.get(part)
+            if node is None:
+                return None
+            if _ROOT in node:
+                return node[_ROOT]
+        return None
+
+    def resolve(self, target_path: str) -> str:
+        """``os.path.realpath`` with the parent directory's resolution cached."""
+        path = target_path if os.path.isabs(target_path) else os.path.join(os.getcwd(), target_path)
+        directory, name = os.path.split(path)
+        if name in ("", ".", ".."):
+            return os.path.realpath(path)
+        real_dir = self._dir_cache.get(directory)
+        if real_dir is None:
+            real_dir = os.path.realpath(directory)
+            self._dir_cache[directory] = real_dir
+            if len(self._dir_cache) > self.cache_size:
+                self._dir_cache.popitem(last=False)
+        else:
+            self._dir_cache.move_to_end(directory)
+        candidate = os.path.join(real_dir, name)
+        return os.path.realpath(candidate) if os.path.islink(candidate) else candidate
+
+    def clear_cache(self) -> None:
+        self._dir_cache.clear()
+
+    @staticmethod
+    def _components(path: str) -> List[str]:
+        return [part for part in path.split(os.sep) if part]
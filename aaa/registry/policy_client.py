@@ -1,14 +1,105 @@
 import hashlib
 import json
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, List, Tuple
 from pydantic import ValidationError
 from ..distribution.manifest import RegistryManifest, PolicyEntry
 
 class RegistryClientError(Exception):
     pass
 
+
+POLICY_REGISTRY_ENV = "AAA_POLICY_REGISTRY_URL"
+# Used when neither --registry nor AAA_POLICY_REGISTRY_URL is given.
+DEFAULT_POLICY_REGISTRY_URL = (Path.home() / ".aaa" / "policies").as_uri()
+
+
+def default_policy_registry_url() -> str:
+    return os.environ.get(POLICY_REGISTRY_ENV) or DEFAULT_POLICY_REGISTRY_URL
+
+
+# Parsed manifests keyed by path; reused while (mtime_ns, size) is unchanged.
+_MANIFEST_CACHE: Dict[str, Tuple[Tuple[int, int], RegistryManifest]] = {}
+_MANIFEST_LOCK = threading.Lock()
+
+
+def load_manifest(path: Path) -> RegistryManifest:
+    """Parse ``policies.json`` once per on-disk revision."""
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = str(path.resolve())
+    with _MANIFEST_LOCK:
+        cached = _MANIFEST_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    manifest = RegistryManifest.model_validate_json(path.read_text(encoding="utf-8"))
+    with _MANIFEST_LOCK:
+        _MANIFEST_CACHE[key] = (stamp, manifest)
+    return manifest
+
+
+def clear_manifest_cache() -> None:
+    with _MANIFEST_LOCK:
+        _MANIFEST_CACHE.clear()
+
+
+class PolicyStore:
+    """
+    Content-addressed store of verified policy scripts:
+    ``<root>/sha256/<hex>.py``. Files are written atomically and only after
+    their hash has been checked; ``get`` re-hashes an entry before returning
+    it and drops entries whose content no longer matches their name.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def path_for(self, digest: str) -> Path:
+        algo, hash_val = digest.split(":", 1)
+        return self.root / algo / f"{hash_val}.py"
+
+    def get(self, digest: str) -> Optional[Path]:
+        algo, _, hash_val = digest.partition(":")
+        if algo != "sha256" or len(hash_val) != 64:
+            return None
+        path = self.path_for(digest)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != hash_val:
+            # Corrupted or swapped since it was stored: evict so the caller re-fetches.
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+        return path
+
+    def put(self, digest: str, content: bytes) -> Path:
+        path = self.path_for(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return path
+
+
+def parse_policy_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """``id`` or ``id@version``."""
+    policy_id, _, version = spec.partition("@")
+    return policy_id, version or None
+
 class RegistryClient:
     """
     Zone One Component: Fetches and verifies policies.
@@ -18,6 +109,7 @@ class RegistryClient:
         self.registry_url = registry_url.rstrip('/')
         self.cache_dir = cache_dir or Path.home() / ".aaa" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.store = PolicyStore(self.cache_dir)
         self.manifest: Optional[RegistryManifest] = None
 
     def fetch_manifest(self) -> RegistryManifest:
@@ -27,8 +119,7 @@ class RegistryClient:
         if self.registry_url.startswith("file://"):
             try:
                 path = Path(self.registry_url.replace("file://", "")) / "policies.json"
-                content = path.read_text(encoding="utf-8")
-                self.manifest = RegistryManifest.model_validate_json(content)
+                self.manifest = load_manifest(path)
                 return self.manifest
             except Exception as e:
                 raise RegistryClientError(f"Failed to load local manifest: {e}")
@@ -57,15 +148,22 @@ class RegistryClient:
 
     def download_policy(self, policy_id: str, version: Optional[str] = None) -> Path:
         """Downloads signed policy script and verifies hash."""
+        return self._fetch(policy_id, version)[0]
+
+    def _fetch(self, policy_id: str, version: Optional[str]) -> Tuple[Path, str, str, bool]:
         if not self.manifest:
             self.fetch_manifest()
-            
+
+        rel_url = self.get_policy_url(policy_id, version)
         if not version:
             version = self.manifest.policies[policy_id].latest
-            
-        rel_url = self.get_policy_url(policy_id, version)
         expected_hash = self.get_policy_hash(policy_id, version)
-        
+
+        # Content-addressed hit: the stored bytes match the hash, nothing to copy
+        cached = self.store.get(expected_hash)
+        if cached:
+            return cached, version, expected_hash, True
+
         # Local protocol logic
         if self.registry_url.startswith("file://"):
            base_path = Path(self.registry_url.replace("file://", ""))
@@ -83,9 +181,25 @@ class RegistryClient:
              raise RegistryClientError(f"Hash mismatch for {policy_id}@{version}")
              
         # Save to Cache
-        dest_path = self.cache_dir / f"{policy_id}_{version}.py"
-        dest_path.write_bytes(content)
-        return dest_path
+        return self.store.put(expected_hash, content), version, expected_hash, False
+
+    def prefetch(self, specs: Iterable[str], workers: int = 8) -> List[Dict[str, Optional[str]]]:
+        """Fetch ``id[@version]`` specs into the store in parallel; one result per spec, in order."""
+        specs = list(specs)
+        if not self.manifest:
+            self.fetch_manifest()
+
+        def fetch_one(spec: str) -> Dict[str, Optional[str]]:
+            policy_id, version = parse_policy_spec(spec)
+            result: Dict[str, Optional[str]] = {"spec": spec, "policy": policy_id, "version": version}
+            try:
+                path, version, digest, hit = self._fetch(policy_id, version)
+            except RegistryClientError as e:
+                return {**result, "status": "error", "error": str(e)}
+            return {**result, "version": version, "hash": digest, "path": str(path), "status": "cached" if hit else "fetched"}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(specs) or 1))) as executor:
+            return list(executor.map(fetch_one, specs))
 
     def _verify_hash(self, content: bytes, expected: str) -> bool:
         algo, hash_val = expected.split(':')
@@ -4,6 +4,8 @@ from typing import Any
 
 from . import context_runtime_preflight
 from . import multi_repo_worktree_identity
+from .bundle_rules import TEXTS, Custom, Equals, Flag, Missing, OneOf, Required, Unknown, When, compile_rules
+from .validation_memo import MEMO, derivation_inputs
 
 
 ALLOWED_TARGET_SCOPE = "repo_or_worktree"
@@ -27,6 +29,7 @@ REQUIRED_CHECK_RESULTS = {
     "overall_status_computed",
     "evidence_refs_bound",
 }
+PREFLIGHT_INPUTS = ("current_truth_sources", "supporting_sources", "preflight_checks")
 
 
 def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
@@ -77,138 +80,122 @@ def _derive_identity_bundle(target_kind: str, target_path: str) -> dict[str, Any
     }
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    command_id = str(bundle.get("command_id", "")).strip()
-    binding_mode = str(bundle.get("binding_mode", "")).strip()
-    target_scope = str(bundle.get("target_scope", "")).strip()
-    target_kind = str(bundle.get("target_kind", "")).strip()
-    target_path = str(bundle.get("target_path", "")).strip()
-    prose_fallback_allowed = bundle.get("prose_fallback_allowed")
-    expected_output_artifact = str(bundle.get("expected_output_artifact", "")).strip()
-    allowed_authority = [str(item).strip() for item in bundle.get("allowed_authority", [])]
-    current_truth_sources = bundle.get("current_truth_sources", [])
-    supporting_sources = bundle.get("supporting_sources", [])
-    preflight_checks = bundle.get("preflight_checks", [])
-    required_check_results = [str(item).strip() for item in bundle.get("required_check_results", [])]
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if command_id != "repo-check":
-        errors.append({"code": "command_id", "message": "command_id must be repo-check"})
-    if binding_mode != "machine_parseable":
-        errors.append({"code": "binding_mode", "message": "binding_mode must be machine_parseable"})
-    if target_scope != ALLOWED_TARGET_SCOPE:
-        errors.append({"code": "target_scope", "message": "target_scope must be repo_or_worktree"})
-    if target_kind not in ALLOWED_TARGET_KINDS:
-        errors.append(
-            {
-                "code": "target_kind",
-                "message": "target_kind must be canonical_repo_root or legal_worktree_instance",
-            }
-        )
-    if not target_path:
-        errors.append({"code": "target_path", "message": "target_path is required"})
-    if prose_fallback_allowed is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose fallback is not allowed"})
-    if expected_output_artifact != "repo_check_result_bundle":
-        errors.append(
-            {
-                "code": "expected_output_artifact",
-                "message": "expected_output_artifact must be repo_check_result_bundle",
-            }
-        )
+RESULT_SHAPE_RULES = compile_rules(
+    [
+        Equals(
+            "result_kind",
+            "repo_check_result_bundle",
+            "result_kind must be repo_check_result_bundle",
+            code="result_shape_contract",
+        ),
+        Flag("machine_checkable", True, "result shape must be machine checkable", code="result_shape_contract"),
+        When(
+            "result_shape_contract",
+            lambda values, contract: "overall_status" not in values["required_fields"]
+            or "evidence_refs" not in values["required_fields"],
+            "required_fields must include overall_status and evidence_refs",
+            fields=(("required_fields", TEXTS),),
+        ),
+    ]
+)
+CONSUMER_RELATION_RULES = compile_rules(
+    [
+        Equals(
+            "relation_mode",
+            "consumable_by_readiness_surface",
+            "relation_mode must be consumable_by_readiness_surface",
+            code="readiness_consumer_relation",
+        ),
+        OneOf(
+            "consumer_surface",
+            ALLOWED_CONSUMER_SURFACES,
+            "consumer_surface must be operator_summary, gate_status_surface, or readiness_panel",
+            code="readiness_consumer_relation",
+        ),
+        Flag(
+            "machine_checkable",
+            True,
+            "readiness consumer relation must be machine checkable",
+            code="readiness_consumer_relation",
+        ),
+    ]
+)
+
+
+def _check_nested_contracts(bundle: dict[str, Any], values: dict[str, Any], errors: list[dict[str, str]]) -> None:
+    errors.extend(RESULT_SHAPE_RULES.check(bundle.get("result_shape_contract", {}))[0])
+    errors.extend(CONSUMER_RELATION_RULES.check(bundle.get("readiness_consumer_relation", {}))[0])
+
+
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        OneOf("command_id", {"repo-check"}, "command_id must be repo-check"),
+        OneOf("binding_mode", {"machine_parseable"}, "binding_mode must be machine_parseable"),
+        OneOf("target_scope", {ALLOWED_TARGET_SCOPE}, "target_scope must be repo_or_worktree"),
+        OneOf(
+            "target_kind",
+            ALLOWED_TARGET_KINDS,
+            "target_kind must be canonical_repo_root or legal_worktree_instance",
+        ),
+        Required("target_path", "target_path is required"),
+        Flag("prose_fallback_allowed", False, "prose fallback is not allowed"),
+        OneOf(
+            "expected_output_artifact",
+            {"repo_check_result_bundle"},
+            "expected_output_artifact must be repo_check_result_bundle",
+        ),
+        Unknown("allowed_authority", ALLOWED_AUTHORITIES, "illegal authority values", sort=True),
+        When(
+            "target_path",
+            lambda values, bundle: values["target_kind"] == "legal_worktree_instance"
+            and "/.worktrees/" not in values["target_path"]
+            and not values["target_path"].startswith(".worktrees/"),
+            "legal_worktree_instance target_path must live under /.worktrees/",
+        ),
+        When(
+            "target_path",
+            lambda values, bundle: values["target_kind"] == "canonical_repo_root" and "/.worktrees/" in values["target_path"],
+            "canonical_repo_root target_path cannot point to a worktree instance",
+        ),
+        When(
+            "target_kind",
+            lambda values, bundle: bool(values["target_path"]) and _looks_like_workspace_root(values["target_path"]),
+            "workspace_root cannot be used as repo-check runtime target",
+        ),
+        Custom(_check_nested_contracts),
+        Missing(
+            "required_check_results",
+            REQUIRED_CHECK_RESULTS,
+            "missing required check results",
+            sort=True,
+        ),
+    ]
+)
 
-    invalid_authority = [item for item in allowed_authority if item not in ALLOWED_AUTHORITIES]
-    if invalid_authority:
-        errors.append(
-            {
-                "code": "allowed_authority",
-                "message": f"illegal authority values: {', '.join(sorted(invalid_authority))}",
-            }
-        )
 
-    if target_kind == "legal_worktree_instance" and "/.worktrees/" not in target_path and not target_path.startswith(
-        ".worktrees/"
-    ):
-        errors.append(
-            {
-                "code": "target_path",
-                "message": "legal_worktree_instance target_path must live under /.worktrees/",
-            }
-        )
-    if target_kind == "canonical_repo_root" and "/.worktrees/" in target_path:
-        errors.append(
-            {
-                "code": "target_path",
-                "message": "canonical_repo_root target_path cannot point to a worktree instance",
-            }
-        )
-    if target_path and _looks_like_workspace_root(target_path):
-        errors.append(
-            {
-                "code": "target_kind",
-                "message": "workspace_root cannot be used as repo-check runtime target",
-            }
-        )
-
-    result_shape_contract = bundle.get("result_shape_contract", {})
-    required_fields = [str(item).strip() for item in result_shape_contract.get("required_fields", [])]
-    if result_shape_contract.get("result_kind") != "repo_check_result_bundle":
-        errors.append({"code": "result_shape_contract", "message": "result_kind must be repo_check_result_bundle"})
-    if result_shape_contract.get("machine_checkable") is not True:
-        errors.append({"code": "result_shape_contract", "message": "result shape must be machine checkable"})
-    if "overall_status" not in required_fields or "evidence_refs" not in required_fields:
-        errors.append(
-            {
-                "code": "result_shape_contract",
-                "message": "required_fields must include overall_status and evidence_refs",
-            }
-        )
-
-    readiness_consumer_relation = bundle.get("readiness_consumer_relation", {})
-    if readiness_consumer_relation.get("relation_mode") != "consumable_by_readiness_surface":
-        errors.append(
-            {
-                "code": "readiness_consumer_relation",
-                "message": "relation_mode must be consumable_by_readiness_surface",
-            }
-        )
-    consumer_surface = str(readiness_consumer_relation.get("consumer_surface", "")).strip()
-    if consumer_surface not in ALLOWED_CONSUMER_SURFACES:
-        errors.append(
-            {
-                "code": "readiness_consumer_relation",
-                "message": "consumer_surface must be operator_summary, gate_status_surface, or readiness_panel",
-            }
-        )
-    if readiness_consumer_relation.get("machine_checkable") is not True:
-        errors.append(
-            {
-                "code": "readiness_consumer_relation",
-                "message": "readiness consumer relation must be machine checkable",
-            }
-        )
-
-    missing_required_results = [item for item in REQUIRED_CHECK_RESULTS if item not in required_check_results]
-    if missing_required_results:
-        errors.append(
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
+    target_kind = values["target_kind"]
+    target_path = values["target_path"]
+
+    identity_result = MEMO.get(
+        "repo-check.multi-repo-worktree-identity",
+        [target_kind, target_path],
+        lambda: multi_repo_worktree_identity.validate_bundle(_derive_identity_bundle(target_kind, target_path)),
+    )
+    preflight_result = MEMO.get(
+        "repo-check.context-runtime-preflight",
+        derivation_inputs(bundle, PREFLIGHT_INPUTS),
+        lambda: context_runtime_preflight.validate_bundle(
             {
-                "code": "required_check_results",
-                "message": f"missing required check results: {', '.join(sorted(missing_required_results))}",
+                "version": "v0.1",
+                "bundle_id": "runtime-adoption.repo-check.preflight.v0.1",
+                "current_truth_sources": bundle.get("current_truth_sources", []),
+                "supporting_sources": bundle.get("supporting_sources", []),
+                "preflight_checks": bundle.get("preflight_checks", []),
             }
-        )
-
-    identity_result = multi_repo_worktree_identity.validate_bundle(_derive_identity_bundle(target_kind, target_path))
-    preflight_result = context_runtime_preflight.validate_bundle(
-        {
-            "version": "v0.1",
-            "bundle_id": "runtime-adoption.repo-check.preflight.v0.1",
-            "current_truth_sources": current_truth_sources,
-            "supporting_sources": supporting_sources,
-            "preflight_checks": preflight_checks,
-        }
+        ),
     )
 
     derived_results = {
@@ -224,10 +211,10 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
-        "resolved_command_id": command_id,
+        "resolved_command_id": values["command_id"],
         "resolved_target_kind": target_kind,
         "resolved_target_path": target_path,
-        "resolved_required_check_results": required_check_results,
+        "resolved_required_check_results": values["required_check_results"],
         "derived_results": derived_results,
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, Unknown, compile_rules
+
 
 ALLOWED_ARTIFACT_KINDS = {
     "dispatch_result_envelope",
@@ -29,65 +31,42 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "promotion_gate_id",
+            "result_artifact_evidence_promotion_gate",
+            "promotion_gate_id must be result_artifact_evidence_promotion_gate",
+        ),
+        Equals("runtime_plane_mode", "result_evidence_gate", "runtime_plane_mode must be result_evidence_gate"),
+        OneOf("result_artifact_kind", ALLOWED_ARTIFACT_KINDS, "result_artifact_kind is not allowed"),
+        OneOf("artifact_eligibility", {"eligible", "ineligible"}, "artifact_eligibility must be eligible or ineligible"),
+        OneOf("evidence_class", ALLOWED_EVIDENCE_CLASSES, "evidence_class is not allowed"),
+        OneOf("promotion_eligibility", {"promotable", "blocked"}, "promotion_eligibility must be promotable or blocked"),
+        OneOf(
+            "promotion_decision_source",
+            {"machine_checkable_gate"},
+            "promotion_decision_source must be machine_checkable_gate",
+        ),
+        OneOf(
+            "evidence_source",
+            ALLOWED_EVIDENCE_SOURCES,
+            "evidence_source must be eligible_result_artifact or promotion_gated_evidence_bundle",
+        ),
+        Unknown(
+            "supporting_review_sources",
+            ALLOWED_SUPPORTING_REVIEW_SOURCES,
+            "unsupported supporting_review_sources",
+        ),
+        Flag("sole_manual_decision_allowed", False, "sole_manual_decision_allowed must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    result_artifact_kind = str(bundle.get("result_artifact_kind", "")).strip()
-    evidence_class = str(bundle.get("evidence_class", "")).strip()
-    promotion_decision_source = str(bundle.get("promotion_decision_source", "")).strip()
-    evidence_source = str(bundle.get("evidence_source", "")).strip()
-    supporting_review_sources = [str(item).strip() for item in bundle.get("supporting_review_sources", [])]
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("promotion_gate_id") != "result_artifact_evidence_promotion_gate":
-        errors.append(
-            {
-                "code": "promotion_gate_id",
-                "message": "promotion_gate_id must be result_artifact_evidence_promotion_gate",
-            }
-        )
-    if bundle.get("runtime_plane_mode") != "result_evidence_gate":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be result_evidence_gate"})
-    if result_artifact_kind not in ALLOWED_ARTIFACT_KINDS:
-        errors.append({"code": "result_artifact_kind", "message": "result_artifact_kind is not allowed"})
-    if str(bundle.get("artifact_eligibility", "")).strip() not in {"eligible", "ineligible"}:
-        errors.append({"code": "artifact_eligibility", "message": "artifact_eligibility must be eligible or ineligible"})
-    if evidence_class not in ALLOWED_EVIDENCE_CLASSES:
-        errors.append({"code": "evidence_class", "message": "evidence_class is not allowed"})
-    if str(bundle.get("promotion_eligibility", "")).strip() not in {"promotable", "blocked"}:
-        errors.append({"code": "promotion_eligibility", "message": "promotion_eligibility must be promotable or blocked"})
-    if promotion_decision_source != "machine_checkable_gate":
-        errors.append(
-            {
-                "code": "promotion_decision_source",
-                "message": "promotion_decision_source must be machine_checkable_gate",
-            }
-        )
-    if evidence_source not in ALLOWED_EVIDENCE_SOURCES:
-        errors.append(
-            {
-                "code": "evidence_source",
-                "message": "evidence_source must be eligible_result_artifact or promotion_gated_evidence_bundle",
-            }
-        )
-    invalid_supporting_sources = [item for item in supporting_review_sources if item not in ALLOWED_SUPPORTING_REVIEW_SOURCES]
-    if invalid_supporting_sources:
-        errors.append(
-            {
-                "code": "supporting_review_sources",
-                "message": f"unsupported supporting_review_sources: {', '.join(invalid_supporting_sources)}",
-            }
-        )
-    if bundle.get("sole_manual_decision_allowed") is not False:
-        errors.append(
-            {
-                "code": "sole_manual_decision_allowed",
-                "message": "sole_manual_decision_allowed must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -97,8 +76,8 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "promotion_decision_source": promotion_decision_source,
-            "evidence_source": evidence_source,
+            "promotion_decision_source": values["promotion_decision_source"],
+            "evidence_source": values["evidence_source"],
             "artifact_eligibility": bundle.get("artifact_eligibility"),
             "promotion_eligibility": bundle.get("promotion_eligibility"),
         },
@@ -8,7 +8,12 @@ from typing import Any
 
 from . import governance_index
 from .action_registry import ActionRegistry, RuntimeSecurityError
+from .jsonl import JsonlEventSink, active_sink
 from .ops import milestone_manager
+from .policy.scope import ScopeEnforcer
+
+
+RUNBOOK_EVENT_COMMAND = "aaa runbook"
 
 
 class RunbookExecutionError(Exception):
@@ -21,17 +26,37 @@ def execute_runbook(
     runbook: dict[str, Any],
     inputs: dict[str, Any],
     registry: ActionRegistry | None = None,
+    sink: JsonlEventSink | None = None,
 ) -> dict[str, Any]:
     registry = registry or _default_registry()
-    allowed_scopes = runbook.get("contract", {}).get("required_scopes")
+    sink = sink or active_sink()
+    authorization = registry.compile(runbook.get("contract", {}).get("required_scopes"))
     steps_output = []
     for index, step in enumerate(runbook.get("steps", [])):
         step_name = step.get("name", "")
         action = step.get("action", "")
+        event_step_id = step_name or f"step_{index}"
         rendered_args = _render_args(step.get("args", []), inputs, steps_output)
+        if sink is not None:
+            sink.emit(
+                event="start",
+                status="start",
+                command=RUNBOOK_EVENT_COMMAND,
+                step_id=event_step_id,
+                data={"action": action},
+            )
         try:
-            output = registry.execute(action, rendered_args, allowed_scopes)
+            output = registry.execute(action, rendered_args, authorization)
         except Exception as exc:
+            if sink is not None:
+                sink.emit(
+                    event="error",
+                    status="error",
+                    command=RUNBOOK_EVENT_COMMAND,
+                    step_id=event_step_id,
+                    message=str(exc),
+                    data={"action": action, "error_type": type(exc).__name__},
+                )
             raise RunbookExecutionError(
                 "runbook step failed",
                 {
@@ -43,6 +68,14 @@ def execute_runbook(
                     "error": str(exc),
                 },
             ) from exc
+        if sink is not None:
+            sink.emit(
+                event="result",
+                status="ok",
+                command=RUNBOOK_EVENT_COMMAND,
+                step_id=event_step_id,
+                data={"action": action},
+            )
         steps_output.append({"name": step_name, "output": output})
     return {"steps": steps_output}
 
@@ -181,18 +214,16 @@ def _resolve_safe_path(path_value: str | Path) -> Path:
     if not path_value:
         raise RuntimeSecurityError("PATH_TRAVERSAL", "empty path not allowed")
     base = Path.cwd().resolve()
+    scope = ScopeEnforcer([str(base)])
     raw = Path(path_value).expanduser()
-    target = raw if raw.is_absolute() else (base / raw)
-    target = target.resolve()
-    try:
-        target.relative_to(base)
-    except ValueError as exc:
+    target = scope.resolve(str(raw if raw.is_absolute() else (base / raw)))
+    if scope.allowed_root(target) is None:
         raise RuntimeSecurityError(
             "PATH_TRAVERSAL",
             "path escapes repo root",
-            {"base": str(base), "path": str(target)},
-        ) from exc
-    return target
+            {"base": str(base), "path": target},
+        )
+    return Path(target)
 
 
 def _payload_from_args(args: Any) -> dict[str, Any]:
@@ -6,6 +6,8 @@ from . import context_runtime_preflight
 from . import multi_repo_worktree_identity
 from . import session_readiness_state
 from . import tool_command_adoption
+from .bundle_rules import Equals, Flag, Missing, OneOf, Required, Unknown, When, compile_rules
+from .validation_memo import MEMO, derivation_inputs
 
 
 ALLOWED_TARGET_SCOPE = "repo_or_worktree"
@@ -23,6 +25,15 @@ REQUIRED_TOOL_CHAIN = [
     "governance.validate-context-runtime-preflight",
     "governance.validate-session-readiness-state",
 ]
+TOOL_COMMAND_INPUTS = (
+    "tool_chain_refs",
+    "command_id",
+    "binding_mode",
+    "allowed_authority",
+    "expected_output_artifact",
+)
+PREFLIGHT_INPUTS = ("current_truth_sources", "supporting_sources", "preflight_checks")
+READINESS_INPUTS = ("readiness_surface", "readiness_checks")
 
 
 def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
@@ -98,101 +109,81 @@ def _derive_readiness_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    command_id = str(bundle.get("command_id", "")).strip()
-    binding_mode = str(bundle.get("binding_mode", "")).strip()
-    target_scope = str(bundle.get("target_scope", "")).strip()
-    target_kind = str(bundle.get("target_kind", "")).strip()
-    target_path = str(bundle.get("target_path", "")).strip()
-    expected_output_artifact = str(bundle.get("expected_output_artifact", "")).strip()
-    prose_fallback_allowed = bundle.get("prose_fallback_allowed")
-    allowed_authority = [str(item).strip() for item in bundle.get("allowed_authority", [])]
-    tool_chain_refs = [str(item).strip() for item in bundle.get("tool_chain_refs", [])]
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if command_id != "readiness-inspect":
-        errors.append({"code": "command_id", "message": "command_id must be readiness-inspect"})
-    if binding_mode != "machine_parseable":
-        errors.append({"code": "binding_mode", "message": "binding_mode must be machine_parseable"})
-    if target_scope != ALLOWED_TARGET_SCOPE:
-        errors.append({"code": "target_scope", "message": "target_scope must be repo_or_worktree"})
-    if target_kind not in ALLOWED_TARGET_KINDS:
-        errors.append(
-            {
-                "code": "target_kind",
-                "message": "target_kind must be canonical_repo_root or legal_worktree_instance",
-            }
-        )
-    if not target_path:
-        errors.append({"code": "target_path", "message": "target_path is required"})
-    if prose_fallback_allowed is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose fallback is not allowed"})
-    if expected_output_artifact != "readiness_state_report":
-        errors.append(
-            {
-                "code": "expected_output_artifact",
-                "message": "expected_output_artifact must be readiness_state_report",
-            }
-        )
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        OneOf("command_id", {"readiness-inspect"}, "command_id must be readiness-inspect"),
+        OneOf("binding_mode", {"machine_parseable"}, "binding_mode must be machine_parseable"),
+        OneOf("target_scope", {ALLOWED_TARGET_SCOPE}, "target_scope must be repo_or_worktree"),
+        OneOf(
+            "target_kind",
+            ALLOWED_TARGET_KINDS,
+            "target_kind must be canonical_repo_root or legal_worktree_instance",
+        ),
+        Required("target_path", "target_path is required"),
+        Flag("prose_fallback_allowed", False, "prose fallback is not allowed"),
+        OneOf(
+            "expected_output_artifact",
+            {"readiness_state_report"},
+            "expected_output_artifact must be readiness_state_report",
+        ),
+        Unknown("allowed_authority", ALLOWED_AUTHORITIES, "illegal authority values", sort=True),
+        Missing("tool_chain_refs", REQUIRED_TOOL_CHAIN, "missing required tool chain refs"),
+        When(
+            "target_path",
+            lambda values, bundle: values["target_kind"] == "legal_worktree_instance"
+            and "/.worktrees/" not in values["target_path"]
+            and not values["target_path"].startswith(".worktrees/"),
+            "legal_worktree_instance target_path must live under /.worktrees/",
+        ),
+        When(
+            "target_path",
+            lambda values, bundle: values["target_kind"] == "canonical_repo_root" and "/.worktrees/" in values["target_path"],
+            "canonical_repo_root target_path cannot point to a worktree instance",
+        ),
+        When(
+            "target_kind",
+            lambda values, bundle: bool(values["target_path"]) and _looks_like_workspace_root(values["target_path"]),
+            "workspace_root cannot be used as runtime adoption target",
+        ),
+    ]
+)
 
-    invalid_authority = [item for item in allowed_authority if item not in ALLOWED_AUTHORITIES]
-    if invalid_authority:
-        errors.append(
-            {
-                "code": "allowed_authority",
-                "message": f"illegal authority values: {', '.join(sorted(invalid_authority))}",
-            }
-        )
 
-    missing_tool_chain = [item for item in REQUIRED_TOOL_CHAIN if item not in tool_chain_refs]
-    if missing_tool_chain:
-        errors.append(
-            {
-                "code": "tool_chain_refs",
-                "message": f"missing required tool chain refs: {', '.join(missing_tool_chain)}",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
+    target_kind = values["target_kind"]
+    target_path = values["target_path"]
 
-    if target_kind == "legal_worktree_instance" and "/.worktrees/" not in target_path and not target_path.startswith(
-        ".worktrees/"
-    ):
-        errors.append(
-            {
-                "code": "target_path",
-                "message": "legal_worktree_instance target_path must live under /.worktrees/",
-            }
-        )
-    if target_kind == "canonical_repo_root" and "/.worktrees/" in target_path:
-        errors.append(
-            {
-                "code": "target_path",
-                "message": "canonical_repo_root target_path cannot point to a worktree instance",
-            }
-        )
-    if target_path and _looks_like_workspace_root(target_path):
-        errors.append(
+    derived_results: dict[str, Any] = {}
+    tool_result = MEMO.get(
+        "readiness-inspect.tool-command-adoption",
+        derivation_inputs(bundle, TOOL_COMMAND_INPUTS),
+        lambda: tool_command_adoption.validate_bundle(_derive_tool_command_bundle(bundle)),
+    )
+    identity_result = MEMO.get(
+        "readiness-inspect.multi-repo-worktree-identity",
+        [target_kind, target_path],
+        lambda: multi_repo_worktree_identity.validate_bundle(_derive_identity_bundle(target_kind, target_path)),
+    )
+    preflight_result = MEMO.get(
+        "readiness-inspect.context-runtime-preflight",
+        derivation_inputs(bundle, PREFLIGHT_INPUTS),
+        lambda: context_runtime_preflight.validate_bundle(
             {
-                "code": "target_kind",
-                "message": "workspace_root cannot be used as runtime adoption target",
+                "version": "v0.1",
+                "bundle_id": "runtime-adoption.readiness-inspect.preflight.v0.1",
+                "current_truth_sources": bundle.get("current_truth_sources", []),
+                "supporting_sources": bundle.get("supporting_sources", []),
+                "preflight_checks": bundle.get("preflight_checks", []),
             }
-        )
-
-    derived_results: dict[str, Any] = {}
-    tool_result = tool_command_adoption.validate_bundle(_derive_tool_command_bundle(bundle))
-    identity_result = multi_repo_worktree_identity.validate_bundle(_derive_identity_bundle(target_kind, target_path))
-    preflight_result = context_runtime_preflight.validate_bundle(
-        {
-            "version": "v0.1",
-            "bundle_id": "runtime-adoption.readiness-inspect.preflight.v0.1",
-            "current_truth_sources": bundle.get("current_truth_sources", []),
-            "supporting_sources": bundle.get("supporting_sources", []),
-            "preflight_checks": bundle.get("preflight_checks", []),
-        }
+        ),
+    )
+    readiness_result = MEMO.get(
+        "readiness-inspect.session-readiness-state",
+        derivation_inputs(bundle, READINESS_INPUTS),
+        lambda: session_readiness_state.validate_bundle(_derive_readiness_bundle(bundle)),
     )
-    readiness_result = session_readiness_state.validate_bundle(_derive_readiness_bundle(bundle))
 
     derived_results["tool_command_adoption"] = tool_result
     derived_results["multi_repo_worktree_identity"] = identity_result
@@ -209,10 +200,10 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
-        "resolved_command_id": command_id,
+        "resolved_command_id": values["command_id"],
         "resolved_target_kind": target_kind,
         "resolved_target_path": target_path,
-        "resolved_tool_chain_refs": tool_chain_refs,
+        "resolved_tool_chain_refs": values["tool_chain_refs"],
         "derived_results": derived_results,
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
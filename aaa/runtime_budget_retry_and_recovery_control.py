@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, compile_rules
+
 
 ALLOWED_BUDGET_SCOPE = {
     "per_turn",
@@ -33,52 +35,25 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("runtime_plane_mode", "runtime_control", "runtime_plane_mode must be runtime_control"),
+        Equals("line_class", "mandatory_core_absorption_line", "line_class must be mandatory_core_absorption_line"),
+        OneOf("budget_scope", ALLOWED_BUDGET_SCOPE, "budget_scope is not allowed"),
+        OneOf("failure_class", ALLOWED_FAILURE_CLASS, "failure_class is not allowed"),
+        OneOf("retry_mode", ALLOWED_RETRY_MODE, "retry_mode is not allowed"),
+        OneOf("fallback_mode", ALLOWED_FALLBACK_MODE, "fallback_mode is not allowed"),
+        OneOf("stop_condition", ALLOWED_STOP_CONDITION, "stop_condition is not allowed"),
+        Flag("fallback_retry_recursion_allowed", False, "fallback path may not recurse into unbounded retry"),
+        Flag("provider_business_layer_allowed", False, "provider business layer expansion is not allowed"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    budget_scope = str(bundle.get("budget_scope", "")).strip()
-    failure_class = str(bundle.get("failure_class", "")).strip()
-    retry_mode = str(bundle.get("retry_mode", "")).strip()
-    fallback_mode = str(bundle.get("fallback_mode", "")).strip()
-    stop_condition = str(bundle.get("stop_condition", "")).strip()
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "runtime_control":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be runtime_control"})
-    if bundle.get("line_class") != "mandatory_core_absorption_line":
-        errors.append({"code": "line_class", "message": "line_class must be mandatory_core_absorption_line"})
-    if budget_scope not in ALLOWED_BUDGET_SCOPE:
-        errors.append({"code": "budget_scope", "message": "budget_scope is not allowed"})
-    if failure_class not in ALLOWED_FAILURE_CLASS:
-        errors.append({"code": "failure_class", "message": "failure_class is not allowed"})
-    if retry_mode not in ALLOWED_RETRY_MODE:
-        errors.append({"code": "retry_mode", "message": "retry_mode is not allowed"})
-    if fallback_mode not in ALLOWED_FALLBACK_MODE:
-        errors.append({"code": "fallback_mode", "message": "fallback_mode is not allowed"})
-    if stop_condition not in ALLOWED_STOP_CONDITION:
-        errors.append({"code": "stop_condition", "message": "stop_condition is not allowed"})
-    if bundle.get("fallback_retry_recursion_allowed") is not False:
-        errors.append(
-            {
-                "code": "fallback_retry_recursion_allowed",
-                "message": "fallback path may not recurse into unbounded retry",
-            }
-        )
-    if bundle.get("provider_business_layer_allowed") is not False:
-        errors.append(
-            {
-                "code": "provider_business_layer_allowed",
-                "message": "provider business layer expansion is not allowed",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -88,11 +63,11 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "budget_scope": budget_scope,
-            "failure_class": failure_class,
-            "retry_mode": retry_mode,
-            "fallback_mode": fallback_mode,
-            "stop_condition": stop_condition,
+            "budget_scope": values["budget_scope"],
+            "failure_class": values["failure_class"],
+            "retry_mode": values["retry_mode"],
+            "fallback_mode": values["fallback_mode"],
+            "stop_condition": values["stop_condition"],
         },
     }
 
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, compile_rules
+
 
 ALLOWED_SESSION_STORE_MODE = {
     "persistent_store",
@@ -27,54 +29,28 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("runtime_plane_mode", "session_persistence", "runtime_plane_mode must be session_persistence"),
+        Equals("line_class", "mandatory_core_absorption_line", "line_class must be mandatory_core_absorption_line"),
+        OneOf("session_store_mode", ALLOWED_SESSION_STORE_MODE, "session_store_mode is not allowed"),
+        OneOf("transcript_class", ALLOWED_TRANSCRIPT_CLASS, "transcript_class is not allowed"),
+        OneOf("compaction_mode", ALLOWED_COMPACTION_MODE, "compaction_mode is not allowed"),
+        OneOf(
+            "replay_input_eligibility",
+            ALLOWED_REPLAY_INPUT_ELIGIBILITY,
+            "replay_input_eligibility must use the fixed machine-checkable enum",
+        ),
+        Flag("canonical_truth_promotion_allowed", False, "transcript may not promote to canonical truth"),
+        Flag("audit_reproducibility_required", True, "audit_reproducibility_required must be true"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    session_store_mode = str(bundle.get("session_store_mode", "")).strip()
-    transcript_class = str(bundle.get("transcript_class", "")).strip()
-    compaction_mode = str(bundle.get("compaction_mode", "")).strip()
-    replay_input_eligibility = str(bundle.get("replay_input_eligibility", "")).strip()
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "session_persistence":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be session_persistence"})
-    if bundle.get("line_class") != "mandatory_core_absorption_line":
-        errors.append({"code": "line_class", "message": "line_class must be mandatory_core_absorption_line"})
-    if session_store_mode not in ALLOWED_SESSION_STORE_MODE:
-        errors.append({"code": "session_store_mode", "message": "session_store_mode is not allowed"})
-    if transcript_class not in ALLOWED_TRANSCRIPT_CLASS:
-        errors.append({"code": "transcript_class", "message": "transcript_class is not allowed"})
-    if compaction_mode not in ALLOWED_COMPACTION_MODE:
-        errors.append({"code": "compaction_mode", "message": "compaction_mode is not allowed"})
-    if replay_input_eligibility not in ALLOWED_REPLAY_INPUT_ELIGIBILITY:
-        errors.append(
-            {
-                "code": "replay_input_eligibility",
-                "message": "replay_input_eligibility must use the fixed machine-checkable enum",
-            }
-        )
-    if bundle.get("canonical_truth_promotion_allowed") is not False:
-        errors.append(
-            {
-                "code": "canonical_truth_promotion_allowed",
-                "message": "transcript may not promote to canonical truth",
-            }
-        )
-    if bundle.get("audit_reproducibility_required") is not True:
-        errors.append(
-            {
-                "code": "audit_reproducibility_required",
-                "message": "audit_reproducibility_required must be true",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -84,10 +60,10 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "session_store_mode": session_store_mode,
-            "transcript_class": transcript_class,
-            "compaction_mode": compaction_mode,
-            "replay_input_eligibility": replay_input_eligibility,
+            "session_store_mode": values["session_store_mode"],
+            "transcript_class": values["transcript_class"],
+            "compaction_mode": values["compaction_mode"],
+            "replay_input_eligibility": values["replay_input_eligibility"],
         },
     }
 
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Missing, OneOf, Unknown, When, compile_rules
+
 
 ALLOWED_ORCHESTRATION_MODES = {
     "interactive_session",
@@ -34,60 +36,35 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    orchestration_mode = str(bundle.get("orchestration_mode", "")).strip()
-    query_state_store = str(bundle.get("query_state_store", "")).strip()
-    readiness_surface = str(bundle.get("readiness_surface", "")).strip()
-    readiness_checks = [str(item).strip() for item in bundle.get("readiness_checks", [])]
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-
-    if orchestration_mode not in ALLOWED_ORCHESTRATION_MODES:
-        errors.append({"code": "orchestration_mode", "message": "invalid orchestration_mode"})
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        OneOf("orchestration_mode", ALLOWED_ORCHESTRATION_MODES, "invalid orchestration_mode"),
+        OneOf("query_state_store", ALLOWED_QUERY_STATE_STORES, "invalid query_state_store"),
+        OneOf("readiness_surface", ALLOWED_READINESS_SURFACES, "invalid readiness_surface"),
+        Unknown("readiness_checks", REQUIRED_READINESS_CHECKS, "unknown readiness checks", sort=True),
+        Missing("readiness_checks", REQUIRED_READINESS_CHECKS, "missing required readiness checks", sort=True),
+        When(
+            "surface_store_binding",
+            lambda values, bundle: values["readiness_surface"] == "readiness_panel"
+            and values["query_state_store"] != "readiness_snapshot",
+            "readiness_panel requires query_state_store=readiness_snapshot",
+        ),
+    ]
+)
 
-    if query_state_store not in ALLOWED_QUERY_STATE_STORES:
-        errors.append({"code": "query_state_store", "message": "invalid query_state_store"})
 
-    if readiness_surface not in ALLOWED_READINESS_SURFACES:
-        errors.append({"code": "readiness_surface", "message": "invalid readiness_surface"})
-
-    unknown_checks = [item for item in readiness_checks if item not in REQUIRED_READINESS_CHECKS]
-    if unknown_checks:
-        errors.append(
-            {
-                "code": "readiness_checks",
-                "message": f"unknown readiness checks: {', '.join(sorted(unknown_checks))}",
-            }
-        )
-
-    missing_checks = [item for item in REQUIRED_READINESS_CHECKS if item not in readiness_checks]
-    if missing_checks:
-        errors.append(
-            {
-                "code": "readiness_checks",
-                "message": f"missing required readiness checks: {', '.join(sorted(missing_checks))}",
-            }
-        )
-
-    if readiness_surface == "readiness_panel" and query_state_store != "readiness_snapshot":
-        errors.append(
-            {
-                "code": "surface_store_binding",
-                "message": "readiness_panel requires query_state_store=readiness_snapshot",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
-        "resolved_orchestration_mode": orchestration_mode,
-        "resolved_query_state_store": query_state_store,
-        "resolved_readiness_surface": readiness_surface,
-        "resolved_readiness_checks": readiness_checks,
+        "resolved_orchestration_mode": values["orchestration_mode"],
+        "resolved_query_state_store": values["query_state_store"],
+        "resolved_readiness_surface": values["readiness_surface"],
+        "resolved_readiness_checks": values["readiness_checks"],
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
     }
@@ -4,6 +4,8 @@ from typing import Any, Callable
 
 from . import repo_check_runtime_adoption
 from . import runtime_adoption_readiness_inspect
+from .bundle_rules import TEXT, Custom, Equals, Flag, OneOf, SameSet, compile_rules
+from .validation_memo import MEMO
 
 
 COMMAND_ENTRY_MAP = {
@@ -27,87 +29,62 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_dispatch_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    command_id = str(bundle.get("command_id", "")).strip()
-    dispatch_entry_ref = str(bundle.get("dispatch_entry_ref", "")).strip()
-    output_envelope = [str(item).strip() for item in bundle.get("common_output_envelope", [])]
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("dispatch_runtime_id") != "shared_command_dispatch":
-        errors.append({"code": "dispatch_runtime_id", "message": "dispatch_runtime_id must be shared_command_dispatch"})
-    if bundle.get("runtime_plane_mode") != "command_dispatch":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be command_dispatch"})
-    if bundle.get("consumed_command_registry_ref") != "internal/development/contracts/ops/command-registry-contract.v0.1.md":
-        errors.append(
-            {
-                "code": "consumed_command_registry_ref",
-                "message": "consumed_command_registry_ref must point to command-registry-contract.v0.1.md",
-            }
-        )
-    if command_id not in COMMAND_ENTRY_MAP:
-        errors.append(
-            {
-                "code": "command_id",
-                "message": "command_id must be readiness-inspect or repo-check",
-            }
-        )
+def _check_dispatch_entry(bundle: dict[str, Any], values: dict[str, Any], errors: list[dict[str, str]]) -> None:
+    command_id = values["command_id"]
     expected_entry = COMMAND_ENTRY_MAP.get(command_id)
-    if expected_entry and dispatch_entry_ref != expected_entry:
+    if expected_entry and values["dispatch_entry_ref"] != expected_entry:
         errors.append(
             {
                 "code": "dispatch_entry_ref",
                 "message": f"dispatch_entry_ref must be {expected_entry} for {command_id}",
             }
         )
-    if bundle.get("target_resolution_ref") != "governance.validate-multi-repo-worktree-identity":
-        errors.append(
-            {
-                "code": "target_resolution_ref",
-                "message": "target_resolution_ref must be governance.validate-multi-repo-worktree-identity",
-            }
-        )
-    if bundle.get("context_preflight_ref") != "governance.validate-context-runtime-preflight":
-        errors.append(
-            {
-                "code": "context_preflight_ref",
-                "message": "context_preflight_ref must be governance.validate-context-runtime-preflight",
-            }
-        )
-    if set(output_envelope) != REQUIRED_OUTPUT_FIELDS:
-        errors.append(
-            {
-                "code": "common_output_envelope",
-                "message": "common_output_envelope must contain status, valid, errors, result_artifact",
-            }
-        )
-    if bundle.get("exit_semantics") != "fail_closed":
-        errors.append({"code": "exit_semantics", "message": "exit_semantics must be fail_closed"})
-    if bundle.get("primary_command_law_mode") != "referenced_only":
-        errors.append(
-            {
-                "code": "primary_command_law_mode",
-                "message": "primary_command_law_mode must be referenced_only",
-            }
-        )
-    if bundle.get("family_expansion_allowed") is not False:
-        errors.append(
-            {
-                "code": "family_expansion_allowed",
-                "message": "family expansion is not allowed in shared dispatch runtime",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose fallback is not allowed"})
+
+
+DISPATCH_RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("dispatch_runtime_id", "shared_command_dispatch", "dispatch_runtime_id must be shared_command_dispatch"),
+        Equals("runtime_plane_mode", "command_dispatch", "runtime_plane_mode must be command_dispatch"),
+        Equals(
+            "consumed_command_registry_ref",
+            "internal/development/contracts/ops/command-registry-contract.v0.1.md",
+            "consumed_command_registry_ref must point to command-registry-contract.v0.1.md",
+        ),
+        OneOf("command_id", COMMAND_ENTRY_MAP, "command_id must be readiness-inspect or repo-check"),
+        Custom(_check_dispatch_entry, fields=(("dispatch_entry_ref", TEXT),)),
+        Equals(
+            "target_resolution_ref",
+            "governance.validate-multi-repo-worktree-identity",
+            "target_resolution_ref must be governance.validate-multi-repo-worktree-identity",
+        ),
+        Equals(
+            "context_preflight_ref",
+            "governance.validate-context-runtime-preflight",
+            "context_preflight_ref must be governance.validate-context-runtime-preflight",
+        ),
+        SameSet(
+            "common_output_envelope",
+            REQUIRED_OUTPUT_FIELDS,
+            "common_output_envelope must contain status, valid, errors, result_artifact",
+        ),
+        Equals("exit_semantics", "fail_closed", "exit_semantics must be fail_closed"),
+        Equals("primary_command_law_mode", "referenced_only", "primary_command_law_mode must be referenced_only"),
+        Flag("family_expansion_allowed", False, "family expansion is not allowed in shared dispatch runtime"),
+        Flag("prose_fallback_allowed", False, "prose fallback is not allowed"),
+    ]
+)
+
+
+def validate_dispatch_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = DISPATCH_RULES.check(bundle)
 
     valid = not errors
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
-        "resolved_command_id": command_id,
-        "resolved_dispatch_entry_ref": dispatch_entry_ref,
+        "resolved_command_id": values["command_id"],
+        "resolved_dispatch_entry_ref": values["dispatch_entry_ref"],
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
     }
@@ -121,7 +98,7 @@ def dispatch_bundle(dispatch_bundle: dict[str, Any], command_bundle: dict[str, A
     command_id = dispatch_result["resolved_command_id"]
     validator = VALIDATORS.get(command_id)
     if validator and dispatch_result["valid"]:
-        command_result = validator(command_bundle)
+        command_result = MEMO.call(command_id, validator, command_bundle)
         if not command_result["valid"]:
             errors.extend(command_result["errors"])
 
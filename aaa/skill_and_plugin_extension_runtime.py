@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, Required, compile_rules
+
 
 ALLOWED_MANIFEST_CLASS = {
     "skill_manifest",
@@ -30,62 +32,35 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    manifest_class = str(bundle.get("manifest_class", "")).strip()
-    load_mode = str(bundle.get("load_mode", "")).strip()
-    register_boundary = str(bundle.get("register_boundary", "")).strip()
-    trust_boundary = str(bundle.get("trust_boundary", "")).strip()
-    injection_target = str(bundle.get("injection_target", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("runtime_plane_mode", "extension_plane", "runtime_plane_mode must be extension_plane"),
+        Equals("line_class", "mandatory_core_absorption_line", "line_class must be mandatory_core_absorption_line"),
+        Required("extension_id", "extension_id is required"),
+        OneOf("manifest_class", ALLOWED_MANIFEST_CLASS, "manifest_class is not allowed"),
+        OneOf("load_mode", ALLOWED_LOAD_MODE, "load_mode is not allowed"),
+        OneOf("register_boundary", ALLOWED_REGISTER_BOUNDARY, "register_boundary is not allowed"),
+        OneOf("trust_boundary", ALLOWED_TRUST_BOUNDARY, "trust_boundary is not allowed"),
+        OneOf("injection_target", ALLOWED_INJECTION_TARGET, "injection_target must use governed target taxonomy"),
+        Flag("canonical_override_allowed", False, "extension runtime may not override canonical law"),
+        Flag(
+            "task_lifecycle_definition_allowed",
+            False,
+            "extension runtime may not define task lifecycle semantics",
+        ),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+        OneOf(
+            "trust_boundary",
+            {"trusted"},
+            "extension runtime requires trusted boundary before injection",
+        ),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "extension_plane":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be extension_plane"})
-    if bundle.get("line_class") != "mandatory_core_absorption_line":
-        errors.append({"code": "line_class", "message": "line_class must be mandatory_core_absorption_line"})
-    if not str(bundle.get("extension_id", "")).strip():
-        errors.append({"code": "extension_id", "message": "extension_id is required"})
-    if manifest_class not in ALLOWED_MANIFEST_CLASS:
-        errors.append({"code": "manifest_class", "message": "manifest_class is not allowed"})
-    if load_mode not in ALLOWED_LOAD_MODE:
-        errors.append({"code": "load_mode", "message": "load_mode is not allowed"})
-    if register_boundary not in ALLOWED_REGISTER_BOUNDARY:
-        errors.append({"code": "register_boundary", "message": "register_boundary is not allowed"})
-    if trust_boundary not in ALLOWED_TRUST_BOUNDARY:
-        errors.append({"code": "trust_boundary", "message": "trust_boundary is not allowed"})
-    if injection_target not in ALLOWED_INJECTION_TARGET:
-        errors.append({"code": "injection_target", "message": "injection_target must use governed target taxonomy"})
-    if bundle.get("canonical_override_allowed") is not False:
-        errors.append(
-            {
-                "code": "canonical_override_allowed",
-                "message": "extension runtime may not override canonical law",
-            }
-        )
-    if bundle.get("task_lifecycle_definition_allowed") is not False:
-        errors.append(
-            {
-                "code": "task_lifecycle_definition_allowed",
-                "message": "extension runtime may not define task lifecycle semantics",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
 
-    if trust_boundary != "trusted":
-        errors.append(
-            {
-                "code": "trust_boundary",
-                "message": "extension runtime requires trusted boundary before injection",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -95,12 +70,12 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "extension_id": str(bundle.get("extension_id", "")).strip(),
-            "manifest_class": manifest_class,
-            "load_mode": load_mode,
-            "register_boundary": register_boundary,
-            "trust_boundary": trust_boundary,
-            "injection_target": injection_target,
+            "extension_id": values["extension_id"],
+            "manifest_class": values["manifest_class"],
+            "load_mode": values["load_mode"],
+            "register_boundary": values["register_boundary"],
+            "trust_boundary": values["trust_boundary"],
+            "injection_target": values["injection_target"],
         },
     }
 
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import TEXTS, Equals, Flag, OneOf, TypeIs, When, compile_rules
+
 
 ALLOWED_OUTPUT_CLASSES = {
     "machine_safe",
@@ -29,72 +31,40 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("runtime_plane_mode", "result_normalization", "runtime_plane_mode must be result_normalization"),
+        Equals("line_class", "mandatory_core_absorption_line", "line_class must be mandatory_core_absorption_line"),
+        OneOf("output_class", ALLOWED_OUTPUT_CLASSES, "output_class is not allowed"),
+        OneOf("status", ALLOWED_STATUS, "status is not allowed"),
+        TypeIs("errors", list, "errors must be an array"),
+        TypeIs("warnings", list, "warnings must be an array"),
+        When(
+            "artifact_refs",
+            lambda values, bundle: not values["artifact_refs"],
+            "artifact_refs must contain at least one reference",
+            fields=(("artifact_refs", TEXTS),),
+        ),
+        OneOf("artifact_refs_role", ALLOWED_ARTIFACT_REF_ROLES, "artifact_refs_role is not allowed"),
+        OneOf("normalized_payload_class", ALLOWED_NORMALIZED_PAYLOAD_CLASSES, "normalized_payload_class is not allowed"),
+        OneOf(
+            "normalized_payload_precedence",
+            {"normalized_payload_primary"},
+            "normalized_payload_precedence must be normalized_payload_primary",
+        ),
+        Flag("prose_only_result_allowed", False, "prose_only_result_allowed must be false"),
+        When(
+            "artifact_refs_role",
+            lambda values, bundle: values["artifact_refs_role"] == "path_specific_artifact",
+            "path_specific_artifact may not be used as the shared normalized result source",
+        ),
+    ]
+)
 
-    output_class = str(bundle.get("output_class", "")).strip()
-    status = str(bundle.get("status", "")).strip()
-    artifact_refs_role = str(bundle.get("artifact_refs_role", "")).strip()
-    normalized_payload_class = str(bundle.get("normalized_payload_class", "")).strip()
-    normalized_payload_precedence = str(bundle.get("normalized_payload_precedence", "")).strip()
-    artifact_refs = [str(item).strip() for item in bundle.get("artifact_refs", [])]
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "result_normalization":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be result_normalization",
-            }
-        )
-    if bundle.get("line_class") != "mandatory_core_absorption_line":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be mandatory_core_absorption_line",
-            }
-        )
-    if output_class not in ALLOWED_OUTPUT_CLASSES:
-        errors.append({"code": "output_class", "message": "output_class is not allowed"})
-    if status not in ALLOWED_STATUS:
-        errors.append({"code": "status", "message": "status is not allowed"})
-    if not isinstance(bundle.get("errors"), list):
-        errors.append({"code": "errors", "message": "errors must be an array"})
-    if not isinstance(bundle.get("warnings"), list):
-        errors.append({"code": "warnings", "message": "warnings must be an array"})
-    if not artifact_refs:
-        errors.append({"code": "artifact_refs", "message": "artifact_refs must contain at least one reference"})
-    if artifact_refs_role not in ALLOWED_ARTIFACT_REF_ROLES:
-        errors.append({"code": "artifact_refs_role", "message": "artifact_refs_role is not allowed"})
-    if normalized_payload_class not in ALLOWED_NORMALIZED_PAYLOAD_CLASSES:
-        errors.append(
-            {
-                "code": "normalized_payload_class",
-                "message": "normalized_payload_class is not allowed",
-            }
-        )
-    if normalized_payload_precedence != "normalized_payload_primary":
-        errors.append(
-            {
-                "code": "normalized_payload_precedence",
-                "message": "normalized_payload_precedence must be normalized_payload_primary",
-            }
-        )
-    if bundle.get("prose_only_result_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_only_result_allowed",
-                "message": "prose_only_result_allowed must be false",
-            }
-        )
-    if artifact_refs_role == "path_specific_artifact":
-        errors.append(
-            {
-                "code": "artifact_refs_role",
-                "message": "path_specific_artifact may not be used as the shared normalized result source",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -104,12 +74,12 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "output_class": output_class,
-            "status": status,
-            "artifact_refs": artifact_refs,
-            "artifact_refs_role": artifact_refs_role,
-            "normalized_payload_class": normalized_payload_class,
-            "normalized_payload_precedence": normalized_payload_precedence,
+            "output_class": values["output_class"],
+            "status": values["status"],
+            "artifact_refs": values["artifact_refs"],
+            "artifact_refs_role": values["artifact_refs_role"],
+            "normalized_payload_class": values["normalized_payload_class"],
+            "normalized_payload_precedence": values["normalized_payload_precedence"],
         },
     }
 
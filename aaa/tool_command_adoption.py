@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Custom, Equals, RAW, compile_rules
+
 
 TOOL_REGISTRY: dict[str, dict[str, Any]] = {
     "ops.registry.inspect": {
@@ -77,34 +79,38 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-    tool_refs = bundle.get("tool_refs", [])
-    command_refs = bundle.get("command_refs", [])
-    binding_mode = bundle.get("binding_mode")
-    allowed_authority_map = bundle.get("allowed_authority_map", {})
-    evidence_targets = bundle.get("evidence_targets", [])
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
+# Per-command authority closure of the required tool chain; the registries are
+# static, so this is resolved once at import instead of once per bundle.
+COMMAND_TOOL_AUTHORITIES: dict[str, frozenset[str]] = {
+    command_id: frozenset(
+        authority
+        for tool_id in command_spec["tool_chain_refs"]
+        for authority in TOOL_REGISTRY.get(tool_id, {}).get("authority_class", [])
+    )
+    for command_id, command_spec in COMMAND_REGISTRY.items()
+}
 
-    if binding_mode != "machine_parseable":
-        errors.append({"code": "binding_mode", "message": "binding_mode must be machine_parseable"})
 
-    unresolved_tools = [tool_id for tool_id in tool_refs if tool_id not in TOOL_REGISTRY]
+def _check_unresolved_refs(bundle: dict[str, Any], values: dict[str, Any], errors: list[dict[str, str]]) -> None:
+    unresolved_tools = [tool_id for tool_id in values["tool_refs"] if tool_id not in TOOL_REGISTRY]
     if unresolved_tools:
         errors.append({"code": "tool_refs", "message": f"unresolved tools: {', '.join(unresolved_tools)}"})
 
-    unresolved_commands = [command_id for command_id in command_refs if command_id not in COMMAND_REGISTRY]
+    unresolved_commands = [command_id for command_id in values["command_refs"] if command_id not in COMMAND_REGISTRY]
     if unresolved_commands:
         errors.append({"code": "command_refs", "message": f"unresolved commands: {', '.join(unresolved_commands)}"})
 
-    for command_id in command_refs:
+
+def _check_command_bindings(bundle: dict[str, Any], values: dict[str, Any], errors: list[dict[str, str]]) -> None:
+    tool_refs = values["tool_refs"]
+    allowed_authority_map = values["allowed_authority_map"]
+    evidence_targets = values["evidence_targets"]
+
+    for command_id in values["command_refs"]:
         if command_id not in COMMAND_REGISTRY:
             continue
         command_spec = COMMAND_REGISTRY[command_id]
-        required_tools = command_spec["tool_chain_refs"]
-        missing_tools = [tool_id for tool_id in required_tools if tool_id not in tool_refs]
+        missing_tools = [tool_id for tool_id in command_spec["tool_chain_refs"] if tool_id not in tool_refs]
         if missing_tools:
             errors.append(
                 {
@@ -123,11 +129,7 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
             )
             continue
 
-        tool_authorities = {
-            authority
-            for tool_id in required_tools
-            for authority in TOOL_REGISTRY.get(tool_id, {}).get("authority_class", [])
-        }
+        tool_authorities = COMMAND_TOOL_AUTHORITIES[command_id]
         illegal_authorities = [item for item in declared_authorities if item not in tool_authorities]
         if illegal_authorities:
             errors.append(
@@ -159,12 +161,32 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
                 }
             )
 
+
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("binding_mode", "machine_parseable", "binding_mode must be machine_parseable"),
+        Custom(_check_unresolved_refs),
+        Custom(_check_command_bindings),
+    ],
+    fields=[
+        ("tool_refs", RAW, []),
+        ("command_refs", RAW, []),
+        ("allowed_authority_map", RAW, {}),
+        ("evidence_targets", RAW, []),
+    ],
+)
+
+
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
+
     valid = not errors
     return {
         "status": "ok" if valid else "error",
         "valid": valid,
-        "resolved_tools": tool_refs,
-        "resolved_commands": command_refs,
+        "resolved_tools": values["tool_refs"],
+        "resolved_commands": values["command_refs"],
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "registry_snapshot": {
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, compile_rules
+
 
 ALLOWED_SIGNAL_CLASS = {
     "progress_signal",
@@ -27,63 +29,28 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals("runtime_plane_mode", "event_stream", "runtime_plane_mode must be event_stream"),
+        Equals("line_class", "mandatory_core_absorption_line", "line_class must be mandatory_core_absorption_line"),
+        Equals("event_stream_id", "shared_runtime_event_stream", "event_stream_id must be shared_runtime_event_stream"),
+        OneOf("signal_class", ALLOWED_SIGNAL_CLASS, "signal_class is not allowed"),
+        OneOf("event_phase", ALLOWED_EVENT_PHASE, "event_phase is not allowed"),
+        OneOf("evidence_source_role", ALLOWED_EVIDENCE_SOURCE_ROLE, "evidence_source_role is not allowed"),
+        Flag(
+            "formal_evidence_artifact",
+            False,
+            "event stream record may not directly equal a formal evidence artifact",
+        ),
+        Flag("canonical_truth_promotion_allowed", False, "event stream may not promote to canonical truth"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    signal_class = str(bundle.get("signal_class", "")).strip()
-    event_phase = str(bundle.get("event_phase", "")).strip()
-    evidence_source_role = str(bundle.get("evidence_source_role", "")).strip()
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "event_stream":
-        errors.append({"code": "runtime_plane_mode", "message": "runtime_plane_mode must be event_stream"})
-    if bundle.get("line_class") != "mandatory_core_absorption_line":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be mandatory_core_absorption_line",
-            }
-        )
-    if bundle.get("event_stream_id") != "shared_runtime_event_stream":
-        errors.append(
-            {
-                "code": "event_stream_id",
-                "message": "event_stream_id must be shared_runtime_event_stream",
-            }
-        )
-    if signal_class not in ALLOWED_SIGNAL_CLASS:
-        errors.append({"code": "signal_class", "message": "signal_class is not allowed"})
-    if event_phase not in ALLOWED_EVENT_PHASE:
-        errors.append({"code": "event_phase", "message": "event_phase is not allowed"})
-    if evidence_source_role not in ALLOWED_EVIDENCE_SOURCE_ROLE:
-        errors.append(
-            {
-                "code": "evidence_source_role",
-                "message": "evidence_source_role is not allowed",
-            }
-        )
-    if bundle.get("formal_evidence_artifact") is not False:
-        errors.append(
-            {
-                "code": "formal_evidence_artifact",
-                "message": "event stream record may not directly equal a formal evidence artifact",
-            }
-        )
-    if bundle.get("canonical_truth_promotion_allowed") is not False:
-        errors.append(
-            {
-                "code": "canonical_truth_promotion_allowed",
-                "message": "event stream may not promote to canonical truth",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -93,9 +60,9 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "signal_class": signal_class,
-            "event_phase": event_phase,
-            "evidence_source_role": evidence_source_role,
+            "signal_class": values["signal_class"],
+            "event_phase": values["event_phase"],
+            "evidence_source_role": values["evidence_source_role"],
             "result_promotion_allowed": bool(bundle.get("result_promotion_allowed")),
             "evidence_promotion_allowed": bool(bundle.get("evidence_promotion_allowed")),
         },
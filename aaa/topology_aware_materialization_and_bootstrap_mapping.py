@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import ArrayOf, Equals, Flag, OneOf, When, compile_rules
+
 
 ALLOWED_TOPOLOGY_MODE = {"dedicated_repo", "repo_local", "hybrid"}
 ALLOWED_MAPPING = {"org_repo_only", "repo_local_only", "hybrid_split"}
@@ -14,127 +16,86 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+MAPPING = "materialization_mapping_by_topology"
 
-    topology_mode = str(bundle.get("topology_mode", "")).strip()
-    mapping = bundle.get("materialization_mapping_by_topology", [])
-    workflow_target_scope = str(bundle.get("workflow_target_scope", "")).strip()
-    codeowners_target_scope = str(bundle.get("codeowners_target_scope", "")).strip()
-    mapping_completeness = str(bundle.get("mapping_completeness", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "topology_aware_materialization_and_bootstrap_mapping",
+            "runtime_plane_mode must be topology_aware_materialization_and_bootstrap_mapping",
+        ),
+        Equals(
+            "line_class",
+            "github_governance_topology_support_program",
+            "line_class must be github_governance_topology_support_program",
+        ),
+        OneOf("topology_mode", ALLOWED_TOPOLOGY_MODE, "topology_mode is not allowed"),
+        ArrayOf(
+            MAPPING,
+            "materialization_mapping_by_topology must be a non-empty array",
+            allowed=ALLOWED_MAPPING,
+            invalid_message="materialization_mapping_by_topology includes an unsupported mapping",
+        ),
+        OneOf("workflow_target_scope", ALLOWED_SCOPE, "workflow_target_scope is not allowed"),
+        OneOf("codeowners_target_scope", ALLOWED_SCOPE, "codeowners_target_scope is not allowed"),
+        OneOf("mapping_completeness", ALLOWED_COMPLETENESS, "mapping_completeness is not allowed"),
+        Flag(
+            "materialization_scope_implies_governance_authority",
+            False,
+            "materialization_scope_implies_governance_authority must be false",
+        ),
+        Flag("package_active_asserted", False, "package_active_asserted must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+        When(
+            MAPPING,
+            lambda values, bundle: values["topology_mode"] == "dedicated_repo" and "org_repo_only" not in values[MAPPING],
+            "dedicated_repo must include org_repo_only mapping",
+        ),
+        When(
+            "workflow_target_scope",
+            lambda values, bundle: values["topology_mode"] == "dedicated_repo"
+            and values["workflow_target_scope"] == "repo_local",
+            "dedicated_repo may not resolve workflows to repo_local only",
+        ),
+        When(
+            MAPPING,
+            lambda values, bundle: values["topology_mode"] == "repo_local" and "repo_local_only" not in values[MAPPING],
+            "repo_local must include repo_local_only mapping",
+        ),
+        When(
+            "workflow_target_scope",
+            lambda values, bundle: values["topology_mode"] == "repo_local" and values["workflow_target_scope"] == "org_repo",
+            "repo_local may not resolve workflows to org_repo only",
+        ),
+        When(
+            "codeowners_target_scope",
+            lambda values, bundle: values["topology_mode"] == "repo_local"
+            and values["codeowners_target_scope"] == "org_repo",
+            "repo_local may not resolve codeowners to org_repo only",
+        ),
+        When(
+            MAPPING,
+            lambda values, bundle: values["topology_mode"] == "hybrid" and "hybrid_split" not in values[MAPPING],
+            "hybrid must include hybrid_split mapping",
+        ),
+        When(
+            "workflow_target_scope",
+            lambda values, bundle: values["topology_mode"] == "hybrid" and values["workflow_target_scope"] != "split",
+            "hybrid must resolve workflow_target_scope to split",
+        ),
+        When(
+            "mapping_completeness",
+            lambda values, bundle: values["mapping_completeness"] == "partial" and values["topology_mode"] == "hybrid",
+            "hybrid mapping may not be marked partial",
+        ),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "topology_aware_materialization_and_bootstrap_mapping":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be topology_aware_materialization_and_bootstrap_mapping",
-            }
-        )
-    if bundle.get("line_class") != "github_governance_topology_support_program":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be github_governance_topology_support_program",
-            }
-        )
-    if topology_mode not in ALLOWED_TOPOLOGY_MODE:
-        errors.append({"code": "topology_mode", "message": "topology_mode is not allowed"})
-    if not isinstance(mapping, list) or not mapping:
-        errors.append(
-            {
-                "code": "materialization_mapping_by_topology",
-                "message": "materialization_mapping_by_topology must be a non-empty array",
-            }
-        )
-    else:
-        for item in mapping:
-            if str(item).strip() not in ALLOWED_MAPPING:
-                errors.append(
-                    {
-                        "code": "materialization_mapping_by_topology",
-                        "message": "materialization_mapping_by_topology includes an unsupported mapping",
-                    }
-                )
-                break
-    if workflow_target_scope not in ALLOWED_SCOPE:
-        errors.append({"code": "workflow_target_scope", "message": "workflow_target_scope is not allowed"})
-    if codeowners_target_scope not in ALLOWED_SCOPE:
-        errors.append({"code": "codeowners_target_scope", "message": "codeowners_target_scope is not allowed"})
-    if mapping_completeness not in ALLOWED_COMPLETENESS:
-        errors.append({"code": "mapping_completeness", "message": "mapping_completeness is not allowed"})
-    if bundle.get("materialization_scope_implies_governance_authority") is not False:
-        errors.append(
-            {
-                "code": "materialization_scope_implies_governance_authority",
-                "message": "materialization_scope_implies_governance_authority must be false",
-            }
-        )
-    if bundle.get("package_active_asserted") is not False:
-        errors.append({"code": "package_active_asserted", "message": "package_active_asserted must be false"})
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
 
-    if topology_mode == "dedicated_repo":
-        if "org_repo_only" not in mapping:
-            errors.append(
-                {
-                    "code": "materialization_mapping_by_topology",
-                    "message": "dedicated_repo must include org_repo_only mapping",
-                }
-            )
-        if workflow_target_scope == "repo_local":
-            errors.append(
-                {
-                    "code": "workflow_target_scope",
-                    "message": "dedicated_repo may not resolve workflows to repo_local only",
-                }
-            )
-    if topology_mode == "repo_local":
-        if "repo_local_only" not in mapping:
-            errors.append(
-                {
-                    "code": "materialization_mapping_by_topology",
-                    "message": "repo_local must include repo_local_only mapping",
-                }
-            )
-        if workflow_target_scope == "org_repo":
-            errors.append(
-                {
-                    "code": "workflow_target_scope",
-                    "message": "repo_local may not resolve workflows to org_repo only",
-                }
-            )
-        if codeowners_target_scope == "org_repo":
-            errors.append(
-                {
-                    "code": "codeowners_target_scope",
-                    "message": "repo_local may not resolve codeowners to org_repo only",
-                }
-            )
-    if topology_mode == "hybrid":
-        if "hybrid_split" not in mapping:
-            errors.append(
-                {
-                    "code": "materialization_mapping_by_topology",
-                    "message": "hybrid must include hybrid_split mapping",
-                }
-            )
-        if workflow_target_scope != "split":
-            errors.append(
-                {
-                    "code": "workflow_target_scope",
-                    "message": "hybrid must resolve workflow_target_scope to split",
-                }
-            )
-    if mapping_completeness == "partial" and topology_mode == "hybrid":
-        errors.append(
-            {
-                "code": "mapping_completeness",
-                "message": "hybrid mapping may not be marked partial",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -144,11 +105,11 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "topology_mode": topology_mode,
-            "materialization_mapping_by_topology": mapping,
-            "workflow_target_scope": workflow_target_scope,
-            "codeowners_target_scope": codeowners_target_scope,
-            "mapping_completeness": mapping_completeness,
+            "topology_mode": values["topology_mode"],
+            "materialization_mapping_by_topology": values[MAPPING],
+            "workflow_target_scope": values["workflow_target_scope"],
+            "codeowners_target_scope": values["codeowners_target_scope"],
+            "mapping_completeness": values["mapping_completeness"],
         },
     }
 
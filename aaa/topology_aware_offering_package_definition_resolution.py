@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import ArrayOf, Equals, Flag, OneOf, When, compile_rules
+
 
 ALLOWED_PACKAGE_LEVEL = {"lite", "core", "full"}
 ALLOWED_TOPOLOGY_MODE = {"dedicated_repo", "repo_local", "hybrid"}
@@ -15,109 +17,70 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
+MINIMUM_REPO_SET = "minimum_repo_set_by_topology"
+PLACEMENT_RULES = "governance_asset_placement_rules"
 
-    package_level = str(bundle.get("package_level", "")).strip()
-    topology_mode = str(bundle.get("topology_mode", "")).strip()
-    minimum_repo_set = bundle.get("minimum_repo_set_by_topology", [])
-    workflow_level = str(bundle.get("workflow_inclusion_level_by_topology", "")).strip()
-    placement_rules = bundle.get("governance_asset_placement_rules", [])
-    source_definition_artifact_ref = str(bundle.get("source_definition_artifact_ref", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "topology_aware_offering_package_definition_resolution",
+            "runtime_plane_mode must be topology_aware_offering_package_definition_resolution",
+        ),
+        Equals(
+            "line_class",
+            "github_governance_topology_support_program",
+            "line_class must be github_governance_topology_support_program",
+        ),
+        OneOf("package_level", ALLOWED_PACKAGE_LEVEL, "package_level is not allowed"),
+        OneOf("topology_mode", ALLOWED_TOPOLOGY_MODE, "topology_mode is not allowed"),
+        OneOf(
+            "source_definition_artifact_ref",
+            {SOURCE_DEFINITION_ARTIFACT_REF},
+            "source_definition_artifact_ref must point to the offering mother draft",
+        ),
+        ArrayOf(MINIMUM_REPO_SET, "minimum_repo_set_by_topology must be a non-empty array"),
+        OneOf(
+            "workflow_inclusion_level_by_topology",
+            ALLOWED_WORKFLOW_LEVEL,
+            "workflow_inclusion_level_by_topology is not allowed",
+        ),
+        ArrayOf(
+            PLACEMENT_RULES,
+            "governance_asset_placement_rules must be a non-empty array",
+            allowed=ALLOWED_PLACEMENT_RULE,
+            invalid_message="governance_asset_placement_rules includes an unsupported placement rule",
+        ),
+        When(
+            MINIMUM_REPO_SET,
+            lambda values, bundle: values["topology_mode"] == "repo_local" and ".github" in values[MINIMUM_REPO_SET],
+            "repo_local may not require dedicated .github repo in minimum_repo_set_by_topology",
+        ),
+        When(
+            MINIMUM_REPO_SET,
+            lambda values, bundle: values["topology_mode"] == "dedicated_repo" and ".github" not in values[MINIMUM_REPO_SET],
+            "dedicated_repo must require .github in minimum_repo_set_by_topology",
+        ),
+        When(
+            PLACEMENT_RULES,
+            lambda values, bundle: values["topology_mode"] == "repo_local" and "repo_local_only" not in values[PLACEMENT_RULES],
+            "repo_local must resolve to repo_local_only governance asset placement",
+        ),
+        When(
+            PLACEMENT_RULES,
+            lambda values, bundle: values["topology_mode"] == "hybrid" and "hybrid_split" not in values[PLACEMENT_RULES],
+            "hybrid must resolve to hybrid_split governance asset placement",
+        ),
+        Flag("back_write_allowed", False, "back_write_allowed must be false"),
+        Flag("reinterpretation_allowed", False, "reinterpretation_allowed must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "topology_aware_offering_package_definition_resolution":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be topology_aware_offering_package_definition_resolution",
-            }
-        )
-    if bundle.get("line_class") != "github_governance_topology_support_program":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be github_governance_topology_support_program",
-            }
-        )
-    if package_level not in ALLOWED_PACKAGE_LEVEL:
-        errors.append({"code": "package_level", "message": "package_level is not allowed"})
-    if topology_mode not in ALLOWED_TOPOLOGY_MODE:
-        errors.append({"code": "topology_mode", "message": "topology_mode is not allowed"})
-    if source_definition_artifact_ref != SOURCE_DEFINITION_ARTIFACT_REF:
-        errors.append(
-            {
-                "code": "source_definition_artifact_ref",
-                "message": "source_definition_artifact_ref must point to the offering mother draft",
-            }
-        )
-    if not isinstance(minimum_repo_set, list) or not minimum_repo_set:
-        errors.append(
-            {
-                "code": "minimum_repo_set_by_topology",
-                "message": "minimum_repo_set_by_topology must be a non-empty array",
-            }
-        )
-    if workflow_level not in ALLOWED_WORKFLOW_LEVEL:
-        errors.append(
-            {
-                "code": "workflow_inclusion_level_by_topology",
-                "message": "workflow_inclusion_level_by_topology is not allowed",
-            }
-        )
-    if not isinstance(placement_rules, list) or not placement_rules:
-        errors.append(
-            {
-                "code": "governance_asset_placement_rules",
-                "message": "governance_asset_placement_rules must be a non-empty array",
-            }
-        )
-    else:
-        for item in placement_rules:
-            if str(item).strip() not in ALLOWED_PLACEMENT_RULE:
-                errors.append(
-                    {
-                        "code": "governance_asset_placement_rules",
-                        "message": "governance_asset_placement_rules includes an unsupported placement rule",
-                    }
-                )
-                break
 
-    if topology_mode == "repo_local" and ".github" in minimum_repo_set:
-        errors.append(
-            {
-                "code": "minimum_repo_set_by_topology",
-                "message": "repo_local may not require dedicated .github repo in minimum_repo_set_by_topology",
-            }
-        )
-    if topology_mode == "dedicated_repo" and ".github" not in minimum_repo_set:
-        errors.append(
-            {
-                "code": "minimum_repo_set_by_topology",
-                "message": "dedicated_repo must require .github in minimum_repo_set_by_topology",
-            }
-        )
-    if topology_mode == "repo_local" and "repo_local_only" not in placement_rules:
-        errors.append(
-            {
-                "code": "governance_asset_placement_rules",
-                "message": "repo_local must resolve to repo_local_only governance asset placement",
-            }
-        )
-    if topology_mode == "hybrid" and "hybrid_split" not in placement_rules:
-        errors.append(
-            {
-                "code": "governance_asset_placement_rules",
-                "message": "hybrid must resolve to hybrid_split governance asset placement",
-            }
-        )
-    if bundle.get("back_write_allowed") is not False:
-        errors.append({"code": "back_write_allowed", "message": "back_write_allowed must be false"})
-    if bundle.get("reinterpretation_allowed") is not False:
-        errors.append({"code": "reinterpretation_allowed", "message": "reinterpretation_allowed must be false"})
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append({"code": "prose_fallback_allowed", "message": "prose_fallback_allowed must be false"})
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -127,12 +90,12 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "package_level": package_level,
-            "topology_mode": topology_mode,
-            "source_definition_artifact_ref": source_definition_artifact_ref,
-            "minimum_repo_set_by_topology": minimum_repo_set,
-            "workflow_inclusion_level_by_topology": workflow_level,
-            "governance_asset_placement_rules": placement_rules,
+            "package_level": values["package_level"],
+            "topology_mode": values["topology_mode"],
+            "source_definition_artifact_ref": values["source_definition_artifact_ref"],
+            "minimum_repo_set_by_topology": values[MINIMUM_REPO_SET],
+            "workflow_inclusion_level_by_topology": values["workflow_inclusion_level_by_topology"],
+            "governance_asset_placement_rules": values[PLACEMENT_RULES],
         },
     }
 
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, TypeIs, When, compile_rules
+
 
 ALLOWED_EXPECTED = {"dedicated_repo", "repo_local", "hybrid"}
 ALLOWED_DETECTED = {"dedicated_repo", "repo_local", "hybrid", "unknown"}
@@ -14,102 +16,64 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+CONCRETE_TOPOLOGY_MODES = {"dedicated_repo", "repo_local", "hybrid"}
+
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "topology_aware_package_status_and_repo_checks",
+            "runtime_plane_mode must be topology_aware_package_status_and_repo_checks",
+        ),
+        Equals(
+            "line_class",
+            "github_governance_topology_support_program",
+            "line_class must be github_governance_topology_support_program",
+        ),
+        OneOf("topology_mode_expected", ALLOWED_EXPECTED, "topology_mode_expected is not allowed"),
+        OneOf("topology_mode_detected", ALLOWED_DETECTED, "topology_mode_detected is not allowed"),
+        OneOf("topology_mode_resolved", ALLOWED_RESOLVED, "topology_mode_resolved is not allowed"),
+        OneOf("topology_compliance_status", ALLOWED_COMPLIANCE, "topology_compliance_status is not allowed"),
+        TypeIs("missing_governance_assets", list, "missing_governance_assets must be an array", default=[]),
+        TypeIs("misplaced_governance_assets", list, "misplaced_governance_assets must be an array", default=[]),
+        Flag("narrative_only_compliance_allowed", False, "narrative_only_compliance_allowed must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+        When(
+            "missing_governance_assets",
+            lambda values, bundle: values["topology_mode_expected"] == "repo_local"
+            and ".github repo" in [str(item).strip() for item in values["missing_governance_assets"]],
+            "repo_local may not report missing .github repo as a required governance asset",
+        ),
+        When(
+            "topology_mode_resolved",
+            lambda values, bundle: values["topology_mode_resolved"] in {"degraded", "not_evaluable"}
+            and values["topology_compliance_status"] == "compliant",
+            "degraded or not_evaluable resolved topology may not claim compliant status",
+        ),
+        When(
+            "topology_mode_resolved",
+            lambda values, bundle: values["topology_mode_detected"] == "unknown"
+            and values["topology_mode_resolved"] in CONCRETE_TOPOLOGY_MODES,
+            "unknown detected topology may not resolve directly to a concrete topology mode",
+        ),
+        When(
+            "topology_mode_resolved",
+            lambda values, bundle: values["topology_mode_detected"] != "unknown"
+            and values["topology_mode_resolved"] == "not_evaluable",
+            "detected topology with evidence may not resolve to not_evaluable",
+        ),
+    ]
+)
+
+
 def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    topology_mode_expected = str(bundle.get("topology_mode_expected", "")).strip()
-    topology_mode_detected = str(bundle.get("topology_mode_detected", "")).strip()
-    topology_mode_resolved = str(bundle.get("topology_mode_resolved", "")).strip()
-    topology_compliance_status = str(bundle.get("topology_compliance_status", "")).strip()
-    missing_governance_assets = bundle.get("missing_governance_assets", [])
-    misplaced_governance_assets = bundle.get("misplaced_governance_assets", [])
-
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "topology_aware_package_status_and_repo_checks":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be topology_aware_package_status_and_repo_checks",
-            }
-        )
-    if bundle.get("line_class") != "github_governance_topology_support_program":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be github_governance_topology_support_program",
-            }
-        )
-    if topology_mode_expected not in ALLOWED_EXPECTED:
-        errors.append({"code": "topology_mode_expected", "message": "topology_mode_expected is not allowed"})
-    if topology_mode_detected not in ALLOWED_DETECTED:
-        errors.append({"code": "topology_mode_detected", "message": "topology_mode_detected is not allowed"})
-    if topology_mode_resolved not in ALLOWED_RESOLVED:
-        errors.append({"code": "topology_mode_resolved", "message": "topology_mode_resolved is not allowed"})
-    if topology_compliance_status not in ALLOWED_COMPLIANCE:
-        errors.append(
-            {
-                "code": "topology_compliance_status",
-                "message": "topology_compliance_status is not allowed",
-            }
-        )
-    if not isinstance(missing_governance_assets, list):
-        errors.append(
-            {
-                "code": "missing_governance_assets",
-                "message": "missing_governance_assets must be an array",
-            }
-        )
-    if not isinstance(misplaced_governance_assets, list):
-        errors.append(
-            {
-                "code": "misplaced_governance_assets",
-                "message": "misplaced_governance_assets must be an array",
-            }
-        )
-    if bundle.get("narrative_only_compliance_allowed") is not False:
-        errors.append(
-            {
-                "code": "narrative_only_compliance_allowed",
-                "message": "narrative_only_compliance_allowed must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
-
-    if topology_mode_expected == "repo_local" and ".github repo" in [str(item).strip() for item in missing_governance_assets]:
-        errors.append(
-            {
-                "code": "missing_governance_assets",
-                "message": "repo_local may not report missing .github repo as a required governance asset",
-            }
-        )
-    if topology_mode_resolved in {"degraded", "not_evaluable"} and topology_compliance_status == "compliant":
-        errors.append(
-            {
-                "code": "topology_mode_resolved",
-                "message": "degraded or not_evaluable resolved topology may not claim compliant status",
-            }
-        )
-    if topology_mode_detected == "unknown" and topology_mode_resolved in {"dedicated_repo", "repo_local", "hybrid"}:
-        errors.append(
-            {
-                "code": "topology_mode_resolved",
-                "message": "unknown detected topology may not resolve directly to a concrete topology mode",
-            }
-        )
-    if topology_mode_detected != "unknown" and topology_mode_resolved == "not_evaluable":
-        errors.append(
-            {
-                "code": "topology_mode_resolved",
-                "message": "detected topology with evidence may not resolve to not_evaluable",
-            }
-        )
+    errors, values = RULES.check(bundle)
+
+    topology_mode_expected = values["topology_mode_expected"]
+    topology_mode_detected = values["topology_mode_detected"]
+    topology_mode_resolved = values["topology_mode_resolved"]
+    topology_compliance_status = values["topology_compliance_status"]
 
     structure_acceptance_status = "structure_accepted"
     if topology_mode_detected == "unknown":
@@ -117,7 +81,7 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
     elif topology_mode_expected != topology_mode_detected:
         structure_acceptance_status = "structure_mismatch"
 
-    if topology_compliance_status == "compliant" and topology_mode_resolved in {"dedicated_repo", "repo_local", "hybrid"}:
+    if topology_compliance_status == "compliant" and topology_mode_resolved in CONCRETE_TOPOLOGY_MODES:
         topology_completion_status = "topology_compliant"
     elif topology_compliance_status == "non_compliant":
         topology_completion_status = "topology_non_compliant"
@@ -139,8 +103,8 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
             "structure_acceptance_status": structure_acceptance_status,
             "topology_completion_status": topology_completion_status,
             "downstream_topology_adjudication_point": "topology_aware_package_status_and_repo_checks",
-            "missing_governance_assets": missing_governance_assets,
-            "misplaced_governance_assets": misplaced_governance_assets,
+            "missing_governance_assets": values["missing_governance_assets"],
+            "misplaced_governance_assets": values["misplaced_governance_assets"],
         },
     }
 
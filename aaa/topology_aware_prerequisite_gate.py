@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .bundle_rules import Equals, Flag, OneOf, When, compile_rules
+
 
 ALLOWED_TOPOLOGY_EXPECTED = {"dedicated_repo", "repo_local", "hybrid"}
 ALLOWED_TOPOLOGY_DETECTED = {"dedicated_repo", "repo_local", "hybrid", "unknown"}
@@ -14,77 +16,47 @@ def load_bundle(bundle_path: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
-    errors: list[dict[str, str]] = []
-
-    topology_expected = str(bundle.get("topology_expected", "")).strip()
-    topology_detected = str(bundle.get("topology_detected", "")).strip()
-    topology_compliance_verdict = str(bundle.get("topology_compliance_verdict", "")).strip()
-    evidence_sufficiency_verdict = str(bundle.get("evidence_sufficiency_verdict", "")).strip()
+RULES = compile_rules(
+    [
+        Equals("version", "v0.1", "unsupported bundle version"),
+        Equals(
+            "runtime_plane_mode",
+            "topology_aware_prerequisite_gate",
+            "runtime_plane_mode must be topology_aware_prerequisite_gate",
+        ),
+        Equals(
+            "line_class",
+            "github_governance_topology_support_program",
+            "line_class must be github_governance_topology_support_program",
+        ),
+        OneOf("topology_expected", ALLOWED_TOPOLOGY_EXPECTED, "topology_expected is not allowed"),
+        OneOf("topology_detected", ALLOWED_TOPOLOGY_DETECTED, "topology_detected is not allowed"),
+        OneOf("topology_compliance_verdict", ALLOWED_COMPLIANCE_VERDICT, "topology_compliance_verdict is not allowed"),
+        OneOf(
+            "evidence_sufficiency_verdict",
+            ALLOWED_EVIDENCE_SUFFICIENCY,
+            "evidence_sufficiency_verdict is not allowed",
+        ),
+        Flag("gate_verdict_is_activation", False, "gate_verdict_is_activation must be false"),
+        Flag("prose_fallback_allowed", False, "prose_fallback_allowed must be false"),
+        When(
+            "topology_compliance_verdict",
+            lambda values, bundle: values["topology_expected"] != values["topology_detected"]
+            and values["topology_compliance_verdict"] == "pass",
+            "topology mismatch may not resolve to pass",
+        ),
+        When(
+            "evidence_sufficiency_verdict",
+            lambda values, bundle: values["topology_detected"] == "unknown"
+            and values["evidence_sufficiency_verdict"] == "sufficient",
+            "unknown detected topology may not claim sufficient evidence",
+        ),
+    ]
+)
 
-    if bundle.get("version") != "v0.1":
-        errors.append({"code": "version", "message": "unsupported bundle version"})
-    if bundle.get("runtime_plane_mode") != "topology_aware_prerequisite_gate":
-        errors.append(
-            {
-                "code": "runtime_plane_mode",
-                "message": "runtime_plane_mode must be topology_aware_prerequisite_gate",
-            }
-        )
-    if bundle.get("line_class") != "github_governance_topology_support_program":
-        errors.append(
-            {
-                "code": "line_class",
-                "message": "line_class must be github_governance_topology_support_program",
-            }
-        )
-    if topology_expected not in ALLOWED_TOPOLOGY_EXPECTED:
-        errors.append({"code": "topology_expected", "message": "topology_expected is not allowed"})
-    if topology_detected not in ALLOWED_TOPOLOGY_DETECTED:
-        errors.append({"code": "topology_detected", "message": "topology_detected is not allowed"})
-    if topology_compliance_verdict not in ALLOWED_COMPLIANCE_VERDICT:
-        errors.append(
-            {
-                "code": "topology_compliance_verdict",
-                "message": "topology_compliance_verdict is not allowed",
-            }
-        )
-    if evidence_sufficiency_verdict not in ALLOWED_EVIDENCE_SUFFICIENCY:
-        errors.append(
-            {
-                "code": "evidence_sufficiency_verdict",
-                "message": "evidence_sufficiency_verdict is not allowed",
-            }
-        )
-    if bundle.get("gate_verdict_is_activation") is not False:
-        errors.append(
-            {
-                "code": "gate_verdict_is_activation",
-                "message": "gate_verdict_is_activation must be false",
-            }
-        )
-    if bundle.get("prose_fallback_allowed") is not False:
-        errors.append(
-            {
-                "code": "prose_fallback_allowed",
-                "message": "prose_fallback_allowed must be false",
-            }
-        )
 
-    if topology_expected != topology_detected and topology_compliance_verdict == "pass":
-        errors.append(
-            {
-                "code": "topology_compliance_verdict",
-                "message": "topology mismatch may not resolve to pass",
-            }
-        )
-    if topology_detected == "unknown" and evidence_sufficiency_verdict == "sufficient":
-        errors.append(
-            {
-                "code": "evidence_sufficiency_verdict",
-                "message": "unknown detected topology may not claim sufficient evidence",
-            }
-        )
+def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
+    errors, values = RULES.check(bundle)
 
     valid = not errors
     return {
@@ -94,11 +66,11 @@ def validate_bundle(bundle: dict[str, Any]) -> dict[str, Any]:
         "error_codes": [item["code"] for item in errors],
         "errors": errors,
         "derived_results": {
-            "topology_expected": topology_expected,
-            "topology_detected": topology_detected,
-            "topology_compliance_verdict": topology_compliance_verdict,
-            "evidence_sufficiency_verdict": evidence_sufficiency_verdict,
-            "topology_mismatch": topology_expected != topology_detected,
+            "topology_expected": values["topology_expected"],
+            "topology_detected": values["topology_detected"],
+            "topology_compliance_verdict": values["topology_compliance_verdict"],
+            "evidence_sufficiency_verdict": values["evidence_sufficiency_verdict"],
+            "topology_mismatch": values["topology_expected"] != values["topology_detected"],
         },
     }
 
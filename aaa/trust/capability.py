@@ -1,5 +1,43 @@
 from enum import Enum
-from typing import Set
+from typing import Dict, Iterable, List, Set
+
+class ScopeInterner:
+    """
+    Interns scope names into single-bit integers, so a set of scopes is an
+    int mask and "holds any of" / "holds all of" are a single AND.
+    """
+    def __init__(self, names: Iterable[str] = ()):
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+        for name in names:
+            self.bit(name)
+
+    def bit(self, name: str) -> int:
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = self._bits[name] = 1 << len(self._names)
+            self._names.append(name)
+        return bit
+
+    def mask(self, names: Iterable[str], intern: bool = True) -> int:
+        """Mask of ``names``; with ``intern=False`` unknown names are ignored (they can match nothing)."""
+        mask = 0
+        if intern:
+            for name in names:
+                mask |= self.bit(name)
+        else:
+            for name in names:
+                mask |= self._bits.get(name, 0)
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        return [name for i, name in enumerate(self._names) if mask >> i & 1]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._bits
+
+    def __len__(self) -> int:
+        return len(self._names)
 
 class Capability(Enum):
     FS_READ = "FS_READ"
@@ -7,13 +45,30 @@ class Capability(Enum):
     GOV_AUDIT = "GOV_AUDIT"
     GOV_RELEASE = "GOV_RELEASE"
 
+    @property
+    def bit(self) -> int:
+        return CAPABILITY_BITS.bit(self.value)
+
+CAPABILITY_BITS = ScopeInterner(cap.value for cap in Capability)
+
 class CapabilityPack:
     def __init__(self, name: str, capabilities: Set[Capability]):
         self.name = name
-        self.capabilities = capabilities
+        self.capabilities = frozenset(capabilities)
+        self.mask = CAPABILITY_BITS.mask(cap.value for cap in self.capabilities)
 
     def has(self, cap: Capability) -> bool:
-        return cap in self.capabilities
+        return bool(self.mask & cap.bit)
+
+    def has_all(self, mask: int) -> bool:
+        return self.mask & mask == mask
+
+    def has_any(self, mask: int) -> bool:
+        return bool(self.mask & mask)
+
+    @classmethod
+    def from_mask(cls, name: str, mask: int) -> "CapabilityPack":
+        return cls(name, {Capability(value) for value in CAPABILITY_BITS.names(mask)})
 
     def __repr__(self):
         return f"CapabilityPack({self.name})"
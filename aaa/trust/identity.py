@@ -1,34 +1,117 @@
 import hashlib
-import json
+import hmac
 import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
+
+SIGNATURE_DOMAIN = b"aaa-identity-v2\0"
+CHUNK_SIZE = 1 << 20
+
+# str is signed as UTF-8 text; a path-like or binary file object is streamed
+# in chunks; any other iterable is taken as a stream of byte chunks.
+Message = Union[str, bytes, "os.PathLike[str]", BinaryIO, Iterable[bytes]]
+
+
+def message_digest(message: Message) -> bytes:
+    """SHA-256 of a message, streaming files and chunk iterables instead of loading them whole."""
+    if isinstance(message, str):
+        return hashlib.sha256(message.encode("utf-8")).digest()
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(message).digest()
+    h = hashlib.sha256()
+    if isinstance(message, os.PathLike):
+        with open(message, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                h.update(chunk)
+    elif hasattr(message, "read"):
+        for chunk in iter(lambda: message.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    else:
+        for chunk in message:
+            h.update(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+    return h.digest()
+
 
 class Identity(ABC):
     @abstractmethod
-    def sign(self, message: str) -> str:
+    def sign(self, message: Message) -> str:
         pass
 
     @abstractmethod
-    def verify(self, message: str, signature: str) -> bool:
+    def verify(self, message: Message, signature: str) -> bool:
         pass
 
+    def verify_many(self, items: Iterable[Tuple[Message, str]], workers: Optional[int] = None) -> List[bool]:
+        return [self.verify(message, signature) for message, signature in items]
+
+
 class AgentIdentity(Identity):
     """
     Minimal Sovereign Identity for v2.0.1.
-    Uses SHA256 hashing for simulation in this prototype phase, 
-    designed to be replaced by full RSA in production.
+    Signatures are HMAC-SHA256 (keyed by ``secret_key``) over the agent id
+    and the message's SHA-256, so a message is hashed once, streamed if it
+    is large, and verification compares in constant time. Verified
+    (digest, signature) pairs are kept in an LRU of ``cache_size`` entries
+    so re-checking the same ledger entry skips the MAC entirely.
     """
-    def __init__(self, agent_id: str, secret_key: str):
+    def __init__(self, agent_id: str, secret_key: str, cache_size: int = 4096):
         self.agent_id = agent_id
         self.secret_key = secret_key
+        self.cache_size = cache_size
+        self._key = secret_key.encode("utf-8")
+        self._prefix = SIGNATURE_DOMAIN + agent_id.encode("utf-8") + b"\0"
+        self._verified: "OrderedDict[Tuple[bytes, str], None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+
+    def sign(self, message: Message) -> str:
+        return self.sign_digest(message_digest(message))
+
+    def sign_digest(self, digest: bytes) -> str:
+        return hmac.new(self._key, self._prefix + digest, hashlib.sha256).hexdigest()
+
+    def verify(self, message: Message, signature: str) -> bool:
+        return self.verify_digest(message_digest(message), signature)
+
+    def verify_digest(self, digest: bytes, signature: str) -> bool:
+        if not isinstance(signature, str):
+            return False
+        key = (digest, signature)
+        with self._lock:
+            if key in self._verified:
+                self._verified.move_to_end(key)
+                self.cache_hits += 1
+                return True
+        if not hmac.compare_digest(self.sign_digest(digest), signature):
+            return False
+        if self.cache_size > 0:
+            with self._lock:
+                self._verified[key] = None
+                if len(self._verified) > self.cache_size:
+                    self._verified.popitem(last=False)
+        return True
 
-    def sign(self, message: str) -> str:
-        # v2.0.1 Signature: HMAC-like SHA256
-        data = f"{self.agent_id}:{message}:{self.secret_key}"
-        return hashlib.sha256(data.encode()).hexdigest()
+    def verify_many(self, items: Iterable[Tuple[Message, str]], workers: Optional[int] = None) -> List[bool]:
+        """
+        Verify many (message, signature) pairs, in order. Messages are hashed
+        on a thread pool (hashlib releases the GIL on large inputs);
+        ``workers=1`` verifies in-process.
+        """
+        items = list(items)
+        workers = workers or min(32, os.cpu_count() or 1)
+        if workers == 1 or len(items) < 2:
+            return [self.verify(message, signature) for message, signature in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = list(executor.map(lambda item: message_digest(item[0]), items))
+        return [self.verify_digest(digest, signature) for digest, (_, signature) in zip(digests, items)]
 
-    def verify(self, message: str, signature: str) -> bool:
-        return self.sign(message) == signature
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._verified.clear()
+            self.cache_hits = 0
 
     def __repr__(self):
         return f"AgentIdentity(id={self.agent_id})"
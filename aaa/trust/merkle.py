@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+NODE_PREFIX = b"aaa-merkle-node-v1\n"
+CHUNK_SIZE = 1 << 20
+# Files modified this close to a build may change again within the same
+# mtime tick; their digests are not trusted on the next run.
+RACY_WINDOW_NS = 2_000_000_000
+
+Entry = Tuple[str, str, str]  # (name, kind "f"/"d", hex digest)
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def node_hash(entries: Iterable[Entry]) -> str:
+    """Hash of a directory: its children sorted by name, binding each name, kind and digest."""
+    h = hashlib.sha256(NODE_PREFIX)
+    for name, kind, digest in sorted(entries):
+        h.update(f"{kind} {name}\0{digest}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _parent(rel: str) -> str:
+    return rel.rpartition("/")[0]
+
+
+def _basename(rel: str) -> str:
+    return rel.rpartition("/")[2]
+
+
+def tracked_files(repo: Path) -> List[str]:
+    """Repo-relative POSIX paths: ``git ls-files`` in a git work tree, otherwise a walk skipping ``.git``."""
+    if (repo / ".git").exists():
+        try:
+            out = subprocess.run(
+                ["git", "-C", str(repo), "ls-files", "-z"], capture_output=True, check=True
+            ).stdout
+            return sorted(p for p in out.decode("utf-8").split("\0") if p and (repo / p).is_file())
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    files = []
+    for dirpath, dirnames, filenames in os.walk(repo):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        rel_dir = os.path.relpath(dirpath, repo).replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        files.extend(prefix + name for name in filenames)
+    return sorted(files)
+
+
+class MerkleTree:
+    """
+    Directory-shaped Merkle tree: a file's leaf is its content sha256, a
+    directory's hash is ``node_hash`` of its children. ``dirs[""]`` is the root.
+    """
+
+    def __init__(self, files: Dict[str, Tuple[int, int, str]], dirs: Dict[str, str], children: Dict[str, Dict[str, str]]):
+        self.files = files  # rel -> (size, mtime_ns, digest)
+        self.dirs = dirs  # rel dir -> hash
+        self.children = children  # rel dir -> {name: kind}
+
+    @property
+    def root(self) -> str:
+        return self.dirs.get("", node_hash([]))
+
+    def _entries(self, directory: str) -> List[Entry]:
+        entries = []
+        prefix = directory + "/" if directory else ""
+        for name, kind in self.children.get(directory, {}).items():
+            rel = prefix + name
+            entries.append((name, kind, self.files[rel][2] if kind == "f" else self.dirs[rel]))
+        return sorted(entries)
+
+    def proof(self, rel_path: str) -> Dict[str, Any]:
+        """Inclusion proof for one file: the sibling entries of every directory from its parent up to the root."""
+        if rel_path not in self.files:
+            raise KeyError(f"not a tracked file: {rel_path}")
+        levels = []
+        directory = rel_path
+        while directory:
+            directory = _parent(directory)
+            levels.append({"dir": directory, "entries": [list(entry) for entry in self._entries(directory)]})
+        return {"path": rel_path, "digest": self.files[rel_path][2], "levels": levels, "root": self.root}
+
+
+def verify_proof(proof: Dict[str, Any], root: str, content: Optional[bytes] = None) -> bool:
+    """Check an inclusion proof against a trusted ``root`` (and optionally the file's bytes)."""
+    digest = proof["digest"]
+    if content is not None and hashlib.sha256(content).hexdigest() != digest:
+        return False
+    name, kind, current = _basename(proof["path"]), "f", digest
+    expected_dir = _parent(proof["path"])
+    for level in proof["levels"]:
+        if level["dir"] != expected_dir:
+            return False
+        entries = [tuple(entry) for entry in level["entries"]]
+        if (name, kind, current) not in entries:
+            return False
+        current = node_hash(entries)
+        name, kind = _basename(expected_dir), "d"
+        if not expected_dir:
+            break
+        expected_dir = _parent(expected_dir)
+    else:
+        return False
+    return current == root and not expected_dir
+
+
+class MerkleBuilder:
+    """
+    Builds ``MerkleTree``s over a repo's tracked files, hashing files on a
+    thread pool. With a ``cache_file``, file digests are reused while a
+    file's (size, mtime_ns) is unchanged and directory hashes are reused
+    for directories with no changed descendant, so a rebuild after a few
+    edits rehashes only those files and the directories above them.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, workers: Optional[int] = None):
+        self.cache_file = cache_file
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.last_stats: Dict[str, int] = {}
+
+    def build(self, repo: Path) -> MerkleTree:
+        repo = Path(repo)
+        started_ns = time.time_ns()
+        cached_files, cached_dirs = self._load_cache()
+        rel_paths = tracked_files(repo)
+
+        base = str(repo)
+        files: Dict[str, Tuple[int, int, str]] = {}
+        to_hash: List[Tuple[str, int, int]] = []
+        for rel in rel_paths:
+            st = os.stat(os.path.join(base, rel))
+            cached = cached_files.get(rel)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                files[rel] = (cached[0], cached[1], cached[2])
+            else:
+                to_hash.append((rel, st.st_size, st.st_mtime_ns))
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            digests = executor.map(lambda item: file_digest(os.path.join(base, item[0])), to_hash)
+            for (rel, size, mtime_ns), digest in zip(to_hash, digests):
+                files[rel] = (size, mtime_ns, digest)
+
+        dirty = {rel for rel, _, _ in to_hash} | (set(cached_files) - set(files))
+        dirty_dirs = set()
+        for rel in dirty:
+            directory = rel
+            while directory:
+                directory = _parent(directory)
+                if directory in dirty_dirs:
+                    break
+                dirty_dirs.add(directory)
+
+        children: Dict[str, Dict[str, str]] = {"": {}}
+        for rel in rel_paths:
+            directory = _parent(rel)
+            children.setdefault(directory, {})[_basename(rel)] = "f"
+            while directory and _basename(directory) not in children.get(_parent(directory), {}):
+                children.setdefault(_parent(directory), {})[_basename(directory)] = "d"
+                directory = _parent(directory)
+
+        tree = MerkleTree(files, {}, children)
+        rehashed_dirs = 0
+        for directory in sorted(children, key=lambda d: d.count("/") + bool(d), reverse=True):
+            if directory not in dirty_dirs and directory in cached_dirs:
+                tree.dirs[directory] = cached_dirs[directory]
+            else:
+                tree.dirs[directory] = node_hash(tree._entries(directory))
+                rehashed_dirs += 1
+
+        self.last_stats = {"files": len(files), "hashed_files": len(to_hash), "dirs": len(children), "hashed_dirs": rehashed_dirs}
+        if dirty or len(cached_dirs) != len(tree.dirs):
+            self._save_cache(tree, started_ns)
+        return tree
+
+    def _load_cache(self) -> Tuple[Dict[str, List[Any]], Dict[str, str]]:
+        if not self.cache_file or not self.cache_file.exists():
+            return {}, {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            return data["files"], data["dirs"]
+        except (ValueError, KeyError):
+            return {}, {}
+
+    def _save_cache(self, tree: MerkleTree, started_ns: int) -> None:
+        if not self.cache_file:
+            return
+        racy = started_ns - RACY_WINDOW_NS
+        files = {rel: [size if mtime_ns < racy else -1, mtime_ns, digest] for rel, (size, mtime_ns, digest) in tree.files.items()}
+        # A racy file forces its ancestors to be recomputed next time as well.
+        dirs = dict(tree.dirs)
+        for rel, entry in files.items():
+            directory = rel
+            while entry[0] == -1 and directory:
+                directory = _parent(directory)
+                dirs.pop(directory, None)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_file.parent, prefix=".merkle-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"files": files, "dirs": dirs}, separators=(",", ":")))
+        os.replace(tmp, self.cache_file)
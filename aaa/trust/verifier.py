@@ -3,6 +3,8 @@ import hashlib
 import json
 from pathlib import Path
 
+from .merkle import MerkleBuilder, MerkleTree, verify_proof
+
 class TrustVerifier:
     """
     Global Trust Network Verifier.
@@ -11,17 +13,41 @@ class TrustVerifier:
     
     def __init__(self, trust_store: Path):
         self.trust_store = trust_store
-        
+
+    def build_tree(self, repo_path: Path) -> MerkleTree:
+        """Merkle tree of a local repo's tracked files; subtree hashes are cached in the trust store."""
+        repo_path = Path(repo_path).resolve()
+        key = hashlib.sha256(str(repo_path).encode("utf-8")).hexdigest()[:16]
+        return MerkleBuilder(cache_file=self.trust_store / ".aaa-merkle" / f"{key}.json").build(repo_path)
+
+    def merkle_root(self, repo_path: Path) -> str:
+        return self.build_tree(repo_path).root
+
+    def inclusion_proof(self, repo_path: Path, rel_path: str) -> Dict[str, Any]:
+        return self.build_tree(repo_path).proof(rel_path)
+
+    @staticmethod
+    def verify_inclusion(proof: Dict[str, Any], root: str, content: Optional[bytes] = None) -> bool:
+        return verify_proof(proof, root, content)
+
     def verify_repo(self, repo_url: str, signature: str) -> bool:
         """
-        Verify a remote repository against a provided signature.
-        (Mock implementation for v2.0 Protocol)
+        Verify a repository against a provided signature.
+
+        A local checkout is verified for real: its Merkle root must equal the
+        signed root (``signature`` as ``<hex>`` or ``sha256:<hex>``).
+        Remote URLs are still the v2.0 Protocol mock.
         """
+        local = Path(repo_url)
+        if local.is_dir():
+            expected = signature.split(":", 1)[1] if signature.startswith("sha256:") else signature
+            return self.merkle_root(local) == expected
+
         # In a real system, this would:
         # 1. Clone repo to temp
         # 2. Calculate Merkle Root of HEAD
         # 3. Verify signature matches Merkle Root via trusted Public Key
-        
+
         print(f"Verifying {repo_url} with sig {signature[:8]}...")
         # Simulating verification delay
         return True
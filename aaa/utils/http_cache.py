@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+from urllib import error, request
+
+DEFAULT_TIMEOUT_SECONDS = 2
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    payload: Any
+    # When the payload was last confirmed current (200 or 304 from the server).
+    fetched_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # "network" (200), "revalidated" (304), "cache" (within max-age) or "stale" (fetch failed)
+    source: str
+    error: Optional[str] = None
+
+    def age(self, now: Optional[float] = None) -> float:
+        return max(0.0, (time.time() if now is None else now) - self.fetched_at)
+
+    def describe(self, now: Optional[float] = None) -> dict[str, Any]:
+        info: dict[str, Any] = {
+            "url": self.url,
+            "source": self.source,
+            "age_seconds": round(self.age(now), 1),
+            "stale": self.source == "stale",
+        }
+        if self.error:
+            info["error"] = self.error
+        return info
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("AAA_HTTP_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".aaa" / "cache" / "http"
+
+
+def cache_path(url: str, cache_dir: Optional[Path] = None) -> Path:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+    return (cache_dir or default_cache_dir()) / f"{key}.json"
+
+
+def fetch_json(
+    url: str,
+    *,
+    max_age: float,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    cache_dir: Optional[Path] = None,
+    now: Optional[float] = None,
+) -> CachedResponse:
+    """
+    GET a JSON document through an on-disk cache. Within ``max_age`` seconds
+    of the last confirmation the cached copy is returned without a request;
+    after that the server is asked with If-None-Match / If-Modified-Since,
+    and a 304 just refreshes the timestamp. If the request fails, a cached
+    copy is returned marked stale; with nothing cached the error propagates.
+    """
+    now = time.time() if now is None else now
+    path = cache_path(url, cache_dir)
+    cached = _read_entry(path, url)
+    if cached is not None and now - cached.fetched_at <= max_age:
+        return _replace(cached, source="cache")
+
+    headers = {"Accept": "application/json"}
+    if cached is not None and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached is not None and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    try:
+        with request.urlopen(request.Request(url, headers=headers), timeout=timeout) as resp:
+            payload = json.loads(resp.read().decode("utf-8"))
+            response = CachedResponse(
+                url=url,
+                payload=payload,
+                fetched_at=now,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+                source="network",
+            )
+    except error.HTTPError as exc:
+        if exc.code == 304 and cached is not None:
+            response = CachedResponse(
+                url=url,
+                payload=cached.payload,
+                fetched_at=now,
+                etag=exc.headers.get("ETag") or cached.etag,
+                last_modified=exc.headers.get("Last-Modified") or cached.last_modified,
+                source="revalidated",
+            )
+        elif cached is not None:
+            return _replace(cached, source="stale", error=f"HTTP {exc.code}")
+        else:
+            raise
+    except (OSError, ValueError) as exc:
+        # URLError and timeouts are OSErrors; ValueError covers a malformed body.
+        if cached is None:
+            raise
+        return _replace(cached, source="stale", error=f"{type(exc).__name__}: {exc}")
+    _write_entry(path, response)
+    return response
+
+
+def _replace(response: CachedResponse, **changes: Any) -> CachedResponse:
+    return CachedResponse(**{**response.__dict__, **changes})
+
+
+def _read_entry(path: Path, url: str) -> Optional[CachedResponse]:
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("url") != url or not isinstance(entry.get("fetched_at"), (int, float)):
+        return None
+    return CachedResponse(
+        url=url,
+        payload=entry.get("payload"),
+        fetched_at=float(entry["fetched_at"]),
+        etag=entry.get("etag"),
+        last_modified=entry.get("last_modified"),
+        source="cache",
+    )
+
+
+def _write_entry(path: Path, response: CachedResponse) -> None:
+    entry = {
+        "url": response.url,
+        "fetched_at": response.fetched_at,
+        "etag": response.etag,
+        "last_modified": response.last_modified,
+        "payload": response.payload,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".http-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=True))
+        os.replace(tmp, path)
+    except OSError:
+        # A read-only home still gets fresh data, just uncached.
+        pass
@@ -9,7 +9,8 @@ from dataclasses import dataclass
 from importlib import metadata
 from pathlib import Path
 from typing import Callable, Optional
-from urllib import request
+
+from . import http_cache
 
 CACHE_TTL_SECONDS = 24 * 60 * 60
 DEFAULT_TIMEOUT_SECONDS = 2
@@ -130,10 +131,12 @@ def _fetch_remote_version() -> Optional[UpdateResult]:
         )
     url = os.environ.get("AAA_UPDATE_SOURCE_URL", DEFAULT_SOURCE_URL)
     try:
-        with request.urlopen(url, timeout=DEFAULT_TIMEOUT_SECONDS) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
+        # Shared HTTP cache: ETag revalidation, and the last release info when offline.
+        payload = http_cache.fetch_json(url, max_age=CACHE_TTL_SECONDS, timeout=DEFAULT_TIMEOUT_SECONDS).payload
     except Exception:
         return None
+    if not isinstance(payload, dict):
+        return None
     tag = str(payload.get("tag_name", ""))
     release_url = str(payload.get("html_url", ""))
     if not tag:
@@ -0,0 +1,131 @@
+"""Content-addressed memo for governance validator results.
+
+Composite validators (readiness-inspect, repo-check, shared command dispatch)
+derive sub-bundles and re-run the leaf validators on them. Bundles that share
+a target path or tool chain derive identical sub-bundles, so the leaf results
+are memoized by validator name plus the SHA-256 of the canonical JSON of the
+bundle (or of the outer fields the sub-bundle is derived from). Keys treat
+bundles as JSON documents.
+
+Memoized results are shared between callers and must be treated as read-only.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from json.encoder import c_make_encoder, encode_basestring_ascii
+from typing import Any, Callable
+
+
+DEFAULT_MAXSIZE = 4096
+
+def _reject(value: Any) -> Any:
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+if c_make_encoder is not None:
+    # ``JSONEncoder.encode`` rebuilds the C encoder on every call, which costs
+    # more than validating a small derived bundle; build it once instead.
+    _c_encode = c_make_encoder(None, _reject, encode_basestring_ascii, None, ":", ",", True, False, True)
+
+    def canonical_json(value: Any) -> str:
+        if isinstance(value, str):
+            return encode_basestring_ascii(value)
+        return "".join(_c_encode(value, 0))
+
+else:
+    canonical_json = json.JSONEncoder(sort_keys=True, separators=(",", ":"), check_circular=False).encode
+
+
+def content_key(name: str, bundle: Any) -> str:
+    """Return the memo key for ``bundle``; raises ``TypeError``/``ValueError`` if it is not JSON."""
+    digest = hashlib.sha256(canonical_json(bundle).encode("utf-8")).hexdigest()
+    return f"{name}:{digest}"
+
+
+def derivation_inputs(bundle: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    """Key payload for a sub-bundle derived from ``fields`` of ``bundle`` (absent keys stay absent)."""
+    return {field: bundle[field] for field in fields if field in bundle}
+
+
+class ValidationMemo:
+    """Thread-safe LRU of validator results keyed by ``content_key``."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.bypassed = 0
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def call(self, name: str, validator: Callable[[Any], dict[str, Any]], bundle: Any) -> dict[str, Any]:
+        """Return ``validator(bundle)``, memoized on the bundle's content."""
+        return self.get(name, bundle, lambda: validator(bundle))
+
+    def get(self, name: str, key_payload: Any, compute: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Return the memoized result for ``key_payload``, running ``compute`` on a miss.
+
+        ``compute`` must be a pure function of ``key_payload``; composite
+        validators pass the few outer fields a derived bundle is built from
+        rather than the derived bundle itself, which keeps the key cheaper
+        than the validation it saves.
+        """
+        if self.maxsize <= 0:
+            return compute()
+        try:
+            key = content_key(name, key_payload)
+        except (TypeError, ValueError):
+            # Not canonical JSON (e.g. sets or non-string keys): validate uncached.
+            with self._lock:
+                self.bypassed += 1
+            return compute()
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            self._evict()
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bypassed": self.bypassed,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _evict(self) -> None:
+        while len(self._entries) > max(self.maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+MEMO = ValidationMemo()
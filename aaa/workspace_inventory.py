@@ -0,0 +1,295 @@
+"""Shared inventory of a workspace's top-level repos and their GitHub workflows.
+
+``package status`` (topology detection, repo inventory), ``outdated``
+(workflow ``uses:`` versions) and ``check`` (reusable gate lookup) all need
+the same facts about a workspace: its child directories, which of them carry
+a ``.github`` directory, and the ``uses:`` references in each
+``.github/workflows/*.yml|yaml`` file of the root and of every child.
+
+``load_inventory`` scans those with ``os.scandir`` (children in parallel),
+parses every workflow once, and keeps the result in memory and as a JSON
+snapshot under ``~/.aaa/cache/inventory`` (at most ``MAX_SNAPSHOTS``, oldest
+evicted). A rescan reuses a directory's entries while its mtime is unchanged
+and a workflow's references while its (mtime, size) is unchanged, so a warm
+call costs a few stats per repo. Per-repo consumers pass ``children=False``
+to read only the root's workflows.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+INVENTORY_VERSION = 1
+WORKFLOW_SUFFIXES = (".yml", ".yaml")
+PARALLEL_MIN_REPOS = 8
+MAX_SNAPSHOTS = 32
+# Entries modified this close to a scan may change again within the same
+# mtime tick; they are recorded as stale so the next scan re-reads them.
+RACY_WINDOW_NS = 2_000_000_000
+STALE = -1
+
+_USES_RE = re.compile(r"uses:\s*(\S+)")
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("AAA_INVENTORY_CACHE_DIR")
+    return Path(override) if override else Path.home() / ".aaa" / "cache" / "inventory"
+
+
+@dataclass
+class WorkflowEntry:
+    mtime_ns: int
+    size: int
+    uses: list[str]
+
+
+@dataclass
+class RepoInventory:
+    mtime_ns: int = STALE
+    has_github: bool = False
+    workflows_mtime_ns: int = STALE
+    workflows: dict[str, WorkflowEntry] = field(default_factory=dict)
+
+    def uses(self) -> list[str]:
+        return [ref for name in sorted(self.workflows) for ref in self.workflows[name].uses]
+
+
+@dataclass
+class WorkspaceInventory:
+    root: str
+    mtime_ns: int = STALE
+    child_dirs: list[str] = field(default_factory=list)
+    # "" is the workspace root itself; other keys are child directory names.
+    repos: dict[str, RepoInventory] = field(default_factory=dict)
+    stats: dict[str, int] = field(default_factory=dict, compare=False)
+
+    def github_children(self) -> list[str]:
+        """Child directories (other than ``.github`` itself) that contain a ``.github`` entry."""
+        return [name for name in self.child_dirs if name != ".github" and self.repos[name].has_github]
+
+    def uses(self, repo: str = "") -> list[str]:
+        entry = self.repos.get(repo)
+        return entry.uses() if entry is not None else []
+
+    def uses_versions(self, repo_name: str, repo: str = "") -> list[str]:
+        """Versions pinned by ``uses: <owner>/<repo_name>@<version>`` references in ``repo``'s workflows."""
+        pattern = re.compile(r"\S*/" + re.escape(repo_name) + r"@([A-Za-z0-9._-]+)")
+        versions = []
+        for ref in self.uses(repo):
+            match = pattern.match(ref)
+            if match:
+                versions.append(match.group(1))
+        return versions
+
+    def references(self, needle: str, repo: str = "") -> bool:
+        """Whether any ``uses:`` reference in ``repo``'s workflows contains ``needle``."""
+        return any(needle in ref for ref in self.uses(repo))
+
+    def to_dict(self) -> dict[str, Any]:
+        # Built by hand: dataclasses.asdict deep-copies every reference list.
+        repos = {
+            name: {
+                "mtime_ns": repo.mtime_ns,
+                "has_github": repo.has_github,
+                "workflows_mtime_ns": repo.workflows_mtime_ns,
+                "workflows": {wf: {"mtime_ns": e.mtime_ns, "size": e.size, "uses": e.uses} for wf, e in repo.workflows.items()},
+            }
+            for name, repo in self.repos.items()
+        }
+        return {"version": INVENTORY_VERSION, "root": self.root, "mtime_ns": self.mtime_ns, "child_dirs": self.child_dirs, "repos": repos}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "WorkspaceInventory":
+        if payload.get("version") != INVENTORY_VERSION:
+            raise ValueError("unsupported inventory snapshot version")
+        repos = {}
+        for name, repo in payload["repos"].items():
+            workflows = {wf: WorkflowEntry(**entry) for wf, entry in repo["workflows"].items()}
+            repos[name] = RepoInventory(repo["mtime_ns"], repo["has_github"], repo["workflows_mtime_ns"], workflows)
+        return cls(payload["root"], payload["mtime_ns"], list(payload["child_dirs"]), repos)
+
+
+def _stamp(st: os.stat_result, started_ns: int) -> int:
+    return STALE if st.st_mtime_ns >= started_ns - RACY_WINDOW_NS else st.st_mtime_ns
+
+
+def _parse_uses(path: str) -> list[str]:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return _USES_RE.findall(f.read())
+
+
+def _scan_repo(path: str, previous: RepoInventory | None, started_ns: int, stats: dict[str, int]) -> RepoInventory:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return RepoInventory()
+    mtime_ns = _stamp(st, started_ns)
+    if previous is not None and previous.mtime_ns != STALE and previous.mtime_ns == st.st_mtime_ns:
+        has_github = previous.has_github
+    else:
+        has_github = os.path.lexists(os.path.join(path, ".github"))
+    repo = RepoInventory(mtime_ns=mtime_ns, has_github=has_github)
+    if not has_github:
+        return repo
+
+    workflows_dir = os.path.join(path, ".github", "workflows")
+    try:
+        st = os.stat(workflows_dir)
+    except OSError:
+        return repo
+    repo.workflows_mtime_ns = _stamp(st, started_ns)
+    if previous is not None and previous.workflows_mtime_ns != STALE and previous.workflows_mtime_ns == st.st_mtime_ns:
+        names = list(previous.workflows)
+    else:
+        stats["listed_dirs"] += 1
+        try:
+            with os.scandir(workflows_dir) as entries:
+                names = [e.name for e in entries if e.name.endswith(WORKFLOW_SUFFIXES) and e.is_file()]
+        except OSError:
+            names = []
+    for name in names:
+        file_path = os.path.join(workflows_dir, name)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        cached = previous.workflows.get(name) if previous is not None else None
+        if cached is not None and cached.mtime_ns != STALE and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+            repo.workflows[name] = cached
+            continue
+        stats["parsed_workflows"] += 1
+        repo.workflows[name] = WorkflowEntry(_stamp(st, started_ns), st.st_size, _parse_uses(file_path))
+    return repo
+
+
+def scan_workspace(
+    workspace: str | Path,
+    previous: WorkspaceInventory | None = None,
+    workers: int | None = None,
+    children: bool = True,
+) -> WorkspaceInventory:
+    """
+    Inventory ``workspace``, reusing whatever in ``previous`` is still current.
+    With ``children=False`` only the root entry is scanned (``child_dirs`` stays empty).
+    """
+    root = os.path.abspath(workspace)
+    started_ns = time.time_ns()
+    stats = {"listed_dirs": 0, "parsed_workflows": 0}
+    inventory = WorkspaceInventory(root=root, stats=stats)
+    if previous is not None and previous.root != root:
+        previous = None
+    try:
+        st = os.stat(root)
+    except OSError:
+        return inventory
+    inventory.mtime_ns = _stamp(st, started_ns)
+    if children and previous is not None and previous.mtime_ns != STALE and previous.mtime_ns == st.st_mtime_ns:
+        inventory.child_dirs = list(previous.child_dirs)
+    elif children:
+        stats["listed_dirs"] += 1
+        with os.scandir(root) as entries:
+            inventory.child_dirs = sorted(e.name for e in entries if e.is_dir())
+
+    names = [""] + inventory.child_dirs
+    prev_repos = previous.repos if previous is not None else {}
+
+    def scan(name: str) -> tuple[RepoInventory, dict[str, int]]:
+        repo_stats = {"listed_dirs": 0, "parsed_workflows": 0}
+        path = os.path.join(root, name) if name else root
+        return _scan_repo(path, prev_repos.get(name), started_ns, repo_stats), repo_stats
+
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    if workers == 1 or len(names) < PARALLEL_MIN_REPOS:
+        repos = [scan(name) for name in names]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            repos = list(executor.map(scan, names))
+    for name, (repo, repo_stats) in zip(names, repos):
+        inventory.repos[name] = repo
+        for key, value in repo_stats.items():
+            stats[key] += value
+    return inventory
+
+
+_memo: dict[tuple[str, bool], WorkspaceInventory] = {}
+_memo_lock = threading.Lock()
+
+
+def _snapshot_path(root: str, cache_dir: Path) -> Path:
+    return cache_dir / f"{hashlib.sha256(root.encode('utf-8')).hexdigest()[:16]}.json"
+
+
+def _read_snapshot(path: Path) -> WorkspaceInventory | None:
+    try:
+        return WorkspaceInventory.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_snapshot(path: Path, inventory: WorkspaceInventory) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".inventory-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(inventory.to_dict(), separators=(",", ":")))
+        os.replace(tmp, path)
+        _evict_snapshots(path)
+    except OSError:
+        # The snapshot is only an accelerator; an unwritable cache is not an error.
+        pass
+
+
+def _evict_snapshots(written: Path) -> None:
+    """Drop the least recently written snapshots beyond ``MAX_SNAPSHOTS`` (never ``written``)."""
+    snapshots = []
+    with os.scandir(written.parent) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file() and entry.path != str(written):
+                snapshots.append((entry.stat().st_mtime_ns, entry.path))
+    for _, path in sorted(snapshots)[: max(0, len(snapshots) + 1 - MAX_SNAPSHOTS)]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def load_inventory(
+    workspace: str | Path,
+    cache_dir: Path | None = None,
+    persist: bool = True,
+    workers: int | None = None,
+    children: bool = True,
+) -> WorkspaceInventory:
+    """
+    Current inventory of ``workspace``. The previous result (from this process,
+    else from the on-disk snapshot) seeds an incremental rescan; the snapshot
+    is rewritten only when something changed. Root-only inventories
+    (``children=False``) are cheap to rebuild and are never persisted.
+    """
+    root = os.path.abspath(workspace)
+    snapshot = _snapshot_path(root, cache_dir or default_cache_dir()) if persist and children else None
+    with _memo_lock:
+        previous = _memo.get((root, children))
+    if previous is None and snapshot is not None:
+        previous = _read_snapshot(snapshot)
+    inventory = scan_workspace(root, previous, workers=workers, children=children)
+    with _memo_lock:
+        _memo[(root, children)] = inventory
+    if snapshot is not None and inventory.repos and inventory != previous:
+        _write_snapshot(snapshot, inventory)
+    return inventory
+
+
+def clear_inventory_cache() -> None:
+    """Forget in-memory inventories (snapshots on disk are kept)."""
+    with _memo_lock:
+        _memo.clear()
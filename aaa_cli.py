@@ -113,10 +113,8 @@ def export_evidence(args):
     # For prototype, use a hardcoded agent_id/secret. In production, these come from secure storage.
     identity = AgentIdentity("agent_alpha", "secret_key_v2.0.1")
     
-    with open(ledger_path, "r") as f:
-        content = f.read()
-    
-    signature = identity.sign(content)
+    with open(ledger_path, "rb") as f:
+        signature = identity.sign(f)
     
     # Update Case Snapshot with Identity Proof (Citation: implementation_plan.md#L36)
     case_path = os.path.join(base_dir, "case_snapshot.json")
@@ -223,11 +221,10 @@ def omega_replay(args):
             print("[X] Missing identity_proof in case_snapshot.json")
             sys.exit(1)
             
-        with open(ledger_path, "r") as f:
-            ledger_content = f.read()
-            
         identity = AgentIdentity(proof["agent_id"], "secret_key_v2.0.1") # Secret must match
-        if not identity.verify(ledger_content, proof["signature"]):
+        with open(ledger_path, "rb") as f:
+            identity_ok = identity.verify(f, proof["signature"])
+        if not identity_ok:
             print(f"[X] Identity Signature Verification FAILED for {proof['agent_id']}")
             sys.exit(1)
             
@@ -0,0 +1,85 @@
+"""End-to-end latency of ``aaa governance`` commands with and without the daemon.
+
+Usage:
+    python scripts/bench_governance_daemon.py COMMAND BUNDLE [--runs N]
+
+Times COMMAND (e.g. ``repo-check``) on BUNDLE three ways: a cold CLI process
+with forwarding disabled, a cold launcher process forwarding to a warm
+``aaa governance serve``, and a raw socket round trip to that daemon.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aaa import governance_client  # noqa: E402
+
+LAUNCHER = "import sys; from aaa.governance_client import main; sys.exit(main())"
+
+
+def _percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p50 = ordered[len(ordered) // 2]
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={p50 * 1e3:8.2f} ms  p95={p95 * 1e3:8.2f} ms"
+
+
+def _time_process(argv: list[str], env: dict[str, str], runs: int) -> tuple[list[float], bytes]:
+    samples = []
+    output = b""
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(argv, env=env, capture_output=True)
+        samples.append(time.perf_counter() - start)
+        output = completed.stdout
+    return samples, output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", help="governance bundle command, e.g. repo-check")
+    parser.add_argument("bundle", help="bundle JSON path")
+    parser.add_argument("--runs", type=int, default=20, help="process launches per mode")
+    args = parser.parse_args()
+
+    repo_root = str(Path(__file__).resolve().parents[1])
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="aaa-gov-bench-"), "d.sock")
+    env = {**os.environ, "PYTHONPATH": repo_root, governance_client.SOCKET_ENV: socket_path}
+    cli_argv = ["governance", args.command, "--bundle", args.bundle, "--format", "json"]
+
+    cold, cold_output = _time_process(
+        [sys.executable, "-c", LAUNCHER, *cli_argv], {**env, governance_client.FORWARD_ENV: "0"}, args.runs
+    )
+    daemon = subprocess.Popen(
+        [sys.executable, "-c", LAUNCHER, "governance", "serve", "--socket", socket_path],
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    try:
+        daemon.stdout.readline()  # "listening" event
+        warm, warm_output = _time_process([sys.executable, "-c", LAUNCHER, *cli_argv], env, args.runs)
+        request = governance_client.build_request(cli_argv)
+        round_trips = []
+        for _ in range(args.runs * 10):
+            start = time.perf_counter()
+            governance_client.send_request(request, socket_path)
+            round_trips.append(time.perf_counter() - start)
+    finally:
+        governance_client.send_request({"op": "shutdown"}, socket_path)
+        daemon.wait(10)
+
+    print(f"{'cold CLI process':<28} {_percentiles(cold)}")
+    print(f"{'forwarded to daemon':<28} {_percentiles(warm)}")
+    print(f"{'socket round trip':<28} {_percentiles(round_trips)}")
+    print(f"{'identical stdout':<28} {cold_output == warm_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
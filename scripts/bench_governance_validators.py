@@ -0,0 +1,72 @@
+"""Per-bundle cost of every governance validator.
+
+Usage:
+    python scripts/bench_governance_validators.py [BUNDLE_DIR] [--repeat N]
+
+Each validator routed by ``aaa governance validate-batch`` is timed on an
+empty bundle (every rule fails) and on each ``*.json`` bundle under
+BUNDLE_DIR that routes to it.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aaa import governance_batch  # noqa: E402
+
+
+def _time_per_call(func, bundle, repeat: int) -> float | None:
+    try:
+        func(bundle)
+    except Exception:
+        return None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(bundle)
+    return (time.perf_counter() - start) / repeat
+
+
+def _micros(seconds: float | None) -> str:
+    return f"{seconds * 1e6:10.2f}" if seconds is not None else f"{'error':>10}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("bundle_dir", nargs="?", help="directory of sample bundles (searched recursively)")
+    parser.add_argument("--repeat", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args()
+
+    samples: dict[str, list[dict]] = {name: [] for name in governance_batch.VALIDATORS}
+    if args.bundle_dir:
+        for path in sorted(Path(args.bundle_dir).rglob("*.json")):
+            try:
+                bundle = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            name = governance_batch.route_bundle(bundle) if isinstance(bundle, dict) else None
+            if name:
+                samples[name].append(bundle)
+
+    print(f"{'validator':<56} {'empty µs':>10} {'samples':>8} {'sample µs':>10}")
+    timed: list[float] = []
+    for name in sorted(governance_batch.VALIDATORS):
+        func = governance_batch.get_validator(name)
+        empty = _time_per_call(func, {}, args.repeat)
+        bundles = samples[name]
+        sample_times = [_time_per_call(func, bundle, args.repeat) for bundle in bundles]
+        sample_times = [value for value in sample_times if value is not None]
+        sample = sum(sample_times) / len(sample_times) if sample_times else None
+        timed.extend(value for value in (empty, sample) if value is not None)
+        sample_text = _micros(sample) if bundles else f"{'-':>10}"
+        print(f"{name:<56} {_micros(empty)} {len(bundles):8d} {sample_text}")
+    if timed:
+        print(f"{'mean per bundle':<56} {_micros(sum(timed) / len(timed))}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
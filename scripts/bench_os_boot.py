@@ -0,0 +1,83 @@
+"""Cold and warm boot latency of the Agent OS kernel.
+
+Usage:
+    python scripts/bench_os_boot.py [--runs N] [--max-cold-ms MS] [--json]
+
+Each run is a fresh interpreter that imports ``aaa.os.kernel``, constructs
+``AgentKernel`` on a throwaway workspace and calls ``boot()``; "cold" is
+the default lazy boot, "warm" passes ``warm=True``. Reported times are
+measured inside the child (import + construct + boot), excluding
+interpreter start-up. With ``--max-cold-ms`` the script exits 1 when the
+cold p50 exceeds the budget, so it can gate CI on boot regressions.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from aaa.os.kernel import AgentKernel
+imported = time.perf_counter()
+status = AgentKernel(__import__("pathlib").Path(sys.argv[1]), warm=sys.argv[2] == "warm").boot()
+done = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1e3, "total_ms": (done - started) * 1e3,
+                  "subsystems": status["boot_report"]["subsystems"]}))
+"""
+
+
+def _p50(samples: list[float]) -> float:
+    return sorted(samples)[len(samples) // 2]
+
+
+def _measure(mode: str, runs: int, workspace: Path) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    results = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", CHILD, str(workspace), mode], env=env, capture_output=True, check=True
+        )
+        results.append(json.loads(completed.stdout))
+    return {
+        "import_ms": round(_p50([r["import_ms"] for r in results]), 2),
+        "total_ms": round(_p50([r["total_ms"] for r in results]), 2),
+        "subsystems": results[-1]["subsystems"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="interpreter launches per mode")
+    parser.add_argument("--max-cold-ms", type=float, help="fail if the cold boot p50 exceeds this")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="aaa-boot-bench-") as tmp:
+        workspace = Path(tmp)
+        (workspace / ".aaa").mkdir()
+        (workspace / ".aaa" / "registry_index.json").write_text('{"packs": {}}', encoding="utf-8")
+        results = {mode: _measure(mode, args.runs, workspace) for mode in ("cold", "warm")}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for mode, result in results.items():
+            print(f"{mode:<5} import p50={result['import_ms']:8.2f} ms  import+boot p50={result['total_ms']:8.2f} ms")
+        for module, entry in results["warm"]["subsystems"].items():
+            print(f"      {module:<13} init {entry.get('init_ms', 0):8.2f} ms")
+
+    if args.max_cold_ms is not None and results["cold"]["total_ms"] > args.max_cold_ms:
+        print(f"cold boot p50 {results['cold']['total_ms']:.2f} ms exceeds budget {args.max_cold_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""Merkle root timings for TrustVerifier: cold, warm and after a small edit.
+
+Usage:
+    python scripts/bench_trust_merkle.py [REPO] [--files N]
+
+Without REPO, generates a synthetic tree of N files (default 50000, ~2 KB
+each, 20 files per directory) in a temp dir. Timings use a fresh subtree
+cache: cold (everything hashed), warm (nothing changed), and after editing
+three files (only they and their ancestor directories are rehashed).
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aaa.trust.merkle import MerkleBuilder  # noqa: E402
+
+
+def _generate(root: Path, count: int) -> None:
+    payload = os.urandom(1024).hex()
+    old = time.time() - 3600
+    for i in range(count):
+        directory = root / f"pkg{i // 2000}" / f"mod{i // 20}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"file{i}.py"
+        path.write_text(f"# {i}\n{payload}\n", encoding="utf-8")
+        os.utime(path, (old, old))
+
+
+def _timed(builder: MerkleBuilder, repo: Path, label: str) -> str:
+    start = time.perf_counter()
+    tree = builder.build(repo)
+    elapsed = time.perf_counter() - start
+    stats = builder.last_stats
+    print(f"{label:<12} {elapsed * 1e3:9.1f} ms  files hashed {stats['hashed_files']:>6}/{stats['files']}  "
+          f"dirs hashed {stats['hashed_dirs']:>5}/{stats['dirs']}")
+    return tree.root
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("repo", nargs="?", help="existing repo to measure (read-only)")
+    parser.add_argument("--files", type=int, default=50000, help="synthetic tree size")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aaa-merkle-bench-"))
+    try:
+        if args.repo:
+            repo = Path(args.repo).resolve()
+        else:
+            repo = workdir / "repo"
+            _generate(repo, args.files)
+        builder = MerkleBuilder(cache_file=workdir / "cache.json")
+        cold = _timed(builder, repo, "cold")
+        warm = _timed(builder, repo, "warm")
+        print(f"{'root stable':<12} {cold == warm}")
+        if not args.repo:
+            old = time.time() - 60
+            for i in (7, 25_001 % args.files, args.files - 1):
+                path = repo / f"pkg{i // 2000}" / f"mod{i // 20}" / f"file{i}.py"
+                path.write_text(path.read_text(encoding="utf-8") + "# edited\n", encoding="utf-8")
+                os.utime(path, (old, old))
+            edited = _timed(builder, repo, "3 edits")
+            print(f"{'root changed':<12} {edited != warm}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
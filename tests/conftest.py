@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_inventory_cache(tmp_path, monkeypatch):
+    # Keep workspace inventory snapshots out of the real ~/.aaa/cache.
+    monkeypatch.setenv("AAA_INVENTORY_CACHE_DIR", str(tmp_path / "inventory-cache"))
@@ -1,5 +1,5 @@
 import pytest
-from aaa.engine.ruleset import InheritanceMerger
+from aaa.engine.ruleset import InheritanceMerger, RulesetResolutionError, RulesetResolver
 
 class TestInheritanceMerger:
     def test_deep_merge_simple_dict(self):
@@ -68,3 +68,78 @@ class TestInheritanceMerger:
         
         # Both None -> return empty dict
         assert merger.merge(None, None) == {}
+
+    def test_merge_shares_untouched_subtrees(self):
+        parent = {"security": {"scanners": ["a"]}, "docs": {"readme": True}}
+        result = InheritanceMerger().merge(parent, {"docs": {"readme": False}})
+
+        assert result["security"] is parent["security"]
+        assert result["docs"] == {"readme": False}
+        assert parent["docs"] == {"readme": True}
+
+
+def _hierarchy(repos=3):
+    resolver = RulesetResolver()
+    resolver.define("org", {"security": {"level": "high", "scanners": ["sast"]}, "docs": {"readme": True}})
+    resolver.define("bu", {"security": {"level": "medium"}}, ["org"])
+    resolver.define("team", {"owners": ["team-a"]}, ["bu"])
+    resolver.define("archetype", {"docs": {"adr": True}})
+    for i in range(repos):
+        resolver.define(f"repo-{i}", {"name": f"repo-{i}"}, ["team", "archetype"])
+    return resolver
+
+
+class TestRulesetResolver:
+    def test_resolves_chain_and_multiple_parents(self):
+        resolver = _hierarchy()
+        merger = InheritanceMerger()
+        expected = merger.merge(
+            merger.merge(
+                merger.merge(merger.merge({"security": {"level": "high", "scanners": ["sast"]}, "docs": {"readme": True}},
+                                          {"security": {"level": "medium"}}), {"owners": ["team-a"]}),
+                {"docs": {"adr": True}}),
+            {"name": "repo-0"})
+
+        assert resolver.resolve("repo-0") == expected
+        assert resolver.resolve("repo-0")["security"]["scanners"] is resolver.resolve("org")["security"]["scanners"]
+
+    def test_shared_intermediate_merges_are_computed_once(self):
+        resolver = _hierarchy(repos=50)
+        resolver.resolve_many(f"repo-{i}" for i in range(50))
+
+        # org/bu/team chain (2 merges) + team+archetype (1) + one per repo
+        assert resolver.stats["merges"] == 3 + 50
+        assert resolver.stats["merge_hits"] == 49
+
+    def test_redefinition_recomputes_only_descendants(self):
+        resolver = _hierarchy()
+        resolver.define("other-team", {"owners": ["team-b"]}, ["bu"])
+        resolver.define("repo-x", {}, ["other-team"])
+        resolver.resolve_many(["repo-0", "repo-1", "repo-2", "repo-x"])
+        before = resolver.resolve("repo-x")
+
+        invalidated = resolver.define("team", {"owners": ["team-c"]}, ["bu"])
+
+        assert invalidated == {"team", "repo-0", "repo-1", "repo-2"}
+        assert resolver.resolve("repo-x") is before
+        assert resolver.resolve("repo-1")["owners"] == ["team-c"]
+
+    def test_unchanged_content_reuses_cached_merges(self):
+        resolver = _hierarchy()
+        first = resolver.resolve("repo-0")
+        merges = resolver.stats["merges"]
+
+        resolver.define("team", {"owners": ["team-a"]}, ["bu"])
+
+        assert resolver.resolve("repo-0") is first
+        assert resolver.stats["merges"] == merges
+
+    def test_unknown_parent_and_cycles_are_errors(self):
+        resolver = RulesetResolver()
+        resolver.define("a", {}, ["missing"])
+        with pytest.raises(RulesetResolutionError, match="Unknown ruleset: missing"):
+            resolver.resolve("a")
+
+        resolver.define("missing", {}, ["a"])
+        with pytest.raises(RulesetResolutionError, match="cycle"):
+            resolver.resolve("a")
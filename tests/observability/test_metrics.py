@@ -4,7 +4,7 @@ import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
-from aaa.observability.custom_metrics import MetricStore
+from aaa.observability.custom_metrics import LatencyHistogram, MetricStore
 
 class TestMetricStore:
     
@@ -70,3 +70,20 @@ class TestMetricStore:
         assert "new_metric" in names
         assert "old_metric" not in names
         conn.close()
+
+    def test_latency_histogram_points(self, db_path):
+        hist = LatencyHistogram(buckets=(1.0, 10.0))
+        for ms in (0.5, 0.7, 5.0, 50.0):
+            hist.observe(ms)
+        assert hist.percentile(0.5) == 1.0
+        assert hist.percentile(0.75) == 10.0
+        assert hist.percentile(1.0) == float("inf")
+
+        store = MetricStore(db_path=db_path)
+        store.record_histogram("lat", hist, tags={"stage": "x"})
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT metric_name, value, tags FROM metrics ORDER BY rowid").fetchall()
+        conn.close()
+        buckets = [(value, json.loads(tags)["le"]) for name, value, tags in rows if name == "lat.bucket"]
+        assert buckets == [(2.0, "1.0"), (3.0, "10.0"), (4.0, "+Inf")]
+        assert ("lat.sum", 56.2) in [(name, round(value, 3)) for name, value, _ in rows]
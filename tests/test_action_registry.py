@@ -16,6 +16,43 @@ class TestActionRegistry(unittest.TestCase):
         with self.assertRaises(action_registry.RuntimeSecurityError):
             registry.execute("fs_write", {"path": "/tmp/a"}, allowed_scopes=[])
 
+    def test_compiled_table_matches_scope_overlap(self):
+        registry = action_registry.ActionRegistry()
+        registry.register("read", lambda args: {"ok": True}, scopes=["repo:read", "repo:write"])
+        registry.register("write", lambda args: {"ok": True}, scopes=["fs:write"])
+        registry.register("open", lambda args: {"ok": True}, scopes=[])
+
+        table = registry.compile(["repo:write", "unknown:scope"])
+        self.assertEqual(table.authorized, {"read": True, "write": False, "open": True})
+        self.assertIs(registry.compile(["unknown:scope", "repo:write"]), table)
+        self.assertTrue(all(registry.compile(None).authorized.values()))
+        self.assertEqual(registry.execute("read", {}, table), {"ok": True})
+        with self.assertRaises(action_registry.RuntimeSecurityError) as ctx:
+            registry.execute("write", {}, table)
+        self.assertEqual(ctx.exception.details["required_any_of"], ["fs:write"])
+
+        # registering invalidates compiled tables
+        registry.register("write", lambda args: {"ok": True}, scopes=["repo:write"])
+        self.assertTrue(registry.compile(["repo:write", "unknown:scope"]).authorized["write"])
+
+    def test_timings_are_recorded_per_action(self):
+        registry = action_registry.ActionRegistry()
+        registry.register("notify", lambda args: {"ok": True}, scopes=["notify:send"])
+        registry.register("boom", lambda args: 1 / 0, scopes=[])
+        for _ in range(3):
+            registry.execute("notify", {}, allowed_scopes=["notify:send"])
+        with self.assertRaises(action_registry.RuntimeSecurityError):
+            registry.execute("notify", {}, allowed_scopes=[])
+        with self.assertRaises(ZeroDivisionError):
+            registry.execute("boom", {}, allowed_scopes=None)
+
+        timings = registry.timings()
+        self.assertEqual((timings["notify"]["calls"], timings["notify"]["denied"]), (4, 1))
+        self.assertEqual(timings["boom"]["calls"], 1)
+        self.assertGreater(timings["boom"]["handler_ms"], 0)
+        registry.reset_timings()
+        self.assertEqual(registry.timings(), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -26,3 +26,46 @@ def test_kernel_run_safe_action(kernel):
 def test_kernel_escalate_conflict(kernel):
     case_id = kernel.escalate_conflict({"detail": "info"})
     assert case_id is not None
+
+def test_boot_is_lazy_and_touches_nothing(tmp_path):
+    kernel = AgentKernel(workspace_root=tmp_path)
+    status = kernel.boot()
+
+    assert status["status"] == "ONLINE"
+    assert set(status["modules"].values()) == {"active"}
+    assert {entry["state"] for entry in status["boot_report"]["subsystems"].values()} == {"lazy"}
+    assert list(tmp_path.iterdir()) == []
+
+    kernel.escalate_conflict({"detail": "info"})
+    report = kernel.boot()["boot_report"]["subsystems"]
+    assert report["constitution"]["state"] == "ready"
+    assert report["constitution"]["init_ms"] >= 0
+    assert report["semantic"] == {"state": "lazy"}
+
+def test_warm_boot_initializes_everything_and_reports_failures(kernel, tmp_path):
+    kernel.warm()
+    status = kernel.boot()
+    assert status["status"] == "ONLINE"
+    assert {entry["state"] for entry in status["boot_report"]["subsystems"].values()} == {"ready"}
+    assert all("init_ms" in entry for entry in status["boot_report"]["subsystems"].values())
+
+    bare = AgentKernel(workspace_root=tmp_path / "bare", warm=True)
+    status = bare.boot()
+    assert status["status"] == "DEGRADED"
+    assert status["modules"]["semantic"] == "error"
+    assert "registry_index.json" in status["boot_report"]["subsystems"]["semantic"]["error"]
+    assert status["modules"]["lock_manager"] == "active"
+
+def test_os_boot_cli_warm(tmp_path, monkeypatch):
+    from typer.testing import CliRunner
+    from aaa.cli import app
+
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(app, ["os", "boot"])
+    assert result.exit_code == 0 and '"state": "lazy"' in result.output
+    assert not (tmp_path / ".aaa").exists()
+
+    result = runner.invoke(app, ["os", "boot", "--warm"])
+    assert result.exit_code == 0 and "DEGRADED" in result.output
+    assert (tmp_path / ".aaa" / "court" / "cases").is_dir()
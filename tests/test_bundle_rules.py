@@ -0,0 +1,54 @@
+import pytest
+
+from aaa.bundle_rules import RAW, TEXT, Custom, Flag, Missing, OneOf, Required, Unknown, When, compile_rules
+
+
+def test_rules_run_in_declaration_order_and_expose_values():
+    rules = compile_rules(
+        [
+            Required("name", "name is required"),
+            OneOf("mode", {"a", "b"}, "mode must be a or b"),
+            Flag("enabled", True, "enabled must be true", code="enabled_flag"),
+            When("mode_name", lambda values, bundle: values["mode"] == "b" and not values["name"], "b needs a name"),
+        ]
+    )
+
+    errors, values = rules.check({"name": "  ", "mode": " b "})
+
+    assert [error["code"] for error in errors] == ["name", "enabled_flag", "mode_name"]
+    assert values == {"name": "", "mode": "b"}
+    assert len(rules) == 4
+    assert rules.source.startswith("def check(bundle):")
+
+
+def test_unknown_and_missing_messages_list_items():
+    rules = compile_rules(
+        [
+            Unknown("refs", {"x", "y"}, "unknown refs", sort=True),
+            Missing("refs", ("y", "x", "z"), "missing refs", code="refs_missing"),
+        ]
+    )
+
+    errors, _ = rules.check({"refs": [" q ", "x", "p"]})
+
+    assert errors == [
+        {"code": "refs", "message": "unknown refs: p, q"},
+        {"code": "refs_missing", "message": "missing refs: y, z"},
+    ]
+
+
+def test_custom_rules_and_raw_defaults_are_fresh_per_call():
+    def collect(bundle, values, errors):
+        values["items"].append("seen")
+        errors.append({"code": "custom", "message": str(len(values["items"]))})
+
+    rules = compile_rules([Custom(collect, fields=(("items", RAW, []),))])
+
+    assert rules.check({})[0] == [{"code": "custom", "message": "1"}]
+    assert rules.check({})[0] == [{"code": "custom", "message": "1"}]
+
+
+def test_conflicting_field_kinds_are_rejected():
+    with pytest.raises(ValueError):
+        compile_rules([Required("items", "items required")], fields=(("items", RAW, []),))
+    assert len(compile_rules([Required("name", "required")], fields=(("name", TEXT),))) == 1
@@ -0,0 +1,90 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from aaa.compiler.evaluator import PolicyEvaluator, evaluate_policy, plan_policy
+from aaa.compiler.generator import Generator
+from aaa.compiler.parser import CompilerError
+from aaa.compiler.schema import (
+    ContentContainsCheck,
+    FileExistsCheck,
+    JsonMatchCheck,
+    Policy,
+    PolicyMetadata,
+    Rule,
+    Severity,
+)
+
+
+def _rule(rule_id, check, severity=Severity.HIGH):
+    return Rule(id=rule_id, description="desc", severity=severity, check=check)
+
+
+POLICY = Policy(
+    metadata=PolicyMetadata(name="repo-structure", version="1.0"),
+    rules=[
+        _rule("readme_exists", FileExistsCheck(path="README.md"), Severity.BLOCKING),
+        _rule("pkg_version", JsonMatchCheck(path="pkg.json", key_path="meta.version", expected_value="2.0")),
+        _rule("readme_title", ContentContainsCheck(path="README.md", pattern=r"^# \w+")),
+        _rule("readme_license", ContentContainsCheck(path="README.md", pattern="it's MIT")),
+        _rule("pkg_private", JsonMatchCheck(path="pkg.json", key_path="private", expected_value=True)),
+        _rule("pkg_name_nested", JsonMatchCheck(path="pkg.json", key_path="name.first", expected_value="x")),
+        _rule("changelog", FileExistsCheck(path="CHANGELOG.md"), Severity.LOW),
+        _rule("broken_json", JsonMatchCheck(path="broken.json", key_path="a", expected_value=1)),
+    ],
+)
+
+
+def _run_generated(policy, root):
+    script = root / "check_policy.py"
+    script.write_text(Generator.generate(policy), encoding="utf-8")
+    completed = subprocess.run([sys.executable, str(script)], cwd=root, capture_output=True, text=True)
+    return completed.returncode, completed.stdout
+
+
+def _format(violations):
+    return [f"  - [{v['severity']}] {v['id']}: {v['message']}" for v in violations]
+
+
+def test_plan_groups_rules_by_file_and_precompiles_patterns():
+    groups = plan_policy(POLICY)
+
+    assert [group.path for group in groups] == ["README.md", "pkg.json", "CHANGELOG.md", "broken.json"]
+    assert [plan.rule.id for plan in groups[0].rules] == ["readme_exists", "readme_title", "readme_license"]
+    assert groups[0].rules[1].pattern.pattern == r"^# \w+"
+    assert groups[1].rules[0].keys == ("meta", "version")
+
+
+def test_evaluator_matches_generated_script(tmp_path):
+    (tmp_path / "README.md").write_text("# Title\nlicense: it's MIT\n", encoding="utf-8")
+    (tmp_path / "pkg.json").write_text(json.dumps({"meta": {"version": "2.0"}, "private": 1, "name": "x"}), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+    violations = evaluate_policy(POLICY, tmp_path)
+    exit_code, stdout = _run_generated(POLICY, tmp_path)
+
+    assert [v["id"] for v in violations] == ["pkg_name_nested", "changelog", "broken_json"]
+    assert exit_code == 1
+    assert stdout.splitlines()[-3:] == _format(violations)
+
+
+def test_evaluator_reports_missing_files_in_rule_order(tmp_path):
+    violations = PolicyEvaluator(POLICY).evaluate(tmp_path)
+    exit_code, stdout = _run_generated(POLICY, tmp_path)
+
+    assert [v["id"] for v in violations] == [rule.id for rule in POLICY.rules]
+    assert violations[1]["message"] == "JSON pkg.json key meta.version != '2.0'"
+    assert exit_code == 1
+    assert stdout.splitlines()[-len(violations):] == _format(violations)
+
+
+def test_invalid_pattern_is_a_compiler_error():
+    policy = Policy(
+        metadata=PolicyMetadata(name="bad", version="1.0"),
+        rules=[_rule("bad_pattern", ContentContainsCheck(path="README.md", pattern="("))],
+    )
+
+    with pytest.raises(CompilerError):
+        PolicyEvaluator(policy)
@@ -29,9 +29,11 @@ def test_generator_all_types():
     
     code = Generator.generate(policy)
     
-    assert "check_file_exists('README.md')" in code
-    assert "check_content_contains('README.md', r'Start')" in code
-    assert "check_json_match('pkg.json', 'ver', 1)" in code
+    assert code.count("path = Path('README.md')") == 1
+    assert "PATTERN_1 = re.compile('Start')" in code
+    assert "if text is None or PATTERN_1.search(text) is None:" in code
+    assert "value = json_value(data, ('ver',)) if data is not INVALID else INVALID" in code
     assert "Policy: test-policy (v1.0)" in code
     assert "if violations:" in code
     assert "sys.exit(1)" in code
+    compile(code, "check_test_policy.py", "exec")
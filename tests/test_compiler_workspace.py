@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from aaa.cli import app
+from aaa.compiler import workspace
+from aaa.compiler.evaluator import evaluate_policy
+from aaa.compiler.parser import CompilerError
+from aaa.compiler.schema import (
+    ContentContainsCheck,
+    FileExistsCheck,
+    JsonMatchCheck,
+    Policy,
+    PolicyMetadata,
+    Rule,
+    Severity,
+)
+from aaa.compiler.workspace import WorkspacePlan, evaluate_workspace
+
+
+def _rule(rule_id, check, severity=Severity.HIGH):
+    return Rule(id=rule_id, description="desc", severity=severity, check=check)
+
+
+STRUCTURE = Policy(
+    metadata=PolicyMetadata(name="structure", version="1.0"),
+    rules=[
+        _rule("readme", FileExistsCheck(path="README.md"), Severity.BLOCKING),
+        _rule("title", ContentContainsCheck(path="README.md", pattern=r"^# \w+")),
+        _rule("changelog", FileExistsCheck(path="CHANGELOG.md"), Severity.LOW),
+    ],
+)
+PACKAGING = Policy(
+    metadata=PolicyMetadata(name="packaging", version="2.0"),
+    rules=[
+        _rule("private", JsonMatchCheck(path="pkg.json", key_path="private", expected_value=True)),
+        _rule("license", ContentContainsCheck(path="README.md", pattern="MIT")),
+    ],
+)
+
+
+def _make_repos(tmp_path):
+    good = tmp_path / "good"
+    good.mkdir()
+    (good / "README.md").write_text("# Good\nMIT\n", encoding="utf-8")
+    (good / "CHANGELOG.md").write_text("", encoding="utf-8")
+    (good / "pkg.json").write_text(json.dumps({"private": True}), encoding="utf-8")
+    bad = tmp_path / "bad"
+    bad.mkdir()
+    (bad / "README.md").write_text("no title\n", encoding="utf-8")
+    (bad / "pkg.json").write_text("{", encoding="utf-8")
+    return [good, bad]
+
+
+def test_matrix_matches_per_policy_evaluation(tmp_path):
+    repos = _make_repos(tmp_path)
+
+    result = evaluate_workspace([STRUCTURE, PACKAGING], repos, workers=1).to_dict()
+
+    for repo in repos:
+        expected = {
+            f"{policy.metadata.name}:{v['id']}" for policy in (STRUCTURE, PACKAGING) for v in evaluate_policy(policy, repo)
+        }
+        failing = {key for key, status in result["matrix"][str(repo)].items() if status == "fail"}
+        assert failing == expected
+    assert result["summary"]["failing_cells"] == 4
+    assert [v["rule"] for v in result["violations"]] == [
+        "structure:title",
+        "structure:changelog",
+        "packaging:private",
+        "packaging:license",
+    ]
+    assert set(result["rule_timing"]) == {column["key"] for column in result["rules"]}
+    assert result["valid"] is False
+
+
+def test_plan_reads_each_file_once_across_policies(tmp_path, monkeypatch):
+    repos = _make_repos(tmp_path)
+    loads = []
+    original = workspace.load_target
+    monkeypatch.setattr(workspace, "load_target", lambda path, *args: loads.append(path.name) or original(path, *args))
+
+    WorkspacePlan([STRUCTURE, PACKAGING]).evaluate_repo(repos[0])
+
+    assert sorted(loads) == ["CHANGELOG.md", "README.md", "pkg.json"]
+
+
+def test_missing_repo_and_duplicate_keys(tmp_path):
+    result = evaluate_workspace([STRUCTURE], [tmp_path / "absent"], workers=1).to_dict()
+
+    assert set(result["matrix"][str(tmp_path / "absent")].values()) == {"error"}
+    assert result["repos"][0]["error"].startswith("FileNotFoundError")
+    with pytest.raises(CompilerError):
+        WorkspacePlan([STRUCTURE, STRUCTURE])
+
+
+def test_process_pool_matches_in_process_and_csv_shape(tmp_path):
+    repos = _make_repos(tmp_path)
+
+    serial = evaluate_workspace([STRUCTURE, PACKAGING], repos, workers=1)
+    pooled = evaluate_workspace([STRUCTURE, PACKAGING], repos, workers=2, chunksize=1)
+
+    assert pooled.to_dict()["matrix"] == serial.to_dict()["matrix"]
+    assert pooled.to_dict()["violations"] == serial.to_dict()["violations"]
+    rows = list(csv.reader(io.StringIO(pooled.to_csv())))
+    assert rows[0][:6] == ["repo", "structure:readme", "structure:title", "structure:changelog", "packaging:private", "packaging:license"]
+    assert rows[0][6:] == ["failed", "elapsed_ms", "error"]
+    assert [row[0] for row in rows[1:]] == [str(repo) for repo in repos]
+    assert rows[2][1:7] == ["pass", "fail", "fail", "fail", "fail", "4"]
+
+
+def test_policy_matrix_cli_writes_outputs(tmp_path):
+    repos = _make_repos(tmp_path)
+    policy_file = tmp_path / "structure.json"
+    policy_file.write_text(json.dumps(STRUCTURE.model_dump(mode="json")), encoding="utf-8")
+    json_out = tmp_path / "matrix.json"
+    csv_out = tmp_path / "matrix.csv"
+
+    result = CliRunner().invoke(
+        app,
+        ["policy", "matrix", str(policy_file), "--repo", str(repos[0]), "--repo", str(repos[1]),
+         "--workers", "1", "--json-out", str(json_out), "--csv-out", str(csv_out)],
+    )
+
+    assert result.exit_code == 1
+    assert json.loads(result.output)["failing_cells"] == 2
+    assert json.loads(json_out.read_text())["matrix"][str(repos[0])]["structure:readme"] == "pass"
+    assert len(csv_out.read_text().splitlines()) == 3
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+from aaa.ops.dashboard_history import DashboardHistory, HistoryRetention, downsample
+
+
+def _entry(index: int) -> dict:
+    return {
+        "date": f"day-{index}",
+        "compliance_rate": 1.0 if index % 2 else 0.5,
+        "drift_rate": 0.0,
+        "repo_health": 1.0,
+        "total_repos": index,
+    }
+
+
+def test_append_keeps_history_beyond_export_window(tmp_path: Path) -> None:
+    history = DashboardHistory(tmp_path, HistoryRetention(compact_every=1000))
+    for index in range(120):
+        history.append(_entry(index))
+
+    exported = history.export_window(90)
+
+    assert len(history.entries()) == 120
+    assert [item["date"] for item in exported] == [f"day-{i}" for i in range(30, 120)]
+    metrics = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    trends = json.loads((tmp_path / "trends.json").read_text(encoding="utf-8"))
+    assert len(metrics) == 90
+    assert set(metrics[0]) == {"date", "compliance_rate", "drift_rate", "repo_health"}
+    assert trends[-1] == {"date": "day-119", "compliance_rate": 1.0, "total_repos": 119}
+
+
+def test_tail_reads_across_block_boundaries(tmp_path: Path) -> None:
+    history = DashboardHistory(tmp_path, HistoryRetention(compact_every=10_000))
+    for index in range(2000):
+        history.append(_entry(index))
+
+    assert [item["date"] for item in history.tail(3)] == ["day-1997", "day-1998", "day-1999"]
+    assert len(history.tail(500)) == 500
+    assert history.tail(5000) == history.entries()
+
+
+def test_downsample_averages_old_points_and_keeps_recent_raw() -> None:
+    entries = [_entry(index) for index in range(10)]
+
+    result = downsample(entries, HistoryRetention(raw_points=4, downsample_every=3))
+
+    assert [item.get("samples", 1) for item in result] == [3, 3, 1, 1, 1, 1]
+    assert result[0]["date"] == "day-2"
+    assert result[0]["compliance_rate"] == round((0.5 + 1.0 + 0.5) / 3, 4)
+    assert result[-4:] == entries[-4:]
+
+
+def test_downsample_does_not_resample_merged_points() -> None:
+    retention = HistoryRetention(raw_points=2, downsample_every=2)
+    first = downsample([_entry(index) for index in range(6)], retention)
+    second = downsample(first + [_entry(6), _entry(7)], retention)
+
+    assert [item.get("samples", 1) for item in second] == [2, 2, 2, 1, 1]
+
+
+def test_compaction_applies_retention_periodically(tmp_path: Path) -> None:
+    retention = HistoryRetention(raw_points=5, downsample_every=5, max_points=8, compact_every=10)
+    history = DashboardHistory(tmp_path, retention)
+    for index in range(30):
+        history.append(_entry(index))
+
+    entries = history.entries()
+    assert len(entries) <= 8 + retention.compact_every
+    assert entries[-1]["date"] == "day-29"
+
+
+def test_legacy_exports_seed_history(tmp_path: Path) -> None:
+    (tmp_path / "metrics.json").write_text(
+        json.dumps([{"date": "old", "compliance_rate": 0.7, "drift_rate": 0.1, "repo_health": 0.8}]),
+        encoding="utf-8",
+    )
+    (tmp_path / "trends.json").write_text(
+        json.dumps([{"date": "old", "compliance_rate": 0.7, "total_repos": 4}]),
+        encoding="utf-8",
+    )
+    history = DashboardHistory(tmp_path)
+
+    history.append(_entry(1))
+
+    entries = history.entries()
+    assert entries[0] == {"date": "old", "compliance_rate": 0.7, "drift_rate": 0.1, "repo_health": 0.8, "total_repos": 4}
+    assert entries[1]["date"] == "day-1"
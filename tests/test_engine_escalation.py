@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from aaa.engine.escalation import (
+    EscalationDispatcher,
+    LocalEscalationProvider,
+    ResponseCache,
+    request_key,
+)
+from aaa.engine.semantic import SemanticChecker, SemanticRule
+
+
+def _judge(content, rule):
+    return ("password" not in content, f"judged {rule}")
+
+
+def test_repeat_scan_of_unchanged_files_costs_nothing(tmp_path):
+    contents = ["password = 1", "my password", "clean"]
+    rules = [SemanticRule("No passwords", ["password"])]
+
+    provider = LocalEscalationProvider(judge=_judge)
+    checker = SemanticChecker(escalation=EscalationDispatcher(provider, ResponseCache(tmp_path / "cache.db")))
+    first = checker.check_many(contents, rules)
+    assert first.cost == 2
+    assert [row[0].passed for row in first.results] == [False, False, True]
+
+    # New process: fresh dispatcher over the same on-disk cache
+    provider = LocalEscalationProvider(judge=_judge)
+    checker = SemanticChecker(escalation=EscalationDispatcher(provider, ResponseCache(tmp_path / "cache.db")))
+    second = checker.check_many(contents, rules)
+    assert second.cost == 0
+    assert provider.batches == []
+    assert [row[0].reason for row in second.results] == [row[0].reason for row in first.results]
+
+
+def test_cache_key_covers_rule_content_and_model():
+    base = request_key("m1", "rule", "content")
+
+    assert base == request_key("m1", "rule", "content")
+    assert len({base, request_key("m2", "rule", "content"), request_key("m1", "other", "content"),
+                request_key("m1", "rule", "changed")}) == 4
+
+
+def test_batches_and_deduplicates_within_a_call():
+    provider = LocalEscalationProvider()
+    dispatcher = EscalationDispatcher(provider, ResponseCache(":memory:"), batch_size=2)
+
+    requests = [(f"file {i % 5}", "rule") for i in range(10)]
+    results = dispatcher.escalate(requests)
+
+    assert sorted(provider.batches) == [1, 2, 2]
+    assert sum(result.cost for result in results) == 5
+    assert dispatcher.stats.to_dict() == {
+        "requests": 10, "cache_hits": 0, "deduplicated": 5, "coalesced": 0,
+        "provider_requests": 5, "provider_batches": 3, "cost": 5,
+    }
+
+
+def test_coalesces_identical_in_flight_requests_and_limits_concurrency():
+    release = threading.Event()
+    active = []
+    peak = []
+
+    class SlowProvider(LocalEscalationProvider):
+        def complete_batch(self, requests):
+            active.append(1)
+            peak.append(len(active))
+            release.wait(5)
+            active.pop()
+            return super().complete_batch(requests)
+
+    provider = SlowProvider()
+    dispatcher = EscalationDispatcher(provider, batch_size=1, max_concurrency=2)
+    results = {}
+
+    def run(name, requests):
+        results[name] = dispatcher.escalate(requests)
+
+    leader = threading.Thread(target=run, args=("leader", [("a", "r"), ("b", "r"), ("c", "r")]))
+    leader.start()
+    while len(active) < 2:
+        pass
+    follower = threading.Thread(target=run, args=("follower", [("a", "r"), ("b", "r"), ("c", "r")]))
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert max(peak) == 2
+    assert sum(provider.batches) == 3
+    assert sum(r.cost for r in results["leader"]) == 3
+    assert sum(r.cost for r in results["follower"]) == 0
+    assert dispatcher.stats.coalesced == 3
+
+
+def test_provider_failure_propagates_and_clears_in_flight():
+    class BrokenProvider(LocalEscalationProvider):
+        def complete_batch(self, requests):
+            raise ConnectionError("endpoint down")
+
+    dispatcher = EscalationDispatcher(BrokenProvider())
+    with pytest.raises(ConnectionError):
+        dispatcher.escalate([("a", "r")])
+    assert dispatcher._inflight == {}
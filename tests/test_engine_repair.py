@@ -1,5 +1,7 @@
+import os
 import unittest
 from pathlib import Path
+from unittest import mock
 from tempfile import TemporaryDirectory
 from aaa.engine.repair import AutoFixEngine
 
@@ -66,5 +68,89 @@ class TestAutoFixEngine(unittest.TestCase):
         # Verify rollback
         self.assertEqual(f.read_text(), original)
 
+    def test_apply_fixes_commits_all_files(self):
+        a = self.root / "a.py"
+        b = self.root / "b.txt"
+        a.write_text("x = 1\n", encoding='utf-8')
+        b.write_text("hello", encoding='utf-8')
+        plan = [
+            (a, lambda text: text.replace("1", "2")),
+            (b, str.upper),
+            (a, lambda text: text + "y = 3\n"),
+        ]
+
+        result = self.engine.apply_fixes(plan)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.changed, [a, b])
+        self.assertEqual(a.read_text(), "x = 2\ny = 3\n")
+        self.assertEqual(b.read_text(), "HELLO")
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()), ["a.py", "b.txt"])
+
+    def test_apply_fixes_writes_nothing_if_any_file_fails(self):
+        good = self.root / "good.txt"
+        bad = self.root / "bad.py"
+        good.write_text("keep", encoding='utf-8')
+        bad.write_text("print('hello')", encoding='utf-8')
+
+        result = self.engine.apply_fixes([(good, str.upper), (bad, lambda text: "print(")])
+
+        self.assertFalse(result.success)
+        self.assertEqual(good.read_text(), "keep")
+        self.assertEqual(bad.read_text(), "print('hello')")
+        self.assertIn("syntax errors", result.results[bad].message)
+        self.assertIn("transaction aborted", result.results[good].message)
+        self.assertEqual(result.changed, [])
+
+    def test_apply_fixes_rolls_back_committed_files_on_commit_failure(self):
+        files = [self.root / f"f{i}.txt" for i in range(3)]
+        for f in files:
+            f.write_text("orig", encoding='utf-8')
+        real_replace = os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        with mock.patch("aaa.engine.repair.os.replace", side_effect=flaky_replace):
+            result = self.engine.apply_fixes([(f, lambda text: "new") for f in files])
+
+        self.assertFalse(result.success)
+        self.assertIn("disk full", result.message)
+        self.assertEqual([f.read_text() for f in files], ["orig"] * 3)
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()), ["f0.txt", "f1.txt", "f2.txt"])
+
+    def test_candidate_verified_in_memory(self):
+        f = self.root / "mem.py"
+        f.write_text("a = 1", encoding='utf-8')
+
+        with mock.patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            result = self.engine.apply_fix(f, lambda text: "a = 2")
+
+        self.assertTrue(result.success)
+        self.assertEqual(f.read_bytes(), b"a = 2")
+
+    def test_apply_fixes_merges_spellings_of_one_file(self):
+        f = self.root / "a.txt"
+        f.write_text("x", encoding='utf-8')
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            result = self.engine.apply_fixes([
+                (Path("a.txt"), lambda text: text + "1"),
+                (self.root / "sub" / ".." / "a.txt", lambda text: text + "2"),
+            ])
+            self.assertTrue(result.success)
+            self.assertEqual(list(result.results), [Path("a.txt")])
+            self.assertEqual(f.read_text(), "x12")
+
+            self.assertTrue(self.engine.apply_fix("a.txt", lambda text: text + "3").changed)
+            self.assertEqual(f.read_text(), "x123")
+        finally:
+            os.chdir(cwd)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from aaa.cli import app
+from aaa.engine.revocation import RevocationChecker, SortedIndex, sync_revocations
+
+
+def _write(path, agents):
+    path.write_text(json.dumps({"revoked_agents": agents}), encoding="utf-8")
+
+
+def test_checks_are_in_memory_until_refresh_interval(tmp_path, monkeypatch):
+    path = tmp_path / "revocation.json"
+    _write(path, ["agent-bad"])
+    checker = RevocationChecker(str(path), refresh_interval=3600)
+
+    assert checker.is_revoked("agent-bad")
+    stats = []
+    monkeypatch.setattr(os, "stat", lambda *a, **kw: stats.append(a) or pytest.fail("stat on fast path"))
+    monkeypatch.setattr("builtins.open", lambda *a, **kw: pytest.fail("open on fast path"))
+    assert not checker.is_revoked("agent-good")
+    assert checker.is_revoked("agent-bad")
+
+
+def test_reloads_only_when_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "revocation.json"
+    _write(path, ["a"])
+    checker = RevocationChecker(str(path), refresh_interval=0)
+    assert checker.is_revoked("a")
+
+    loads = []
+    import aaa.engine.revocation as revocation
+    original = revocation.load_revocation_list
+    monkeypatch.setattr(revocation, "load_revocation_list", lambda p: loads.append(p) or original(p))
+    assert checker.is_revoked("a") and not checker.is_revoked("b")
+    assert loads == []
+
+    # Atomic replace gives a new inode even if mtime granularity hides the change
+    replacement = tmp_path / "new.json"
+    _write(replacement, ["b"])
+    os.replace(replacement, path)
+    assert checker.is_revoked("b") and not checker.is_revoked("a")
+    assert len(loads) == 1
+
+    path.write_text("{corrupt", encoding="utf-8")
+    assert checker.is_revoked("b")  # last good list kept
+
+    path.unlink()
+    assert not checker.is_revoked("b")
+
+
+def test_sorted_index_membership(tmp_path):
+    ids = [f"agent-{i:05d}" for i in range(0, 5000, 3)] + ["ünïcode", "z"]
+    path = tmp_path / "revocation.idx"
+    assert SortedIndex.write(str(path), ids + ids[:10]) == len(ids)
+
+    index = SortedIndex(str(path))
+    assert all(agent in index for agent in ids)
+    assert not any(f"agent-{i:05d}" in index for i in range(1, 5000, 3))
+    assert "" not in index and "a" not in index and "zz" not in index
+    index.close()
+
+    SortedIndex.write(str(path), [])
+    assert "x" not in SortedIndex(str(path))
+
+
+def test_sync_merges_sources_atomically(tmp_path):
+    local = tmp_path / ".aaa" / "revocation.json"
+    local.parent.mkdir()
+    local.write_text(json.dumps({"revoked_agents": ["a"], "updated_by": "ops"}), encoding="utf-8")
+    remote_a = tmp_path / "remote_a.json"
+    _write(remote_a, ["b", "a"])
+    remote_b = tmp_path / "remote_b.json"
+    remote_b.write_text(json.dumps(["c"]), encoding="utf-8")
+
+    result = sync_revocations(str(local), [str(remote_a), f"file://{remote_b}"], index_file=str(tmp_path / "r.idx"))
+
+    assert result["total"] == 3 and result["added"] == 2
+    assert json.loads(local.read_text()) == {"revoked_agents": ["a", "b", "c"], "updated_by": "ops"}
+    assert RevocationChecker(str(local), index_file=str(tmp_path / "r.idx")).is_revoked("c")
+
+    before = local.read_text()
+    with pytest.raises(Exception):
+        sync_revocations(str(local), [str(remote_a), str(tmp_path / "missing.json")])
+    assert local.read_text() == before
+    assert sorted(os.listdir(local.parent)) == ["revocation.json"]
+
+
+def test_revocation_cli_sync_and_check(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    remote = tmp_path / "remote.json"
+    _write(remote, ["rogue"])
+    runner = CliRunner()
+
+    assert runner.invoke(app, ["revocation", "sync", str(remote)]).exit_code == 0
+    assert runner.invoke(app, ["revocation", "check", "rogue"]).exit_code == 1
+    assert runner.invoke(app, ["revocation", "check", "friendly"]).exit_code == 0
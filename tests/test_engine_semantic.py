@@ -1,5 +1,6 @@
 import unittest
-from aaa.engine.semantic import SemanticChecker
+from aaa.engine import semantic
+from aaa.engine.semantic import KeywordAutomaton, SemanticChecker, SemanticRule
 
 class TestSemanticChecker(unittest.TestCase):
     def setUp(self):
@@ -32,5 +33,39 @@ class TestSemanticChecker(unittest.TestCase):
         
         self.assertEqual(result.cost, 1)
 
+    def test_automaton_finds_overlapping_keywords(self):
+        automaton = KeywordAutomaton(["he", "she", "his", "hers", "password", "word"])
+        self.assertEqual(automaton.search("ushers"), {0, 1, 3})
+        self.assertEqual(automaton.search("my password"), {4, 5})
+        self.assertEqual(automaton.search("nothing"), set())
+
+    def test_check_many_matches_check(self):
+        contents = ["password = '1234'", "def hello(): pass", "API_TOKEN=abc", ""]
+        rules = [
+            SemanticRule("No passwords", ["password", "secret"]),
+            SemanticRule("No tokens", ["Token"]),
+            SemanticRule("General check"),
+        ]
+        for threshold in (768, 1):
+            with self.subTest(threshold=threshold):
+                original = semantic.AUTOMATON_MIN_KEYWORDS
+                semantic.AUTOMATON_MIN_KEYWORDS = threshold
+                try:
+                    batch = self.checker.check_many(contents, rules)
+                finally:
+                    semantic.AUTOMATON_MIN_KEYWORDS = original
+                for c, content in enumerate(contents):
+                    for r, rule in enumerate(rules):
+                        single = self.checker.check(content, rule.description, keywords=rule.keywords)
+                        self.assertEqual((batch.results[c][r].passed, batch.results[c][r].cost), (single.passed, single.cost))
+                self.assertEqual(batch.escalated, [(0, 0), (0, 2), (1, 2), (2, 1), (2, 2), (3, 2)])
+                self.assertEqual(batch.cost, 6)
+
+    def test_check_many_escalates_as_one_batch(self):
+        calls = []
+        self.checker._escalate_batch = lambda requests: calls.append(requests) or [semantic.SemanticCheckResult(True, "ok", 1) for _ in requests]
+        self.checker.check_many(["a secret", "a password", "clean"], [SemanticRule("No secrets", ["SECRET", "password"])])
+        self.assertEqual(calls, [[("a secret", "No secrets"), ("a password", "No secrets")]])
+
 if __name__ == '__main__':
     unittest.main()
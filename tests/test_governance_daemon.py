@@ -0,0 +1,189 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from aaa import governance_client, governance_daemon
+from aaa.cli import app
+
+
+TOOL_BUNDLE = {
+    "version": "v0.1",
+    "tool_refs": ["ops.registry.inspect", "ops.registry.rebuild"],
+    "command_refs": ["aaa.ops.registry.rebuild"],
+    "binding_mode": "machine_parseable",
+    "allowed_authority_map": {"aaa.ops.registry.rebuild": ["analysis_only", "mutation_repo"]},
+    "evidence_targets": ["registry_snapshot", "artifact_report"],
+}
+
+DISPATCH_FAIL_BUNDLE = {
+    "version": "v0.1",
+    "dispatch_runtime_id": "shared_command_dispatch",
+    "runtime_plane_mode": "command_dispatch",
+    "command_id": "orchestration-debug",
+    "dispatch_entry_ref": "governance.repo-check",
+    "exit_semantics": "fail_open",
+    "family_expansion_allowed": True,
+    "prose_fallback_allowed": True,
+}
+
+
+@pytest.fixture
+def daemon_socket():
+    # AF_UNIX paths are limited to ~100 bytes, so avoid pytest's long tmp_path.
+    socket_dir = tempfile.mkdtemp(prefix="aaa-gov-")
+    socket_path = os.path.join(socket_dir, "d.sock")
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=governance_daemon.serve,
+        args=(socket_path,),
+        kwargs={"on_ready": lambda server: ready.set()},
+        daemon=True,
+    )
+    thread.start()
+    assert ready.wait(5)
+    yield socket_path
+    governance_daemon.control("shutdown", socket_path)
+    thread.join(5)
+    assert not os.path.exists(socket_path)
+    os.rmdir(socket_dir)
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def test_build_request_only_forwards_plain_bundle_commands():
+    request = governance_client.build_request(["governance", "repo-check", "--bundle", "b.json", "--format=json"])
+    assert request["op"] == "validate"
+    assert request["args"] == {"bundle": "b.json"}
+    assert request["format"] == "json"
+
+    dispatch = governance_client.build_request(
+        ["governance", "shared-command-dispatch", "--dispatch-bundle", "d.json", "--command-bundle", "c.json"]
+    )
+    assert dispatch["op"] == "dispatch"
+    assert dispatch["args"] == {"dispatch_bundle": "d.json", "command_bundle": "c.json"}
+
+    assert governance_client.build_request(["governance", "repo-check", "--help"]) is None
+    assert governance_client.build_request(["governance", "repo-check", "--bundle", "a", "--bundle", "b"]) is None
+    assert governance_client.build_request(["governance", "validate-batch", "bundles/"]) is None
+    assert governance_client.build_request(["check", "--bundle", "b.json"]) is None
+
+
+@pytest.mark.parametrize("output_format", ["json", "human"])
+def test_forwarded_output_matches_cli_byte_for_byte(daemon_socket, tmp_path, monkeypatch, capsys, output_format):
+    monkeypatch.chdir(tmp_path)
+    _write_json(tmp_path / "tool.json", TOOL_BUNDLE)
+    _write_json(tmp_path / "bad-tool.json", {**TOOL_BUNDLE, "binding_mode": "prose_only"})
+    _write_json(tmp_path / "dispatch.json", DISPATCH_FAIL_BUNDLE)
+    _write_json(tmp_path / "command.json", {})
+    runs = [
+        ["governance", "validate-tool-command-adoption", "--bundle", "tool.json", "--format", output_format],
+        ["governance", "validate-tool-command-adoption", "--bundle", "bad-tool.json", "--format", output_format],
+        [
+            "governance",
+            "shared-command-dispatch",
+            "--dispatch-bundle",
+            "dispatch.json",
+            "--command-bundle",
+            "command.json",
+            "--format",
+            output_format,
+        ],
+    ]
+
+    for argv in runs:
+        expected = CliRunner().invoke(app, argv)
+        capsys.readouterr()
+        exit_code = governance_client.forward(argv, daemon_socket)
+        assert capsys.readouterr().out == expected.stdout
+        assert exit_code == expected.exit_code
+
+    stats = governance_daemon.control("stats", daemon_socket)["stats"]
+    assert stats["requests"] == 3
+    assert stats["latency_us"]["window"] == 3
+
+
+def test_forward_falls_back_when_daemon_missing_or_request_fails(daemon_socket, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    argv = ["governance", "repo-check", "--bundle", "missing.json"]
+
+    assert governance_client.forward(argv, daemon_socket) is None
+    assert governance_client.forward(argv, str(tmp_path / "absent.sock")) is None
+    monkeypatch.setenv(governance_client.FORWARD_ENV, "0")
+    _write_json(tmp_path / "missing.json", {})
+    assert governance_client.forward(argv, daemon_socket) is None
+
+
+def test_serve_refuses_a_second_daemon_on_the_same_socket(daemon_socket):
+    assert governance_daemon.control("ping", daemon_socket)["ok"] is True
+    with pytest.raises(RuntimeError):
+        governance_daemon.GovernanceServer(daemon_socket)
+
+
+def test_client_refuses_sockets_other_users_could_have_planted(daemon_socket, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _write_json(tmp_path / "tool.json", TOOL_BUNDLE)
+    argv = ["governance", "validate-tool-command-adoption", "--bundle", "tool.json"]
+    assert governance_client.socket_is_trusted(daemon_socket)
+
+    os.chmod(daemon_socket, 0o666)
+    assert governance_client.forward(argv, daemon_socket) is None
+    assert governance_daemon.control("ping", daemon_socket) is None
+    os.chmod(daemon_socket, 0o600)
+
+    os.chmod(os.path.dirname(daemon_socket), 0o777)
+    assert not governance_client.socket_is_trusted(daemon_socket)
+    os.chmod(os.path.dirname(daemon_socket), 0o700)
+
+    (tmp_path / "plain.sock").write_text("", encoding="utf-8")
+    assert not governance_client.socket_is_trusted(str(tmp_path / "plain.sock"))
+    assert governance_client.forward(argv, daemon_socket) == 0
+    capsys.readouterr()
+
+
+def test_default_socket_lives_in_a_private_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv(governance_client.SOCKET_ENV, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert governance_client.default_socket_path() == str(tmp_path / "aaa-governance.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert governance_client.default_socket_path() == str(tmp_path / ".aaa" / "run" / "governance.sock")
+
+
+def test_serve_never_deletes_files_it_does_not_own():
+    socket_dir = tempfile.mkdtemp(prefix="aaa-gov-")
+    try:
+        regular = os.path.join(socket_dir, "file.sock")
+        Path(regular).write_text("keep", encoding="utf-8")
+        with pytest.raises(RuntimeError, match="refusing to replace"):
+            governance_daemon.GovernanceServer(regular)
+        assert Path(regular).read_text(encoding="utf-8") == "keep"
+
+        # A stale socket of our own (nobody listening) is reclaimed.
+        stale_path = os.path.join(socket_dir, "stale.sock")
+        stale = governance_daemon.socket.socket(governance_daemon.socket.AF_UNIX)
+        stale.bind(stale_path)
+        stale.close()
+        server = governance_daemon.GovernanceServer(stale_path)
+        server.server_close()
+        assert not os.path.exists(stale_path)
+
+        if os.getuid() == 0:
+            foreign_path = os.path.join(socket_dir, "foreign.sock")
+            foreign = governance_daemon.socket.socket(governance_daemon.socket.AF_UNIX)
+            foreign.bind(foreign_path)
+            foreign.close()
+            os.chown(foreign_path, 12345, 12345)
+            with pytest.raises(RuntimeError, match="refusing to replace"):
+                governance_daemon.GovernanceServer(foreign_path)
+            assert os.path.exists(foreign_path)
+    finally:
+        for name in os.listdir(socket_dir):
+            os.unlink(os.path.join(socket_dir, name))
+        os.rmdir(socket_dir)
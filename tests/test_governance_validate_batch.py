@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from aaa import governance_batch
+from aaa.cli import app
+
+
+TOOL_BUNDLE = {
+    "version": "v0.1",
+    "tool_refs": ["ops.registry.inspect", "ops.registry.rebuild"],
+    "command_refs": ["aaa.ops.registry.rebuild"],
+    "binding_mode": "machine_parseable",
+    "allowed_authority_map": {"aaa.ops.registry.rebuild": ["analysis_only", "mutation_repo"]},
+    "evidence_targets": ["registry_snapshot", "artifact_report"],
+}
+
+PERMISSION_BUNDLE = {
+    "version": "v0.1",
+    "runtime_plane_mode": "permission_gate",
+    "line_class": "mandatory_core_absorption_line",
+    "permission_context_ref": "internal/development/contracts/ops/tool-contract.v0.1.md",
+    "command_id": "readiness-inspect",
+    "allowed_authority": ["read_only", "analysis_only"],
+    "decision_mode": "allow",
+    "interactive_mode": "prompt_not_required",
+    "non_interactive_mode": "preauthorized_only",
+    "primary_law_creation_allowed": False,
+    "prose_fallback_allowed": False,
+}
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_route_prefers_runtime_plane_mode_over_command_id():
+    assert governance_batch.route_bundle(PERMISSION_BUNDLE) == "permission-gate"
+    assert governance_batch.route_bundle({"command_id": "repo-check"}) == "repo-check"
+    assert governance_batch.route_bundle(TOOL_BUNDLE) == "validate-tool-command-adoption"
+    assert governance_batch.route_bundle({"version": "v0.1"}) is None
+
+
+def test_every_route_targets_a_known_validator():
+    routed = set(governance_batch.PLANE_MODE_ROUTES.values()) | set(governance_batch.COMMAND_ID_ROUTES.values())
+    routed |= {name for _, name in governance_batch.FIELD_ROUTES}
+    assert routed == set(governance_batch.VALIDATORS)
+    for name in governance_batch.VALIDATORS:
+        assert callable(governance_batch.get_validator(name))
+
+
+def test_validate_batch_reads_directories_and_jsonl_streams(tmp_path: Path):
+    _write_json(tmp_path / "bundles" / "a.json", TOOL_BUNDLE)
+    _write_json(tmp_path / "bundles" / "nested" / "b.json", PERMISSION_BUNDLE)
+    (tmp_path / "bundles" / "broken.json").write_text("{", encoding="utf-8")
+    stream = tmp_path / "stream.jsonl"
+    stream.write_text(
+        json.dumps({**PERMISSION_BUNDLE, "prose_fallback_allowed": True}) + "\n\n" + json.dumps({"version": "v0.1"}) + "\n",
+        encoding="utf-8",
+    )
+
+    results = list(governance_batch.validate_batch([str(tmp_path / "bundles"), str(stream)], workers=1))
+
+    by_source = {Path(item["source"]).name: item for item in results}
+    assert by_source["a.json"]["validator"] == "validate-tool-command-adoption"
+    assert by_source["a.json"]["valid"] is True
+    assert by_source["b.json"]["validator"] == "permission-gate"
+    assert by_source["broken.json"]["error_codes"] == ["bundle_load"]
+    assert by_source["stream.jsonl:1"]["error_codes"] == ["prose_fallback_allowed"]
+    assert by_source["stream.jsonl:3"]["error_codes"] == ["unroutable"]
+
+
+def test_validate_batch_process_pool_preserves_input_order(tmp_path: Path):
+    for index in range(12):
+        _write_json(tmp_path / f"bundle-{index:02d}.json", TOOL_BUNDLE if index % 2 else PERMISSION_BUNDLE)
+
+    results = list(governance_batch.validate_batch([str(tmp_path / "bundle-*.json")], workers=2, chunksize=3))
+
+    assert [Path(item["source"]).name for item in results] == [f"bundle-{index:02d}.json" for index in range(12)]
+    assert all(item["valid"] for item in results)
+
+
+def test_cli_validate_batch_streams_results_and_summary(tmp_path: Path):
+    _write_json(tmp_path / "ok.json", TOOL_BUNDLE)
+    _write_json(tmp_path / "bad.json", {**TOOL_BUNDLE, "binding_mode": "prose_only"})
+
+    result = CliRunner().invoke(app, ["governance", "validate-batch", str(tmp_path), "--workers", "1"])
+
+    assert result.exit_code == 2
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["event"] for line in lines] == ["result", "result", "summary"]
+    summary = lines[-1]
+    assert summary["total"] == 2
+    assert summary["invalid_count"] == 1
+    assert summary["by_validator"]["validate-tool-command-adoption"] == {"total": 2, "valid": 1, "invalid": 1}
@@ -0,0 +1,145 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from aaa import outdated
+from aaa.utils import http_cache, version_check
+
+
+class _Registry:
+    """Local stand-in for the registry host: serves one JSON document with ETag/Last-Modified."""
+
+    def __init__(self, payload, use_etag=True):
+        self.payload = payload
+        self.use_etag = use_etag
+        self.version = 1
+        self.requests = []
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                registry.requests.append(dict(self.headers))
+                etag = f'"v{registry.version}"'
+                last_modified = f"Mon, 0{registry.version} Jan 2024 00:00:00 GMT"
+                if registry.use_etag and self.headers.get("If-None-Match") == etag or (
+                    not registry.use_etag and self.headers.get("If-Modified-Since") == last_modified
+                ):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps(registry.payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag" if registry.use_etag else "Last-Modified", etag if registry.use_etag else last_modified)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/registry_index.json"
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        self.thread.start()
+
+    def update(self, payload):
+        self.payload = payload
+        self.version += 1
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def registry():
+    server = _Registry({"components": {"tools": {"latest": "v1.0.0"}}})
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AAA_HTTP_CACHE_DIR", str(tmp_path / "http"))
+    monkeypatch.delenv("AAA_REGISTRY_INDEX_PATH", raising=False)
+    monkeypatch.delenv("AAA_REGISTRY_MAX_AGE", raising=False)
+    return tmp_path / "http"
+
+
+def test_max_age_then_etag_revalidation(registry):
+    first = http_cache.fetch_json(registry.url, max_age=60, now=1000.0)
+    assert first.source == "network" and first.etag == '"v1"'
+
+    cached = http_cache.fetch_json(registry.url, max_age=60, now=1050.0)
+    assert cached.source == "cache" and cached.age(1050.0) == 50.0
+    assert len(registry.requests) == 1
+
+    revalidated = http_cache.fetch_json(registry.url, max_age=60, now=1100.0)
+    assert revalidated.source == "revalidated" and revalidated.payload == first.payload
+    assert registry.requests[-1]["If-None-Match"] == '"v1"'
+    assert http_cache.fetch_json(registry.url, max_age=60, now=1150.0).source == "cache"
+
+    registry.update({"components": {"tools": {"latest": "v2.0.0"}}})
+    changed = http_cache.fetch_json(registry.url, max_age=0, now=1200.0)
+    assert changed.source == "network" and changed.payload["components"]["tools"]["latest"] == "v2.0.0"
+    assert changed.etag == '"v2"'
+
+
+def test_last_modified_revalidation():
+    server = _Registry({"a": 1}, use_etag=False)
+    try:
+        http_cache.fetch_json(server.url, max_age=0)
+        assert http_cache.fetch_json(server.url, max_age=0).source == "revalidated"
+        assert server.requests[-1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert "If-None-Match" not in server.requests[-1]
+    finally:
+        server.stop()
+
+
+def test_offline_serves_stale_and_raises_without_cache(registry):
+    url = registry.url
+    http_cache.fetch_json(url, max_age=60, now=1000.0)
+    registry.stop()
+
+    stale = http_cache.fetch_json(url, max_age=60, now=5000.0, timeout=1)
+    assert stale.source == "stale" and stale.payload == {"components": {"tools": {"latest": "v1.0.0"}}}
+    assert stale.describe(5000.0)["age_seconds"] == 4000.0 and stale.describe()["stale"]
+    with pytest.raises(OSError):
+        http_cache.fetch_json(url + "?other", max_age=60, timeout=1)
+
+
+def test_outdated_report_shows_cache_age_and_staleness(registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("AAA_REGISTRY_INDEX_URL", registry.url)
+    with mock.patch.object(outdated.metadata, "version", return_value="v0.9.0"):
+        fresh = outdated.build_outdated_report(tmp_path)
+        assert fresh["registry"]["source"] == "network"
+        assert outdated.build_outdated_report(tmp_path)["registry"]["source"] == "cache"
+        assert outdated.build_outdated_report(tmp_path, max_age=0)["registry"]["source"] == "revalidated"
+        assert len(registry.requests) == 2
+
+        registry.stop()
+        stale = outdated.build_outdated_report(tmp_path, max_age=0)
+    tools = next(c for c in stale["components"] if c["name"] == "tools")
+    assert tools["status"] == "outdated" and tools["remote_version"] == "v1.0.0"
+    assert stale["registry"]["stale"] is True
+    assert "Registry index is 0s old (offline:" in outdated.render_outdated_report(stale)
+
+    monkeypatch.setenv("AAA_REGISTRY_INDEX_URL", registry.url + "?never-cached")
+    unavailable = outdated.build_outdated_report(tmp_path)
+    assert unavailable["registry"]["source"] == "unavailable"
+    assert "Registry index unavailable" in outdated.render_outdated_report(unavailable)
+
+
+def test_version_check_shares_the_cache(registry, monkeypatch, cache_dir):
+    registry.update({"tag_name": "v9.9.9", "html_url": "https://example.com/release"})
+    monkeypatch.setenv("AAA_UPDATE_SOURCE_URL", registry.url)
+    monkeypatch.delenv("AAA_UPDATE_REMOTE_VERSION", raising=False)
+
+    assert version_check._fetch_remote_version().remote_version == "v9.9.9"
+    assert version_check._fetch_remote_version().remote_version == "v9.9.9"
+    assert len(registry.requests) == 1
+    assert http_cache.cache_path(registry.url).parent == cache_dir
@@ -0,0 +1,172 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from aaa import init_commands
+from aaa.cli import app
+from aaa.init_run_journal import JOURNAL_FILE, JOURNAL_ROOT
+
+
+runner = CliRunner()
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def _repo(name: str) -> dict:
+    return {
+        "name": name,
+        "type": "docs",
+        "template": "aaa-tpl-docs",
+        "description": f"{name} repo",
+        "owners": ["@aaa/architect"],
+        "required_checks": ["lint", "test", "eval"],
+    }
+
+
+def _plan() -> dict:
+    return {
+        "plan_version": "2.0",
+        "aaa": {
+            "org": "ai-asset-architecture",
+            "version_tag": "v2.0.4",
+            "templates": {
+                "docs": "aaa-tpl-docs",
+                "service": "aaa-tpl-service",
+                "frontend": "aaa-tpl-frontend",
+            },
+            "actions_repo": "aaa-actions",
+        },
+        "target": {
+            "project_slug": "demo",
+            "org": "demo",
+            "visibility": "private",
+            "default_branch": "main",
+            "mode": "pr",
+            "github_governance_topology": "repo_local",
+        },
+        "steps": [
+            {"id": "ensure_repos", "type": "github", "description": "ensure repos", "commands": ["aaa init ensure-repos"]},
+            {"id": "branch_protection", "type": "github", "description": "protect", "commands": ["aaa init protect"]},
+            {"id": "open_prs", "type": "github", "description": "open prs", "commands": ["aaa init open-prs"]},
+        ],
+        "reporting": {"output_schema_path": "output.schema.json", "required_fields": ["metadata"]},
+        "default_preset": "repo_local_demo",
+        "presets": {
+            "repo_local_demo": {
+                "github_governance_topology": "repo_local",
+                "repos": [_repo("alpha-docs"), _repo("beta-docs")],
+            }
+        },
+    }
+
+
+class _FakeGh:
+    def __init__(self, fail_pr_for: set[str]):
+        self.fail_pr_for = fail_pr_for
+        self.calls: list[list[str]] = []
+
+    def __call__(self, cmd, cwd=None, input_data=None):
+        self.calls.append(cmd)
+        if cmd[:3] == ["gh", "repo", "view"]:
+            return init_commands.CommandResult(0, json.dumps({"url": f"https://github.com/{cmd[3]}"}), "")
+        if cmd[:3] == ["gh", "pr", "create"]:
+            repo = cmd[cmd.index("--repo") + 1]
+            if repo in self.fail_pr_for:
+                return init_commands.CommandResult(1, "", "boom")
+            return init_commands.CommandResult(0, f"https://github.com/{repo}/pull/1", "")
+        if cmd[:2] == ["gh", "api"] and cmd[2].endswith("/pulls"):
+            return init_commands.CommandResult(0, "[]", "")
+        return init_commands.CommandResult(0, "", "")
+
+    def count(self, prefix: list[str]) -> int:
+        return sum(1 for cmd in self.calls if cmd[: len(prefix)] == prefix)
+
+
+def _setup(tmp_path: Path, monkeypatch, fake: _FakeGh) -> tuple[Path, Path]:
+    plan_path = tmp_path / "plan.json"
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    _write_json(plan_path, _plan())
+    monkeypatch.setenv("WORKSPACE_DIR", str(workspace_dir))
+    monkeypatch.setenv("AAA_CHECKS_MANIFEST", str(tmp_path / "missing-manifest.json"))
+    monkeypatch.setattr(init_commands.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(init_commands, "_tool_version", lambda name: "test")
+    monkeypatch.setattr(init_commands, "_run_command", fake)
+    return plan_path, workspace_dir
+
+
+def _invoke(plan_path: Path, *extra: str):
+    return runner.invoke(app, ["init", "--plan", str(plan_path), "--jsonl", *extra])
+
+
+def test_run_plan_writes_checkpoint_journal(tmp_path: Path, monkeypatch) -> None:
+    fake = _FakeGh(fail_pr_for=set())
+    plan_path, workspace_dir = _setup(tmp_path, monkeypatch, fake)
+
+    result = _invoke(plan_path)
+
+    assert result.exit_code == 0, result.output
+    journals = list((workspace_dir / JOURNAL_ROOT).glob(f"*/{JOURNAL_FILE}"))
+    assert len(journals) == 1
+    entries = [json.loads(line) for line in journals[0].read_text(encoding="utf-8").splitlines()]
+    units = {(entry["step"], entry["repo"]) for entry in entries if entry["kind"] == "unit"}
+    assert ("ensure_repos", "alpha-docs") in units
+    assert ("branch_protection", "beta-docs") in units
+    assert ("open_prs", "beta-docs") in units
+
+
+def test_resume_skips_completed_units_and_rebuilds_report(tmp_path: Path, monkeypatch) -> None:
+    fake = _FakeGh(fail_pr_for={"demo/beta-docs"})
+    plan_path, workspace_dir = _setup(tmp_path, monkeypatch, fake)
+
+    failed = _invoke(plan_path)
+    assert failed.exit_code == init_commands.ERROR_PR_CREATE_FAILED
+
+    fake.fail_pr_for = set()
+    fake.calls.clear()
+    resumed = _invoke(plan_path, "--resume")
+
+    assert resumed.exit_code == 0, resumed.output
+    assert fake.count(["gh", "repo", "view"]) == 0
+    assert fake.count(["gh", "api", "repos/demo/alpha-docs/branches/main/protection"]) == 0
+    pr_creates = [cmd for cmd in fake.calls if cmd[:3] == ["gh", "pr", "create"]]
+    assert [cmd[cmd.index("--repo") + 1] for cmd in pr_creates] == ["demo/beta-docs"]
+
+    events = [json.loads(line) for line in resumed.output.splitlines() if line.startswith("{")]
+    assert any(event["step_id"] == "ensure_repos" and event["data"].get("status") == "resumed" for event in events)
+
+    report = json.loads((workspace_dir / "aaa-init-report.json").read_text(encoding="utf-8"))
+    assert [step["id"] for step in report["steps"]] == ["ensure_repos", "branch_protection", "open_prs"]
+    repos = {repo["name"]: repo for repo in report["repos"]}
+    assert repos["alpha-docs"]["url"] == "https://github.com/demo/alpha-docs"
+    assert repos["alpha-docs"]["pr_url"] == "https://github.com/demo/alpha-docs/pull/1"
+    assert repos["beta-docs"]["pr_url"] == "https://github.com/demo/beta-docs/pull/1"
+
+
+def test_resume_reruns_units_whose_inputs_changed(tmp_path: Path, monkeypatch) -> None:
+    fake = _FakeGh(fail_pr_for=set())
+    plan_path, _workspace_dir = _setup(tmp_path, monkeypatch, fake)
+    assert _invoke(plan_path).exit_code == 0
+
+    plan = _plan()
+    plan["presets"]["repo_local_demo"]["repos"][1]["description"] = "renamed"
+    _write_json(plan_path, plan)
+    fake.calls.clear()
+    resumed = _invoke(plan_path, "--resume")
+
+    assert resumed.exit_code == 0, resumed.output
+    assert [cmd[3] for cmd in fake.calls if cmd[:3] == ["gh", "repo", "view"]] == ["demo/beta-docs"]
+
+
+def test_run_without_resume_starts_fresh_journal(tmp_path: Path, monkeypatch) -> None:
+    fake = _FakeGh(fail_pr_for=set())
+    plan_path, _workspace_dir = _setup(tmp_path, monkeypatch, fake)
+    assert _invoke(plan_path).exit_code == 0
+
+    fake.calls.clear()
+    assert _invoke(plan_path).exit_code == 0
+
+    assert fake.count(["gh", "repo", "view"]) == 2
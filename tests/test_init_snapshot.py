@@ -17,7 +17,7 @@ rules:
     path: README.md
 """
 
-EXPECTED_PY = """# Generated by AAA Governance Compiler v1.3
+EXPECTED_PY = """# Generated by AAA Governance Compiler v1.4
 # Policy: golden-policy (v1.0.0)
 import sys
 from pathlib import Path
@@ -26,37 +26,34 @@ import re
 
 # --- Helper Functions ---
 
-def check_file_exists(path: str) -> bool:
-    return Path(path).exists()
+INVALID = object()
 
-def check_content_contains(path: str, pattern: str) -> bool:
-    p = Path(path)
-    if not p.exists(): return False
-    content = p.read_text(encoding='utf-8')
-    return re.search(pattern, content) is not None
-
-def check_json_match(path: str, key_path: str, expected) -> bool:
-    p = Path(path)
-    if not p.exists(): return False
+def read_json(path: Path, text):
     try:
-        data = json.loads(p.read_text(encoding='utf-8'))
-        keys = key_path.split('.')
-        val = data
-        for k in keys:
-            if isinstance(val, dict): val = val.get(k)
-            else: return False
-        return val == expected
-    except:
-        return False
+        return json.loads(text if text is not None else path.read_text(encoding='utf-8'))
+    except Exception:
+        return INVALID
 
+def json_value(data, keys):
+    value = data
+    for key in keys:
+        if not isinstance(value, dict):
+            return INVALID
+        value = value.get(key)
+    return value
 
 def main():
     violations = []
     print('Running Policy: golden-policy')
+
+    # --- File: README.md ---
+    path = Path('README.md')
+    exists = path.exists()
     # Rule: rule1
-    if not check_file_exists('README.md'):
-        violations.append({'id': 'rule1', 'severity': 'high', 'message': 'File not found: README.md'})
+    if not exists:
+        violations.append((0, {'id': 'rule1', 'severity': 'high', 'message': 'File not found: README.md'}))
 
+    violations = [v for _, v in sorted(violations, key=lambda item: item[0])]
     if violations:
         print('\\n❌ Policy Violations Found:')
         for v in violations:
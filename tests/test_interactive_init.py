@@ -51,7 +51,8 @@ def test_interactive_init(tmp_path):
         
         py_content = py_path.read_text()
         assert "def main():" in py_content
-        assert "check_file_exists('README.md')" in py_content
+        assert "path = Path('README.md')" in py_content
+        assert "if not exists:" in py_content
 
 def test_interactive_init_json_match(tmp_path):
     with patch("aaa.init_commands.typer") as mock_typer:
@@ -75,4 +76,5 @@ def test_interactive_init_json_match(tmp_path):
         py_path = output_dir / "check_json_policy.py"
         assert py_path.exists()
         py_content = py_path.read_text()
-        assert "check_json_match('package.json', 'version', '1.0.0')" in py_content
+        assert "path = Path('package.json')" in py_content
+        assert "if value is INVALID or value != '1.0.0':" in py_content
@@ -0,0 +1,177 @@
+import io
+import json
+import threading
+from pathlib import Path
+
+from aaa import jsonl
+from aaa.jsonl import FileOutput, JsonlEventSink, RotatingFileOutput, StreamOutput, emit_jsonl, use_sink
+from aaa.runbook_runtime import execute_runbook
+from aaa.action_registry import ActionRegistry
+
+
+def _lines(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def test_sink_buffers_until_flush() -> None:
+    stream = io.StringIO()
+    sink = JsonlEventSink([StreamOutput(stream)], max_buffered=10, flush_interval=60)
+
+    sink.emit(event="start", status="start", command="aaa test", step_id="one")
+    assert stream.getvalue() == ""
+
+    sink.flush()
+    events = _lines(stream.getvalue())
+    assert events[0]["step_id"] == "one"
+    assert events[0]["seq"] == 1
+    sink.close()
+
+
+def test_sink_flushes_when_buffer_full() -> None:
+    stream = io.StringIO()
+    sink = JsonlEventSink([StreamOutput(stream)], max_buffered=2, flush_interval=60)
+
+    sink.emit(event="start", status="start", command="aaa test", step_id="one")
+    sink.emit(event="result", status="ok", command="aaa test", step_id="one")
+
+    assert [event["seq"] for event in _lines(stream.getvalue())] == [1, 2]
+    sink.close()
+
+
+def test_sink_timestamps_are_monotonic_with_fixed_clock() -> None:
+    ticks = iter([100.0, 100.5, 101.0])
+    stream = io.StringIO()
+    sink = JsonlEventSink([StreamOutput(stream)], flush_interval=0, clock=lambda: next(ticks))
+
+    sink.emit(event="start", status="start", command="aaa test", step_id="a")
+    sink.emit(event="result", status="ok", command="aaa test", step_id="a")
+
+    first, second = _lines(stream.getvalue())
+    assert first["ts"] < second["ts"]
+    sink.close()
+
+
+def test_sink_keeps_per_step_order_across_threads(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = JsonlEventSink([FileOutput(path)], max_buffered=16, flush_interval=60)
+
+    def worker(step_id: str) -> None:
+        for index in range(200):
+            sink.emit(event="result", status="ok", command="aaa test", step_id=step_id, data={"index": index})
+
+    threads = [threading.Thread(target=worker, args=(f"step-{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.close()
+
+    events = _lines(path.read_text(encoding="utf-8"))
+    assert len(events) == 800
+    for n in range(4):
+        step_events = [event for event in events if event["step_id"] == f"step-{n}"]
+        assert [event["data"]["index"] for event in step_events] == list(range(200))
+        assert [event["seq"] for event in step_events] == list(range(1, 201))
+
+
+def test_rotating_file_output_rolls_over(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = JsonlEventSink([RotatingFileOutput(path, max_bytes=300, backup_count=2)], flush_interval=0)
+
+    for index in range(10):
+        sink.emit(event="result", status="ok", command="aaa test", step_id="rotate", data={"index": index})
+    sink.close()
+
+    assert path.exists()
+    assert (tmp_path / "events.jsonl.1").exists()
+    assert not (tmp_path / "events.jsonl.3").exists()
+    assert path.stat().st_size <= 300
+
+
+def test_use_sink_routes_emit_jsonl(capsys) -> None:
+    stream = io.StringIO()
+    sink = JsonlEventSink([StreamOutput(stream)], flush_interval=60)
+
+    with use_sink(sink):
+        emit_jsonl(True, event="start", status="start", command="aaa init", step_id="run_plan")
+        emit_jsonl(False, event="start", status="start", command="aaa init", step_id="ignored")
+
+    assert capsys.readouterr().out == ""
+    assert [event["step_id"] for event in _lines(stream.getvalue())] == ["run_plan"]
+    sink.close()
+
+
+def test_emit_jsonl_without_sink_prints_legacy_payload(capsys) -> None:
+    emit_jsonl(True, event="start", status="start", command="aaa init", step_id="run_plan")
+
+    payload = json.loads(capsys.readouterr().out)
+    assert "seq" not in payload
+    assert payload["step_id"] == "run_plan"
+
+
+def test_execute_runbook_emits_step_events() -> None:
+    stream = io.StringIO()
+    sink = JsonlEventSink([StreamOutput(stream)], flush_interval=60)
+    registry = ActionRegistry()
+    registry.register("echo", lambda args: {"args": args}, scopes=["notify:send"])
+    runbook = {
+        "contract": {"required_scopes": ["notify:send"]},
+        "steps": [{"name": "say", "action": "echo", "args": ["hi"]}],
+    }
+
+    execute_runbook(runbook, {}, registry=registry, sink=sink)
+    sink.flush()
+
+    events = _lines(stream.getvalue())
+    assert [(event["event"], event["step_id"]) for event in events] == [("start", "say"), ("result", "say")]
+    assert all(event["command"] == "aaa runbook" for event in events)
+    sink.close()
+
+
+def test_live_sinks_are_flushed_at_exit() -> None:
+    stream = io.StringIO()
+    sink = JsonlEventSink([StreamOutput(stream)], flush_interval=60)
+    sink.emit(event="start", status="start", command="aaa test", step_id="exit")
+
+    jsonl._close_live_sinks()
+
+    assert len(_lines(stream.getvalue())) == 1
+
+
+def test_init_jsonl_goes_through_one_buffered_sink(tmp_path: Path) -> None:
+    from typer.testing import CliRunner
+    from aaa.cli import app
+
+    missing = tmp_path / "missing.json"
+    result = CliRunner().invoke(app, ["init", "validate-plan", "--plan", str(missing), "--jsonl"])
+    events = _lines(result.stdout)
+    assert [(event["event"], event["seq"]) for event in events] == [("start", 1), ("error", 2)]
+    assert events[1]["data"] == {"path": str(missing)}
+
+    path = tmp_path / "events.jsonl"
+    result = CliRunner().invoke(app, ["init", "validate-plan", "--plan", str(missing), "--jsonl", "--jsonl-file", str(path)])
+    assert result.stdout == ""
+    assert [event["event"] for event in _lines(path.read_text())] == ["start", "error"]
+    assert jsonl.active_sink() is None
+
+
+def test_runbook_cli_writes_step_events_to_jsonl_file(tmp_path: Path) -> None:
+    from typer.testing import CliRunner
+    from aaa.cli import app
+
+    repo_root = Path(__file__).resolve().parents[1]
+    path = tmp_path / "runbook.jsonl"
+    CliRunner().invoke(
+        app,
+        ["run", "runbook", "--runbook-file", str(repo_root / "runbooks/security/attack-scope.yaml"), "--json", "--jsonl-file", str(path)],
+    )
+    events = _lines(path.read_text())
+    assert [(event["event"], event["step_id"]) for event in events] == [("start", "try-write"), ("error", "try-write")]
+
+
+def test_nested_sessions_share_the_outer_sink() -> None:
+    stream = io.StringIO()
+    outer = JsonlEventSink([StreamOutput(stream)], flush_interval=60)
+    with use_sink(outer), jsonl.jsonl_session(True) as inner:
+        assert inner is outer
+    outer.close()
@@ -4,6 +4,13 @@ from unittest.mock import MagicMock, patch
 from aaa import mcp_server
 from aaa import output_formatter
 
+
+@pytest.fixture(autouse=True)
+def _fresh_result_cache():
+    mcp_server.RESULT_CACHE.clear()
+    yield
+    mcp_server.RESULT_CACHE.clear()
+
 def test_mcp_aaa_check():
     with patch("aaa.check_commands.run_blocking_check") as mock_check:
         mock_check.return_value = {"status": "success", "errors": []}
@@ -34,3 +41,58 @@ def test_llm_formatter_does_not_include_mcp_fields():
     semantic = output_formatter.SemanticResult(status="success", command="check", violations=[])
     text = output_formatter.get_formatter("llm").format(semantic)
     assert "post_init_required" not in text
+
+def test_mcp_aaa_check_reuses_result_for_unchanged_repo(tmp_path):
+    (tmp_path / "README.md").write_text("hello", encoding="utf-8")
+    with patch("aaa.check_commands.run_blocking_check") as mock_check:
+        mock_check.return_value = {"status": "success", "errors": []}
+        mcp_server.aaa_check(str(tmp_path))
+        mcp_server.aaa_check(str(tmp_path))
+        assert mock_check.call_count == 1
+        assert mcp_server.RESULT_CACHE.hits == 1
+
+def test_mcp_aaa_check_reruns_after_file_change(tmp_path):
+    readme = tmp_path / "README.md"
+    readme.write_text("hello", encoding="utf-8")
+    with patch("aaa.check_commands.run_blocking_check") as mock_check:
+        mock_check.return_value = {"status": "success", "errors": []}
+        mcp_server.aaa_check(str(tmp_path))
+        readme.write_text("hello, changed", encoding="utf-8")
+        mcp_server.aaa_check(str(tmp_path))
+        assert mock_check.call_count == 2
+
+def test_repo_fingerprint_ignores_git_internals(tmp_path):
+    (tmp_path / "README.md").write_text("hello", encoding="utf-8")
+    before = mcp_server.repo_fingerprint(tmp_path)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "index").write_text("x", encoding="utf-8")
+    assert mcp_server.repo_fingerprint(tmp_path) == before
+    (tmp_path / "new.txt").write_text("y", encoding="utf-8")
+    assert mcp_server.repo_fingerprint(tmp_path) != before
+
+def test_mcp_aaa_check_status_returns_last_known_result(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    (tmp_path / "README.md").write_text("hello", encoding="utf-8")
+    executor = ThreadPoolExecutor(max_workers=1)
+    with patch("aaa.check_commands.run_blocking_check") as mock_check, patch.object(mcp_server, "_EXECUTOR", executor):
+        mock_check.return_value = {"status": "success", "errors": []}
+        pending = mcp_server.aaa_check_status(str(tmp_path))
+        assert pending["status"] == "pending"
+        mcp_server.RESULT_CACHE.refresh_in_background("check", tmp_path.resolve(), mcp_server._run_check).result()
+        cached = mcp_server.aaa_check_status(str(tmp_path))
+        executor.shutdown(wait=True)
+        assert mock_check.call_count == 1
+        assert cached["status"] == "cached"
+        assert cached["freshness"]["stale"] is False
+        assert cached["freshness"]["age_seconds"] >= 0
+        assert "post_init_required" in cached
+
+def test_mcp_tools_run_in_background_executor(tmp_path):
+    import asyncio
+
+    (tmp_path / "README.md").write_text("hello", encoding="utf-8")
+    with patch("aaa.check_commands.run_blocking_check") as mock_check:
+        mock_check.return_value = {"status": "success", "errors": []}
+        result = asyncio.run(mcp_server.aaa_check_tool(str(tmp_path)))
+        assert "post_init_required" in result
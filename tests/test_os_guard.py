@@ -0,0 +1,162 @@
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from aaa.court.schema import Ruling
+from aaa.observability.custom_metrics import MetricStore
+from aaa.os.guard import STAGES, GuardPipeline, payload_digest
+from aaa.os.kernel import AgentKernel
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / ".aaa").mkdir()
+    (tmp_path / ".aaa" / "registry_index.json").write_text(
+        json.dumps({"packs": {"core": {"capabilities": ["fs_write", "notify"]}}}), encoding="utf-8"
+    )
+    (tmp_path / "src").mkdir()
+    return tmp_path
+
+
+def test_each_stage_can_deny(workspace):
+    kernel = AgentKernel(workspace)
+    guard = GuardPipeline(kernel, workers=1)
+
+    assert guard.check("alice", "notify", {"message": "hi"}).allowed
+    assert guard.check("alice", "deploy", {}).reasons == ["semantic: action 'deploy' is not a registered capability"]
+    assert not guard.check("alice", "fs_write", {"path": "../escape.txt"}).stages["scope"]
+
+    (workspace / ".aaa" / "revocation.json").write_text(json.dumps(["mallory"]), encoding="utf-8")
+    assert not guard.check("mallory", "notify", {}).stages["revocation"]
+
+    with kernel.locker.lock("src/a.py", "bob"):
+        decision = guard.check("alice", "fs_write", {"path": "src/a.py"})
+        assert decision.stages == {**{stage: True for stage in STAGES}, "locks": False}
+        assert guard.check("bob", "fs_write", {"path": "src/a.py"}).allowed
+
+    case_id = kernel.clerk.file_case("ops", {"action": "notify", "agent_id": "alice"})
+    assert guard.check("alice", "notify", {}).allowed
+    kernel.clerk.apply_ruling(case_id, Ruling.DENY, "no", "judge")
+    assert not guard.check("alice", "notify", {}).stages["constitution"]
+    assert guard.check("bob", "notify", {}).allowed
+
+
+def test_missing_registry_fails_closed(tmp_path):
+    decision = GuardPipeline(AgentKernel(tmp_path), workers=1).check("alice", "notify", {})
+    assert not decision.allowed
+    assert decision.reasons[0].startswith("semantic: RegistryClientError")
+
+
+def test_decisions_are_cached_until_state_changes(workspace, monkeypatch):
+    kernel = AgentKernel(workspace)
+    guard = GuardPipeline(kernel, workers=1)
+    evaluations = []
+    original = guard._evaluate
+    monkeypatch.setattr(guard, "_evaluate", lambda *a: evaluations.append(a) or original(*a))
+
+    first = guard.check("alice", "notify", {"message": "hi", "level": 1})
+    again = guard.check("alice", "notify", {"level": 1, "message": "hi"})
+    assert first.allowed and not first.cached and again.cached
+    assert len(evaluations) == 1 and guard.stats["cache_hits"] == 1
+    assert payload_digest({"a": 1, "b": 2}) == payload_digest({"b": 2, "a": 1})
+
+    guard.check("bob", "notify", {"message": "hi", "level": 1})
+    assert len(evaluations) == 2
+
+    (workspace / ".aaa" / "revocation.json").write_text(json.dumps(["alice"]), encoding="utf-8")
+    assert not guard.check("alice", "notify", {"message": "hi", "level": 1}).allowed
+    assert len(evaluations) == 3 and guard.stats["invalidations"] == 1
+
+    kernel.clerk.file_case("ops", {"action": "other"})
+    guard.check("alice", "notify", {"message": "hi", "level": 1})
+    assert len(evaluations) == 4
+
+    expiring = GuardPipeline(kernel, workers=1, ttl=0)
+    expiring.check("alice", "notify", {})
+    assert not expiring.check("alice", "notify", {}).cached
+
+
+def test_stages_run_concurrently(workspace, monkeypatch):
+    guard = GuardPipeline(AgentKernel(workspace))
+    barrier = threading.Barrier(len(STAGES), timeout=5)
+    for stage in STAGES:
+        monkeypatch.setattr(guard, f"_check_{stage}", lambda *a: barrier.wait() and None)
+
+    assert guard.check("alice", "notify", {}).allowed
+    guard.close()
+
+
+def test_stage_latencies_are_flushed_to_metric_store(workspace):
+    store = MetricStore(db_path=workspace / "metrics.db")
+    guard = GuardPipeline(AgentKernel(workspace), metrics=store, flush_interval=3600)
+    for _ in range(3):
+        guard.check("alice", "notify", {})
+    guard.close()
+
+    conn = sqlite3.connect(workspace / "metrics.db")
+    rows = conn.execute("SELECT value, tags FROM metrics WHERE metric_name = 'guard.latency_ms.count'").fetchall()
+    conn.close()
+    counts = {json.loads(tags)["stage"]: value for value, tags in rows}
+    assert counts == {**{stage: 1.0 for stage in STAGES}, "total": 3.0}
+    assert all(h.count == 0 for h in guard.histograms.values())
+
+
+def test_kernel_run_safe_action_uses_guard(workspace):
+    kernel = AgentKernel(workspace)
+    assert kernel.run_safe_action("notify", {"message": "hi"})["status"] == "executed"
+    result = kernel.run_safe_action("fs_write", {"path": "/etc/passwd"}, agent_id="alice")
+    assert result["status"] == "denied"
+    assert result["reasons"][0].startswith("scope:")
+    assert kernel.boot()["boot_report"]["subsystems"]["guard"]["state"] == "ready"
+
+
+def test_directory_swapped_for_symlink_is_denied(workspace, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside")
+    (workspace / "sub").mkdir()
+    kernel = AgentKernel(workspace)
+    assert kernel.run_safe_action("fs_write", {"path": "sub/a"})["status"] == "executed"
+    assert kernel.guard.check("alice", "fs_write", {"path": "sub/b"}).allowed
+
+    (workspace / "sub").rmdir()
+    (workspace / "sub").symlink_to(outside, target_is_directory=True)
+    result = kernel.run_safe_action("fs_write", {"path": "sub/b"})
+    assert result["status"] == "denied" and result["reasons"][0].startswith("scope: outside workspace")
+    cached = kernel.guard.check("alice", "fs_write", {"path": "sub/b"})
+    assert cached.cached and not cached.allowed and not cached.stages["scope"]
+
+
+def _metric_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT tags, value FROM metrics WHERE metric_name = 'guard.latency_ms.count'").fetchall()
+    conn.close()
+    totals = {}
+    for tags, value in rows:
+        stage = json.loads(tags)["stage"]
+        totals[stage] = totals.get(stage, 0.0) + value
+    return totals
+
+
+def test_kernel_persists_guard_latencies(workspace):
+    with AgentKernel(workspace) as kernel:
+        for _ in range(50):
+            assert kernel.run_safe_action("notify", {"message": "hi"})["status"] == "executed"
+    assert _metric_rows(workspace / ".aaa" / "observability.db") == {**{stage: 1.0 for stage in STAGES}, "total": 50.0}
+
+
+def test_cache_hits_flush_and_exit_hook_flushes(workspace):
+    from aaa.os import guard as guard_module
+
+    store = MetricStore(db_path=workspace / "metrics.db")
+    guard = GuardPipeline(AgentKernel(workspace), workers=1, metrics=store, flush_interval=0)
+    guard.check("alice", "notify", {})
+    guard.check("alice", "notify", {})
+
+    assert _metric_rows(workspace / "metrics.db")["total"] == 2.0  # the cache hit flushed its own sample
+
+    guard.flush_interval = 3600
+    guard.check("alice", "notify", {})
+    assert _metric_rows(workspace / "metrics.db")["total"] == 2.0
+    guard_module._close_live_guards()
+    assert _metric_rows(workspace / "metrics.db")["total"] == 3.0
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from aaa.action_registry import RuntimeSecurityError
+from aaa.policy.scope import ScopeEnforcer
+from aaa.runbook_runtime import _resolve_safe_path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "repo" / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "repo" / "docs").mkdir()
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "secret.txt").write_text("s", encoding="utf-8")
+    (tmp_path / "repo" / "escape").symlink_to(tmp_path / "outside")
+    (tmp_path / "repo" / "src" / "leak.txt").symlink_to(tmp_path / "outside" / "secret.txt")
+    return tmp_path
+
+
+def test_allows_roots_and_descendants_only(tree):
+    scope = ScopeEnforcer([str(tree / "repo" / "src"), str(tree / "repo" / "docs")])
+
+    assert scope.is_allowed(str(tree / "repo" / "src"))
+    assert scope.is_allowed(str(tree / "repo" / "src" / "pkg" / "new_file.py"))
+    assert scope.is_allowed(str(tree / "repo" / "docs" / "a.md"))
+    assert not scope.is_allowed(str(tree / "repo" / "srcfoo" / "a.py"))
+    assert not scope.is_allowed(str(tree / "repo" / "README.md"))
+    assert not scope.is_allowed(str(tree / "repo" / "src" / ".." / "README.md"))
+
+
+def test_symlinks_are_resolved(tree):
+    scope = ScopeEnforcer([str(tree / "repo")])
+
+    assert not scope.is_allowed(str(tree / "repo" / "escape" / "secret.txt"))
+    assert not scope.is_allowed(str(tree / "repo" / "src" / "leak.txt"))
+    # ".." after a symlinked directory follows the link target, as the OS does
+    assert not scope.is_allowed(str(tree / "repo" / "escape" / ".." / "outside" / "secret.txt"))
+    assert ScopeEnforcer([str(tree / "repo" / "escape")]).is_allowed(str(tree / "outside" / "secret.txt"))
+
+
+def test_is_allowed_many_matches_is_allowed_and_caches_directories(tree, monkeypatch):
+    scope = ScopeEnforcer([str(tree / "repo" / "src")], cache_size=2)
+    targets = [str(tree / "repo" / d / f"f{i}.py") for i in range(50) for d in ("src", "src/pkg", "docs")]
+
+    expected = [ScopeEnforcer([str(tree / "repo" / "src")]).is_allowed(t) for t in targets]
+    roomy = ScopeEnforcer([str(tree / "repo" / "src")])
+    calls = []
+    real = os.path.realpath
+    monkeypatch.setattr(os.path, "realpath", lambda p, **kw: calls.append(p) or real(p, **kw))
+
+    batch = scope.is_allowed_many(targets)
+    assert batch == expected
+    assert batch.count(True) == 100
+    # cache_size=2 with three rotating directories: every lookup misses
+    assert len(calls) == len(targets)
+
+    calls.clear()
+    assert roomy.is_allowed_many(targets) == expected
+    assert len(calls) == 3
+
+
+def test_relative_targets_and_filesystem_root(tree, monkeypatch):
+    monkeypatch.chdir(tree / "repo")
+    scope = ScopeEnforcer(["src"])
+
+    assert scope.is_allowed("src/pkg/x.py")
+    assert not scope.is_allowed("docs/x.md")
+    assert ScopeEnforcer([os.sep]).is_allowed("/etc/passwd")
+
+
+def test_runbook_safe_path_uses_scope_engine(tree, monkeypatch):
+    monkeypatch.chdir(tree / "repo")
+
+    assert _resolve_safe_path("src/pkg/x.py") == tree / "repo" / "src" / "pkg" / "x.py"
+    for escape in ("escape/secret.txt", "src/leak.txt", "../outside/secret.txt"):
+        with pytest.raises(RuntimeSecurityError):
+            _resolve_safe_path(escape)
@@ -55,3 +55,59 @@ def test_version_not_found(mock_registry):
     client = RegistryClient(f"file://{mock_registry}")
     with pytest.raises(RegistryClientError, match="Version '9.9.9' not found"):
         client.get_policy_url("test", "9.9.9")
+
+def test_download_reuses_content_addressed_store(mock_registry, tmp_path, monkeypatch):
+    client = RegistryClient(f"file://{mock_registry}", cache_dir=tmp_path / "cache")
+    first = client.download_policy("test", "1.0.0")
+    assert first.parent == tmp_path / "cache" / "sha256"
+
+    # Source gone and manifest unchanged: a store hit only re-hashes the stored copy
+    (mock_registry / "policies" / "test" / "1.0.0" / "check_test.py").unlink()
+    real_read_bytes = Path.read_bytes
+    monkeypatch.setattr(
+        Path, "read_bytes", lambda self: real_read_bytes(self) if self.parent == first.parent else pytest.fail("re-read script")
+    )
+    again = RegistryClient(f"file://{mock_registry}", cache_dir=tmp_path / "cache")
+    assert again.download_policy("test") == first
+
+def test_corrupted_store_entry_is_refetched(mock_registry, tmp_path):
+    client = RegistryClient(f"file://{mock_registry}", cache_dir=tmp_path / "cache")
+    stored = client.download_policy("test", "1.0.0")
+    stored.write_text("print('swapped')", encoding="utf-8")
+
+    assert client.download_policy("test", "1.0.0") == stored
+    assert stored.read_text() == "print('ok')"
+
+    stored.write_text("print('swapped')", encoding="utf-8")
+    (mock_registry / "policies" / "test" / "1.0.0" / "check_test.py").unlink()
+    with pytest.raises(RegistryClientError, match="Remote file not found"):
+        client.download_policy("test", "1.0.0")
+    assert not stored.exists()
+
+def test_manifest_memoized_until_file_changes(mock_registry):
+    client = RegistryClient(f"file://{mock_registry}")
+    first = client.fetch_manifest()
+    assert client.fetch_manifest() is first
+
+    manifest = mock_registry / "policies.json"
+    manifest.write_text(manifest.read_text(encoding="utf-8") + " ", encoding="utf-8")
+    assert client.fetch_manifest() is not first
+
+def test_prefetch_reports_each_spec(mock_registry, tmp_path):
+    client = RegistryClient(f"file://{mock_registry}", cache_dir=tmp_path)
+    results = client.prefetch(["test@1.0.0", "missing"], workers=2)
+
+    assert [r["status"] for r in results] == ["fetched", "error"]
+    assert results[1]["error"] == "Policy 'missing' not found"
+    assert client.prefetch(["test"])[0] == {**results[0], "spec": "test", "status": "cached"}
+
+def test_policy_prefetch_cli(mock_registry, tmp_path):
+    from typer.testing import CliRunner
+    from aaa.cli import app
+
+    args = ["policy", "prefetch", "--all", "--registry", f"file://{mock_registry}", "--cache-dir", str(tmp_path)]
+    result = CliRunner().invoke(app, args)
+
+    assert result.exit_code == 0
+    assert "test@1.0.0" in result.output
+    assert len(list((tmp_path / "sha256").glob("*.py"))) == 1
@@ -137,6 +137,103 @@ class TestRenderDashboard(unittest.TestCase):
         self.assertTrue(md_path.exists())
         self.assertTrue(html_path.exists())
 
+    def _large_payload(self):
+        repos = []
+        for index in range(40):
+            checks = [
+                {"id": "readme", "status": "pass"},
+                {"id": "orphaned_assets", "status": "fail" if index % 3 == 0 else "pass"},
+                {"id": "workflow", "status": "error" if index % 5 == 0 else "pass"},
+            ]
+            repos.append(
+                {"name": f"repo-{index}", "repo_type": "docs", "archived": index % 7 == 0, "checks": checks}
+            )
+        return {"repos": repos, "generated_at": "2026-01-24", "score": 12345}
+
+    def test_aggregator_matches_two_pass_computation(self):
+        from aaa.ops import render_dashboard
+
+        payload = self._large_payload()
+        rate, rows, summary = render_dashboard.compute_compliance(payload)
+        metrics = render_dashboard.compute_metrics(payload)
+        aggregator = render_dashboard.DashboardAggregator()
+        for repo in payload["repos"]:
+            aggregator.add(repo)
+
+        self.assertAlmostEqual(aggregator.compliance_rate, rate)
+        self.assertEqual(aggregator.summary(), summary)
+        self.assertEqual(aggregator.metrics(), metrics)
+        self.assertEqual(aggregator.failing, render_dashboard._build_failing_list(rows))
+
+    def test_iter_audit_repos_streams_across_small_chunks(self):
+        import json
+        import tempfile
+        from pathlib import Path
+        from aaa.ops.render_dashboard import iter_audit_repos
+
+        payload = self._large_payload()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "audit.json"
+            path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            meta = {}
+            repos = list(iter_audit_repos(path, meta, chunk_size=7))
+
+        self.assertEqual(repos, payload["repos"])
+        self.assertEqual(meta, {"generated_at": "2026-01-24", "score": 12345})
+
+    def test_streaming_render_matches_in_memory_render(self):
+        import json
+        import tempfile
+        from pathlib import Path
+        from aaa.ops import render_dashboard
+
+        payload = self._large_payload()
+        thresholds = {"compliance": 0.8, "drift": 0.05, "health": 0.9}
+        rate, rows, summary = render_dashboard.compute_compliance(payload)
+        metrics = render_dashboard.compute_metrics(payload)
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            input_path = tmp_dir / "audit.json"
+            input_path.write_text(json.dumps(payload), encoding="utf-8")
+            render_dashboard.render_dashboard(
+                str(input_path), str(tmp_dir / "out.md"), str(tmp_dir / "index.html"), thresholds, page_size=10
+            )
+            md = (tmp_dir / "out.md").read_text(encoding="utf-8")
+            html = (tmp_dir / "index.html").read_text(encoding="utf-8")
+
+        self.assertEqual(md, render_dashboard.render_markdown("2026-01-24", rate, rows, summary, metrics))
+        self.assertEqual(
+            html,
+            render_dashboard.render_html("2026-01-24", rate, rows, summary, metrics, thresholds, page_size=10),
+        )
+        self.assertEqual(html.count("<tr hidden>"), 30)
+        self.assertIn('data-page-size="10"', html)
+
+    def test_invalid_status_is_rejected_before_writing(self):
+        import json
+        import tempfile
+        from pathlib import Path
+        from aaa.ops import render_dashboard
+
+        payload = {"repos": [{"name": "a", "checks": [{"id": "x", "status": "bogus"}]}]}
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            input_path = tmp_dir / "audit.json"
+            input_path.write_text(json.dumps(payload), encoding="utf-8")
+            with self.assertRaises(ValueError):
+                render_dashboard.render_dashboard(str(input_path), str(tmp_dir / "out.md"), str(tmp_dir / "index.html"))
+            self.assertFalse((tmp_dir / "index.html").exists())
+
+    def test_templates_are_compiled_once(self):
+        from aaa.ops import render_dashboard
+
+        render_dashboard._compile_template.cache_clear()
+        render_dashboard._render_template("dashboard.md.tmpl", date="a")
+        render_dashboard._render_template("dashboard.md.tmpl", date="b")
+        info = render_dashboard._compile_template.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,21 @@
+from aaa.trust.capability import ADMIN_PACK, DEFAULT_PACK, Capability, CapabilityPack, ScopeInterner
+
+
+def test_packs_are_bitmasks():
+    assert DEFAULT_PACK.has(Capability.FS_READ)
+    assert not DEFAULT_PACK.has(Capability.FS_WRITE)
+    assert all(ADMIN_PACK.has(cap) for cap in Capability)
+    assert ADMIN_PACK.has_all(DEFAULT_PACK.mask)
+    assert not DEFAULT_PACK.has_all(ADMIN_PACK.mask)
+    assert DEFAULT_PACK.has_any(Capability.GOV_AUDIT.bit | Capability.GOV_RELEASE.bit)
+    assert CapabilityPack.from_mask("copy", DEFAULT_PACK.mask).capabilities == DEFAULT_PACK.capabilities
+
+
+def test_scope_interner():
+    scopes = ScopeInterner(["fs:read"])
+    write = scopes.bit("fs:write")
+    assert scopes.bit("fs:write") == write and len(scopes) == 2
+    assert scopes.mask(["fs:read", "fs:write"]) == 0b11
+    assert scopes.mask(["fs:read", "net:send"], intern=False) == 0b01
+    assert "net:send" not in scopes
+    assert scopes.names(0b10) == ["fs:write"]
@@ -0,0 +1,81 @@
+import hashlib
+import hmac
+import io
+
+import pytest
+
+import aaa.trust.identity as identity_module
+from aaa.trust.identity import AgentIdentity, message_digest
+
+
+def test_signature_is_hmac_bound_to_agent_and_key():
+    alice = AgentIdentity("alice", "k1")
+    sig = alice.sign("hello")
+
+    expected = hmac.new(b"k1", b"aaa-identity-v2\0alice\0" + hashlib.sha256(b"hello").digest(), hashlib.sha256).hexdigest()
+    assert sig == expected
+    assert alice.verify("hello", sig)
+    assert not alice.verify("hello!", sig)
+    assert not AgentIdentity("bob", "k1").verify("hello", sig)
+    assert not AgentIdentity("alice", "k2").verify("hello", sig)
+    assert not alice.verify("hello", sig.upper())
+    assert not alice.verify("hello", None)
+
+
+def test_streaming_inputs_sign_like_the_whole_message(tmp_path):
+    identity = AgentIdentity("agent", "secret")
+    payload = b"line\n" * 500_000
+    path = tmp_path / "ledger.jsonl"
+    path.write_bytes(payload)
+
+    sig = identity.sign(payload)
+    assert identity.sign(payload.decode("utf-8")) == sig
+    assert identity.sign(path) == sig
+    assert identity.sign(io.BytesIO(payload)) == sig
+    assert identity.sign(payload[i:i + 4096] for i in range(0, len(payload), 4096)) == sig
+    with open(path, "rb") as f:
+        assert identity.verify(f, sig)
+
+
+def test_verified_pairs_are_cached(monkeypatch):
+    identity = AgentIdentity("agent", "secret", cache_size=2)
+    sigs = {m: identity.sign(m) for m in ("a", "b", "c")}
+
+    macs = []
+    original = identity.sign_digest
+    monkeypatch.setattr(identity, "sign_digest", lambda d: macs.append(d) or original(d))
+    assert identity.verify("a", sigs["a"]) and identity.verify("a", sigs["a"])
+    assert len(macs) == 1 and identity.cache_hits == 1
+
+    # failures are never cached
+    assert not identity.verify("a", sigs["b"]) and not identity.verify("a", sigs["b"])
+    assert len(macs) == 3
+
+    identity.verify("b", sigs["b"])
+    identity.verify("c", sigs["c"])  # evicts "a"
+    macs.clear()
+    identity.verify("a", sigs["a"])
+    assert len(macs) == 1
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_verify_many_preserves_order(workers):
+    identity = AgentIdentity("agent", "secret")
+    messages = [f"entry-{i}" * 100 for i in range(200)]
+    items = [(m, identity.sign(m)) for m in messages]
+    items[17] = (messages[17], identity.sign("tampered"))
+    items[150] = (messages[150] + "x", items[150][1])
+
+    fresh = AgentIdentity("agent", "secret")
+    results = fresh.verify_many(items, workers=workers)
+    assert results == [i not in (17, 150) for i in range(200)]
+
+
+def test_verify_many_hashes_each_message_once(monkeypatch):
+    identity = AgentIdentity("agent", "secret")
+    items = [(f"m{i}", identity.sign(f"m{i}")) for i in range(10)]
+    calls = []
+    monkeypatch.setattr(identity_module, "message_digest", lambda m: calls.append(m) or message_digest(m))
+
+    assert all(identity.verify_many(items, workers=3))
+    assert sorted(calls) == sorted(m for m, _ in items)
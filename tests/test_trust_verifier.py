@@ -1,4 +1,8 @@
+import json
+import os
+
 import pytest
+from aaa.trust.merkle import MerkleBuilder, verify_proof
 from aaa.trust.verifier import TrustVerifier
 
 @pytest.fixture
@@ -18,3 +22,69 @@ def test_get_certification_status(verifier, tmp_path):
     
     status = verifier.get_certification_status(workspace)
     assert status["tier"] == "Bronze"
+
+def _repo(root):
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "README.md").write_text("# repo\n", encoding="utf-8")
+    (root / "src" / "pkg" / "a.py").write_text("a = 1\n", encoding="utf-8")
+    (root / "src" / "pkg" / "b.py").write_text("b = 2\n", encoding="utf-8")
+    (root / "docs" / "guide.md").write_text("guide\n", encoding="utf-8")
+    return root
+
+def _age(root, seconds=60):
+    paths = [root] if root.is_file() else [p for p in root.rglob("*") if p.is_file()]
+    for path in paths:
+        stamp = path.stat().st_mtime - seconds
+        os.utime(path, (stamp, stamp))
+
+def test_merkle_root_is_content_addressed(tmp_path):
+    repo = _repo(tmp_path / "repo")
+    copy = _repo(tmp_path / "copy")
+    store = tmp_path / "store"
+    store.mkdir()
+    verifier = TrustVerifier(trust_store=store)
+
+    root = verifier.merkle_root(repo)
+    assert root == verifier.merkle_root(copy)
+    assert verifier.verify_repo(str(repo), f"sha256:{root}")
+    (copy / "docs" / "guide.md").write_text("changed\n", encoding="utf-8")
+    assert not verifier.verify_repo(str(copy), root)
+
+def test_incremental_rebuild_rehashes_only_changed_paths(tmp_path):
+    repo = _repo(tmp_path / "repo")
+    _age(repo)
+    builder = MerkleBuilder(cache_file=tmp_path / "cache.json")
+    cold = builder.build(repo)
+    assert builder.last_stats["hashed_files"] == 4
+
+    warm = builder.build(repo)
+    assert warm.root == cold.root
+    assert builder.last_stats["hashed_files"] == 0 and builder.last_stats["hashed_dirs"] == 0
+
+    (repo / "src" / "pkg" / "a.py").write_text("a = 10\n", encoding="utf-8")
+    _age(repo / "src" / "pkg" / "a.py")
+    changed = builder.build(repo)
+    assert builder.last_stats["hashed_files"] == 1
+    assert builder.last_stats["hashed_dirs"] == 3  # src/pkg, src, root
+    assert changed.dirs["docs"] == cold.dirs["docs"]
+    assert changed.root == MerkleBuilder().build(repo).root != cold.root
+
+    (repo / "docs" / "guide.md").unlink()
+    assert builder.build(repo).root == MerkleBuilder().build(repo).root
+
+def test_inclusion_proofs(tmp_path):
+    repo = _repo(tmp_path / "repo")
+    verifier = TrustVerifier(trust_store=tmp_path)
+    tree = verifier.build_tree(repo)
+
+    proof = verifier.inclusion_proof(repo, "src/pkg/a.py")
+    assert [level["dir"] for level in proof["levels"]] == ["src/pkg", "src", ""]
+    assert verifier.verify_inclusion(proof, tree.root, content=b"a = 1\n")
+    assert not verifier.verify_inclusion(proof, tree.root, content=b"a = 2\n")
+    assert verifier.verify_inclusion(tree.proof("README.md"), tree.root)
+
+    forged = json.loads(json.dumps(proof))
+    forged["digest"] = "0" * 64
+    assert not verify_proof(forged, tree.root)
+    assert not verify_proof(proof, "f" * 64)
@@ -0,0 +1,108 @@
+from aaa import runtime_adoption_readiness_inspect
+from aaa.validation_memo import DEFAULT_MAXSIZE, MEMO, ValidationMemo, content_key, derivation_inputs
+
+
+READINESS_BUNDLE = {
+    "version": "v0.1",
+    "command_id": "readiness-inspect",
+    "binding_mode": "machine_parseable",
+    "target_scope": "repo_or_worktree",
+    "target_kind": "legal_worktree_instance",
+    "target_path": "/repo/aaa-tpl-docs/.worktrees/v2-1-5-readiness",
+    "allowed_authority": [
+        "read_only",
+        "analysis_only",
+    ],
+    "tool_chain_refs": [
+        "governance.validate-tool-command-adoption",
+        "governance.validate-multi-repo-worktree-identity",
+        "governance.validate-context-runtime-preflight",
+        "governance.validate-session-readiness-state",
+    ],
+    "current_truth_sources": [
+        "canonical_contract_docs",
+        "canonical_registries_indexes",
+        "repo_tracked_files",
+    ],
+    "supporting_sources": [
+        "external_execution_outputs",
+        "generated_runtime_summaries",
+    ],
+    "preflight_checks": [
+        "current_truth_source_check",
+        "supporting_source_check",
+        "anti_contamination_check",
+        "promotion_block_check",
+    ],
+    "readiness_surface": "gate_status_surface",
+    "readiness_checks": [
+        "context_loaded",
+        "authority_resolved",
+        "preflight_passed",
+        "evidence_path_bound",
+    ],
+    "expected_output_artifact": "readiness_state_report",
+    "prose_fallback_allowed": False,
+}
+
+
+def test_content_key_is_canonical_and_scoped_by_name():
+    assert content_key("v", {"b": [1, "x"], "a": None}) == content_key("v", {"a": None, "b": [1, "x"]})
+    assert content_key("v", {"a": 1}) != content_key("w", {"a": 1})
+    assert content_key("v", {"a": 1}) != content_key("v", {"a": 1.0})
+    assert derivation_inputs({"a": None, "c": 3}, ("a", "b")) == {"a": None}
+
+
+def test_memo_is_a_bounded_lru_with_hit_rate_stats():
+    memo = ValidationMemo(maxsize=2)
+    calls = []
+
+    def validator(bundle):
+        calls.append(bundle["id"])
+        return {"valid": True, "id": bundle["id"]}
+
+    for bundle_id in (1, 2, 1, 3, 2):
+        memo.call("v", validator, {"id": bundle_id})
+
+    assert calls == [1, 2, 3, 2]
+    assert memo.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+        "bypassed": 0,
+        "hit_rate": 0.2,
+    }
+
+
+def test_non_json_bundles_bypass_the_memo():
+    memo = ValidationMemo()
+
+    assert memo.call("v", lambda bundle: {"valid": bool(bundle)}, {"refs": {"a"}}) == {"valid": True}
+    assert memo.stats()["bypassed"] == 1
+    assert memo.stats()["size"] == 0
+
+
+def test_composite_validators_share_derived_results_without_changing_output():
+    MEMO.clear()
+    # target_scope feeds no derived bundle, so every sub-validation is shared.
+    sibling = {**READINESS_BUNDLE, "target_scope": "workspace"}
+    failing = {**READINESS_BUNDLE, "readiness_checks": ["context_loaded"]}
+
+    first = runtime_adoption_readiness_inspect.validate_bundle(READINESS_BUNDLE)
+    second = runtime_adoption_readiness_inspect.validate_bundle(sibling)
+    third = runtime_adoption_readiness_inspect.validate_bundle(failing)
+
+    assert MEMO.stats()["hits"] == 4 + 3
+    assert second["derived_results"] == first["derived_results"]
+    assert second["error_codes"] == ["target_scope"]
+    assert "readiness_checks" in third["error_codes"]
+
+    MEMO.resize(0)
+    try:
+        assert runtime_adoption_readiness_inspect.validate_bundle(sibling) == second
+        assert runtime_adoption_readiness_inspect.validate_bundle(failing) == third
+    finally:
+        MEMO.resize(DEFAULT_MAXSIZE)
+        MEMO.clear()
@@ -0,0 +1,142 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from aaa import workspace_inventory
+from aaa.cmd import verify_ci
+from aaa.outdated import _collect_uses_versions
+from aaa.package_commands import _top_level_repo_names, detect_topology_mode
+from aaa.workspace_inventory import WorkspaceInventory, clear_inventory_cache, load_inventory, scan_workspace
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AAA_INVENTORY_CACHE_DIR", str(tmp_path / "cache"))
+    clear_inventory_cache()
+    yield tmp_path / "cache"
+    clear_inventory_cache()
+
+
+def _workflow(repo: Path, name: str, content: str) -> Path:
+    path = repo / ".github" / "workflows" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _age(*paths: Path, seconds: int = 60) -> None:
+    for path in paths:
+        stamp = path.stat().st_mtime - seconds
+        os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "workspace"
+    (root / ".github").mkdir(parents=True)
+    (root / "aaa-actions").mkdir()
+    (root / "notes.txt").write_text("not a repo", encoding="utf-8")
+    _workflow(root / "aaa-tools", "ci.yml", "jobs:\n  gate:\n    uses: org/aaa-actions/.github/workflows/reusable-gate.yaml@main\n")
+    _workflow(root / "aaa-tools", "release.yaml", "steps:\n  - uses: 'org/aaa-evals@v1.2.0'\n  - uses: org/aaa-evals@v1.3.0 # pinned\n")
+    (root / "aaa-tools" / ".github" / "workflows" / "README.md").write_text("uses: org/aaa-evals@v9", encoding="utf-8")
+    _workflow(root, "root.yml", "uses: org/aaa-actions@v0.9.1\nuses: org/aaa-actions@v1.0.0\n")
+    _age(root, *root.rglob("*"))
+    return root
+
+
+def test_inventory_matches_consumers(workspace):
+    inventory = load_inventory(workspace)
+
+    assert inventory.child_dirs == [".github", "aaa-actions", "aaa-tools"]
+    assert inventory.github_children() == ["aaa-tools"]
+    assert inventory.uses_versions("aaa-actions") == ["v0.9.1", "v1.0.0"]
+    assert inventory.uses_versions("aaa-evals", repo="aaa-tools") == ["v1.2.0", "v1.3.0"]
+    assert inventory.references("reusable-gate.yaml", repo="aaa-tools")
+    assert not inventory.references("reusable-gate.yaml")
+
+    assert _top_level_repo_names(workspace) == inventory.child_dirs
+    assert detect_topology_mode(workspace)["detected_topology_mode"] == "hybrid"
+    assert detect_topology_mode(workspace)["repo_local_github_paths"] == ["aaa-tools/.github"]
+    assert _collect_uses_versions(workspace, "aaa-actions") == ["v0.9.1", "v1.0.0"]
+    assert verify_ci.has_reusable_gate(workspace / "aaa-tools", "org/aaa-actions/.github/workflows/reusable-gate.yaml")
+    assert not verify_ci.has_reusable_gate(workspace / "aaa-actions", "reusable-gate.yaml")
+
+
+def test_rescans_reuse_unchanged_directories_and_workflows(workspace, monkeypatch):
+    cold = load_inventory(workspace)
+    assert cold.stats == {"listed_dirs": 3, "parsed_workflows": 3}
+
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda p, *a, **kw: opened.append(p) or real_open(p, *a, **kw))
+    warm = load_inventory(workspace)
+    assert warm == cold and warm.stats == {"listed_dirs": 0, "parsed_workflows": 0}
+    assert opened == []
+
+    release = workspace / "aaa-tools" / ".github" / "workflows" / "release.yaml"
+    release.write_text("uses: org/aaa-evals@v2.0.0\n", encoding="utf-8")
+    (workspace / "aaa-evals" / ".github").mkdir(parents=True)
+    _age(release, workspace, workspace / "aaa-evals", workspace / "aaa-evals" / ".github")
+    changed = load_inventory(workspace)
+    assert changed.stats == {"listed_dirs": 1, "parsed_workflows": 1}
+    assert changed.github_children() == ["aaa-evals", "aaa-tools"]
+    assert changed.uses_versions("aaa-evals", repo="aaa-tools") == ["v2.0.0"]
+
+
+def test_snapshot_persists_across_processes(workspace, cache_dir):
+    load_inventory(workspace)
+    snapshots = list(cache_dir.glob("*.json"))
+    assert len(snapshots) == 1
+    assert WorkspaceInventory.from_dict(json.loads(snapshots[0].read_text())).child_dirs == [".github", "aaa-actions", "aaa-tools"]
+
+    clear_inventory_cache()
+    assert load_inventory(workspace).stats == {"listed_dirs": 0, "parsed_workflows": 0}
+
+    snapshots[0].write_text("{corrupt", encoding="utf-8")
+    clear_inventory_cache()
+    assert load_inventory(workspace).stats["parsed_workflows"] == 3
+
+
+def test_recent_changes_are_not_trusted(tmp_path):
+    path = _workflow(tmp_path, "ci.yml", "uses: org/aaa-actions@v1\n")
+    first = scan_workspace(tmp_path)
+    assert first.repos[""].workflows["ci.yml"].mtime_ns == workspace_inventory.STALE
+    # Same size, same mtime tick: only the racy-window rule catches this edit
+    stamp = path.stat().st_mtime_ns
+    path.write_text("uses: org/aaa-actions@v2\n", encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+    assert scan_workspace(tmp_path, previous=first).uses_versions("aaa-actions") == ["v2"]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_parallel_scan_is_deterministic(tmp_path, workers):
+    for i in range(20):
+        _workflow(tmp_path / f"repo{i:02d}", "ci.yml", f"uses: org/aaa-actions@v{i}\n")
+    inventory = scan_workspace(tmp_path, workers=workers)
+    assert inventory.github_children() == [f"repo{i:02d}" for i in range(20)]
+    assert [inventory.uses_versions("aaa-actions", repo=f"repo{i:02d}") for i in range(20)] == [[f"v{i}"] for i in range(20)]
+    assert load_inventory(tmp_path / "missing").child_dirs == []
+
+
+def test_root_only_consumers_skip_children_and_snapshots(workspace, cache_dir):
+    (workspace / "aaa-tools" / "node_modules").mkdir()
+    inventory = load_inventory(workspace, children=False)
+    assert inventory.child_dirs == [] and list(inventory.repos) == [""]
+    assert inventory.stats == {"listed_dirs": 1, "parsed_workflows": 1}
+    assert inventory.uses_versions("aaa-actions") == ["v0.9.1", "v1.0.0"]
+    assert not cache_dir.exists()
+
+    assert verify_ci.has_reusable_gate(workspace / "aaa-tools", "reusable-gate.yaml")
+    assert load_inventory(workspace).github_children() == ["aaa-tools"]
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+def test_snapshots_are_capped(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(workspace_inventory, "MAX_SNAPSHOTS", 3)
+    for i in range(5):
+        root = tmp_path / f"ws{i}"
+        _workflow(root / "repo", "ci.yml", "uses: org/aaa-actions@v1\n")
+        load_inventory(root)
+    assert len(list(cache_dir.glob("*.json"))) == 3